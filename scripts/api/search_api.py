@@ -4,39 +4,202 @@ Natural language search for recruiters
 """
 import sys
 import os
+import time
+import threading
+from contextlib import asynccontextmanager
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Literal, Union
 import logging
 
 from core.load_env import load_env
 from core.query_parser import GeminiQueryParser
-from core.intelligent_search import IntelligentSearchEngine
+from core.intelligent_search import IntelligentSearchEngine, ApplicantNotFound
 from core.match_explainer import MatchExplainer
+from core.query_log import QueryLogger
+from core.warmup import warm_up, HealthMonitor
+from core.qdrant_factory import close_qdrant_clients
+from core.passage_index import PassageIndex
+from core.lexical_index import LexicalIndex
+from core.local_embedder import LocalEmbedder
+from core.query_projection import QueryProjection
+from core.rule_parser import RuleQueryParser
+from core.search_tiers import SearchTiers
+from core.time_partitions import PartitionRouter
+from core.read_replica import ReadReplica
+from core.text_store import TextStore
+from core.result_cache import ResultCache
+from core.query_reuse import QueryReuse
+from core.jd_parser import parse_job_description
 
-# Load environment
-load_env()
-
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize components
-logger.info("Initializing search system...")
-parser = GeminiQueryParser()
-engine = IntelligentSearchEngine()
-explainer = MatchExplainer()
-logger.info("✓ Search system ready")
+# Search components are built on first use (or at startup by the lifespan
+# handler), never at import, so importing this module needs no credentials
+# or network access. Tests and harnesses inject their own with configure().
+_components: Dict[str, Any] = {}
+_components_lock = threading.RLock()
+_UNSET = object()
+
+
+def configure(
+    parser: Optional[Any] = None,
+    engine: Optional[Any] = None,
+    explainer: Optional[Any] = None,
+    query_logger: Any = _UNSET,
+    search_tiers: Optional[SearchTiers] = None,
+    query_reuse: Any = _UNSET
+) -> None:
+    """
+    Install pre-built search components
+
+    Args:
+        parser: GeminiQueryParser (or compatible)
+        engine: IntelligentSearchEngine (or compatible)
+        explainer: MatchExplainer (or compatible)
+        query_logger: QueryLogger, or None to disable query logging
+        search_tiers: Latency tier presets (defaults to SearchTiers.from_env())
+        query_reuse: QueryReuse, or None to always call the parser (a new parser
+            also drops the parses indexed so far)
+    """
+    with _components_lock:
+        if parser is not None:
+            _components['parser'] = parser
+            _components.pop('query_reuse', None)
+        if engine is not None:
+            _components['engine'] = engine
+        if explainer is not None:
+            _components['explainer'] = explainer
+        if query_logger is not _UNSET:
+            _components['query_logger'] = query_logger
+        if search_tiers is not None:
+            _components['search_tiers'] = search_tiers
+        if query_reuse is not _UNSET:
+            _components['query_reuse'] = query_reuse
+
+
+def _get_component(name: str, factory):
+    component = _components.get(name)
+    if component is None and name not in _components:
+        with _components_lock:
+            if name not in _components:
+                _components[name] = factory()
+            component = _components[name]
+    return component
+
+
+def get_parser() -> GeminiQueryParser:
+    return _get_component('parser', GeminiQueryParser)
+
+
+def get_query_reuse() -> Optional[QueryReuse]:
+    return _get_component('query_reuse', QueryReuse.from_env)
+
+
+def get_rule_parser() -> RuleQueryParser:
+    return _get_component('rule_parser', RuleQueryParser)
+
+
+def get_search_tiers() -> SearchTiers:
+    return _get_component('search_tiers', SearchTiers.from_env)
+
+
+def _build_engine() -> IntelligentSearchEngine:
+    # With a passage index the full resume text is only needed for applicants added
+    # after the index was built; skip downloading it only if a text store can serve those
+    explainer = get_explainer()
+    text_elsewhere = explainer.passage_index is not None and explainer.text_store is not None
+    # The replica mirrors applicants_unified only, not the quarterly partitions
+    partition_router = PartitionRouter.from_env()
+    read_replica = None
+    if partition_router is None:
+        read_replica = ReadReplica.from_env()
+    elif os.getenv("QDRANT_REPLICA_URL") or os.getenv("QDRANT_REPLICA_PATH"):
+        logger.warning("⚠ Read replica disabled: it does not mirror partitions (SEARCH_PARTITIONED=true)")
+    return IntelligentSearchEngine(
+        payload_exclude=["resume_full_text"] if text_elsewhere else None,
+        lexical_index=LexicalIndex.from_env(),
+        local_embedder=LocalEmbedder.from_env(),
+        query_projection=QueryProjection.from_env(),
+        partition_router=partition_router,
+        read_replica=read_replica,
+        result_cache=ResultCache.from_env()
+    )
+
+
+def get_engine() -> IntelligentSearchEngine:
+    return _get_component('engine', _build_engine)
+
+
+def get_explainer() -> MatchExplainer:
+    return _get_component('explainer', lambda: MatchExplainer(
+        passage_index=PassageIndex.from_env(), text_store=TextStore.from_env()
+    ))
+
+
+def get_query_logger() -> Optional[QueryLogger]:
+    return _get_component('query_logger', QueryLogger.from_env)
+
+
+def get_health_monitor() -> HealthMonitor:
+    return _get_component('health_monitor', lambda: HealthMonitor(get_parser(), get_engine()))
+
+
+# /ready only succeeds once warm-up has finished
+_readiness: Dict[str, Any] = {"ready": False, "warmup": None, "error": None}
+
+
+def run_warmup(queries: Optional[List[str]] = None) -> None:
+    """Build the components and warm connections/caches, then mark the API ready"""
+    try:
+        logger.info("Initializing search system...")
+        get_explainer()
+        get_query_logger()
+        get_search_tiers()  # a bad SEARCH_TIERS_FILE fails warm-up, not the first request
+        # The local model loads alongside warm-up; local mode is used once it is ready
+        local_embedder = getattr(get_engine(), 'local_embedder', None)
+        if local_embedder is not None and not local_embedder.is_ready:
+            local_embedder.preload()
+        # Replica loads/syncs in the background; searches use the primary until it is fresh
+        read_replica = getattr(get_engine(), 'read_replica', None)
+        if read_replica is not None:
+            read_replica.start()
+        _readiness['warmup'] = warm_up(get_parser(), get_engine(), queries)
+        _readiness['error'] = None
+        _readiness['ready'] = True
+        logger.info("✓ Search system ready")
+    except Exception as e:
+        _readiness['error'] = str(e)
+        logger.error(f"❌ Warm-up failed: {e}", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load .env and warm up in the background; /ready reports completion"""
+    logging.basicConfig(level=logging.INFO)
+    load_env()
+
+    threading.Thread(target=run_warmup, name="search-warmup", daemon=True).start()
+
+    yield
+
+    read_replica = getattr(_components.get('engine'), 'read_replica', None)
+    if read_replica is not None:
+        read_replica.stop()
+    close_qdrant_clients()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Intelligent Candidate Search API",
     description="Natural language search for recruiting",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
@@ -58,11 +221,78 @@ class SearchRequest(BaseModel):
         True,
         description="Enable skills-based re-ranking"
     )
+    scores_only: bool = Field(
+        False,
+        description="Return candidates and scores without match reasons or snippets"
+    )
+    hybrid: bool = Field(
+        False,
+        description="Fuse dense and BM25 keyword (skills/title/company) scores in Qdrant"
+    )
+    embedding_mode: Optional[Literal["gemini", "local", "projected"]] = Field(
+        None,
+        description=(
+            "Query embedding: 'gemini' (API), 'local' (on-box model, *_local vectors) or "
+            "'projected' (on-box model projected onto the Gemini vectors); default from SEARCH_EMBEDDING_MODE"
+        )
+    )
+    retrieval: Optional[Literal["full", "truncated", "profile"]] = Field(
+        None,
+        description=(
+            "'truncated' searches truncated vectors and rescores on full 3072-dim vectors; "
+            "'profile' runs one ANN query on the fused profile vector; default from SEARCH_RETRIEVAL"
+        )
+    )
+    hnsw_ef: Optional[int] = Field(None, ge=1, le=4096, description="HNSW search beam width (default SEARCH_HNSW_EF)")
+    oversampling: Optional[float] = Field(
+        None, ge=1.0, le=16.0, description="Quantized candidates fetched per result (default SEARCH_OVERSAMPLING)"
+    )
+    rescore: Optional[bool] = Field(None, description="Re-score quantized candidates on original vectors (default SEARCH_RESCORE)")
+    mode: Optional[str] = Field(
+        None,
+        description=(
+            "Latency tier: 'fast' (rule parser, small ef), 'balanced' or 'exhaustive' (exact search, deep over-fetch), "
+            "or a tier from SEARCH_TIERS_FILE; default SEARCH_DEFAULT_TIER. Explicit fields above override the tier"
+        )
+    )
+
+
+class SimilarRequest(BaseModel):
+    """Find-similar request (the path candidate is the first positive example)"""
+    positive_ids: List[Union[int, str]] = Field(
+        default_factory=list, description="More applicants (point_id) the results should resemble"
+    )
+    negative_ids: List[Union[int, str]] = Field(
+        default_factory=list, description="Applicants (point_id) the results should not resemble"
+    )
+    filters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Filters as in parsed_filters (min_experience, location, education_level, ...)"
+    )
+    limit: int = Field(20, ge=1, le=100, description="Maximum number of results")
+    scores_only: bool = Field(False, description="Return candidates and scores without match reasons or snippets")
+
+
+class JDMatchRequest(BaseModel):
+    """Job description match request"""
+    job_description: str = Field(..., min_length=1, max_length=20000, description="Full job description text")
+    limit: int = Field(20, ge=1, le=100, description="Maximum number of results")
+    enable_reranking: bool = Field(True, description="Re-rank by the skills listed in the JD")
+    scores_only: bool = Field(False, description="Return candidates and scores without match reasons or snippets")
+    filters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Filters overriding those read from the JD (keys as in parsed_filters; null clears one)"
+    )
+    max_weight: float = Field(
+        0.5, ge=0.0, le=1.0,
+        description="Share of the best section score in the aggregate; the rest is the mean over all sections"
+    )
 
 
 class CandidateInfo(BaseModel):
     """Candidate information"""
     id: str
+    point_id: Optional[Union[int, str]] = None  # Qdrant point id, used by /candidates/{id}/similar
     name: str
     email: str
     job_title: str
@@ -92,14 +322,33 @@ class SearchResult(BaseModel):
     resume_snippet: str
 
 
+class JDMatchResponse(BaseModel):
+    """Job description match response"""
+    sections: List[str]  # titles of the sections matched
+    parsed_filters: Dict[str, Any]
+    total_results: int
+    results: List[SearchResult]
+    degraded: bool = False
+    warning: Optional[str] = None
+
+
+class SimilarResponse(BaseModel):
+    """Find-similar response"""
+    candidate_id: Union[int, str]
+    total_results: int
+    results: List[SearchResult]
+
+
 class SearchResponse(BaseModel):
     """Complete search response"""
     query: str
     parsed_filters: Dict[str, Any]
     total_results: int
     results: List[SearchResult]
-    api_used: Optional[str] = None  # 'gemini', 'openai', or 'none'
+    api_used: Optional[str] = None  # 'gemini', 'openai', 'none', 'rules' or 'reuse'
     fallback_used: bool = False
+    degraded: bool = False  # True when embeddings failed and results are lexical (BM25)
+    tier: Optional[str] = None  # latency tier the search ran with
     warning: Optional[str] = None
 
 
@@ -115,25 +364,32 @@ async def root():
 
 
 @app.get("/health")
-async def health():
-    """Detailed health check"""
+def health():
+    """Detailed health check (measured, cached for HEALTH_CHECK_TTL_SECONDS)"""
     try:
-        return {
-            "status": "healthy",
-            "components": {
-                "query_parser": "ready",
-                "search_engine": "ready",
-                "match_explainer": "ready",
-                "qdrant_connection": "connected",
-                "gemini_api": "connected"
-            }
-        }
+        report = get_health_monitor().check()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"System unhealthy: {str(e)}")
 
+    report = {**report, "ready": _readiness['ready']}
+    if report['status'] == "unhealthy":
+        return JSONResponse(status_code=503, content=report)
+    return report
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 200 only after startup warm-up has completed"""
+    if not _readiness['ready']:
+        return JSONResponse(
+            status_code=503,
+            content={"ready": False, "error": _readiness['error']}
+        )
+    return {"ready": True, "warmup": _readiness['warmup']}
+
 
 @app.post("/search", response_model=SearchResponse)
-async def search_candidates(request: SearchRequest):
+def search_candidates(request: SearchRequest):
     """
     Search for candidates using natural language
 
@@ -145,30 +401,64 @@ async def search_candidates(request: SearchRequest):
 
     Example query: "Senior Python developer with Django, 3+ years in Manila"
     """
+    try:
+        tier, parser_name, search_kwargs = get_search_tiers().resolve(request.mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Fields set on the request win over the tier preset
+    overrides = {
+        "retrieval": request.retrieval,
+        "hnsw_ef": request.hnsw_ef,
+        "oversampling": request.oversampling,
+        "rescore": request.rescore
+    }
+    search_kwargs = {**search_kwargs, **{key: value for key, value in overrides.items() if value is not None}}
+
     try:
         logger.info(f"\n{'=' * 80}")
-        logger.info(f"API Search Request: '{request.query}'")
+        logger.info(f"API Search Request: '{request.query}' (tier: {tier})")
         logger.info(f"{'=' * 80}")
 
+        parser = get_rule_parser() if parser_name == "rules" else get_parser()
+        # Near-duplicates of recent queries reuse their LLM parse (rules are cheaper than a lookup)
+        query_reuse = get_query_reuse() if parser_name != "rules" else None
+        engine = get_engine()
+        explainer = get_explainer()
+        query_logger = get_query_logger()
+
+        started = time.perf_counter()
+
         # Step 1: Parse query
         logger.info("[1/3] Parsing natural language query...")
-        parsed_query = parser.parse(request.query)
+        if query_reuse is not None:
+            parsed_query = query_reuse.parse(parser, request.query)
+        else:
+            parsed_query = parser.parse(request.query)
+        parse_ms = (time.perf_counter() - started) * 1000
 
         # Step 2: Search
         logger.info("[2/3] Searching candidates...")
+        trace = {}
         search_results = engine.search(
             parsed_query,
             limit=request.limit,
-            enable_reranking=request.enable_reranking
+            enable_reranking=request.enable_reranking,
+            trace=trace,
+            hybrid=request.hybrid,
+            embedding_mode=request.embedding_mode,
+            **search_kwargs
         )
 
         # Step 3: Generate explanations
         logger.info("[3/3] Generating match explanations...")
-        explained_results = []
-
-        for result in search_results:
-            explained = explainer.explain(result, parsed_query)
-            explained_results.append(explained)
+        stage = time.perf_counter()
+        explained_results = explainer.explain_batch(
+            search_results,
+            parsed_query,
+            scores_only=request.scores_only
+        )
+        explain_ms = (time.perf_counter() - stage) * 1000
 
         # Build response
         api_used = parsed_query.get('api_used', 'gemini')
@@ -181,6 +471,11 @@ async def search_candidates(request: SearchRequest):
             elif api_used == 'none':
                 warning = "⚠ Both Gemini and OpenAI failed - showing semantic results only"
 
+        degraded = trace.get('degraded', False)
+        if degraded:
+            lexical_warning = "⚠ Gemini embeddings unavailable - showing keyword (lexical) results"
+            warning = f"{lexical_warning}; {warning[2:]}" if warning else lexical_warning
+
         response = {
             "query": request.query,
             "parsed_filters": parsed_query['filters'],
@@ -188,9 +483,37 @@ async def search_candidates(request: SearchRequest):
             "results": explained_results,
             "api_used": api_used,
             "fallback_used": fallback_used,
+            "degraded": degraded,
+            "tier": tier,
             "warning": warning
         }
 
+        if query_logger:
+            timings = {"parse_ms": parse_ms, **trace.get('timings', {}), "explain_ms": explain_ms}
+            timings['request_ms'] = (time.perf_counter() - started) * 1000
+            try:
+                query_logger.record(
+                    query=request.query,
+                    request_options={
+                        "limit": request.limit,
+                        "enable_reranking": request.enable_reranking,
+                        "hybrid": request.hybrid,
+                        "embedding_mode": trace.get('embedding_mode'),
+                        "retrieval": request.retrieval,
+                        "hnsw_ef": request.hnsw_ef,
+                        "oversampling": request.oversampling,
+                        "rescore": request.rescore,
+                        **search_kwargs
+                    },
+                    tier=tier,
+                    parsed_query=parsed_query,
+                    query_vector=trace.get('query_vector'),
+                    timings=timings,
+                    results=search_results
+                )
+            except Exception as e:
+                logger.warning(f"⚠ Query log write failed: {e}")
+
         logger.info(f"✓ Returning {len(explained_results)} results (API: {api_used})")
         if warning:
             logger.warning(warning)
@@ -203,22 +526,123 @@ async def search_candidates(request: SearchRequest):
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+@app.post("/match/jd", response_model=JDMatchResponse)
+def match_job_description(request: JDMatchRequest):
+    """
+    Candidates matching a pasted job description
+
+    The JD is split into requirement sections (company blurb and benefits
+    dropped), all sections are embedded in one Gemini call and searched in one
+    Qdrant batch, and section scores are fused per candidate (max/mean) before
+    re-ranking by the skills the JD lists. Latency is about one /search.
+    """
+    started = time.perf_counter()
+    parsed = parse_job_description(request.job_description)
+    filters = {**parsed['filters'], **request.filters}
+    sections = parsed['sections']
+    if not sections:
+        raise HTTPException(status_code=400, detail="Job description has no content to match")
+
+    try:
+        trace = {}
+        search_results = get_engine().search_sections(
+            [section['text'] for section in sections],
+            filters,
+            limit=request.limit,
+            max_weight=request.max_weight,
+            enable_reranking=request.enable_reranking,
+            trace=trace
+        )
+        explained_results = get_explainer().explain_batch(
+            search_results, {"search_intent": parsed['search_intent'], "filters": filters},
+            scores_only=request.scores_only
+        )
+    except Exception as e:
+        logger.error(f"JD match failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"JD match failed: {str(e)}")
+
+    degraded = trace.get('degraded', False)
+    logger.info(
+        f"✓ JD match: {len(sections)} sections, {len(explained_results)} results "
+        f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return {
+        "sections": [section['title'] for section in sections],
+        "parsed_filters": filters,
+        "total_results": len(explained_results),
+        "results": explained_results,
+        "degraded": degraded,
+        "warning": "⚠ Gemini embeddings unavailable - showing keyword (lexical) results" if degraded else None
+    }
+
+
+def _point_id(value: Union[int, str]) -> Union[int, str]:
+    """Qdrant point ids are unsigned ints or UUID strings; numeric strings are ints"""
+    return int(value) if isinstance(value, str) and value.isdigit() else value
+
+
+@app.post("/candidates/{candidate_id}/similar", response_model=SimilarResponse)
+def similar_candidates(candidate_id: str, request: Optional[SimilarRequest] = None):
+    """
+    Candidates similar to a stored applicant (and optional extra positive /
+    negative examples), ranked by the same weighted resume/skills/tasks fusion
+    as /search from the stored vectors: no LLM or embedding call, one Qdrant query
+
+    `candidate_id` is the `point_id` of a search result.
+    """
+    request = request or SimilarRequest()
+    positive_ids = [_point_id(candidate_id)] + [_point_id(i) for i in request.positive_ids]
+    negative_ids = [_point_id(i) for i in request.negative_ids]
+
+    try:
+        search_results = get_engine().similar(
+            positive_ids, negative_ids, filters=request.filters, limit=request.limit
+        )
+    except ApplicantNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Similar search failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Similar search failed: {str(e)}")
+
+    explained_results = get_explainer().explain_batch(
+        search_results, {"search_intent": "", "filters": request.filters}, scores_only=request.scores_only
+    )
+    return {
+        "candidate_id": positive_ids[0],
+        "total_results": len(explained_results),
+        "results": explained_results
+    }
+
+
 @app.get("/stats")
-async def get_stats():
+def get_stats():
     """Get search system statistics"""
     try:
-        # Get collection info
-        collection_info = engine.client.get_collection(engine.COLLECTION_NAME)
+        engine = get_engine()
+        parser = get_parser()
+
+        # Get collection info (every quarterly partition when partitioned)
+        router = engine.partition_router
+        names = sorted(router.partitions(engine.client).values()) if router is not None else [engine.COLLECTION_NAME]
+        infos = [engine.client.get_collection(name) for name in names]
 
         return {
-            "total_candidates": collection_info.points_count,
+            "total_candidates": sum(info.points_count or 0 for info in infos),
             "collection_name": engine.COLLECTION_NAME,
-            "collection_status": collection_info.status,
+            "collection_status": infos[-1].status if infos else None,
+            "partitions": names if router is not None else None,
             "vectors_per_candidate": 3,
             "vector_names": ["resume", "skills", "tasks"],
             "vector_dimension": 3072,
             "embedding_model": "gemini-embedding-001",
-            "query_parser_model": "gemini-2.0-flash-001"
+            "query_parser_model": "gemini-2.0-flash-001",
+            "caches": {
+                "parse": parser.cache.stats() if parser.cache else None,
+                "embedding": engine.embedding_cache.stats() if engine.embedding_cache else None,
+                "query_reuse": get_query_reuse().stats() if get_query_reuse() else None
+            }
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
@@ -228,6 +652,8 @@ async def get_stats():
 if __name__ == "__main__":
     import uvicorn
 
+    logging.basicConfig(level=logging.INFO)
+
     logger.info("\n" + "=" * 80)
     logger.info("STARTING INTELLIGENT CANDIDATE SEARCH API")
     logger.info("=" * 80)
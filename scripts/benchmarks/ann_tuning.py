@@ -0,0 +1,449 @@
+"""
+ANN Recall-vs-Latency Tuning Harness
+Exact brute-force top-k over the stored resume/skills/tasks vectors (NumPy) is
+the ground truth; each configuration in a sweep of collection settings
+(quantization, HNSW m, truncated copies, profile vector) and search parameters
+(hnsw_ef, exact, oversampling/rescore, retrieval, over-fetch) is then measured on:
+
+    vector recall@k  - per named vector ANN results vs exact top-k (mean of the three)
+    fused recall@k   - IntelligentSearchEngine.search() top-k vs the exact fused
+                       ranking sum(w * cosine) over all points
+    overlap@10       - engine top-10 vs the engine's own exact-search top-10
+                       (isolates ANN loss from fusion/threshold effects)
+    p50 / p95 ms     - engine.search() wall time
+
+and printed as a table with the recall@10 / p50 Pareto front marked.
+
+Run it against a Qdrant server (e.g. docker, restored from a production
+snapshot) for meaningful numbers: the in-process stand-in always searches
+exactly, so it only checks the plumbing. Collections below Qdrant's
+full_scan_threshold are brute-forced by the server too.
+
+Usage:
+    # Local Qdrant restored from a snapshot, logged Gemini query vectors
+    python3 scripts/benchmarks/ann_tuning.py --qdrant-url http://localhost:6333 \\
+        --snapshot file:///snapshots/applicants_unified.snapshot --query-log logs/queries.jsonl \\
+        --ef 16 32 64 128 --quantization scalar binary --truncated 256 768 --output ann.json
+
+    # Synthetic corpus loaded into a local Qdrant server (or in-process without --qdrant-url)
+    python3 scripts/benchmarks/ann_tuning.py --stand-in 20000 --dim 3072 --qdrant-url http://localhost:6333
+
+    # Explicit grid: JSON list of {"name", "collection", "engine", "search"}
+    python3 scripts/benchmarks/ann_tuning.py --qdrant-url http://localhost:6333 --grid grid.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+# Add scripts directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.intelligent_search import IntelligentSearchEngine
+from core.collection_config import quantization_config, search_params
+from core.truncated_vectors import truncated_document_vectors, truncated_vectors_config
+from benchmarks.load_test import percentile
+from benchmarks.recall_harness import sample_point_queries, logged_queries
+from benchmarks.replay_queries import overlap_at_k
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = IntelligentSearchEngine.COLLECTION_NAME
+VECTOR_NAMES = tuple(IntelligentSearchEngine.WEIGHTS)
+SEARCH_KWARGS = ("hnsw_ef", "exact", "oversampling", "rescore", "retrieval", "overfetch", "profile_rescore")
+
+
+# ============================================================================
+# GROUND TRUTH
+# ============================================================================
+
+def load_stored_vectors(client, collection: str, names=VECTOR_NAMES, batch: int = 512) -> Tuple[list, Dict[str, np.ndarray]]:
+    """Point ids and unit-normalized (n, dim) matrices of the named vectors"""
+    ids, columns = [], {name: [] for name in names}
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection, limit=batch, offset=offset, with_vectors=list(names), with_payload=False
+        )
+        for point in points:
+            ids.append(point.id)
+            for name in names:
+                columns[name].append(point.vector[name])
+        if offset is None:
+            break
+    matrices = {}
+    for name, rows in columns.items():
+        matrix = np.asarray(rows, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrices[name] = matrix / np.where(norms == 0, 1, norms)
+    return ids, matrices
+
+
+def exact_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first"""
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def ground_truth(ids: list, matrices: Dict[str, np.ndarray], query: List[float], k: int) -> Dict[str, list]:
+    """Exact top-k ids per named vector and for the weighted fusion of the three"""
+    q = np.asarray(query, dtype=np.float32)
+    q = q / (np.linalg.norm(q) or 1.0)
+    truth, fused = {}, np.zeros(len(ids), dtype=np.float32)
+    for name, weight in IntelligentSearchEngine.WEIGHTS.items():
+        scores = matrices[name] @ q
+        truth[name] = [ids[i] for i in exact_top_k(scores, k)]
+        fused += weight * scores
+    truth["fused"] = [ids[i] for i in exact_top_k(fused, k)]
+    return truth
+
+
+# ============================================================================
+# COLLECTION CONFIGS
+# ============================================================================
+
+def clone_collection(
+    client,
+    source: str,
+    target: str,
+    quantization: Optional[str] = None,
+    hnsw_m: Optional[int] = None,
+    hnsw_ef_construct: Optional[int] = None,
+    truncated_dims: Optional[List[int]] = None,
+    profile: bool = False,
+    batch: int = 256
+) -> None:
+    """
+    Copy `source` into `target` with different storage settings, adding truncated
+    copies / the profile vector computed from the stored full vectors
+    """
+    from qdrant_client.models import VectorParams, Distance, PointStruct, HnswConfigDiff
+
+    params = client.get_collection(source).config.params
+    vectors_config = dict(params.vectors)
+    vectors_config.update(truncated_vectors_config(truncated_dims or []))
+    if profile:
+        dim = vectors_config[VECTOR_NAMES[0]].size
+        vectors_config[IntelligentSearchEngine.PROFILE_VECTOR] = VectorParams(size=dim, distance=Distance.DOT)
+
+    if client.collection_exists(target):
+        client.delete_collection(target)
+    hnsw = HnswConfigDiff(m=hnsw_m, ef_construct=hnsw_ef_construct) if (hnsw_m or hnsw_ef_construct) else None
+    client.create_collection(
+        collection_name=target,
+        vectors_config=vectors_config,
+        sparse_vectors_config=params.sparse_vectors,
+        quantization_config=quantization_config(quantization or "none"),
+        hnsw_config=hnsw
+    )
+
+    offset, copied = None, 0
+    while True:
+        points, offset = client.scroll(source, limit=batch, offset=offset, with_vectors=True, with_payload=True)
+        upserts = []
+        for point in points:
+            dense = {name: point.vector[name] for name in VECTOR_NAMES}
+            vector = {**point.vector, **truncated_document_vectors(dense, truncated_dims or [])}
+            if profile:
+                vector[IntelligentSearchEngine.PROFILE_VECTOR] = IntelligentSearchEngine.profile_vector(dense)
+            upserts.append(PointStruct(id=point.id, vector=vector, payload=point.payload))
+        if upserts:
+            client.upsert(collection_name=target, points=upserts, wait=True)
+            copied += len(upserts)
+        if offset is None:
+            break
+    _wait_until_indexed(client, target)
+    logger.info(f"  ✓ {target}: {copied} points (quantization={quantization or 'none'}, m={hnsw_m}, "
+                f"truncated={truncated_dims or []}, profile={profile})")
+
+
+def _wait_until_indexed(client, collection: str, timeout: float = 1800.0) -> None:
+    """Block until the server has finished building HNSW / quantized indexes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = str(getattr(client.get_collection(collection), "status", "green"))
+        if status.lower().endswith("green"):
+            return
+        time.sleep(2.0)
+    logger.warning(f"⚠ {collection} still indexing after {timeout:.0f}s - measuring anyway")
+
+
+def default_grid(
+    ef_values: List[int],
+    quantizations: List[str],
+    oversampling: List[float],
+    truncated_dims: List[int],
+    rescore_limits: List[int],
+    profile: bool = False
+) -> List[Dict[str, Any]]:
+    """Sweep: ef on the source collection, quantization x oversampling, truncated dims x rescore limits"""
+    grid = [{"name": "exact", "search": {"exact": True}}]
+    grid += [{"name": f"ef{ef}", "search": {"hnsw_ef": ef}} for ef in ef_values]
+    for mode in quantizations:
+        grid.append({"name": f"{mode}", "collection": {"quantization": mode}, "search": {"rescore": False}})
+        grid += [
+            {"name": f"{mode}+os{factor:g}", "collection": {"quantization": mode},
+             "search": {"oversampling": factor, "rescore": True}}
+            for factor in oversampling
+        ]
+    for dim in truncated_dims:
+        grid += [
+            {"name": f"trunc{dim}+rescore{limit}", "collection": {"truncated_dims": [dim]},
+             "engine": {"truncated_dim": dim, "rescore_limit": limit}, "search": {"retrieval": "truncated"}}
+            for limit in rescore_limits
+        ]
+    if profile:
+        grid.append({"name": "profile", "collection": {"profile": True}, "search": {"retrieval": "profile"}})
+        grid.append({"name": "profile+rescore", "collection": {"profile": True},
+                     "search": {"retrieval": "profile", "profile_rescore": True}})
+    return grid
+
+
+# ============================================================================
+# SWEEP
+# ============================================================================
+
+def _vector_results(engine: IntelligentSearchEngine, query: List[float], name: str, k: int, search: Dict[str, Any]) -> list:
+    """ANN top-k of one named vector under the config's search params (and retrieval)"""
+    params = search_params(
+        hnsw_ef=search.get("hnsw_ef"), exact=search.get("exact", False),
+        oversampling=search.get("oversampling"), rescore=search.get("rescore")
+    )
+    truncated = search.get("retrieval") == "truncated"
+    points = engine.client.query_points(
+        collection_name=engine.COLLECTION_NAME,
+        prefetch=engine._first_stage(query, name, None, params) if truncated else None,
+        query=query,
+        using=name,
+        search_params=None if truncated else params,
+        limit=k,
+        with_payload=False
+    ).points
+    return [point.id for point in points]
+
+
+def measure_config(
+    engine: IntelligentSearchEngine,
+    queries: List[List[float]],
+    truths: List[Dict[str, list]],
+    references: List[list],
+    search: Dict[str, Any],
+    ks: Tuple[int, ...] = (10, 50)
+) -> Dict[str, Any]:
+    """Recall, overlap with the exact engine ranking and latency of one configuration"""
+    k_max = max(ks)
+    parsed = {"search_intent": "ann tuning", "filters": {}}
+    search_kwargs = {key: value for key, value in search.items() if key in SEARCH_KWARGS}
+    per_vector = search.get("retrieval") != "profile"
+
+    engine.search(parsed, limit=k_max, enable_reranking=False, query_vector=queries[0], **search_kwargs)  # warm
+
+    vector_recall = {k: [] for k in ks}
+    fused_recall = {k: [] for k in ks}
+    overlaps, latencies = [], []
+    for query, truth, reference in zip(queries, truths, references):
+        started = time.perf_counter()
+        results = engine.search(parsed, limit=k_max, enable_reranking=False, query_vector=query, **search_kwargs)
+        latencies.append((time.perf_counter() - started) * 1000)
+        ranked = [candidate["id"] for candidate in results]
+
+        for k in ks:
+            fused_recall[k].append(len(set(ranked[:k]) & set(truth["fused"][:k])) / k)
+        overlaps.append(overlap_at_k(reference, ranked, 10))
+        if per_vector:
+            for name in VECTOR_NAMES:
+                found = _vector_results(engine, query, name, k_max, search)
+                for k in ks:
+                    vector_recall[k].append(len(set(found[:k]) & set(truth[name][:k])) / k)
+
+    row = {}
+    for k in ks:
+        row[f"vector_recall@{k}"] = round(float(np.mean(vector_recall[k])), 4) if vector_recall[k] else None
+        row[f"fused_recall@{k}"] = round(float(np.mean(fused_recall[k])), 4)
+    row["overlap@10"] = round(float(np.mean(overlaps)), 4)
+    row["p50_ms"] = round(percentile(latencies, 50), 2)
+    row["p95_ms"] = round(percentile(latencies, 95), 2)
+    return row
+
+
+def sweep(
+    client,
+    queries: List[List[float]],
+    grid: List[Dict[str, Any]],
+    source: str = COLLECTION_NAME,
+    ks: Tuple[int, ...] = (10, 50),
+    keep: bool = False
+) -> Dict[str, Any]:
+    """
+    Run every grid entry and return the report
+
+    Each entry: {"name", "collection": clone_collection() kwargs (omit for the source
+    collection), "engine": IntelligentSearchEngine kwargs (truncated_dim, rescore_limit),
+    "search": engine.search() kwargs}
+    """
+    logger.info(f"Loading stored vectors from '{source}' for exact ground truth...")
+    ids, matrices = load_stored_vectors(client, source)
+    k_max = max(ks)
+    truths = [ground_truth(ids, matrices, query, k_max) for query in queries]
+    logger.info(f"  ✓ {len(ids)} points, {len(queries)} queries")
+
+    def build_engine(collection: str, engine_kwargs: Dict[str, Any]) -> IntelligentSearchEngine:
+        # Query vectors are always supplied, so Gemini is never called
+        engine = IntelligentSearchEngine(
+            client=client, gemini_api_key=os.getenv("GEMINI_API_KEY") or "ann-tuning-unused", **engine_kwargs
+        )
+        engine.COLLECTION_NAME = collection
+        return engine
+
+    # Reference ranking: the engine itself with exact vector search on the source collection
+    parsed = {"search_intent": "ann tuning", "filters": {}}
+    reference_engine = build_engine(source, {})
+    references = [
+        [c["id"] for c in reference_engine.search(parsed, limit=k_max, enable_reranking=False, query_vector=q, exact=True)]
+        for q in queries
+    ]
+
+    clones: Dict[str, str] = {}
+    rows = []
+    try:
+        for entry in grid:
+            spec = entry.get("collection") or {}
+            collection = source
+            if spec:
+                key = json.dumps(spec, sort_keys=True)
+                if key not in clones:
+                    clones[key] = f"{source}_tuning_{len(clones)}"
+                    logger.info(f"Building {clones[key]} {spec}...")
+                    clone_collection(client, source, clones[key], **spec)
+                collection = clones[key]
+
+            engine = build_engine(collection, entry.get("engine") or {})
+            row = measure_config(engine, queries, truths, references, entry.get("search") or {}, ks)
+            rows.append({"name": entry["name"], "collection": spec, "engine": entry.get("engine") or {},
+                         "search": entry.get("search") or {}, **row})
+            logger.info(f"  ✓ {entry['name']}: fused recall@10={row['fused_recall@10']:.3f} p50={row['p50_ms']:.1f}ms")
+    finally:
+        if not keep:
+            for collection in clones.values():
+                client.delete_collection(collection)
+
+    recall_key = f"fused_recall@{min(ks)}"
+    for row, on_front in zip(rows, pareto_front(rows, recall_key)):
+        row["pareto"] = on_front
+    return {"points": len(ids), "queries": len(queries), "ks": list(ks), "configs": rows}
+
+
+def pareto_front(rows: List[Dict[str, Any]], recall_key: str, latency_key: str = "p50_ms") -> List[bool]:
+    """True for rows no other row beats on both recall (>=) and latency (<=), strictly on one"""
+    flags = []
+    for row in rows:
+        dominated = any(
+            other[recall_key] >= row[recall_key] and other[latency_key] <= row[latency_key]
+            and (other[recall_key] > row[recall_key] or other[latency_key] < row[latency_key])
+            for other in rows
+        )
+        flags.append(not dominated)
+    return flags
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    small, large = report["ks"][0], report["ks"][-1]
+    lines = [
+        f"ANN tuning: {report['queries']} queries over {report['points']} points (* = Pareto front, fused recall@{small} vs p50)",
+        f"{'config':<24}{'vec@' + str(small):>8}{'vec@' + str(large):>8}{'fused@' + str(small):>10}"
+        f"{'fused@' + str(large):>10}{'ovl@10':>8}{'p50 ms':>9}{'p95 ms':>9}",
+    ]
+
+    def cell(value, width):
+        return f"{'-':>{width}}" if value is None else f"{value:>{width}.3f}"
+
+    for row in sorted(report["configs"], key=lambda r: r["p50_ms"]):
+        name = ("* " if row["pareto"] else "  ") + row["name"]
+        lines.append(
+            f"{name:<24}{cell(row[f'vector_recall@{small}'], 8)}{cell(row[f'vector_recall@{large}'], 8)}"
+            f"{cell(row[f'fused_recall@{small}'], 10)}{cell(row[f'fused_recall@{large}'], 10)}"
+            f"{cell(row['overlap@10'], 8)}{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ANN recall vs latency sweep against exact NumPy search")
+    parser.add_argument("--qdrant-url", help="Local Qdrant server (omit with --stand-in for an in-process collection)")
+    parser.add_argument("--snapshot", help="Recover the source collection from this snapshot location first")
+    parser.add_argument("--stand-in", type=int, metavar="N", help="Load N synthetic applicants as the source collection")
+    parser.add_argument("--dim", type=int, default=3072, help="Stand-in vector dim")
+    parser.add_argument("--collection", default=COLLECTION_NAME, help="Source collection")
+    parser.add_argument("--query-log", help="Use Gemini query vectors stored in this query log")
+    parser.add_argument("--queries", type=int, default=100, help="Number of queries")
+    parser.add_argument("--k", type=int, nargs="+", default=[10, 50], help="recall@k cutoffs")
+    parser.add_argument("--ef", type=int, nargs="*", default=[16, 32, 64, 128, 256], help="hnsw_ef values")
+    parser.add_argument("--quantization", nargs="*", default=["scalar", "binary"], choices=["scalar", "binary"])
+    parser.add_argument("--oversampling", type=float, nargs="*", default=[1.0, 2.0, 4.0])
+    parser.add_argument("--truncated", type=int, nargs="*", default=[256, 768], help="Truncated dims")
+    parser.add_argument("--rescore", type=int, nargs="*", default=[100, 300], help="Truncated rescore limits")
+    parser.add_argument("--profile", action="store_true", help="Include profile-vector retrieval")
+    parser.add_argument("--grid", help="JSON grid file (replaces the generated sweep)")
+    parser.add_argument("--keep", action="store_true", help="Keep the cloned collections")
+    parser.add_argument("--output", help="Write the report JSON here")
+    args = parser.parse_args()
+
+    if args.stand_in:
+        from benchmarks.stand_ins import build_synthetic_corpus, create_local_qdrant
+        client = create_local_qdrant(
+            build_synthetic_corpus(args.stand_in, args.dim), collection_name=args.collection,
+            location=args.qdrant_url or ":memory:"
+        )
+    elif args.qdrant_url:
+        from qdrant_client import QdrantClient
+        client = QdrantClient(url=args.qdrant_url, timeout=300)
+        if args.snapshot:
+            logger.info(f"Recovering '{args.collection}' from {args.snapshot}...")
+            client.recover_snapshot(collection_name=args.collection, location=args.snapshot, wait=True)
+    else:
+        parser.error("use --qdrant-url (local server) and/or --stand-in")
+
+    if not args.qdrant_url:
+        logger.warning("⚠ In-process Qdrant always searches exactly - recall/latency here only checks the harness")
+
+    if args.query_log:
+        queries = logged_queries(args.query_log, dim=args.dim, limit=args.queries)
+    else:
+        queries = sample_point_queries(client, args.collection, VECTOR_NAMES[0], args.queries)
+    if not queries:
+        logger.error("❌ No query vectors (QUERY_LOG_EMBEDDINGS=hash, or an empty collection?)")
+        return 1
+
+    if args.grid:
+        with open(args.grid, "r", encoding="utf-8") as f:
+            grid = json.load(f)
+    else:
+        grid = default_grid(args.ef, args.quantization, args.oversampling, args.truncated, args.rescore, args.profile)
+
+    # Per-step engine logging would dominate the timings
+    logging.getLogger("core.intelligent_search").setLevel(logging.WARNING)
+    report = sweep(client, queries, grid, source=args.collection, ks=tuple(sorted(args.k)), keep=args.keep)
+    print(format_table(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
@@ -0,0 +1,538 @@
+"""
+Concurrent HTTP Load-Test Harness for the Search API
+Drives scripts/api/search_api.py with closed- or open-loop load and reports
+latency percentiles, error rates and saturation throughput per endpoint.
+
+Usage:
+    # Serve the API wired to local stand-ins (Gemini, OpenAI, Qdrant)
+    python3 scripts/benchmarks/load_test.py serve --port 8765 \\
+        --gemini-embed-latency lognormal:300,0.3 --qdrant-latency const:40
+
+    # Closed loop: 8 concurrent recruiters for 30s against a running API
+    python3 scripts/benchmarks/load_test.py run --url http://localhost:8765 --concurrency 8
+
+    # Open loop: Poisson arrivals at 5 req/s, spawning the stand-in API
+    python3 scripts/benchmarks/load_test.py run --spawn --rate 5
+
+    # Saturation sweep over concurrency levels
+    python3 scripts/benchmarks/load_test.py run --spawn --sweep 1,2,4,8,16 --slo-ms 1500
+"""
+import os
+import sys
+import json
+import time
+import math
+import random
+import asyncio
+import argparse
+import logging
+import subprocess
+from typing import List, Dict, Any, Optional
+
+# Add scripts directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stand_ins import (
+    LatencyModel,
+    FakeGeminiClient,
+    FakeOpenAIClient,
+    LatencyProxy,
+    build_synthetic_corpus,
+    create_local_qdrant,
+    synthetic_queries,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# QUERY MIX
+# ============================================================================
+
+def default_mix() -> List[Dict[str, Any]]:
+    """Weighted request mix roughly matching dashboard traffic"""
+    queries = synthetic_queries()
+    return [
+        {
+            "name": "POST /search",
+            "method": "POST",
+            "path": "/search",
+            "weight": 8,
+            "bodies": [{"query": q, "limit": 20, "enable_reranking": True} for q in queries]
+        },
+        {
+            "name": "POST /search (limit=100)",
+            "method": "POST",
+            "path": "/search",
+            "weight": 1,
+            "bodies": [{"query": q, "limit": 100, "enable_reranking": True} for q in queries]
+        },
+        {"name": "GET /health", "method": "GET", "path": "/health", "weight": 1},
+    ]
+
+
+def load_mix(path: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Load a query mix from JSON, or return the default mix
+
+    File format: a list of entries like
+        {"name": "...", "method": "POST", "path": "/search", "weight": 3,
+         "bodies": [{"query": "...", "limit": 20}]}
+    """
+    if not path:
+        return default_mix()
+
+    with open(path, "r", encoding="utf-8") as f:
+        mix = json.load(f)
+
+    for entry in mix:
+        entry.setdefault("method", "GET")
+        entry.setdefault("weight", 1)
+        entry.setdefault("name", f"{entry['method']} {entry['path']}")
+    return mix
+
+
+class MixPicker:
+    """Weighted random choice over mix entries"""
+
+    def __init__(self, mix: List[Dict[str, Any]], seed: Optional[int] = None):
+        self.mix = mix
+        self.weights = [float(entry.get("weight", 1)) for entry in mix]
+        self.rng = random.Random(seed)
+
+    def pick(self):
+        entry = self.rng.choices(self.mix, weights=self.weights, k=1)[0]
+        bodies = entry.get("bodies")
+        body = self.rng.choice(bodies) if bodies else None
+        return entry, body
+
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list (0 for empty input)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """
+    Aggregate raw samples into per-endpoint and overall statistics
+
+    Each sample is {"name", "latency_ms", "ok", "status", "error"}.
+    """
+    def stats(group: List[Dict[str, Any]]) -> Dict[str, Any]:
+        latencies = [s["latency_ms"] for s in group if s["ok"]]
+        errors = [s for s in group if not s["ok"]]
+        error_kinds: Dict[str, int] = {}
+        for s in errors:
+            kind = s.get("error") or f"HTTP {s.get('status')}"
+            error_kinds[kind] = error_kinds.get(kind, 0) + 1
+        return {
+            "requests": len(group),
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(group), 4) if group else 0.0,
+            "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p90_ms": round(percentile(latencies, 90), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(max(latencies), 1) if latencies else 0.0,
+            "error_kinds": error_kinds,
+        }
+
+    by_endpoint: Dict[str, List[Dict[str, Any]]] = {}
+    for s in samples:
+        by_endpoint.setdefault(s["name"], []).append(s)
+
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "overall": stats(samples),
+        "endpoints": {name: stats(group) for name, group in sorted(by_endpoint.items())},
+    }
+
+
+# ============================================================================
+# LOAD GENERATORS
+# ============================================================================
+
+async def _send(client, entry: Dict[str, Any], body: Optional[Dict[str, Any]], started: float) -> Dict[str, Any]:
+    """Send one request and time it from `started` (perf_counter seconds)"""
+    sample = {"name": entry["name"], "ok": False, "status": None, "error": None}
+    try:
+        response = await client.request(entry["method"], entry["path"], json=body)
+        sample["status"] = response.status_code
+        sample["ok"] = response.status_code < 400
+    except Exception as e:
+        sample["error"] = type(e).__name__
+    sample["latency_ms"] = (time.perf_counter() - started) * 1000
+    return sample
+
+
+async def run_closed_loop(
+    client,
+    mix: List[Dict[str, Any]],
+    concurrency: int,
+    duration: float,
+    warmup: float = 0.0,
+    think_time_ms: float = 0.0,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Closed loop: `concurrency` virtual recruiters, each waits for its
+    response (plus think time) before sending the next request.
+    """
+    picker = MixPicker(mix, seed)
+    samples: List[Dict[str, Any]] = []
+    start = time.perf_counter()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+
+    async def user():
+        while time.perf_counter() < stop_at:
+            entry, body = picker.pick()
+            sent = time.perf_counter()
+            sample = await _send(client, entry, body, sent)
+            if sent >= measure_from:
+                samples.append(sample)
+            if think_time_ms > 0:
+                await asyncio.sleep(think_time_ms / 1000.0)
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+
+    report = summarize(samples, duration)
+    report["load"] = {"model": "closed", "concurrency": concurrency, "think_time_ms": think_time_ms}
+    return report
+
+
+async def run_open_loop(
+    client,
+    mix: List[Dict[str, Any]],
+    rate: float,
+    duration: float,
+    warmup: float = 0.0,
+    max_in_flight: int = 256,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Open loop: Poisson arrivals at `rate` req/s regardless of response times.
+
+    Latency is measured from the scheduled arrival time so that queueing
+    delay is not hidden (no coordinated omission). Arrivals that would
+    exceed `max_in_flight` are recorded as client-side overflow errors.
+    """
+    picker = MixPicker(mix, seed)
+    rng = random.Random(seed)
+    samples: List[Dict[str, Any]] = []
+    tasks = set()
+    start = time.perf_counter()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+    next_arrival = start
+
+    async def fire(entry, body, scheduled):
+        sample = await _send(client, entry, body, scheduled)
+        if scheduled >= measure_from:
+            samples.append(sample)
+
+    while next_arrival < stop_at:
+        now = time.perf_counter()
+        if next_arrival > now:
+            await asyncio.sleep(next_arrival - now)
+
+        entry, body = picker.pick()
+        if len(tasks) >= max_in_flight:
+            if next_arrival >= measure_from:
+                samples.append({
+                    "name": entry["name"], "ok": False, "status": None,
+                    "error": "ClientOverflow", "latency_ms": 0.0
+                })
+        else:
+            task = asyncio.create_task(fire(entry, body, next_arrival))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        next_arrival += rng.expovariate(rate)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+
+    report = summarize(samples, duration)
+    report["load"] = {"model": "open", "rate_rps": rate, "max_in_flight": max_in_flight}
+    return report
+
+
+def find_saturation(
+    steps: List[Dict[str, Any]],
+    slo_ms: float,
+    max_error_rate: float = 0.01
+) -> Dict[str, Any]:
+    """
+    Pick the highest-throughput sweep step that still meets the SLO
+
+    A step qualifies when overall p95 <= slo_ms and error rate <= max_error_rate.
+    """
+    qualifying = [
+        step for step in steps
+        if step["overall"]["p95_ms"] <= slo_ms and step["overall"]["error_rate"] <= max_error_rate
+    ]
+    if not qualifying:
+        return {"saturation_rps": 0.0, "step": None}
+
+    best = max(qualifying, key=lambda step: step["overall"]["throughput_rps"])
+    return {"saturation_rps": best["overall"]["throughput_rps"], "step": best["load"]}
+
+
+# ============================================================================
+# STAND-IN SERVICE
+# ============================================================================
+
+def install_stand_ins(
+    corpus_size: int = 2000,
+    dim: int = 3072,
+    gemini_embed_latency: str = "0",
+    gemini_generate_latency: str = "0",
+    openai_latency: str = "0",
+    qdrant_latency: str = "0",
+    gemini_error_rate: float = 0.0,
+    seed: int = 42
+):
+    """
+    Wire the API's search components to local stand-ins and return the FastAPI app
+    """
+    from core.query_parser import GeminiQueryParser
+    from core.intelligent_search import IntelligentSearchEngine
+    from api import search_api
+
+    gemini = FakeGeminiClient(
+        embed_latency=LatencyModel.parse(gemini_embed_latency, seed),
+        generate_latency=LatencyModel.parse(gemini_generate_latency, seed),
+        dim=dim,
+        error_rate=gemini_error_rate,
+        seed=seed
+    )
+    openai_client = FakeOpenAIClient(latency=LatencyModel.parse(openai_latency, seed))
+    qdrant = LatencyProxy(
+        create_local_qdrant(build_synthetic_corpus(corpus_size, dim, seed)),
+        LatencyModel.parse(qdrant_latency, seed)
+    )
+
+    search_api.configure(
+        parser=GeminiQueryParser(gemini_client=gemini, openai_client=openai_client),
+        engine=IntelligentSearchEngine(client=qdrant, gemini_client=gemini)
+    )
+    return search_api.app
+
+
+def _stand_in_args(args) -> List[str]:
+    return [
+        "--corpus-size", str(args.corpus_size),
+        "--dim", str(args.dim),
+        "--gemini-embed-latency", args.gemini_embed_latency,
+        "--gemini-generate-latency", args.gemini_generate_latency,
+        "--openai-latency", args.openai_latency,
+        "--qdrant-latency", args.qdrant_latency,
+        "--gemini-error-rate", str(args.gemini_error_rate),
+    ]
+
+
+def serve(args) -> None:
+    """Run the API with stand-ins in this process (one uvicorn worker)"""
+    import uvicorn
+
+    app = install_stand_ins(
+        corpus_size=args.corpus_size,
+        dim=args.dim,
+        gemini_embed_latency=args.gemini_embed_latency,
+        gemini_generate_latency=args.gemini_generate_latency,
+        openai_latency=args.openai_latency,
+        qdrant_latency=args.qdrant_latency,
+        gemini_error_rate=args.gemini_error_rate,
+    )
+    # The API logs every search step at INFO; keep the server quiet under load
+    logging.getLogger().setLevel(logging.WARNING)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+def spawn_server(args) -> subprocess.Popen:
+    """Start `serve` in a subprocess and wait until /ready answers (warm-up done)"""
+    import httpx
+
+    command = [sys.executable, os.path.abspath(__file__), "serve",
+               "--host", "127.0.0.1", "--port", str(args.port)] + _stand_in_args(args)
+    logger.info(f"Spawning stand-in API: {' '.join(command)}")
+    process = subprocess.Popen(command)
+
+    url = f"http://127.0.0.1:{args.port}/ready"
+    deadline = time.time() + args.startup_timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Stand-in API exited with code {process.returncode}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+
+    process.terminate()
+    raise RuntimeError(f"Stand-in API not ready after {args.startup_timeout}s")
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render one run as a fixed-width table"""
+    load = report.get("load", {})
+    if load.get("model") == "closed":
+        header = f"Closed loop, concurrency={load['concurrency']}, think={load['think_time_ms']}ms"
+    else:
+        header = f"Open loop, rate={load.get('rate_rps')} req/s"
+
+    lines = [header, f"Measured window: {report['elapsed_s']}s", ""]
+    lines.append(f"{'Endpoint':<28}{'reqs':>7}{'err%':>7}{'rps':>8}{'p50':>8}{'p90':>8}{'p95':>8}{'p99':>8}{'max':>8}")
+
+    rows = list(report["endpoints"].items()) + [("ALL", report["overall"])]
+    for name, s in rows:
+        lines.append(
+            f"{name[:27]:<28}{s['requests']:>7}{s['error_rate'] * 100:>6.1f}%{s['throughput_rps']:>8.2f}"
+            f"{s['p50_ms']:>8.0f}{s['p90_ms']:>8.0f}{s['p95_ms']:>8.0f}{s['p99_ms']:>8.0f}{s['max_ms']:>8.0f}"
+        )
+        if s["error_kinds"]:
+            lines.append(f"{'':<28}errors: {s['error_kinds']}")
+    return "\n".join(lines)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+async def _run_async(args, base_url: str) -> Dict[str, Any]:
+    import httpx
+
+    mix = load_mix(args.mix)
+    if args.sweep:
+        levels = [float(v) for v in args.sweep.split(",")]
+    elif args.rate:
+        levels = [args.rate]
+    else:
+        levels = [args.concurrency]
+
+    open_loop = bool(args.rate) or args.model == "open"
+    steps = []
+
+    for level in levels:
+        connections = int(args.max_in_flight if open_loop else level)
+        limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+        async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+            if open_loop:
+                report = await run_open_loop(
+                    client, mix, rate=level, duration=args.duration, warmup=args.warmup,
+                    max_in_flight=args.max_in_flight, seed=args.seed
+                )
+            else:
+                report = await run_closed_loop(
+                    client, mix, concurrency=int(level), duration=args.duration, warmup=args.warmup,
+                    think_time_ms=args.think_time_ms, seed=args.seed
+                )
+        print("\n" + format_report(report))
+        steps.append(report)
+
+    result: Dict[str, Any] = {"url": base_url, "steps": steps}
+    if len(steps) > 1 or args.sweep:
+        saturation = find_saturation(steps, args.slo_ms, args.max_error_rate)
+        result["saturation"] = saturation
+        per_recruiter_rps = args.recruiter_rpm / 60.0
+        recruiters = int(saturation["saturation_rps"] / per_recruiter_rps) if per_recruiter_rps > 0 else 0
+        result["recruiters_per_worker"] = recruiters
+        print("\n" + "=" * 80)
+        print(f"Saturation throughput: {saturation['saturation_rps']:.2f} req/s "
+              f"(p95 <= {args.slo_ms:.0f}ms, errors <= {args.max_error_rate:.1%}) at {saturation['step']}")
+        print(f"≈ {recruiters} recruiters per worker at {args.recruiter_rpm} requests/min each")
+        print("=" * 80)
+
+    return result
+
+
+def run(args) -> Dict[str, Any]:
+    process = spawn_server(args) if args.spawn else None
+    base_url = f"http://127.0.0.1:{args.port}" if args.spawn else args.url
+    try:
+        result = asyncio.run(_run_async(args, base_url))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"\n✓ Report written to {args.output}")
+    return result
+
+
+def _add_stand_in_options(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("stand-ins")
+    group.add_argument("--corpus-size", type=int, default=2000, help="Synthetic applicants in local Qdrant")
+    group.add_argument("--dim", type=int, default=3072, help="Embedding dimension")
+    group.add_argument("--gemini-embed-latency", default="lognormal:300,0.3", help="Latency spec for embed_content")
+    group.add_argument("--gemini-generate-latency", default="lognormal:700,0.3", help="Latency spec for query parsing")
+    group.add_argument("--openai-latency", default="lognormal:900,0.3", help="Latency spec for the OpenAI fallback")
+    group.add_argument("--qdrant-latency", default="const:40", help="Latency spec per Qdrant call")
+    group.add_argument("--gemini-error-rate", type=float, default=0.0, help="Fraction of Gemini calls that fail")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Load-test the candidate search API")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = sub.add_parser("serve", help="Serve the API wired to local stand-ins")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    _add_stand_in_options(serve_parser)
+
+    run_parser = sub.add_parser("run", help="Generate load against the API")
+    run_parser.add_argument("--url", default="http://localhost:8000", help="API base URL")
+    run_parser.add_argument("--spawn", action="store_true", help="Start a stand-in API subprocess")
+    run_parser.add_argument("--port", type=int, default=8765, help="Port for --spawn")
+    run_parser.add_argument("--startup-timeout", type=float, default=120.0)
+    run_parser.add_argument("--model", choices=["closed", "open"], default="closed")
+    run_parser.add_argument("--concurrency", type=int, default=4, help="Closed-loop virtual recruiters")
+    run_parser.add_argument("--rate", type=float, help="Open-loop arrival rate (req/s)")
+    run_parser.add_argument("--sweep", help="Comma-separated concurrency levels (or rates with --model open)")
+    run_parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds per step")
+    run_parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured seconds before each step")
+    run_parser.add_argument("--think-time-ms", type=float, default=0.0)
+    run_parser.add_argument("--max-in-flight", type=int, default=256)
+    run_parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout (s)")
+    run_parser.add_argument("--mix", help="JSON query mix file")
+    run_parser.add_argument("--slo-ms", type=float, default=2000.0, help="p95 target for saturation")
+    run_parser.add_argument("--max-error-rate", type=float, default=0.01)
+    run_parser.add_argument("--recruiter-rpm", type=float, default=2.0, help="Requests per minute per recruiter")
+    run_parser.add_argument("--seed", type=int, default=7)
+    run_parser.add_argument("--output", help="Write JSON report here")
+    _add_stand_in_options(run_parser)
+
+    return parser
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    cli_args = build_arg_parser().parse_args()
+
+    try:
+        if cli_args.command == "serve":
+            serve(cli_args)
+        else:
+            run(cli_args)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
@@ -0,0 +1,170 @@
+"""
+Recall Harness for Truncated-Vector Retrieval
+Measures recall@k and latency of two-stage search (truncated vectors, then
+rescoring on the full vectors) against exact full-dimension search.
+
+Usage:
+    # Against the live collection, with logged Gemini query vectors
+    python3 scripts/benchmarks/recall_harness.py --query-log logs/queries.jsonl --dims 256 768 --rescore 100 300
+
+    # Offline, against an in-process stand-in collection
+    python3 scripts/benchmarks/recall_harness.py --stand-in 3000 --dim 3072 --dims 256 768
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+# Add scripts directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.query_log import read_query_log, decode_embedding
+from core.truncated_vectors import truncate, truncated_vector_name
+from benchmarks.load_test import percentile
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "applicants_unified"
+
+
+def sample_point_queries(client, collection: str, vector_name: str, count: int, seed: int = 42) -> List[List[float]]:
+    """Stored vectors of random points, used as queries when no query log is available"""
+    points, _ = client.scroll(collection, limit=max(count * 5, 100), with_vectors=[vector_name], with_payload=False)
+    rng = np.random.default_rng(seed)
+    chosen = rng.choice(len(points), size=min(count, len(points)), replace=False)
+    return [list(points[i].vector[vector_name]) for i in chosen]
+
+
+def logged_queries(path: str, dim: int = 3072, limit: Optional[int] = None) -> List[List[float]]:
+    """Gemini query vectors stored in a query log"""
+    vectors = []
+    for record in read_query_log(path):
+        if record.get("embedding_b64") and record.get("embedding_dim") == dim:
+            vectors.append(decode_embedding(record["embedding_b64"]))
+    return vectors[:limit] if limit else vectors
+
+
+def measure_recall(
+    client,
+    queries: List[List[float]],
+    dims: List[int],
+    rescore_limits: List[int],
+    k: int = 10,
+    vector_name: str = "resume",
+    collection: str = COLLECTION_NAME
+) -> Dict[str, Any]:
+    """
+    recall@k and latency per configuration, relative to exact full-dimension search
+
+    Configurations: "full" (HNSW, full vectors), "{dim}" (truncated only, no
+    rescoring) and "{dim}+rescore{n}" (truncated, top n rescored on full vectors).
+    """
+    from qdrant_client.models import Prefetch, SearchParams
+
+    def run(**kwargs):
+        started = time.perf_counter()
+        points = client.query_points(collection_name=collection, limit=k, with_payload=False, **kwargs).points
+        return [point.id for point in points], (time.perf_counter() - started) * 1000
+
+    configs = {"full": lambda q: run(query=q, using=vector_name)}
+    for dim in dims:
+        truncated_name = truncated_vector_name(vector_name, dim)
+        configs[str(dim)] = lambda q, dim=dim, name=truncated_name: run(query=truncate(q, dim), using=name)
+        for rescore in rescore_limits:
+            configs[f"{dim}+rescore{rescore}"] = lambda q, dim=dim, name=truncated_name, rescore=rescore: run(
+                prefetch=Prefetch(query=truncate(q, dim), using=name, limit=rescore),
+                query=q,
+                using=vector_name
+            )
+
+    recalls = {name: [] for name in configs}
+    latencies = {name: [] for name in configs}
+    for query in queries:
+        truth, _ = run(query=query, using=vector_name, search_params=SearchParams(exact=True))
+        truth = set(truth)
+        for name, search in configs.items():
+            ids, latency_ms = search(query)
+            recalls[name].append(len(truth & set(ids)) / max(1, len(truth)))
+            latencies[name].append(latency_ms)
+
+    full_dim = len(queries[0]) if queries else 0
+    results = {}
+    for name in configs:
+        dim = int(name.split("+")[0]) if name != "full" else full_dim
+        results[name] = {
+            f"recall@{k}": round(float(np.mean(recalls[name])), 4) if queries else None,
+            "p50_ms": round(percentile(latencies[name], 50), 2) if queries else None,
+            "p95_ms": round(percentile(latencies[name], 95), 2) if queries else None,
+            "hnsw_dim": dim,
+            "memory_ratio": round(full_dim / dim, 1) if dim else None,
+        }
+    return {"k": k, "vector": vector_name, "queries": len(queries), "configs": results}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    k = report["k"]
+    lines = [
+        f"Recall vs exact full-dimension search ({report['queries']} queries, vector '{report['vector']}')",
+        f"{'config':<22}{'recall@' + str(k):>10}{'p50 ms':>9}{'p95 ms':>9}{'HNSW dim':>10}{'RAM x':>7}",
+    ]
+    for name, row in report["configs"].items():
+        lines.append(
+            f"{name:<22}{row[f'recall@{k}']:>10.3f}{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}"
+            f"{row['hnsw_dim']:>10}{row['memory_ratio']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="recall@k of truncated two-stage search vs exact search")
+    parser.add_argument("--dims", type=int, nargs="+", default=[256, 768], help="Truncated dims to evaluate")
+    parser.add_argument("--rescore", type=int, nargs="+", default=[100, 300], help="Rescore limits")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--vector", default="resume", help="Named vector (resume, skills, tasks)")
+    parser.add_argument("--queries", type=int, default=100, help="Number of queries")
+    parser.add_argument("--query-log", help="Use Gemini query vectors stored in this query log")
+    parser.add_argument("--collection", default=COLLECTION_NAME)
+    parser.add_argument("--stand-in", type=int, metavar="N", help="Build an in-process collection of N synthetic applicants")
+    parser.add_argument("--dim", type=int, default=3072, help="Stand-in full vector dim")
+    parser.add_argument("--output", help="Write the report JSON here")
+    args = parser.parse_args()
+
+    if args.stand_in:
+        from benchmarks.stand_ins import build_synthetic_corpus, create_local_qdrant
+        client = create_local_qdrant(
+            build_synthetic_corpus(args.stand_in, args.dim), collection_name=args.collection, truncated_dims=args.dims
+        )
+    else:
+        from core.load_env import load_env
+        from core.qdrant_factory import get_qdrant_client
+        load_env()
+        client = get_qdrant_client()
+
+    if args.query_log:
+        queries = logged_queries(args.query_log, limit=args.queries)
+    else:
+        queries = sample_point_queries(client, args.collection, args.vector, args.queries)
+    if not queries:
+        logger.error("❌ No query vectors (QUERY_LOG_EMBEDDINGS=hash, or an empty collection?)")
+        return 1
+
+    report = measure_recall(client, queries, args.dims, args.rescore, args.k, args.vector, args.collection)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
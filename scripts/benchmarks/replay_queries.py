@@ -0,0 +1,304 @@
+"""
+Deterministic Query Replay for Performance Regression Testing
+Re-runs a captured query log (QUERY_LOG_PATH) against any engine configuration
+using the recorded parses and embeddings, so no LLM or embedding API is called.
+
+Usage:
+    # Replay a log against the current engine configuration
+    python3 scripts/benchmarks/replay_queries.py run --log logs/queries.jsonl --output baseline.json
+
+    # Replay with different engine settings / collection
+    python3 scripts/benchmarks/replay_queries.py run --log logs/queries.jsonl \\
+        --collection applicants_unified_v2 --search-kwargs '{"limit": 50}' --output candidate.json
+
+    # Compare latency and result sets (runs or the raw log itself)
+    python3 scripts/benchmarks/replay_queries.py diff baseline.json candidate.json
+    python3 scripts/benchmarks/replay_queries.py diff logs/queries.jsonl candidate.json
+"""
+import os
+import sys
+import json
+import copy
+import time
+import argparse
+import logging
+from typing import List, Dict, Any, Optional
+
+# Add scripts directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.query_log import read_query_log, decode_embedding
+from benchmarks.load_test import percentile
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+def replay(
+    engine,
+    records: List[Dict[str, Any]],
+    search_kwargs: Optional[Dict[str, Any]] = None,
+    repeat: int = 1
+) -> Dict[str, Any]:
+    """
+    Re-run logged searches against `engine` with their recorded embeddings
+
+    Args:
+        engine: IntelligentSearchEngine (or compatible) instance
+        records: Query log records from read_query_log()
+        search_kwargs: Overrides passed to engine.search() (limit, enable_reranking, ...)
+        repeat: Run each query this many times and keep the fastest (reduces noise)
+
+    Returns:
+        Run dict with per-query latency and ranked result ids
+    """
+    search_kwargs = dict(search_kwargs or {})
+    replayed = []
+    skipped = 0
+
+    for index, record in enumerate(records):
+        if not record.get("embedding_b64"):
+            skipped += 1
+            continue
+
+        query_vector = decode_embedding(record["embedding_b64"])
+        options = {**record.get("options", {}), **search_kwargs}
+        limit = options.pop("limit", 20)
+        enable_reranking = options.pop("enable_reranking", True)
+
+        best = None
+        for _ in range(max(1, repeat)):
+            trace: Dict[str, Any] = {}
+            started = time.perf_counter()
+            results = engine.search(
+                copy.deepcopy(record["parsed_query"]),
+                limit=limit,
+                enable_reranking=enable_reranking,
+                query_vector=query_vector,
+                trace=trace,
+                **options
+            )
+            wall_ms = (time.perf_counter() - started) * 1000
+            if best is None or wall_ms < best[0]:
+                best = (wall_ms, results, trace)
+
+        wall_ms, results, trace = best
+        replayed.append({
+            "index": index,
+            "query": record.get("query"),
+            "engine_ms": round(wall_ms, 2),
+            "timings_ms": {k: round(v, 2) for k, v in trace.get("timings", {}).items()},
+            "results": [
+                {"id": candidate["id"], "score": round(float(candidate["final_score"]), 6)}
+                for candidate in results
+            ],
+        })
+
+    if skipped:
+        logger.warning(f"⚠ Skipped {skipped} records without stored embeddings (QUERY_LOG_EMBEDDINGS=hash)")
+
+    return {
+        "created_at": time.time(),
+        "search_kwargs": search_kwargs,
+        "collection": getattr(engine, "COLLECTION_NAME", None),
+        "skipped": skipped,
+        "records": replayed,
+    }
+
+
+def log_as_run(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """View a raw query log as a run, using its recorded engine timings"""
+    replayed = []
+    for index, record in enumerate(records):
+        timings = record.get("timings_ms", {})
+        engine_ms = timings.get("total_ms", 0.0) - timings.get("embed_ms", 0.0)
+        replayed.append({
+            "index": index,
+            "query": record.get("query"),
+            "engine_ms": round(engine_ms, 2),
+            "timings_ms": timings,
+            "results": record.get("results", []),
+        })
+    return {"source": "query_log", "records": replayed}
+
+
+def load_run(path: str) -> Dict[str, Any]:
+    """Load a run JSON file, or a query log (.jsonl) viewed as a run"""
+    if path.endswith(".jsonl") or ".jsonl." in path:
+        return log_as_run(list(read_query_log(path)))
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ============================================================================
+# DIFF
+# ============================================================================
+
+def overlap_at_k(a: List[Any], b: List[Any], k: int) -> float:
+    """Fraction of the top-k ids shared by two rankings"""
+    top_a, top_b = set(a[:k]), set(b[:k])
+    denominator = min(k, max(len(top_a), len(top_b)))
+    if denominator == 0:
+        return 1.0
+    return len(top_a & top_b) / denominator
+
+
+def diff_runs(baseline: Dict[str, Any], candidate: Dict[str, Any], k: int = 10, worst: int = 5) -> Dict[str, Any]:
+    """
+    Compare two runs query by query (aligned on log index)
+
+    Returns latency percentiles for both sides, mean overlap@1/@k, the share
+    of queries with identical rankings and the queries that changed most.
+    """
+    base_by_index = {r["index"]: r for r in baseline["records"]}
+    pairs = [(base_by_index[r["index"]], r) for r in candidate["records"] if r["index"] in base_by_index]
+
+    def latency_stats(values: List[float]) -> Dict[str, float]:
+        return {
+            "mean_ms": round(sum(values) / len(values), 2) if values else 0.0,
+            "p50_ms": round(percentile(values, 50), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+        }
+
+    base_latency = latency_stats([b["engine_ms"] for b, _ in pairs])
+    cand_latency = latency_stats([c["engine_ms"] for _, c in pairs])
+
+    per_query = []
+    for b, c in pairs:
+        ids_b = [r["id"] for r in b["results"]]
+        ids_c = [r["id"] for r in c["results"]]
+        per_query.append({
+            "index": b["index"],
+            "query": b.get("query"),
+            "overlap_at_1": overlap_at_k(ids_b, ids_c, 1),
+            "overlap_at_k": overlap_at_k(ids_b, ids_c, k),
+            "identical": ids_b == ids_c,
+            "latency_delta_ms": round(c["engine_ms"] - b["engine_ms"], 2),
+        })
+
+    count = len(per_query) or 1
+    return {
+        "queries_compared": len(per_query),
+        "k": k,
+        "latency": {
+            "baseline": base_latency,
+            "candidate": cand_latency,
+            "p50_change_pct": _pct_change(base_latency["p50_ms"], cand_latency["p50_ms"]),
+            "p95_change_pct": _pct_change(base_latency["p95_ms"], cand_latency["p95_ms"]),
+        },
+        "results": {
+            "mean_overlap_at_1": round(sum(q["overlap_at_1"] for q in per_query) / count, 4),
+            f"mean_overlap_at_{k}": round(sum(q["overlap_at_k"] for q in per_query) / count, 4),
+            "identical_rankings": round(sum(q["identical"] for q in per_query) / count, 4),
+        },
+        "most_changed": sorted(per_query, key=lambda q: (q["overlap_at_k"], q["overlap_at_1"]))[:worst],
+    }
+
+
+def _pct_change(before: float, after: float) -> Optional[float]:
+    if not before:
+        return None
+    return round((after - before) / before * 100, 1)
+
+
+def format_diff(report: Dict[str, Any]) -> str:
+    latency = report["latency"]
+    results = report["results"]
+    k = report["k"]
+    lines = [
+        f"Queries compared: {report['queries_compared']}",
+        "",
+        f"{'Latency (engine)':<20}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}",
+    ]
+    for side in ("baseline", "candidate"):
+        s = latency[side]
+        lines.append(f"{side:<20}{s['mean_ms']:>10.1f}{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['p99_ms']:>10.1f}")
+    lines.append(f"p50 change: {latency['p50_change_pct']}%   p95 change: {latency['p95_change_pct']}%")
+    lines.append("")
+    lines.append(f"Mean overlap@1:  {results['mean_overlap_at_1']:.3f}")
+    lines.append(f"Mean overlap@{k}: {results[f'mean_overlap_at_{k}']:.3f}")
+    lines.append(f"Identical rankings: {results['identical_rankings']:.1%}")
+    if report["most_changed"]:
+        lines.append("")
+        lines.append("Most changed queries:")
+        for q in report["most_changed"]:
+            lines.append(f"  [{q['index']}] overlap@{k}={q['overlap_at_k']:.2f} Δ{q['latency_delta_ms']:+.1f}ms  {q['query']}")
+    return "\n".join(lines)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def _build_engine(args):
+    from core.load_env import load_env
+    from core.intelligent_search import IntelligentSearchEngine
+
+    load_env()
+    # Recorded embeddings are always supplied, so Gemini is never called;
+    # the engine still requires a key at construction time.
+    engine = IntelligentSearchEngine(
+        qdrant_url=args.qdrant_url,
+        gemini_api_key=os.getenv("GEMINI_API_KEY") or "replay-unused"
+    )
+    if args.collection:
+        engine.COLLECTION_NAME = args.collection
+    return engine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay captured queries and diff runs")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Replay a query log against the engine")
+    run_parser.add_argument("--log", required=True, help="Query log path (QUERY_LOG_PATH)")
+    run_parser.add_argument("--output", required=True, help="Where to write the run JSON")
+    run_parser.add_argument("--qdrant-url", help="Override QDRANT_URL")
+    run_parser.add_argument("--collection", help="Override the engine collection name")
+    run_parser.add_argument("--search-kwargs", default="{}", help="JSON overrides for engine.search()")
+    run_parser.add_argument("--max-records", type=int, help="Replay only the first N records")
+    run_parser.add_argument("--repeat", type=int, default=1, help="Runs per query (fastest kept)")
+
+    diff_parser = sub.add_parser("diff", help="Compare two runs (or a log and a run)")
+    diff_parser.add_argument("baseline")
+    diff_parser.add_argument("candidate")
+    diff_parser.add_argument("--k", type=int, default=10)
+    diff_parser.add_argument("--output", help="Write the diff JSON here")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        records = list(read_query_log(args.log))
+        if args.max_records:
+            records = records[:args.max_records]
+        logger.info(f"Replaying {len(records)} logged queries...")
+
+        engine = _build_engine(args)
+        # Per-step engine logging would dominate replay timings
+        logging.getLogger("core.intelligent_search").setLevel(logging.WARNING)
+
+        run_result = replay(engine, records, json.loads(args.search_kwargs), repeat=args.repeat)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(run_result, f, indent=2)
+        logger.info(f"✓ Replayed {len(run_result['records'])} queries → {args.output}")
+    else:
+        report = diff_runs(load_run(args.baseline), load_run(args.candidate), k=args.k)
+        print(format_diff(report))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
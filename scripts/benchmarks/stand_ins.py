@@ -0,0 +1,448 @@
+"""
+Local Stand-ins for Gemini, OpenAI and Qdrant
+Lets the API run offline with injectable latency for load and replay testing
+"""
+import re
+import json
+import time
+import random
+import hashlib
+import logging
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# LATENCY MODELS
+# ============================================================================
+
+class LatencyModel:
+    """
+    Latency distribution sampled before every stand-in call.
+
+    Spec strings (all values in milliseconds):
+        "0" or "none"          - no added latency
+        "const:50"             - fixed 50 ms
+        "uniform:20,80"        - uniform between 20 and 80 ms
+        "normal:100,20"        - normal with mean 100, stddev 20 (clipped at 0)
+        "lognormal:300,0.4"    - lognormal with median 300 and sigma 0.4
+    """
+
+    KINDS = ("const", "uniform", "normal", "lognormal")
+
+    def __init__(self, kind: str = "const", params: Optional[List[float]] = None, seed: Optional[int] = None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        self.kind = kind
+        self.params = params or [0.0]
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def parse(cls, spec: Optional[str], seed: Optional[int] = None) -> "LatencyModel":
+        """Build a latency model from a spec string"""
+        if not spec or spec.strip().lower() in ("0", "none"):
+            return cls("const", [0.0], seed)
+
+        if ":" not in spec:
+            return cls("const", [float(spec)], seed)
+
+        kind, raw = spec.split(":", 1)
+        params = [float(v) for v in raw.split(",") if v.strip()]
+
+        expected = {"const": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        kind = kind.strip().lower()
+        if kind not in expected:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        if len(params) != expected[kind]:
+            raise ValueError(f"'{kind}' latency needs {expected[kind]} parameter(s), got {len(params)}")
+
+        return cls(kind, params, seed)
+
+    def sample_ms(self) -> float:
+        """Draw one latency value in milliseconds"""
+        if self.kind == "const":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = self._rng.uniform(self.params[0], self.params[1])
+        elif self.kind == "normal":
+            value = self._rng.gauss(self.params[0], self.params[1])
+        else:
+            median, sigma = self.params
+            value = median * np.exp(self._rng.gauss(0.0, sigma)) if median > 0 else 0.0
+        return max(0.0, float(value))
+
+    def sleep(self) -> None:
+        """Block for one sampled latency"""
+        delay = self.sample_ms()
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+    def __repr__(self) -> str:
+        return f"LatencyModel({self.kind}:{','.join(str(p) for p in self.params)})"
+
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+TOPICS = [
+    ("Civil Engineer", ["AutoCAD", "Revit", "SketchUp", "Structural Design", "Project Management"]),
+    ("Python Developer", ["Python", "Django", "FastAPI", "SQL", "Docker"]),
+    ("Frontend Developer", ["JavaScript", "React", "TypeScript", "CSS", "Node.js"]),
+    ("Marketing Specialist", ["SEO", "Content Marketing", "Google Analytics", "Canva", "Social Media"]),
+    ("Mortgage Underwriter", ["Underwriting", "Credit Analysis", "Excel", "Loan Processing", "Compliance"]),
+    ("Virtual Assistant", ["Email Management", "Excel", "Data Entry", "Scheduling", "Customer Service"]),
+    ("Graphic Designer", ["Photoshop", "Illustrator", "Canva", "Figma", "Branding"]),
+    ("Accountant", ["QuickBooks", "Excel", "Bookkeeping", "Payroll", "Tax Preparation"]),
+]
+
+LOCATIONS = [
+    "Manila, Philippines",
+    "Quezon City, Philippines",
+    "Cebu City, Philippines",
+    "Davao City, Philippines",
+    "Makati, Philippines",
+]
+
+EDUCATION_LEVELS = ["Bachelor's Degree", "Master's Degree", "Associate's Degree", "Diploma/Vocational", "Not Specified"]
+
+COMPANIES = ["Accenture", "Google", "Microsoft", "Ayala Land", "Globe Telecom", "Concentrix", "SM Group", "Jollibee"]
+
+SENIORITY = ["", "Senior ", "Junior ", "Lead "]
+
+
+def _topic_vector(topic_index: int, dim: int) -> np.ndarray:
+    vector = np.random.default_rng(10_000 + topic_index).standard_normal(dim)
+    return vector / np.linalg.norm(vector)
+
+
+def text_embedding(text: str, dim: int = 3072) -> List[float]:
+    """
+    Deterministic unit vector for a text (same text -> same vector)
+
+    Texts that mention a synthetic topic (job title or one of its skills)
+    land near that topic's centroid, so fake query embeddings retrieve
+    the matching synthetic applicants.
+    """
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+    vector = 0.3 * np.random.default_rng(seed).standard_normal(dim) / np.sqrt(dim)
+
+    lower = text.lower()
+    for topic_index, (title, skills) in enumerate(TOPICS):
+        words = [title.lower().split()[0]] + [skill.lower() for skill in skills]
+        if any(word in lower for word in words):
+            vector = vector + _topic_vector(topic_index, dim)
+
+    return (vector / np.linalg.norm(vector)).astype(np.float32).tolist()
+
+
+def build_synthetic_corpus(count: int = 2000, dim: int = 3072, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Generate applicant records shaped like applicants_with_embeddings_clean.json
+
+    Each applicant is drawn from a topic so that topic queries retrieve
+    topic applicants, which keeps result sets realistic for benchmarks.
+    """
+    rng = np.random.default_rng(seed)
+    now = int(time.time())
+    topic_vectors = [_topic_vector(i, dim) for i in range(len(TOPICS))]
+
+    records = []
+    for i in range(count):
+        topic_index = int(rng.integers(len(TOPICS)))
+        title, skills = TOPICS[topic_index]
+        chosen = [s for s in skills if rng.random() < 0.7] or skills[:1]
+        years = round(float(rng.gamma(2.0, 3.0)), 1)
+        companies = list(rng.choice(COMPANIES, size=2, replace=False))
+        job_title = f"{SENIORITY[int(rng.integers(len(SENIORITY)))]}{title}"
+        location = LOCATIONS[int(rng.integers(len(LOCATIONS)))]
+
+        embeddings = {}
+        for field, noise in (("resume", 0.9), ("skills", 0.7), ("tasks", 1.1)):
+            vector = topic_vectors[topic_index] + noise * rng.standard_normal(dim) / np.sqrt(dim)
+            embeddings[field] = (vector / np.linalg.norm(vector)).astype(np.float32).tolist()
+
+        skills_text = ", ".join(chosen)
+        records.append({
+            "id": f"synthetic-{i}",
+            "full_name": f"Applicant {i}",
+            "email": f"applicant{i}@example.com",
+            "job_title": job_title,
+            "current_stage": "Applied",
+            "education_level": EDUCATION_LEVELS[int(rng.integers(len(EDUCATION_LEVELS)))],
+            "total_years_experience": years,
+            "longest_tenure_years": round(years * float(rng.uniform(0.2, 0.8)), 1),
+            "current_company": companies[0],
+            "company_names": ", ".join(companies),
+            "location": location,
+            "skills_extracted": skills_text,
+            "tasks_summary": f"Worked as {job_title} using {skills_text}.",
+            "work_history_text": f"{companies[0]} - {job_title}; {companies[1]} - {title}",
+            "resume_full_text": (
+                f"Applicant {i}\n{location}\n\n{job_title} with {years} years of experience.\n"
+                f"Skills: {skills_text}.\nExperience at {', '.join(companies)}."
+            ),
+            "resume_url": "",
+            "date_applied": now - int(rng.integers(0, 365 * 86400)),
+            "embedding_resume": embeddings["resume"],
+            "embedding_skills": embeddings["skills"],
+            "embedding_tasks": embeddings["tasks"],
+        })
+
+    return records
+
+
+def synthetic_queries() -> List[str]:
+    """Natural language queries that hit the synthetic topics"""
+    return [
+        "Senior civil engineer in Manila with AutoCAD, 5+ years",
+        "Python developer with Django and FastAPI",
+        "Frontend developer who knows React and TypeScript",
+        "Marketing specialist with SEO skills in Cebu",
+        "Mortgage underwriters with 3+ years",
+        "Virtual assistant with Excel and data entry",
+        "Graphic designer with Photoshop and Figma",
+        "Accountant with QuickBooks, bachelor's degree",
+    ]
+
+
+# ============================================================================
+# GEMINI / OPENAI STAND-INS
+# ============================================================================
+
+_KNOWN_SKILLS = sorted({skill for _, skills in TOPICS for skill in skills}, key=len, reverse=True)
+
+
+def rule_parse(query: str) -> Dict[str, Any]:
+    """Cheap deterministic parse in the GeminiQueryParser output format"""
+    lower = query.lower()
+    filters: Dict[str, Any] = {
+        "min_experience": None,
+        "max_experience": None,
+        "location": None,
+        "education_level": None,
+        "required_skills": None,
+        "seniority_keywords": None,
+        "desired_job_titles": None,
+        "target_companies": None,
+        "application_date": None,
+    }
+
+    years = re.search(r"(\d+(?:\.\d+)?)\s*\+?\s*(?:years|yrs)", lower)
+    if years:
+        filters["min_experience"] = float(years.group(1))
+
+    for location in LOCATIONS:
+        city = location.split(",")[0].lower().replace(" city", "")
+        if city in lower:
+            filters["location"] = location
+            break
+
+    skills = [skill for skill in _KNOWN_SKILLS if skill.lower() in lower]
+    if skills:
+        filters["required_skills"] = skills
+
+    seniority = [level for level in ("senior", "junior", "lead") if level in lower]
+    if seniority:
+        filters["seniority_keywords"] = seniority
+
+    return {"search_intent": query, "filters": filters}
+
+
+def _extract_query_from_prompt(prompt: str) -> str:
+    """Pull the natural query back out of GeminiQueryParser._build_prompt()"""
+    match = re.search(r'Now parse this query:\s*"(.*)"', prompt, re.DOTALL)
+    return match.group(1) if match else prompt
+
+
+class _FakeGeminiModels:
+    def __init__(self, owner: "FakeGeminiClient"):
+        self._owner = owner
+
+    def embed_content(self, model: str, contents, config=None):
+        owner = self._owner
+        owner.embed_latency.sleep()
+        owner._maybe_fail("embed_content")
+        texts = [contents] if isinstance(contents, str) else list(contents)
+        return SimpleNamespace(embeddings=[
+            SimpleNamespace(values=text_embedding(text, owner.dim)) for text in texts
+        ])
+
+    def generate_content(self, model: str, contents, config=None):
+        owner = self._owner
+        owner.generate_latency.sleep()
+        owner._maybe_fail("generate_content")
+        query = _extract_query_from_prompt(contents if isinstance(contents, str) else str(contents))
+        return SimpleNamespace(text=json.dumps(rule_parse(query)))
+
+    def get(self, model: str, config=None):
+        return SimpleNamespace(name=model)
+
+
+class FakeGeminiClient:
+    """Drop-in for google.genai.Client (embed_content, generate_content, get)"""
+
+    def __init__(
+        self,
+        embed_latency: Optional[LatencyModel] = None,
+        generate_latency: Optional[LatencyModel] = None,
+        dim: int = 3072,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.embed_latency = embed_latency or LatencyModel()
+        self.generate_latency = generate_latency or LatencyModel()
+        self.dim = dim
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.models = _FakeGeminiModels(self)
+
+    def _maybe_fail(self, operation: str) -> None:
+        if self.error_rate and self._rng.random() < self.error_rate:
+            raise RuntimeError(f"Injected Gemini {operation} failure")
+
+
+class _FakeCompletions:
+    def __init__(self, owner: "FakeOpenAIClient"):
+        self._owner = owner
+
+    def create(self, model: str, messages: List[Dict[str, str]], **kwargs):
+        self._owner.latency.sleep()
+        prompt = messages[-1]["content"] if messages else ""
+        content = json.dumps(rule_parse(_extract_query_from_prompt(prompt)))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeOpenAIClient:
+    """Drop-in for openai.OpenAI (chat.completions.create, models.retrieve)"""
+
+    def __init__(self, latency: Optional[LatencyModel] = None):
+        self.latency = latency or LatencyModel()
+        self.chat = SimpleNamespace(completions=_FakeCompletions(self))
+        self.models = SimpleNamespace(retrieve=lambda model, **kwargs: SimpleNamespace(id=model))
+
+
+class FakeSentenceModel:
+    """
+    Drop-in for a sentence_transformers.SentenceTransformer (hashed bag of words),
+    so texts sharing words get similar vectors without downloading a model
+    """
+
+    def __init__(self, dim: int = 64, latency: Optional[LatencyModel] = None):
+        self.dim = dim
+        self.latency = latency or LatencyModel()
+        self.calls = 0
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def encode(self, texts: List[str], batch_size: int = 32, normalize_embeddings: bool = False, **kwargs):
+        self.latency.sleep()
+        self.calls += 1
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in re.findall(r"[a-z0-9+#]+", text.lower()):
+                digest = hashlib.md5(word.encode("utf-8")).digest()
+                vectors[row, int.from_bytes(digest[:4], "little") % self.dim] += 1.0
+            vectors[row, 0] += 1e-3  # empty texts still get a non-zero vector
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+# ============================================================================
+# QDRANT STAND-IN
+# ============================================================================
+
+class LatencyProxy:
+    """Wrap any client so every public method call pays a sampled latency"""
+
+    def __init__(self, target: Any, latency: Optional[LatencyModel] = None):
+        self._target = target
+        self._latency = latency or LatencyModel()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            self._latency.sleep()
+            return attribute(*args, **kwargs)
+
+        return call
+
+
+def build_payload(applicant: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload create_unified_collection.upload_data() writes (its applicant_payload)"""
+    from migrations.create_unified_collection import applicant_payload
+
+    return applicant_payload(applicant)
+
+
+def create_local_qdrant(
+    records: List[Dict[str, Any]],
+    collection_name: str = "applicants_unified",
+    location: str = ":memory:",
+    local_embedder: Optional[Any] = None,
+    truncated_dims: Optional[List[int]] = None,
+    profile: bool = False
+):
+    """
+    Load records into an embedded (in-process) Qdrant collection (plus *_local
+    vectors with a local embedder, {name}_{dim} truncated copies and the profile vector)
+    """
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import Distance, VectorParams, PointStruct
+    from core.sparse_encoder import SparseEncoder, sparse_vectors_config
+    from core.local_embedder import local_vectors_config
+    from core.truncated_vectors import truncated_document_vectors, truncated_vectors_config
+    from core.intelligent_search import IntelligentSearchEngine
+
+    dim = len(records[0]["embedding_resume"]) if records else 3072
+    client = QdrantClient(location=location)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config={
+            **{name: VectorParams(size=dim, distance=Distance.COSINE) for name in ("resume", "skills", "tasks")},
+            **(local_vectors_config(local_embedder.dimension) if local_embedder is not None else {}),
+            **truncated_vectors_config(truncated_dims or []),
+            **({IntelligentSearchEngine.PROFILE_VECTOR: VectorParams(size=dim, distance=Distance.DOT)} if profile else {})
+        },
+        sparse_vectors_config=sparse_vectors_config()
+    )
+
+    payloads = [build_payload(applicant) for applicant in records]
+    sparse_encoder = SparseEncoder().fit(payloads)
+    local_vectors = local_embedder.document_vectors(payloads) if local_embedder is not None else [{}] * len(payloads)
+
+    batch = []
+    for i, applicant in enumerate(records):
+        dense = {
+            "resume": applicant["embedding_resume"],
+            "skills": applicant["embedding_skills"],
+            "tasks": applicant["embedding_tasks"],
+        }
+        batch.append(PointStruct(
+            id=i,
+            vector={
+                **dense,
+                **truncated_document_vectors(dense, truncated_dims or []),
+                **({IntelligentSearchEngine.PROFILE_VECTOR: IntelligentSearchEngine.profile_vector(dense)} if profile else {}),
+                **sparse_encoder.document_vectors(payloads[i]),
+                **local_vectors[i],
+            },
+            payload=payloads[i]
+        ))
+        if len(batch) >= 256:
+            client.upsert(collection_name=collection_name, points=batch)
+            batch = []
+    if batch:
+        client.upsert(collection_name=collection_name, points=batch)
+
+    logger.info(f"✓ Local Qdrant stand-in loaded with {len(records)} applicants ({dim}-dim)")
+    return client
@@ -9,36 +9,37 @@ Production-Ready Batch Processing for Applicant Data Extraction
 """
 
 import os
+import sys
 import json
 import csv
 import logging
 import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from openai import OpenAI, APIError, APITimeoutError, RateLimitError
 from pydantic import BaseModel, Field, ValidationError
 
-# Load environment
-import sys
-sys.path.append(os.path.dirname(__file__))
-from load_env import load_env
-load_env()
+# The OpenAI SDK is imported on first use so that importing this module
+# has no side effects (no .env loading, log files or API clients).
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('batch_processing.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
+def setup_logging(log_file: str = 'batch_processing.log') -> None:
+    """Log to batch_processing.log + console (called by the CLI, not on import)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+
 # ============================================================================
 # PYDANTIC MODELS FOR VALIDATION
 # ============================================================================
@@ -106,7 +107,21 @@ class Config:
         logger.info(f"Configuration loaded: model={self.openai_model}")
 
 
-config = Config()
+_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """Return the shared Config, creating (and validating) it on first use"""
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
+
+
+def _openai_client(timeout: float):
+    """Create an OpenAI client (SDK imported lazily)"""
+    from openai import OpenAI
+    return OpenAI(api_key=get_config().openai_api_key, timeout=timeout)
 
 
 # ============================================================================
@@ -207,6 +222,8 @@ def generate_batch_requests(
     """
     Generate JSONL file for OpenAI Batch API with error handling.
     """
+    config = get_config()
+
     logger.info("=" * 80)
     logger.info("GENERATING BATCH REQUESTS")
     logger.info("=" * 80)
@@ -305,6 +322,9 @@ def submit_batch_job(
     description: str = "Applicant data extraction"
 ) -> Optional[Dict]:
     """Submit batch job with retry logic"""
+    from openai import APIError, APITimeoutError, RateLimitError
+
+    config = get_config()
 
     logger.info("=" * 80)
     logger.info("SUBMITTING BATCH JOB")
@@ -314,10 +334,7 @@ def submit_batch_job(
         logger.error(f"JSONL file not found: {jsonl_file}")
         raise FileNotFoundError(f"JSONL file not found: {jsonl_file}")
 
-    client = OpenAI(
-        api_key=config.openai_api_key,
-        timeout=30.0  # 30 second timeout
-    )
+    client = _openai_client(timeout=30.0)  # 30 second timeout
 
     for attempt in range(config.max_retries):
         try:
@@ -382,7 +399,7 @@ def submit_batch_job(
 def check_batch_status(batch_id: str) -> Optional[Dict]:
     """Check batch status with error handling"""
 
-    client = OpenAI(api_key=config.openai_api_key, timeout=30.0)
+    client = _openai_client(timeout=30.0)
 
     try:
         batch = client.batches.retrieve(batch_id)
@@ -428,7 +445,7 @@ def download_batch_results(
 ) -> Optional[str]:
     """Download batch results with error handling"""
 
-    client = OpenAI(api_key=config.openai_api_key, timeout=60.0)
+    client = _openai_client(timeout=60.0)
 
     try:
         batch = client.batches.retrieve(batch_id)
@@ -635,6 +652,11 @@ def process_batch_results(
 if __name__ == "__main__":
     import argparse
 
+    sys.path.append(os.path.dirname(__file__))
+    from load_env import load_env
+    load_env()
+    setup_logging()
+
     parser = argparse.ArgumentParser(description="Production batch processing with full error handling")
     parser.add_argument("--generate", action="store_true", help="Generate batch requests")
     parser.add_argument("--submit", action="store_true", help="Submit batch job")
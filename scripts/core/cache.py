@@ -0,0 +1,84 @@
+"""
+In-Process TTL Cache
+Small thread-safe LRU with per-entry expiry, used for query parses and
+query embeddings so repeated recruiter searches skip the LLM/embedding calls.
+"""
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after `ttl_seconds`
+
+    Values are returned as stored; callers that mutate them should copy.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 600.0):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls, prefix: str, default_size: int = 1024, default_ttl: float = 600.0) -> Optional["TTLCache"]:
+        """
+        Build a cache from {prefix}_SIZE / {prefix}_TTL_SECONDS, or None when size is 0
+
+        Example: TTLCache.from_env("PARSE_CACHE") reads PARSE_CACHE_SIZE and PARSE_CACHE_TTL_SECONDS
+        """
+        size = int(os.getenv(f"{prefix}_SIZE", str(default_size)))
+        if size <= 0:
+            return None
+        return cls(size, float(os.getenv(f"{prefix}_TTL_SECONDS", str(default_ttl))))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,140 @@
+"""
+Collection Storage and Search Parameters
+Quantization, on-disk originals and HNSW settings for create_collection, and
+the per-request SearchParams (hnsw_ef, exact, quantization oversampling/rescore).
+
+Configuration (from .env):
+    QDRANT_QUANTIZATION            - "none" (default), "scalar" (int8) or "binary"
+    QDRANT_QUANTIZATION_ALWAYS_RAM - keep quantized vectors in RAM (default true)
+    QDRANT_ON_DISK_VECTORS         - store original float32 vectors on disk (default: on when quantized)
+    QDRANT_HNSW_M                  - HNSW edges per node (Qdrant default 16)
+    QDRANT_HNSW_EF_CONSTRUCT       - HNSW build beam width (Qdrant default 100)
+    SEARCH_HNSW_EF                 - default search beam width (unset = Qdrant default)
+    SEARCH_OVERSAMPLING            - default quantization oversampling (unset = Qdrant default)
+    SEARCH_RESCORE                 - default rescoring with original vectors (unset = Qdrant default)
+"""
+import os
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+QUANTIZATION_MODES = ("none", "scalar", "binary")
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name, "").strip()
+    return int(value) if value else None
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name, "").strip()
+    return float(value) if value else None
+
+
+def _env_bool(name: str, default: Optional[bool] = None) -> Optional[bool]:
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return default
+    return value in ("1", "true", "yes", "on")
+
+
+def quantization_config(mode: Optional[str] = None, always_ram: Optional[bool] = None):
+    """
+    QuantizationConfig for create_collection, or None
+
+    Args:
+        mode: "none", "scalar" (int8, ~4x smaller) or "binary" (~32x smaller);
+            defaults to QDRANT_QUANTIZATION
+        always_ram: Keep quantized vectors in RAM (defaults to QDRANT_QUANTIZATION_ALWAYS_RAM, else true)
+    """
+    from qdrant_client.models import (
+        ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+        BinaryQuantization, BinaryQuantizationConfig
+    )
+
+    mode = (mode or os.getenv("QDRANT_QUANTIZATION", "none")).lower()
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization '{mode}' (expected one of {list(QUANTIZATION_MODES)})")
+    always_ram = _env_bool("QDRANT_QUANTIZATION_ALWAYS_RAM", True) if always_ram is None else always_ram
+
+    if mode == "scalar":
+        return ScalarQuantization(scalar=ScalarQuantizationConfig(
+            type=ScalarType.INT8, quantile=0.99, always_ram=always_ram
+        ))
+    if mode == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=always_ram))
+    return None
+
+
+def quantization_update(mode: Optional[str] = None):
+    """
+    quantization_config for update_collection: the config, or Disabled when the
+    mode is "none" (None there would leave existing quantization in place)
+    """
+    from qdrant_client.models import Disabled
+
+    quantization = quantization_config(mode)
+    return quantization if quantization is not None else Disabled.DISABLED
+
+
+def hnsw_config(m: Optional[int] = None, ef_construct: Optional[int] = None):
+    """HnswConfigDiff from arguments or QDRANT_HNSW_M / QDRANT_HNSW_EF_CONSTRUCT, or None for defaults"""
+    from qdrant_client.models import HnswConfigDiff
+
+    m = m if m is not None else _env_int("QDRANT_HNSW_M")
+    ef_construct = ef_construct if ef_construct is not None else _env_int("QDRANT_HNSW_EF_CONSTRUCT")
+    if m is None and ef_construct is None:
+        return None
+    return HnswConfigDiff(m=m, ef_construct=ef_construct)
+
+
+def vectors_on_disk(quantized: bool) -> bool:
+    """Whether original vectors go on disk (QDRANT_ON_DISK_VECTORS, default: when quantized)"""
+    return _env_bool("QDRANT_ON_DISK_VECTORS", quantized)
+
+
+def collection_storage_kwargs(quantization: Optional[str] = None) -> Dict[str, Any]:
+    """quantization_config / hnsw_config kwargs for create_collection (only the ones set)"""
+    kwargs = {}
+    quantization = quantization_config(quantization)
+    if quantization is not None:
+        kwargs["quantization_config"] = quantization
+    hnsw = hnsw_config()
+    if hnsw is not None:
+        kwargs["hnsw_config"] = hnsw
+    return kwargs
+
+
+def search_params(
+    hnsw_ef: Optional[int] = None,
+    exact: bool = False,
+    oversampling: Optional[float] = None,
+    rescore: Optional[bool] = None
+):
+    """
+    SearchParams for query_points / Prefetch, or None when everything is default
+
+    Args:
+        hnsw_ef: HNSW search beam width (higher = better recall, slower)
+        exact: Brute-force search (ground truth for recall measurements)
+        oversampling: Fetch oversampling x limit candidates from the quantized index
+        rescore: Re-score those candidates with the original vectors
+    """
+    from qdrant_client.models import SearchParams, QuantizationSearchParams
+
+    quantization = None
+    if oversampling is not None or rescore is not None:
+        quantization = QuantizationSearchParams(oversampling=oversampling, rescore=rescore)
+    if hnsw_ef is None and not exact and quantization is None:
+        return None
+    return SearchParams(hnsw_ef=hnsw_ef, exact=exact, quantization=quantization)
+
+
+def default_search_settings() -> Dict[str, Any]:
+    """Engine defaults from SEARCH_HNSW_EF / SEARCH_OVERSAMPLING / SEARCH_RESCORE"""
+    return {
+        "hnsw_ef": _env_int("SEARCH_HNSW_EF"),
+        "oversampling": _env_float("SEARCH_OVERSAMPLING"),
+        "rescore": _env_bool("SEARCH_RESCORE"),
+    }
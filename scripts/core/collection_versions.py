@@ -0,0 +1,176 @@
+"""
+Blue/Green Collection Versions
+Rebuilds write into a fresh versioned collection (applicants_unified_v{n});
+the name searches use, "applicants_unified", is an alias switched atomically
+to the new version once it is indexed and passes a smoke search. Previous
+versions are kept for rollback (COLLECTION_VERSIONS_KEEP, default 2).
+
+Roll back with: python3 scripts/migrations/switch_collection_alias.py --rollback
+
+In-place writes (upserts, payload moves, replica syncs) bump the collection's
+`data_version` metadata instead, which invalidates cached results
+(core.result_cache).
+"""
+import os
+import re
+import time
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEEP = 2
+
+
+def versioned_name(alias: str, version: int) -> str:
+    return f"{alias}_v{version}"
+
+
+def list_versions(client, alias: str) -> List[int]:
+    """Version numbers of the existing {alias}_v{n} collections, ascending"""
+    pattern = re.compile(rf"^{re.escape(alias)}_v(\d+)$")
+    versions = []
+    for collection in client.get_collections().collections:
+        match = pattern.match(collection.name)
+        if match:
+            versions.append(int(match.group(1)))
+    return sorted(versions)
+
+
+def next_version_name(client, alias: str) -> str:
+    versions = list_versions(client, alias)
+    return versioned_name(alias, (versions[-1] + 1) if versions else 1)
+
+
+def resolve_alias(client, alias: str) -> Optional[str]:
+    """Collection the alias points to, or None (no alias of that name)"""
+    for description in client.get_aliases().aliases:
+        if description.alias_name == alias:
+            return description.collection_name
+    return None
+
+
+def wait_until_green(client, collection: str, timeout: float = 1800.0, poll: float = 2.0) -> None:
+    """
+    Block until the optimizers are done (status green)
+
+    Raises:
+        TimeoutError: Still yellow/grey after `timeout` seconds
+        RuntimeError: Status red (optimizer error)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        info = client.get_collection(collection)
+        status = str(info.status).lower()
+        if status.endswith("green"):
+            return
+        if status.endswith("red"):
+            raise RuntimeError(f"Collection '{collection}' is red: {getattr(info, 'optimizer_status', None)}")
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Collection '{collection}' still {status} after {timeout:.0f}s")
+        time.sleep(poll)
+
+
+def smoke_search(client, collection: str, min_points: int = 1, vector_name: str = "resume") -> int:
+    """
+    Check a new version before it goes live: enough points, and a stored
+    vector finds its own point
+
+    Returns:
+        Number of points
+
+    Raises:
+        RuntimeError: The collection fails the check
+    """
+    count = client.count(collection, exact=True).count
+    if count < min_points:
+        raise RuntimeError(f"Smoke search: '{collection}' has {count} points (expected >= {min_points})")
+
+    points, _ = client.scroll(collection, limit=1, with_vectors=[vector_name], with_payload=False)
+    if not points:
+        raise RuntimeError(f"Smoke search: '{collection}' returned no points")
+    probe = points[0]
+    hits = client.query_points(
+        collection_name=collection, query=probe.vector[vector_name], using=vector_name, limit=5, with_payload=False
+    ).points
+    if probe.id not in [hit.id for hit in hits]:
+        raise RuntimeError(f"Smoke search: point {probe.id} not found by its own '{vector_name}' vector in '{collection}'")
+    return count
+
+
+def switch_alias(client, alias: str, collection: str) -> Optional[str]:
+    """
+    Point `alias` at `collection` in one atomic alias update
+
+    A plain (pre-alias) collection named like the alias is dropped first; that
+    one-time migration has a short gap. Returns the previous target.
+    """
+    from qdrant_client.models import (
+        CreateAlias, CreateAliasOperation, DeleteAlias, DeleteAliasOperation
+    )
+
+    previous = resolve_alias(client, alias)
+    if previous is None and client.collection_exists(alias):
+        logger.warning(f"⚠ '{alias}' is a collection, not an alias - deleting it to create the alias (one-time)")
+        client.delete_collection(alias)
+
+    operations = []
+    if previous is not None:
+        operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+    operations.append(CreateAliasOperation(create_alias=CreateAlias(collection_name=collection, alias_name=alias)))
+    client.update_collection_aliases(change_aliases_operations=operations)
+    logger.info(f"✓ Alias '{alias}' -> '{collection}' (was: {previous or 'none'})")
+    return previous
+
+
+def rollback_target(client, alias: str) -> Optional[str]:
+    """Newest version older than the live one, or None"""
+    live = resolve_alias(client, alias)
+    versions = list_versions(client, alias)
+    if live is not None:
+        live_match = re.match(rf"^{re.escape(alias)}_v(\d+)$", live)
+        if live_match:
+            versions = [v for v in versions if v < int(live_match.group(1))]
+    return versioned_name(alias, versions[-1]) if versions and live is not None else None
+
+
+def prune_versions(client, alias: str, keep: Optional[int] = None) -> List[str]:
+    """
+    Delete old versions, keeping the live one plus the `keep` newest older ones
+    (COLLECTION_VERSIONS_KEEP); returns the deleted names
+
+    Versions newer than the live one (a failed or running build) are neither
+    deleted nor counted toward `keep`, so they never displace the rollback target.
+    """
+    keep = int(os.getenv("COLLECTION_VERSIONS_KEEP", str(DEFAULT_KEEP))) if keep is None else keep
+    live = resolve_alias(client, alias)
+    live_match = re.match(rf"^{re.escape(alias)}_v(\d+)$", live or "")
+    versions = list_versions(client, alias)
+    if live_match:
+        versions = [v for v in versions if v < int(live_match.group(1))]
+    others = [versioned_name(alias, v) for v in versions if versioned_name(alias, v) != live]
+    stale = others[:max(0, len(others) - keep)]
+    for name in stale:
+        client.delete_collection(name)
+        logger.info(f"  ✓ Deleted old version '{name}'")
+    return stale
+
+
+def bump_data_version(client, collection: str) -> Optional[int]:
+    """
+    Mark in-place data changes: sets the collection's data_version metadata to now (ns)
+
+    Collection metadata needs Qdrant 1.16+. If the update fails the write that
+    called this still stands: a warning is logged and None returned, and
+    cached results can then lag the data by up to RESULT_CACHE_TTL_SECONDS.
+    """
+    version = time.time_ns()
+    try:
+        client.update_collection(collection_name=collection, metadata={"data_version": version})
+    except Exception as e:
+        logger.warning(
+            f"⚠ Could not bump data_version of '{collection}' (collection metadata needs Qdrant 1.16+): {e} "
+            f"- cached results may be stale until RESULT_CACHE_TTL_SECONDS"
+        )
+        return None
+    return version
@@ -9,33 +9,34 @@ Production-Ready Gemini Embeddings Integration
 """
 
 import os
+import sys
 import logging
 import time
 from typing import List, Optional
-from google import genai
 from pydantic import BaseModel, Field, ValidationError
 
-# Load environment
-import sys
-sys.path.append(os.path.dirname(__file__))
-from load_env import load_env
-load_env()
+# google.genai is imported on first use so that importing this module
+# has no side effects (no .env loading, log files or API clients).
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('gemini_embedder.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
+def setup_logging(log_file: str = 'gemini_embedder.log') -> None:
+    """Log to gemini_embedder.log + console (called by the CLI, not on import)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+
 # ============================================================================
 # PYDANTIC MODELS FOR VALIDATION
 # ============================================================================
@@ -78,7 +79,15 @@ class Config:
         return model_str.split("#")[0].strip()
 
 
-config = Config()
+_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """Return the shared Config, creating (and validating) it on first use"""
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
 
 
 # ============================================================================
@@ -136,25 +145,34 @@ class GeminiEmbedder:
             api_key: Gemini API key (defaults to env var)
             model: Model name (defaults to env var)
         """
-        self.api_key = api_key or config.gemini_api_key
-        self.model = model or config.gemini_model
+        self.config = get_config()
+        self.api_key = api_key or self.config.gemini_api_key
+        self.model = model or self.config.gemini_model
 
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not found")
 
-        # Initialize client
-        try:
-            self.client = genai.Client(api_key=self.api_key)
-            logger.info(f"✓ Gemini Embedder initialized")
-            logger.info(f"  Model: {self.model}")
-        except Exception as e:
-            logger.error(f"Failed to initialize Gemini client: {e}")
-            raise
+        # Client is created on first embed call
+        self._client = None
+        logger.info(f"✓ Gemini Embedder initialized")
+        logger.info(f"  Model: {self.model}")
 
         # Initialize fallback
         self.fallback = FallbackEmbedder()
         self.fallback_active = False
 
+    @property
+    def client(self):
+        """Gemini client, created (and the SDK imported) on first use"""
+        if self._client is None:
+            try:
+                from google import genai
+                self._client = genai.Client(api_key=self.api_key)
+            except Exception as e:
+                logger.error(f"Failed to initialize Gemini client: {e}")
+                raise
+        return self._client
+
     def embed_single(
         self,
         text: str,
@@ -180,7 +198,7 @@ class GeminiEmbedder:
             text = text[:10000]
 
         # Try Gemini with retries
-        for attempt in range(config.max_retries):
+        for attempt in range(self.config.max_retries):
             try:
                 result = self.client.models.embed_content(
                     model=self.model,
@@ -193,13 +211,13 @@ class GeminiEmbedder:
 
             except ValidationError as e:
                 logger.error(f"Validation error on attempt {attempt + 1}: {e}")
-                if attempt < config.max_retries - 1:
+                if attempt < self.config.max_retries - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 continue
 
             except Exception as e:
                 logger.warning(f"Gemini error on attempt {attempt + 1}: {e}")
-                if attempt < config.max_retries - 1:
+                if attempt < self.config.max_retries - 1:
                     time.sleep(2 ** attempt)
                 continue
 
@@ -357,6 +375,11 @@ def test_gemini_embedder():
 # ============================================================================
 
 if __name__ == "__main__":
+    sys.path.append(os.path.dirname(__file__))
+    from load_env import load_env
+    load_env()
+    setup_logging()
+
     try:
         test_gemini_embedder()
     except KeyboardInterrupt:
@@ -3,15 +3,41 @@ Intelligent Multi-Vector Search Engine
 Pre-filtering + Weighted Multi-Vector Fusion + Skills Re-ranking
 """
 import os
+import time
 import logging
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient
-from qdrant_client.models import Filter, FieldCondition, Range, MatchValue, MatchText, MatchAny
-from google import genai
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+try:
+    from core.cache import TTLCache
+    from core.qdrant_factory import get_qdrant_client, operation_timeout
+    from core.sparse_encoder import SparseEncoder, SPARSE_FIELDS
+    from core.local_embedder import LOCAL_VECTOR_NAMES
+    from core.truncated_vectors import (
+        truncate, truncated_vector_name, DEFAULT_TRUNCATED_DIM, DEFAULT_RESCORE_LIMIT
+    )
+    from core.collection_config import search_params, default_search_settings
+except ImportError:  # run directly as scripts/core/intelligent_search.py
+    from cache import TTLCache
+    from qdrant_factory import get_qdrant_client, operation_timeout
+    from sparse_encoder import SparseEncoder, SPARSE_FIELDS
+    from local_embedder import LOCAL_VECTOR_NAMES
+    from truncated_vectors import (
+        truncate, truncated_vector_name, DEFAULT_TRUNCATED_DIM, DEFAULT_RESCORE_LIMIT
+    )
+    from collection_config import search_params, default_search_settings
+
+if TYPE_CHECKING:
+    from qdrant_client.models import Filter
 
 logger = logging.getLogger(__name__)
 
 
+class ApplicantNotFound(LookupError):
+    """An example applicant passed to similar() is not in the collection"""
+
+
 class IntelligentSearchEngine:
     """
     Multi-vector search engine with:
@@ -20,8 +46,12 @@ class IntelligentSearchEngine:
     - Skills-based re-ranking
     """
 
+    # Alias of the live applicants_unified_v{n} (blue/green rebuilds switch it atomically)
     COLLECTION_NAME = "applicants_unified"
 
+    # How often the alias target is re-read; a switch drops the cached vector config
+    ALIAS_CHECK_SECONDS = 30.0
+
     # Vector weights for fusion
     WEIGHTS = {
         "resume": 0.5,   # 50% - most important
@@ -29,59 +59,896 @@ class IntelligentSearchEngine:
         "tasks": 0.2     # 20% - task experience
     }
 
+    # Hybrid mode: share of the final score from dense vectors (rest is sparse)
+    HYBRID_DENSE_WEIGHT = 0.5
+
+    # Sparse (BM25) vector weights within the sparse share
+    SPARSE_WEIGHTS = {
+        "skills_sparse": 0.6,
+        "title_sparse": 0.25,
+        "company_sparse": 0.15
+    }
+
+    # BM25 scores are unbounded; s / (s + K) maps them into 0..1 before fusion
+    SPARSE_SATURATION = 4.0
+
+    # Query embedding modes -> named dense vectors searched
+    EMBEDDING_MODES = {
+        "gemini": {name: name for name in WEIGHTS},
+        "local": LOCAL_VECTOR_NAMES,
+        "projected": {name: name for name in WEIGHTS},  # local query projected into the Gemini space
+    }
+
+    # full: one ANN per named vector, fused in Python; truncated: ANN on truncated
+    # copies + full-vector rescoring; profile: one ANN on the fused profile vector
+    RETRIEVAL_MODES = ("full", "truncated", "profile")
+
+    # Precomputed sum(WEIGHTS[name] * vector[name]) of the component vectors (each
+    # normalized first), renormalized to unit length; searched with DOT distance and a
+    # unit query, so scores are cosines to the profile (0.3 threshold as for the components)
+    PROFILE_VECTOR = "profile"
+
     def __init__(
         self,
         qdrant_url: Optional[str] = None,
         qdrant_api_key: Optional[str] = None,
-        gemini_api_key: Optional[str] = None
+        gemini_api_key: Optional[str] = None,
+        client: Optional[Any] = None,
+        gemini_client: Optional[Any] = None,
+        embedding_cache: Optional[TTLCache] = None,
+        payload_exclude: Optional[List[str]] = None,
+        lexical_index: Optional[Any] = None,
+        local_embedder: Optional[Any] = None,
+        query_projection: Optional[Any] = None,
+        embedding_mode: Optional[str] = None,
+        retrieval: Optional[str] = None,
+        truncated_dim: Optional[int] = None,
+        rescore_limit: Optional[int] = None,
+        overfetch: Optional[int] = None,
+        partition_router: Optional[Any] = None,
+        read_replica: Optional[Any] = None,
+        result_cache: Optional[Any] = None
     ):
         """
         Initialize search engine
 
+        Clients are created on first use, so constructing the engine imports
+        neither qdrant_client nor google.genai and makes no network calls.
+        Call verify_collection() to check the collection at startup.
+
         Args:
             qdrant_url: Qdrant Cloud URL (defaults to env var)
             qdrant_api_key: Qdrant API key (defaults to env var)
             gemini_api_key: Gemini API key for embeddings (defaults to env var)
+            client: Pre-built Qdrant client (skips the URL/key requirement)
+            gemini_client: Pre-built Gemini client (skips the API key requirement)
+            embedding_cache: Query embedding cache (defaults to EMBED_CACHE_SIZE / EMBED_CACHE_TTL_SECONDS)
+            payload_exclude: Payload fields not to download with results (e.g. resume_full_text
+                when snippets come from the passage index)
+            lexical_index: Local BM25 index (core.lexical_index) answering queries when
+                Gemini embeddings fail; without it embedding errors propagate
+            local_embedder: On-box query embedder (core.local_embedder) for the *_local vectors
+            query_projection: Local -> Gemini projection (core.query_projection) for "projected" mode
+            embedding_mode: Default query embedding mode, "gemini", "local" or "projected"
+                (defaults to SEARCH_EMBEDDING_MODE, else "gemini")
+            retrieval: Default retrieval, "full" or "truncated" (defaults to SEARCH_RETRIEVAL, else "full")
+            truncated_dim: Truncated vector dim searched first (defaults to SEARCH_TRUNCATED_DIM, else 768)
+            rescore_limit: Candidates rescored on the full vectors (defaults to RESCORE_LIMIT, else 300)
+            overfetch: Candidates fetched per requested result for re-ranking/fusion
+                (defaults to SEARCH_OVERFETCH, else 2)
+            partition_router: Quarterly partitions (core.time_partitions); searches go to the
+                partitions overlapping the date filter instead of COLLECTION_NAME
+            read_replica: Co-located replica (core.read_replica) searched while it is in
+                sync; reads fall back to the primary when it lags. Not with partition_router
+                (the replica only mirrors COLLECTION_NAME)
+            result_cache: Final results by query + options (core.result_cache), served
+                only while the collection version they were stored under is current
         """
-        # Connect to Qdrant
+        self._client_lock = threading.Lock()
+
+        # Qdrant connection settings
         self.qdrant_url = qdrant_url or os.getenv('QDRANT_URL')
         self.qdrant_api_key = qdrant_api_key or os.getenv('QDRANT_API_KEY')
+        self._client = client
 
-        if not self.qdrant_url or not self.qdrant_api_key:
+        if client is None and (not self.qdrant_url or not self.qdrant_api_key):
             raise ValueError("QDRANT_URL and QDRANT_API_KEY required")
 
-        self.client = QdrantClient(
-            url=self.qdrant_url,
-            api_key=self.qdrant_api_key,
-            timeout=120
+        # Server-side timeout for each vector search (QDRANT_SEARCH_TIMEOUT)
+        self.search_timeout = operation_timeout("search")
+        self.payload_exclude = list(payload_exclude or [])
+        self._sparse_available: Optional[bool] = None
+        self.lexical_index = lexical_index
+        self.local_embedder = local_embedder
+        self.query_projection = query_projection
+        self._dense_vectors: Optional[set] = None
+        self._collection_target: Optional[str] = None
+        if partition_router is not None and read_replica is not None:
+            raise ValueError("read_replica cannot be combined with partition_router (the replica has no partitions)")
+        self.partition_router = partition_router
+        self.read_replica = read_replica
+        self.result_cache = result_cache
+        self._alias_checked = 0.0
+        self.embedding_mode = embedding_mode or os.getenv('SEARCH_EMBEDDING_MODE', 'gemini')
+        if self.embedding_mode not in self.EMBEDDING_MODES:
+            raise ValueError(f"Unknown embedding mode '{self.embedding_mode}' (expected one of {list(self.EMBEDDING_MODES)})")
+
+        # Two-stage retrieval: HNSW on truncated vectors, rescoring on the full ones
+        self.retrieval = retrieval or os.getenv('SEARCH_RETRIEVAL', 'full')
+        if self.retrieval not in self.RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval '{self.retrieval}' (expected one of {list(self.RETRIEVAL_MODES)})")
+        self.truncated_dim = truncated_dim or int(os.getenv('SEARCH_TRUNCATED_DIM', str(DEFAULT_TRUNCATED_DIM)))
+        self.rescore_limit = rescore_limit or int(os.getenv('RESCORE_LIMIT', str(DEFAULT_RESCORE_LIMIT)))
+
+        # Default hnsw_ef / quantization oversampling / rescore (SEARCH_HNSW_EF, ...)
+        self.search_settings = default_search_settings()
+        self.overfetch = overfetch or int(os.getenv('SEARCH_OVERFETCH', '2'))
+        if self.overfetch < 1:
+            raise ValueError(f"overfetch must be >= 1, got {self.overfetch}")
+
+        # Gemini settings for query embeddings
+        self.gemini_api_key = gemini_api_key or os.getenv('GEMINI_API_KEY')
+        self._gemini_client = gemini_client
+
+        if gemini_client is None and not self.gemini_api_key:
+            raise ValueError("GEMINI_API_KEY required")
+
+        # Query embeddings keyed by search intent text
+        self.embedding_cache = (
+            embedding_cache if embedding_cache is not None
+            else TTLCache.from_env("EMBED_CACHE", 4096, 3600)
         )
 
-        logger.info(f"✓ Connected to Qdrant: {self.qdrant_url}")
+    @property
+    def client(self):
+        """Qdrant client searches read from: the read replica while fresh, else the primary"""
+        if self.read_replica is not None:
+            replica = self.read_replica.client_for_reads()
+            if replica is not None:
+                return replica
+        return self.primary_client
+
+    @property
+    def primary_client(self):
+        """Shared pooled Qdrant client (see core.qdrant_factory), created on first use"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = get_qdrant_client(self.qdrant_url, self.qdrant_api_key)
+        return self._client
+
+    @property
+    def gemini_client(self):
+        """Gemini client, created (and google.genai imported) on first use"""
+        if self._gemini_client is None:
+            with self._client_lock:
+                if self._gemini_client is None:
+                    from google import genai
+                    self._gemini_client = genai.Client(api_key=self.gemini_api_key)
+                    logger.info("✓ Gemini embedder initialized")
+        return self._gemini_client
+
+    def verify_collection(self) -> int:
+        """
+        Check that the collection exists
 
-        # Initialize Gemini for query embeddings
-        self.gemini_api_key = gemini_api_key or os.getenv('GEMINI_API_KEY')
-        if not self.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY required")
+        Returns:
+            Number of applicants in the collection
 
-        self.gemini_client = genai.Client(api_key=self.gemini_api_key)
-        logger.info("✓ Gemini embedder initialized")
+        Raises:
+            ValueError: If the collection cannot be read
+        """
+        if self.partition_router is not None:
+            partitions = list(self.partition_router.partitions(self.client).values())
+            if not partitions:
+                raise ValueError(f"No partitions of '{self.COLLECTION_NAME}' found")
+            total = sum(self.client.get_collection(name).points_count or 0 for name in partitions)
+            logger.info(f"✓ {len(partitions)} partitions of '{self.COLLECTION_NAME}' with {total} applicants")
+            return total
 
-        # Verify collection exists
         try:
             info = self.client.get_collection(self.COLLECTION_NAME)
-            logger.info(f"✓ Collection '{self.COLLECTION_NAME}' found with {info.points_count} applicants")
         except Exception as e:
             raise ValueError(f"Collection '{self.COLLECTION_NAME}' not found: {e}")
 
+        logger.info(f"✓ Collection '{self.COLLECTION_NAME}' found with {info.points_count} applicants")
+        return info.points_count
+
     def _embed_query(self, text: str) -> List[float]:
-        """Generate Gemini embedding for search query (3072-dim)"""
+        """Generate Gemini embedding for search query (3072-dim), cached by text"""
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get(text)
+            if cached is not None:
+                return cached
+
         response = self.gemini_client.models.embed_content(
             model='models/gemini-embedding-001',
             contents=text
         )
-        return response.embeddings[0].values
+        values = list(response.embeddings[0].values)
+
+        if self.embedding_cache is not None:
+            self.embedding_cache.set(text, values)
+        return values
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Gemini embeddings for several texts: cached ones from the cache, the rest in one call"""
+        vectors: List[Optional[List[float]]] = [
+            self.embedding_cache.get(text) if self.embedding_cache is not None else None for text in texts
+        ]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            response = self.gemini_client.models.embed_content(
+                model='models/gemini-embedding-001',
+                contents=[texts[i] for i in missing]
+            )
+            for i, embedding in zip(missing, response.embeddings):
+                vectors[i] = list(embedding.values)
+                if self.embedding_cache is not None:
+                    self.embedding_cache.set(texts[i], vectors[i])
+        return vectors
+
+    def _embed_query_local(self, text: str, mode: str = "local") -> List[float]:
+        """
+        Embed the query on-box, cached by mode and text
+
+        "local" returns the encoder vector (for the *_local vectors); "projected"
+        maps it into the Gemini space with the query projection.
+        """
+        key = f"{mode}:{text}"
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get(key)
+            if cached is not None:
+                return cached
+
+        values = self.local_embedder.embed(text)
+        if mode == "projected":
+            values = self.query_projection.project(values).tolist()
+
+        if self.embedding_cache is not None:
+            self.embedding_cache.set(key, values)
+        return values
+
+    def local_mode_available(self, mode: str = "local") -> bool:
+        """
+        Whether an on-box mode can serve now: the local model is loaded, and
+        the collection has the *_local vectors ("local") or a projection is
+        configured ("projected")
+        """
+        if self.local_embedder is None or not self.local_embedder.is_ready:
+            return False
+        if mode == "projected":
+            return self.query_projection is not None
+        return self.has_dense_vectors(LOCAL_VECTOR_NAMES.values())
+
+    def _config_collection(self) -> str:
+        """Collection whose vector config the searches rely on (newest partition when partitioned)"""
+        if self.partition_router is not None:
+            return self.partition_router.newest(self.client) or self.COLLECTION_NAME
+        return self.COLLECTION_NAME
+
+    def _searched_collections(self) -> List[str]:
+        """Every collection a search can read (all partitions when partitioned)"""
+        if self.partition_router is not None:
+            return sorted(self.partition_router.partitions(self.client).values())
+        return [self.COLLECTION_NAME]
+
+    def _config_fingerprint(self) -> Dict[str, Any]:
+        """Engine settings that shape results, part of the result cache key"""
+        return {
+            "weights": self.WEIGHTS, "embedding_mode": self.embedding_mode, "retrieval": self.retrieval,
+            "truncated_dim": self.truncated_dim, "rescore_limit": self.rescore_limit, "overfetch": self.overfetch,
+            "search_settings": self.search_settings, "payload_exclude": self.payload_exclude,
+            "read_from": "replica" if self.client is not self.primary_client else "primary"
+        }
+
+    def _check_alias(self) -> None:
+        """Forget the cached collection config when the alias moved to another version"""
+        now = time.monotonic()
+        if now - self._alias_checked < self.ALIAS_CHECK_SECONDS:
+            return
+        self._alias_checked = now
+        try:
+            name = self._config_collection()
+            aliases = self.client.get_aliases().aliases
+            target = next((a.collection_name for a in aliases if a.alias_name == name), name)
+        except Exception as e:
+            logger.warning(f"⚠ Could not read collection aliases: {e}")
+            return
+        if target != self._collection_target:
+            if self._collection_target is not None:
+                logger.info(f"✓ Searches now use '{target}' - re-reading its vector config")
+            self._collection_target = target
+            self._dense_vectors = None
+            self._sparse_available = None
+
+    def has_dense_vectors(self, names) -> bool:
+        """Whether the collection defines all these named dense vectors (config read once per version)"""
+        self._check_alias()
+        if self._dense_vectors is None:
+            try:
+                info = self.client.get_collection(self._config_collection())
+                self._dense_vectors = set(info.config.params.vectors or {})
+            except Exception as e:
+                logger.warning(f"⚠ Could not read vector config: {e}")
+                return False
+        return all(name in self._dense_vectors for name in names)
+
+    def _first_stage(
+        self,
+        query_vector: List[float],
+        vector_name: str,
+        query_filter: Optional["Filter"],
+        params: Optional[Any] = None
+    ):
+        """Prefetch over the truncated copy of `vector_name`; the outer query rescores on the full vector"""
+        from qdrant_client.models import Prefetch
+
+        return Prefetch(
+            query=truncate(query_vector, self.truncated_dim),
+            using=truncated_vector_name(vector_name, self.truncated_dim),
+            filter=query_filter,
+            params=params,
+            limit=self.rescore_limit
+        )
+
+    def warm_up(self, query_vector: List[float]) -> Dict[str, float]:
+        """
+        Run a small search against each named vector to open the Qdrant
+        connection pool and page in the HNSW graphs
+
+        Returns:
+            Latency (ms) per vector name
+        """
+        latencies = {}
+        for vector_name in self.WEIGHTS:
+            stage = time.perf_counter()
+            self.client.query_points(
+                collection_name=self._config_collection(),
+                query=query_vector,
+                using=vector_name,
+                limit=10,
+                with_payload=self._payload_selector(),
+                timeout=self.search_timeout
+            )
+            latencies[vector_name] = (time.perf_counter() - stage) * 1000
+        return latencies
+
+    @staticmethod
+    def unit_vector(vector: List[float]) -> List[float]:
+        """`vector` scaled to length 1 (unchanged if zero)"""
+        import numpy as np
+
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return (array / norm).tolist() if norm else array.tolist()
+
+    @classmethod
+    def profile_vector(cls, vectors: Dict[str, List[float]]) -> List[float]:
+        """Unit profile vector of one applicant from its resume/skills/tasks vectors (computed at ingest)"""
+        import numpy as np
+
+        profile = sum(
+            weight * np.asarray(cls.unit_vector(vectors[name]), dtype=np.float32)
+            for name, weight in cls.WEIGHTS.items()
+        )
+        return cls.unit_vector(profile)
+
+    def _profile_search(
+        self,
+        query_vector: List[float],
+        query_filter: Optional["Filter"],
+        depth: int,
+        params: Optional[Any] = None,
+        rescore_components: bool = False,
+        collection: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        One ANN query on the profile vector for `depth` candidates; with
+        rescore_components the pool is re-scored exactly as sum(w * cosine) on the
+        three component vectors (useful when the profile index is quantized)
+        """
+        from qdrant_client.models import Prefetch, FormulaQuery, SumExpression, MultExpression
+
+        collection = collection or self.COLLECTION_NAME
+        # DOT on unit vectors: projected/local queries are not guaranteed to be unit length
+        query_vector = self.unit_vector(query_vector)
+        if not rescore_components:
+            results = self.client.query_points(
+                collection_name=collection,
+                query=query_vector,
+                using=self.PROFILE_VECTOR,
+                query_filter=query_filter,
+                search_params=params,
+                limit=depth,
+                with_payload=self._payload_selector(),
+                score_threshold=0.3,
+                timeout=self.search_timeout
+            ).points
+        else:
+            pool_size = max(depth, self.rescore_limit)
+            pool = Prefetch(
+                query=query_vector, using=self.PROFILE_VECTOR, filter=query_filter, params=params, limit=pool_size
+            )
+            results = self.client.query_points(
+                collection_name=collection,
+                prefetch=[
+                    Prefetch(prefetch=pool, query=query_vector, using=name, limit=pool_size)
+                    for name in self.WEIGHTS
+                ],
+                query=FormulaQuery(
+                    formula=SumExpression(sum=[
+                        MultExpression(mult=[weight, f"$score[{index}]"])
+                        for index, weight in enumerate(self.WEIGHTS.values())
+                    ]),
+                    defaults={f"$score[{index}]": 0.0 for index in range(len(self.WEIGHTS))}
+                ),
+                limit=depth,
+                with_payload=self._payload_selector(),
+                score_threshold=0.3,
+                timeout=self.search_timeout
+            ).points
+
+        return [
+            {
+                "id": result.id,
+                "semantic_score": result.score,
+                "vector_scores": {self.PROFILE_VECTOR: result.score},
+                "payload": result.payload
+            }
+            for result in results
+        ]
+
+    def _dense_search(
+        self,
+        query_vector: List[float],
+        query_filter: Optional["Filter"],
+        depth: int,
+        vector_names: Dict[str, str],
+        truncated: bool = False,
+        params: Optional[Any] = None,
+        collection: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """One ANN query per named vector, merged by point ID with weighted scores"""
+        all_results = {}
+
+        for vector_name, weight in self.WEIGHTS.items():
+            logger.info(f"        - Searching '{vector_name}' vector (weight: {weight})...")
+
+            results = self.client.query_points(
+                collection_name=collection or self.COLLECTION_NAME,
+                prefetch=self._first_stage(query_vector, vector_name, query_filter, params) if truncated else None,
+                query=query_vector,
+                using=vector_names[vector_name],
+                query_filter=query_filter,
+                search_params=None if truncated else params,
+                limit=depth,  # Get more for re-ranking
+                with_payload=self._payload_selector(),
+                score_threshold=0.3,  # Minimum similarity
+                timeout=self.search_timeout
+            ).points
+
+            logger.info(f"          ✓ Found {len(results)} matches")
+
+            # Merge by point ID with weighted scores
+            for result in results:
+                point_id = result.id
+                weighted_score = result.score * weight
+
+                if point_id not in all_results:
+                    all_results[point_id] = {
+                        "id": point_id,
+                        "semantic_score": weighted_score,
+                        "vector_scores": {vector_name: result.score},
+                        "payload": result.payload
+                    }
+                else:
+                    # Add weighted score
+                    all_results[point_id]["semantic_score"] += weighted_score
+                    all_results[point_id]["vector_scores"][vector_name] = result.score
+
+        logger.info(f"        ✓ Merged: {len(all_results)} unique candidates")
+        return list(all_results.values())
+
+    def has_sparse_vectors(self) -> bool:
+        """Whether the collection defines the named sparse vectors (checked once per version)"""
+        self._check_alias()
+        if self._sparse_available is None:
+            try:
+                info = self.client.get_collection(self._config_collection())
+                sparse = info.config.params.sparse_vectors or {}
+                self._sparse_available = all(name in sparse for name in SPARSE_FIELDS)
+            except Exception as e:
+                logger.warning(f"⚠ Could not read sparse vector config: {e}")
+                return False
+        return self._sparse_available
+
+    def _sparse_queries(self, search_intent: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Query SparseVector per named sparse vector (only those with terms)"""
+        from qdrant_client.models import SparseVector
+
+        texts = {
+            "skills_sparse": filters.get('required_skills') or [search_intent],
+            "title_sparse": (filters.get('desired_job_titles') or []) + [search_intent],
+            "company_sparse": filters.get('target_companies') or [],
+        }
+        queries = {}
+        for name, field_texts in texts.items():
+            indices, values = SparseEncoder.encode_query(field_texts)
+            if indices:
+                queries[name] = SparseVector(indices=indices, values=values)
+        return queries
+
+    def _hybrid_search(
+        self,
+        query_vector: List[float],
+        query_filter: Optional["Filter"],
+        search_intent: str,
+        filters: Dict[str, Any],
+        limit: int,
+        vector_names: Optional[Dict[str, str]] = None,
+        truncated: bool = False,
+        params: Optional[Any] = None,
+        profile: bool = False,
+        depth: Optional[int] = None,
+        collection: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Dense + sparse retrieval fused server-side in a single query_points call
+
+        Each named vector is a prefetch; a FormulaQuery combines them as
+            0.5 * (0.5 resume + 0.3 skills + 0.2 tasks)
+          + 0.5 * sum(w * s / (s + K)) over the BM25 sparse vectors
+        With truncated=True each dense prefetch rescores a truncated-vector prefetch.
+        `params` (SearchParams) apply to the dense ANN searches. With profile=True
+        the three dense prefetches are replaced by one on the profile vector.
+        Each prefetch fetches `depth` candidates (default limit * overfetch).
+        """
+        from qdrant_client.models import (
+            Prefetch, FormulaQuery, SumExpression, MultExpression, DivExpression, DivParams
+        )
+
+        prefetch = []
+        terms = []
+        defaults = {}
+        vector_names = vector_names or self.EMBEDDING_MODES["gemini"]
+        depth = depth or limit * self.overfetch
+
+        if profile:
+            prefetch.append(Prefetch(
+                query=self.unit_vector(query_vector),
+                using=self.PROFILE_VECTOR,
+                filter=query_filter,
+                params=params,
+                limit=depth,
+                score_threshold=0.3
+            ))
+            terms.append(MultExpression(mult=[self.HYBRID_DENSE_WEIGHT, "$score[0]"]))
+            defaults["$score[0]"] = 0.0
+
+        for vector_name, weight in ({} if profile else self.WEIGHTS).items():
+            index = len(prefetch)
+            prefetch.append(Prefetch(
+                prefetch=self._first_stage(query_vector, vector_name, query_filter, params) if truncated else None,
+                query=query_vector,
+                using=vector_names[vector_name],
+                filter=query_filter,
+                params=None if truncated else params,
+                limit=depth,
+                score_threshold=0.3
+            ))
+            terms.append(MultExpression(mult=[self.HYBRID_DENSE_WEIGHT * weight, f"$score[{index}]"]))
+            defaults[f"$score[{index}]"] = 0.0
+
+        sparse_queries = self._sparse_queries(search_intent, filters)
+        sparse_share = 1.0 - self.HYBRID_DENSE_WEIGHT
+        for vector_name, sparse_query in sparse_queries.items():
+            index = len(prefetch)
+            score = f"$score[{index}]"
+            prefetch.append(Prefetch(query=sparse_query, using=vector_name, filter=query_filter, limit=depth))
+            terms.append(MultExpression(mult=[
+                sparse_share * self.SPARSE_WEIGHTS[vector_name],
+                DivExpression(div=DivParams(left=score, right=SumExpression(sum=[score, self.SPARSE_SATURATION])))
+            ]))
+            defaults[score] = 0.0
+
+        dense_count = 1 if profile else len(self.WEIGHTS)
+        logger.info(f"        - Hybrid: {dense_count} dense + {len(sparse_queries)} sparse prefetches, fused in Qdrant")
+
+        results = self.client.query_points(
+            collection_name=collection or self.COLLECTION_NAME,
+            prefetch=prefetch,
+            query=FormulaQuery(formula=SumExpression(sum=terms), defaults=defaults),
+            limit=limit,
+            with_payload=self._payload_selector(),
+            timeout=self.search_timeout
+        ).points
+
+        return [
+            {
+                "id": result.id,
+                "semantic_score": result.score,
+                "vector_scores": {},
+                "payload": result.payload,
+                "skills_match_score": 0.0,
+                "final_score": result.score
+            }
+            for result in results
+        ]
+
+    def similar(
+        self,
+        positive_ids: List[Any],
+        negative_ids: Optional[List[Any]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        trace: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Candidates similar to stored applicants, from their stored vectors
+
+        One query_points call: a recommend prefetch per named vector (positive
+        and negative examples by point id) fused with the same 0.5/0.3/0.2
+        weights as search(). No query is parsed or embedded. The examples
+        themselves are excluded from the results. Partitioned collections
+        first retrieve the example vectors, since they may live in any partition.
+
+        Args:
+            positive_ids / negative_ids: Qdrant point ids (the `point_id` of a search result)
+            filters: Parsed-query style filters (see _build_filter)
+
+        Returns:
+            search()-shaped candidates, best first
+
+        Raises:
+            ApplicantNotFound: An example id is not in the collection
+            ValueError: Invalid filters
+        """
+        from qdrant_client.models import (
+            Prefetch, RecommendQuery, RecommendInput, FormulaQuery, SumExpression, MultExpression,
+            Filter, HasIdCondition
+        )
+
+        started = time.perf_counter()
+        negative_ids = list(negative_ids or [])
+        seeds = list(positive_ids) + negative_ids
+        base = self._build_filter(filters or {})
+        query_filter = Filter(must=base.must if base else None, must_not=[HasIdCondition(has_id=seeds)])
+        depth = limit * self.overfetch
+
+        def recommend(collection: str, positive: List[Any], negative: List[Any]) -> List[Dict[str, Any]]:
+            names = list(self.WEIGHTS)
+            results = self.client.query_points(
+                collection_name=collection,
+                prefetch=[
+                    Prefetch(
+                        query=RecommendQuery(recommend=RecommendInput(
+                            positive=[p[name] if isinstance(p, dict) else p for p in positive],
+                            negative=[n[name] if isinstance(n, dict) else n for n in negative]
+                        )),
+                        using=name,
+                        filter=query_filter,
+                        limit=depth
+                    )
+                    for name in names
+                ],
+                query=FormulaQuery(
+                    formula=SumExpression(sum=[
+                        MultExpression(mult=[self.WEIGHTS[name], f"$score[{index}]"])
+                        for index, name in enumerate(names)
+                    ]),
+                    defaults={f"$score[{index}]": 0.0 for index in range(len(names))}
+                ),
+                limit=limit,
+                with_payload=self._payload_selector(),
+                timeout=self.search_timeout
+            ).points
+            return [
+                {
+                    "id": result.id,
+                    "semantic_score": result.score,
+                    "vector_scores": {},
+                    "payload": result.payload,
+                    "skills_match_score": 0.0,
+                    "final_score": result.score
+                }
+                for result in results
+            ]
+
+        def examples(collections: List[str], with_vectors: bool) -> Dict[Any, Any]:
+            """Stored vectors by example id; ApplicantNotFound if any is missing"""
+            found = {}
+            for collection in collections:
+                for record in self.client.retrieve(
+                    collection, ids=seeds, with_vectors=list(self.WEIGHTS) if with_vectors else False, with_payload=False
+                ):
+                    found[record.id] = record.vector
+            missing = [seed for seed in seeds if seed not in found]
+            if missing:
+                raise ApplicantNotFound(f"Applicants not found: {', '.join(str(seed) for seed in missing)}")
+            return found
+
+        if self.partition_router is None:
+            collections = [self.COLLECTION_NAME]
+            try:
+                candidates = recommend(self.COLLECTION_NAME, list(positive_ids), negative_ids)
+            except Exception as e:
+                # An unknown example id fails the query (ValueError locally, 404 from a server)
+                if not isinstance(e, ValueError) and getattr(e, 'status_code', None) != 404:
+                    raise
+                examples(collections, with_vectors=False)
+                raise
+        else:
+            # Example vectors may sit in any partition: fetch them, then query every partition with them
+            collections = self._searched_collections()
+            found = examples(collections, with_vectors=True)
+            positive = [found[seed] for seed in positive_ids]
+            negative = [found[seed] for seed in negative_ids]
+            candidates = []
+            with ThreadPoolExecutor(max_workers=min(len(collections), 8)) as pool:
+                for partition_candidates in pool.map(lambda c: recommend(c, positive, negative), collections):
+                    candidates.extend(partition_candidates)
+            candidates.sort(key=lambda x: x['final_score'], reverse=True)
+            candidates = candidates[:limit]
+
+        if trace is not None:
+            trace['collections'] = collections
+            if self.read_replica is not None:
+                trace['read_from'] = "replica" if self.client is not self.primary_client else "primary"
+            trace['timings'] = {'total_ms': (time.perf_counter() - started) * 1000}
+
+        logger.info(f"✓ Found {len(candidates)} candidates similar to {', '.join(str(p) for p in positive_ids)}")
+        return candidates
+
+    def search_sections(
+        self,
+        sections: List[str],
+        filters: Dict[str, Any],
+        limit: int = 20,
+        max_weight: float = 0.5,
+        enable_reranking: bool = True,
+        trace: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Match a long text (a job description) split into sections
+
+        All sections are embedded in one Gemini call and searched in one Qdrant
+        query_batch_points call (one request per section, each fusing the
+        resume/skills/tasks vectors with WEIGHTS). Per candidate the section
+        scores are aggregated as
+            max_weight * max + (1 - max_weight) * mean
+        where the mean counts sections the candidate did not match as 0, so
+        candidates covering more of the requirements rank higher. The result
+        is then re-ranked by filters['required_skills'] like search().
+
+        Args:
+            sections: Section texts (see core.jd_parser.split_sections)
+            filters: Parsed-query filters (pre-filter + required_skills)
+            max_weight: Share of the best section score in the aggregate (0..1)
+
+        Returns:
+            search()-shaped candidates; vector_scores holds the per-section scores
+        """
+        from qdrant_client.models import QueryRequest, Prefetch, FormulaQuery, SumExpression, MultExpression
+
+        if not sections:
+            raise ValueError("No sections to match")
+        if not 0.0 <= max_weight <= 1.0:
+            raise ValueError(f"max_weight must be between 0 and 1, got {max_weight}")
+
+        timings = {}
+        started = time.perf_counter()
+        logger.info(f"\n🔍 Matching {len(sections)} sections")
+
+        stage = time.perf_counter()
+        degraded = False
+        try:
+            section_vectors = self._embed_texts(sections)
+        except Exception as e:
+            if self.lexical_index is None:
+                raise
+            logger.warning(f"⚠ Gemini embedding failed ({e}) - degraded mode, searching the lexical index")
+            section_vectors = None
+            degraded = True
+        timings['embedding_ms'] = (time.perf_counter() - stage) * 1000
+
+        query_filter = self._build_filter(filters)
+        depth = limit * self.overfetch
+        params = search_params(
+            hnsw_ef=self.search_settings['hnsw_ef'],
+            oversampling=self.search_settings['oversampling'],
+            rescore=self.search_settings['rescore']
+        )
+
+        stage = time.perf_counter()
+        collections = [self.COLLECTION_NAME]
+        if degraded:
+            # Keyword fallback: the skills, else the sections' words, against the local BM25 index
+            text = " ".join(filters.get('required_skills') or sections)
+            candidates = self.lexical_index.search(text, filters, depth)
+        else:
+            if self.partition_router is not None:
+                collections = self.partition_router.route(
+                    self.client, filters.get('min_date_applied'), filters.get('max_date_applied')
+                )
+            names = list(self.WEIGHTS)
+            fusion = FormulaQuery(
+                formula=SumExpression(sum=[
+                    MultExpression(mult=[self.WEIGHTS[name], f"$score[{index}]"]) for index, name in enumerate(names)
+                ]),
+                defaults={f"$score[{index}]": 0.0 for index in range(len(names))}
+            )
+            requests = [
+                QueryRequest(
+                    prefetch=[
+                        Prefetch(query=vector, using=name, filter=query_filter, params=params, limit=depth)
+                        for name in names
+                    ],
+                    query=fusion,
+                    limit=depth,
+                    with_payload=self._payload_selector()
+                )
+                for vector in section_vectors
+            ]
 
-    def _build_filter(self, filters: Dict[str, Any]) -> Optional[Filter]:
+            def retrieve(collection: str):
+                return self.client.query_batch_points(
+                    collection_name=collection, requests=requests, timeout=self.search_timeout
+                )
+
+            section_scores: Dict[Any, Dict[str, Any]] = {}
+            batches = []
+            if len(collections) == 1:
+                batches = [retrieve(collections[0])]
+            elif collections:
+                with ThreadPoolExecutor(max_workers=min(len(collections), 8)) as pool:
+                    batches = list(pool.map(retrieve, collections))
+            for batch in batches:
+                for index, response in enumerate(batch):
+                    for point in response.points:
+                        entry = section_scores.setdefault(point.id, {"payload": point.payload, "scores": {}})
+                        entry["scores"][f"section_{index + 1}"] = point.score
+
+            candidates = []
+            for point_id, entry in section_scores.items():
+                scores = list(entry["scores"].values())
+                semantic = max_weight * max(scores) + (1.0 - max_weight) * sum(scores) / len(sections)
+                candidates.append({
+                    "id": point_id,
+                    "semantic_score": semantic,
+                    "vector_scores": entry["scores"],
+                    "payload": entry["payload"]
+                })
+        timings['vector_search_ms'] = (time.perf_counter() - stage) * 1000
+        logger.info(f"        ✓ {len(candidates)} candidates across {len(sections)} sections")
+
+        stage = time.perf_counter()
+        required_skills = filters.get('required_skills') if enable_reranking else None
+        self._rerank(candidates, required_skills)
+        top_candidates = candidates[:limit]
+        timings['rerank_ms'] = (time.perf_counter() - stage) * 1000
+        timings['total_ms'] = (time.perf_counter() - started) * 1000
+
+        if trace is not None:
+            trace['sections'] = len(sections)
+            trace['degraded'] = degraded
+            if self.partition_router is not None:
+                trace['partitions'] = [] if degraded else collections
+            if self.read_replica is not None:
+                trace['read_from'] = "replica" if self.client is not self.primary_client else "primary"
+            trace['timings'] = timings
+
+        logger.info(f"✓ Found {len(top_candidates)} candidates")
+        return top_candidates
+
+    def _payload_selector(self):
+        """with_payload value for result queries (everything except payload_exclude)"""
+        if not self.payload_exclude:
+            return True
+        from qdrant_client.models import PayloadSelectorExclude
+        return PayloadSelectorExclude(exclude=self.payload_exclude)
+
+    def _build_filter(self, filters: Dict[str, Any]) -> Optional["Filter"]:
         """
         Build Qdrant filter from parsed query filters
 
@@ -91,6 +958,8 @@ class IntelligentSearchEngine:
         Returns:
             Qdrant Filter object or None
         """
+        from qdrant_client.models import Filter, FieldCondition, Range, MatchValue, MatchText
+
         conditions = []
 
         # Experience range filter
@@ -220,11 +1089,41 @@ class IntelligentSearchEngine:
 
         return matched / len(required_skills)
 
+    def _rerank(self, candidates: List[Dict[str, Any]], required_skills: Optional[List[str]]) -> None:
+        """
+        Sort candidates in place by final_score: 70% semantic + 30% skills match
+        with required skills, else the semantic score alone
+        """
+        for candidate in candidates:
+            if required_skills:
+                skills_match = self._calculate_skills_match(
+                    candidate['payload'].get('skills_extracted', ''),
+                    required_skills
+                )
+                candidate['skills_match_score'] = skills_match
+                candidate['final_score'] = candidate['semantic_score'] * 0.7 + skills_match * 0.3
+            else:
+                candidate['skills_match_score'] = 0.0
+                candidate['final_score'] = candidate['semantic_score']
+
+        candidates.sort(key=lambda x: x['final_score'], reverse=True)
+
     def search(
         self,
         parsed_query: Dict[str, Any],
         limit: int = 20,
-        enable_reranking: bool = True
+        enable_reranking: bool = True,
+        query_vector: Optional[List[float]] = None,
+        trace: Optional[Dict[str, Any]] = None,
+        hybrid: bool = False,
+        embedding_mode: Optional[str] = None,
+        retrieval: Optional[str] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        oversampling: Optional[float] = None,
+        rescore: Optional[bool] = None,
+        profile_rescore: bool = False,
+        overfetch: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute intelligent search with multi-vector fusion
@@ -233,23 +1132,127 @@ class IntelligentSearchEngine:
             parsed_query: Output from GeminiQueryParser.parse()
             limit: Number of results to return
             enable_reranking: Whether to re-rank by skills match
+            query_vector: Precomputed query embedding (skips the Gemini call, used by replay)
+            trace: Optional dict filled with the query embedding, stage timings (ms)
+                and 'degraded' (True when served from the lexical index)
+            hybrid: Fuse dense vectors with BM25 sparse vectors (skills/title/company)
+                server-side instead of re-ranking skills in Python
+            embedding_mode: "gemini", "local" or "projected" (defaults to the engine's mode).
+                Local embeds the query on-box and searches the *_local vectors; projected
+                maps the on-box embedding into the Gemini space and searches the Gemini
+                vectors. Both fall back to Gemini while the model is loading or the
+                vectors/projection are missing.
+                A provided query_vector must match the mode's vectors.
+            retrieval: "full", "truncated" or "profile" (defaults to the engine's). Truncated
+                searches the {name}_{truncated_dim} vectors and rescores the top rescore_limit
+                on the full vectors; profile runs one ANN query on the fused profile vector
+                (Gemini-space modes only; both fall back to full if the vectors are missing).
+            hnsw_ef: HNSW beam width for the vector searches (defaults to SEARCH_HNSW_EF)
+            exact: Brute-force vector search (bypasses HNSW and quantization)
+            oversampling: Quantized candidates fetched per result (defaults to SEARCH_OVERSAMPLING)
+            rescore: Re-score quantized candidates on the original vectors (defaults to SEARCH_RESCORE)
+            profile_rescore: In profile retrieval, re-score the pool on the three component vectors
+            overfetch: Candidates fetched per result before re-ranking (defaults to the engine's)
 
         Returns:
             List of candidate dictionaries with scores and metadata
         """
         search_intent = parsed_query['search_intent']
         filters = parsed_query['filters']
+        timings = {}
+        started = time.perf_counter()
+
+        # Final-result cache: same query + options on the same collection version
+        cache_key = stamp = None
+        if self.result_cache is not None and query_vector is None:
+            options = {
+                "limit": limit, "enable_reranking": enable_reranking, "hybrid": hybrid,
+                "embedding_mode": embedding_mode, "retrieval": retrieval, "hnsw_ef": hnsw_ef, "exact": exact,
+                "oversampling": oversampling, "rescore": rescore, "profile_rescore": profile_rescore,
+                "overfetch": overfetch, "engine": self._config_fingerprint()
+            }
+            cache_key = self.result_cache.key(parsed_query, options)
+            stamp = self.result_cache.stamp(self.client, self._searched_collections())
+            hit = self.result_cache.get(cache_key, stamp) if stamp is not None else None
+            if hit is not None:
+                results, cached_trace = hit
+                if trace is not None:
+                    trace.update(cached_trace)
+                    trace['result_cache'] = "hit"
+                    trace['timings'] = {'total_ms': (time.perf_counter() - started) * 1000}
+                logger.info(f"\n🔍 Searching: '{search_intent}' - ✓ {len(results)} cached results ({stamp})")
+                return [
+                    {**candidate, 'payload': dict(candidate['payload']), 'vector_scores': dict(candidate.get('vector_scores', {}))}
+                    for candidate in results
+                ]
 
         logger.info(f"\n🔍 Searching: '{search_intent}'")
 
         # Step 1: Generate query embedding
         logger.info("  [1/4] Generating query embedding...")
-        query_vector = self._embed_query(search_intent)
-        logger.info(f"        ✓ Embedding: {len(query_vector)} dimensions")
+        stage = time.perf_counter()
+        degraded = False
+        mode = embedding_mode or self.embedding_mode
+        if mode not in self.EMBEDDING_MODES:
+            raise ValueError(f"Unknown embedding mode '{mode}' (expected one of {list(self.EMBEDDING_MODES)})")
+        if mode != "gemini" and query_vector is None and not self.local_mode_available(mode):
+            logger.warning(f"⚠ {mode.capitalize()} embedding mode unavailable (model not loaded, no *_local vectors or no projection) - using Gemini")
+            mode = "gemini"
+
+        if query_vector is None and mode != "gemini":
+            query_vector = self._embed_query_local(search_intent, mode)
+            embedding_source = mode
+        elif query_vector is None:
+            try:
+                query_vector = self._embed_query(search_intent)
+                embedding_source = "gemini"
+            except Exception as e:
+                if self.lexical_index is None:
+                    raise
+                logger.warning(f"⚠ Gemini embedding failed ({e}) - degraded mode, searching the lexical index")
+                embedding_source = "none"
+                degraded = True
+        else:
+            embedding_source = "provided"
+        timings['embed_ms'] = (time.perf_counter() - stage) * 1000
+        vector_names = self.EMBEDDING_MODES[mode]
+
+        requested_retrieval = retrieval
+        retrieval = retrieval or self.retrieval
+        if retrieval not in self.RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval '{retrieval}' (expected one of {list(self.RETRIEVAL_MODES)})")
+        if degraded or mode == "local":
+            retrieval = "full"
+        elif retrieval == "truncated" and not self.has_dense_vectors(
+            truncated_vector_name(name, self.truncated_dim) for name in self.WEIGHTS
+        ):
+            logger.warning(f"⚠ No {self.truncated_dim}-dim truncated vectors in the collection - using full-dimension search")
+            retrieval = "full"
+        elif retrieval == "profile" and not self.has_dense_vectors([self.PROFILE_VECTOR]):
+            logger.warning("⚠ No profile vector in the collection - using per-vector search")
+            retrieval = "full"
+        truncated = retrieval == "truncated"
+        profile = retrieval == "profile"
+
+        settings = {
+            "hnsw_ef": hnsw_ef if hnsw_ef is not None else self.search_settings['hnsw_ef'],
+            "exact": exact,
+            "oversampling": oversampling if oversampling is not None else self.search_settings['oversampling'],
+            "rescore": rescore if rescore is not None else self.search_settings['rescore'],
+        }
+        params = search_params(**settings)
+        overfetch = overfetch or self.overfetch
+        if overfetch < 1:
+            raise ValueError(f"overfetch must be >= 1, got {overfetch}")
+        depth = limit * overfetch
+        if not degraded:
+            logger.info(f"        ✓ Embedding: {len(query_vector)} dimensions ({embedding_source})")
 
         # Step 2: Build metadata filter
         logger.info("  [2/4] Building pre-filters...")
+        stage = time.perf_counter()
         query_filter = self._build_filter(filters)
+        timings['filter_ms'] = (time.perf_counter() - stage) * 1000
 
         if query_filter:
             logger.info(f"        ✓ Filters applied:")
@@ -273,80 +1276,103 @@ class IntelligentSearchEngine:
             logger.info(f"        ✓ No pre-filters (searching all candidates)")
 
         # Step 3: Multi-vector search with weighted fusion
-        logger.info("  [3/4] Searching 3 vectors (resume, skills, tasks)...")
-
-        # Search each vector
-        all_results = {}
-
-        for vector_name, weight in self.WEIGHTS.items():
-            logger.info(f"        - Searching '{vector_name}' vector (weight: {weight})...")
-
-            results = self.client.search(
-                collection_name=self.COLLECTION_NAME,
-                query_vector=(vector_name, query_vector),
-                query_filter=query_filter,
-                limit=limit * 2,  # Get more for re-ranking
-                with_payload=True,
-                score_threshold=0.3  # Minimum similarity
+        use_hybrid = hybrid and not degraded and self.has_sparse_vectors()
+        if hybrid and not degraded and not use_hybrid:
+            logger.warning("⚠ Hybrid requested but the collection has no sparse vectors - using dense search")
+
+        # Partitioned collections: only the quarters overlapping the date filter are searched
+        collections = [self.COLLECTION_NAME]
+        if self.partition_router is not None and not degraded:
+            collections = self.partition_router.route(
+                self.client, filters.get('min_date_applied'), filters.get('max_date_applied')
             )
+            logger.info(f"        - Partitions: {', '.join(collections) or 'none in the date range'}")
 
-            logger.info(f"          ✓ Found {len(results)} matches")
-
-            # Merge by point ID with weighted scores
-            for result in results:
-                point_id = result.id
-                weighted_score = result.score * weight
-
-                if point_id not in all_results:
-                    all_results[point_id] = {
-                        "id": point_id,
-                        "semantic_score": weighted_score,
-                        "vector_scores": {vector_name: result.score},
-                        "payload": result.payload
-                    }
-                else:
-                    # Add weighted score
-                    all_results[point_id]["semantic_score"] += weighted_score
-                    all_results[point_id]["vector_scores"][vector_name] = result.score
-
-        logger.info(f"        ✓ Merged: {len(all_results)} unique candidates")
-
-        # Convert to list
-        candidates = list(all_results.values())
+        def retrieve(collection: str) -> List[Dict[str, Any]]:
+            if use_hybrid:
+                return self._hybrid_search(
+                    query_vector, query_filter, search_intent, filters, limit, vector_names, truncated, params,
+                    profile, depth, collection
+                )
+            if profile:
+                return self._profile_search(query_vector, query_filter, depth, params, profile_rescore, collection)
+            return self._dense_search(query_vector, query_filter, depth, vector_names, truncated, params, collection)
+
+        if degraded:
+            logger.info("  [3/4] Lexical search (BM25, local index)...")
+            stage = time.perf_counter()
+            candidates = self.lexical_index.search(search_intent, filters, depth)
+            timings['vector_search_ms'] = (time.perf_counter() - stage) * 1000
+            logger.info(f"        ✓ Found {len(candidates)} keyword matches")
+        else:
+            if use_hybrid:
+                logger.info("  [3/4] Hybrid search (3 dense + sparse skills/title/company)...")
+            elif profile:
+                logger.info(f"  [3/4] Searching the profile vector (one ANN query{', component rescoring' if profile_rescore else ''})...")
+            else:
+                logger.info("  [3/4] Searching 3 vectors (resume, skills, tasks)...")
+            stage = time.perf_counter()
+            if len(collections) == 1:
+                candidates = retrieve(collections[0])
+            else:
+                # Fan out; partitions hold disjoint applicants, so merging is a sort
+                candidates = []
+                if collections:
+                    with ThreadPoolExecutor(max_workers=min(len(collections), 8)) as pool:
+                        for partition_candidates in pool.map(retrieve, collections):
+                            candidates.extend(partition_candidates)
+                score_key = 'final_score' if use_hybrid else 'semantic_score'
+                candidates.sort(key=lambda x: x[score_key], reverse=True)
+                candidates = candidates[:limit if use_hybrid else depth]
+            timings['vector_search_ms'] = (time.perf_counter() - stage) * 1000
+            logger.info(f"        ✓ {len(candidates)} candidates")
 
         # Step 4: Re-rank with skills matching
-        if enable_reranking and filters.get('required_skills'):
+        stage = time.perf_counter()
+        if use_hybrid:
+            logger.info(f"  [4/4] Skipping re-ranking (keyword relevance ranked by Qdrant)")
+        elif enable_reranking and filters.get('required_skills'):
             logger.info(f"  [4/4] Re-ranking by skills match...")
             logger.info(f"        Required skills: {', '.join(filters['required_skills'])}")
-
-            for candidate in candidates:
-                skills_text = candidate['payload'].get('skills_extracted', '')
-                skills_match = self._calculate_skills_match(
-                    skills_text,
-                    filters['required_skills']
-                )
-
-                # Combined score: 70% semantic + 30% skills
-                candidate['skills_match_score'] = skills_match
-                candidate['final_score'] = (
-                    candidate['semantic_score'] * 0.7 +
-                    skills_match * 0.3
-                )
-
-            # Sort by final score
-            candidates.sort(key=lambda x: x['final_score'], reverse=True)
+            self._rerank(candidates, filters['required_skills'])
             logger.info(f"        ✓ Re-ranked by combined score (70% semantic + 30% skills)")
         else:
             logger.info(f"  [4/4] Skipping re-ranking (no required skills)")
-            # Just use semantic score
-            for candidate in candidates:
-                candidate['skills_match_score'] = 0.0
-                candidate['final_score'] = candidate['semantic_score']
-
-            candidates.sort(key=lambda x: x['final_score'], reverse=True)
+            self._rerank(candidates, None)
 
         # Return top N
         top_candidates = candidates[:limit]
+        timings['rerank_ms'] = (time.perf_counter() - stage) * 1000
+        timings['total_ms'] = (time.perf_counter() - started) * 1000
+
+        # Cache only results of the requested configuration (no degraded/fallback runs)
+        fell_back = mode != (embedding_mode or self.embedding_mode) or retrieval != (requested_retrieval or self.retrieval)
+        if stamp is not None and not degraded and not fell_back:
+            self.result_cache.put(cache_key, stamp, [
+                {**candidate, 'payload': dict(candidate['payload']), 'vector_scores': dict(candidate.get('vector_scores', {}))}
+                for candidate in top_candidates
+            ], {
+                'query_vector': query_vector, 'embedding_source': embedding_source, 'embedding_mode': mode,
+                'retrieval': f"truncated_{self.truncated_dim}" if truncated else retrieval,
+                'hybrid': use_hybrid, 'degraded': False
+            })
+
+        if trace is not None:
+            trace['query_vector'] = query_vector
+            trace['embedding_source'] = embedding_source
+            trace['embedding_mode'] = mode
+            trace['retrieval'] = f"truncated_{self.truncated_dim}" if truncated else retrieval
+            trace['search_params'] = {key: value for key, value in settings.items() if value not in (None, False)}
+            trace['overfetch'] = overfetch
+            if self.partition_router is not None:
+                trace['partitions'] = [] if degraded else collections
+            if self.read_replica is not None:
+                trace['read_from'] = "replica" if self.client is not self.primary_client else "primary"
+            trace['hybrid'] = use_hybrid
+            trace['degraded'] = degraded
+            trace['timings'] = timings
+            if stamp is not None:
+                trace['result_cache'] = "miss"
 
         logger.info(f"\n✓ Found {len(top_candidates)} candidates")
         if top_candidates:
@@ -0,0 +1,212 @@
+"""
+Job Description Parser
+Splits a pasted job description (2-10k characters) into requirement sections
+for /match/jd: each section is embedded and searched on its own, so a long
+JD is neither truncated nor blurred into one vector. Company blurbs,
+benefits and application instructions are dropped. No network call.
+
+Also pulls the skills listed in the requirement bullets (for the skills
+re-ranker) and the filters a JD states unambiguously: minimum experience
+and location. Degree lines ("Bachelor's degree or equivalent") are left to
+the vectors since the education filter is an exact match.
+"""
+import re
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from core.rule_parser import RuleQueryParser, SKILL_SEPARATORS, NON_SKILL
+except ImportError:  # run directly as scripts/core/jd_parser.py
+    from rule_parser import RuleQueryParser, SKILL_SEPARATORS, NON_SKILL
+
+logger = logging.getLogger(__name__)
+
+# gemini-embedding-001 takes 2048 tokens per input; ~2000 characters stays well under
+MAX_SECTION_CHARS = 2000
+MAX_SECTIONS = 12
+MAX_SKILLS = 20
+MIN_SECTION_CHARS = 20
+
+HEADING_KEYWORDS = re.compile(
+    r"\b(?:requirements?|qualifications?|responsibilit(?:y|ies)|duties|skills?|experience|about|overview|summary"
+    r"|role|position|job|tech(?:nical)? stack|tools|must[- ]haves?|nice[- ]to[- ]haves?|preferred|benefits|perks"
+    r"|what (?:you|we)|who (?:you|we)|you will|you'll|education|offer|compensation|salary|apply)\b",
+    re.I
+)
+SKIP_SECTIONS = re.compile(
+    r"\b(?:about (?:us|the company|the team)|who we are|our (?:company|story|mission|culture)|benefits|perks"
+    r"|what we offer|compensation|salary|equal (?:employment )?opportunity|eeo|how to apply|application process"
+    r"|why join)\b",
+    re.I
+)
+SKILL_SECTIONS = re.compile(
+    r"\b(?:requirements?|qualifications?|skills?|tech(?:nical)? stack|tools|must[- ]haves?|what you(?:'ll)? (?:need|bring))\b",
+    re.I
+)
+OPTIONAL_SECTIONS = re.compile(r"\b(?:nice[- ]to[- ]haves?|preferred|bonus|plus)\b", re.I)
+# Requirements first, then responsibilities, then everything else (when there are too many sections)
+PRIORITY = [SKILL_SECTIONS, re.compile(r"\b(?:responsibilit(?:y|ies)|duties|you will|you'll|role)\b", re.I)]
+
+BULLET = re.compile(r"^\s*(?:[-*•·▪◦‣–]|\d+[.)])\s+")
+INLINE_LIST = re.compile(r"^\s*(?:skills?|tech(?:nical)? stack|tools|technologies)\s*:\s*(.+)$", re.I)
+SKILL_LEAD = re.compile(
+    r"\b(?:with|skilled in|knowledge of|proficien(?:t|cy) in|experienced? (?:in|with)|familiarity with"
+    r"|expertise in|working knowledge of)\s+(.+)$",
+    re.I
+)
+SKILL_END = re.compile(r"\d|\b(?:in a|for|to|who|based|including|such as|is|are|would)\b", re.I)
+
+
+def _heading(line: str) -> Optional[str]:
+    """Section title if the line is a heading ("Requirements:", "## About the role", "WHAT YOU'LL DO")"""
+    text = line.strip()
+    if not text or len(text) > 60 or BULLET.match(text):
+        return None
+    if text.startswith("#"):
+        return text.lstrip("#").strip(" :") or None
+    if text.endswith(":") and len(text.split()) <= 6:
+        return text.rstrip(":").strip()
+    letters = re.sub(r"[^A-Za-z]", "", text)
+    if len(text.split()) <= 5 and not text.endswith(".") and (
+        (letters.isupper() and len(letters) > 2) or HEADING_KEYWORDS.search(text) and text[0].isupper()
+    ):
+        return text
+    return None
+
+
+def _chunks(text: str, max_chars: int) -> List[str]:
+    """Pack lines into chunks of at most max_chars (a longer single line is cut)"""
+    chunks, current = [], ""
+    for line in text.splitlines():
+        line = line.rstrip()
+        while len(line) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and len(current) + len(line) + 1 > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    if current.strip():
+        chunks.append(current)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def split_sections(
+    job_description: str,
+    max_sections: int = MAX_SECTIONS,
+    max_chars: int = MAX_SECTION_CHARS
+) -> List[Dict[str, str]]:
+    """
+    Requirement sections of a job description, in document order
+
+    Headed sections are kept unless they are company/benefits/application
+    boilerplate; a JD without headings is split into paragraph-packed chunks.
+    Sections over max_chars are split, and past max_sections the
+    lowest-priority ones are dropped (requirements, then responsibilities, then the rest).
+
+    Returns:
+        [{"title", "text"}] where text is the content to embed
+    """
+    raw: List[Tuple[str, List[str]]] = [("Overview", [])]
+    for line in job_description.splitlines():
+        title = _heading(line)
+        if title is not None:
+            raw.append((title, []))
+        else:
+            raw[-1][1].append(line)
+
+    sections = []
+    for title, lines in raw:
+        body = "\n".join(lines).strip()
+        if len(body) < MIN_SECTION_CHARS or SKIP_SECTIONS.search(title):
+            continue
+        parts = _chunks(body, max_chars)
+        for index, part in enumerate(parts):
+            sections.append({"title": title if len(parts) == 1 else f"{title} ({index + 1})", "text": part})
+
+    if not sections and job_description.strip():
+        # All boilerplate, or too short for a section: match on the whole text
+        sections = [{"title": "Job description", "text": part} for part in _chunks(job_description.strip(), max_chars)]
+
+    if len(sections) > max_sections:
+        def priority(item):
+            index, section = item
+            rank = next((rank for rank, pattern in enumerate(PRIORITY) if pattern.search(section["title"])), len(PRIORITY))
+            return rank, index
+
+        kept = sorted(sorted(enumerate(sections), key=priority)[:max_sections])
+        logger.info(f"⚠ Job description has {len(sections)} sections - matching the {max_sections} most relevant")
+        sections = [section for _, section in kept]
+    return sections
+
+
+def _clean_skills(text: str) -> List[str]:
+    skills = []
+    for part in SKILL_SEPARATORS.split(SKILL_END.split(text)[0]):
+        part = re.sub(r"^(?:and|or|the|a|an)\s+|\s+(?:skills?|experience|knowledge)$", "", part.strip(" .()"), flags=re.I)
+        if not part or NON_SKILL.search(part) or len(part) > 40 or len(part.split()) > 3:
+            continue
+        skills.append(part)
+    return skills
+
+
+def extract_skills(job_description: str, max_skills: int = MAX_SKILLS) -> Optional[List[str]]:
+    """
+    Skills from the requirement / skills / tech stack sections (not "nice to have")
+
+    Short bullets ("- Django", "- REST APIs") are skills; longer bullets
+    contribute the list after "experience with", "proficient in", ...;
+    "Tech stack: Python, Django" lines are split.
+    """
+    title = "Overview"
+    found: Dict[str, str] = {}
+    for line in job_description.splitlines():
+        heading = _heading(line)
+        if heading is not None:
+            title = heading
+            continue
+        inline = INLINE_LIST.match(BULLET.sub("", line))
+        if inline:
+            candidates = _clean_skills(inline.group(1))
+        elif not SKILL_SECTIONS.search(title) or OPTIONAL_SECTIONS.search(title) or not BULLET.match(line):
+            continue
+        else:
+            item = BULLET.sub("", line).strip()
+            lead = SKILL_LEAD.search(item)
+            if lead:
+                candidates = _clean_skills(lead.group(1))
+            elif len(item.split()) <= 3 and not NON_SKILL.search(item):
+                candidates = [item.strip(" .;")]
+            else:
+                candidates = []
+        for skill in candidates:
+            found.setdefault(skill.lower(), skill)
+    skills = list(found.values())[:max_skills]
+    return skills or None
+
+
+def parse_job_description(job_description: str) -> Dict[str, Any]:
+    """
+    Sections, skills and filters of a job description
+
+    Returns:
+        {"sections": [{"title", "text"}], "search_intent", "filters"} where filters
+        has the parsed-query keys (only min_experience, location and required_skills set)
+    """
+    sections = split_sections(job_description)
+    rules = RuleQueryParser().parse("\n".join(section["text"] for section in sections))["filters"]
+    skills = extract_skills(job_description)
+    filters = {key: None for key in rules}
+    filters.update({
+        "min_experience": rules["min_experience"],
+        "location": rules["location"],
+        "required_skills": skills,
+    })
+    return {
+        "sections": sections,
+        "search_intent": ", ".join(skills or []) or (sections[0]["text"][:200] if sections else ""),
+        "filters": filters,
+    }
@@ -0,0 +1,261 @@
+"""
+Local BM25 Lexical Index (degraded mode)
+Inverted index over resume, skills, tasks and job title, stored as
+memory-mapped numpy arrays. When Gemini embeddings are unavailable the
+engine answers from it with no network calls, applying the same filter
+semantics as IntelligentSearchEngine._build_filter().
+
+Build with: python3 scripts/migrations/build_lexical_index.py
+"""
+import os
+import json
+import math
+import logging
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+import numpy as np
+
+try:
+    from core.passage_index import tokenize
+except ImportError:  # run directly from scripts/core
+    from passage_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Field -> term frequency boost (BM25F-style; one combined document per applicant)
+FIELD_BOOSTS = {
+    "job_title": 3.0,
+    "skills_extracted": 2.0,
+    "tasks_summary": 1.0,
+    "resume_full_text": 1.0,
+}
+
+# Payload fields not kept in the index (large; snippets come from the passage index)
+EXCLUDED_PAYLOAD_FIELDS = ("resume_full_text", "work_history_text")
+
+# Lexical scores are unbounded; s / (s + K) maps them to a 0..1 "semantic" score
+SCORE_SATURATION = 10.0
+
+_ARRAYS = ("indptr", "postings_docs", "postings_weights", "idf", "experience", "date_applied")
+
+
+class LexicalIndex:
+    """BM25 over a CSR inverted index (term -> doc ids, weights)"""
+
+    def __init__(
+        self,
+        vocabulary: List[str],
+        arrays: Dict[str, np.ndarray],
+        point_ids: List[Any],
+        payloads: List[Dict[str, Any]],
+        meta: Dict[str, Any]
+    ):
+        self.vocabulary = vocabulary
+        self.term_ids = {term: i for i, term in enumerate(vocabulary)}
+        self.indptr = arrays["indptr"]
+        self.postings_docs = arrays["postings_docs"]
+        self.postings_weights = arrays["postings_weights"]
+        self.idf = arrays["idf"]
+        self.experience = arrays["experience"]
+        self.date_applied = arrays["date_applied"]
+        self.point_ids = point_ids
+        self.payloads = payloads
+        self.meta = meta
+
+        # Exact-match columns and word sets for the MatchText filters
+        self._location = np.array([p.get("location") for p in payloads], dtype=object)
+        self._education = np.array([p.get("education_level") for p in payloads], dtype=object)
+        self._words = {
+            field: [frozenset(tokenize(p.get(field) or "")) for p in payloads]
+            for field in ("job_title", "company_names", "current_company")
+        }
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    # ------------------------------------------------------------------
+    # Build / persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, records: Iterable[Tuple[Any, Dict[str, Any]]], k1: float = 1.2, b: float = 0.75) -> "LexicalIndex":
+        """
+        Build from (point_id, payload) pairs in collection order
+
+        Args:
+            records: Point ids and payloads as uploaded to applicants_unified
+            k1, b: BM25 parameters
+        """
+        point_ids, payloads, doc_terms = [], [], []
+        for point_id, payload in records:
+            counts: Counter = Counter()
+            for field, boost in FIELD_BOOSTS.items():
+                for term in tokenize(payload.get(field) or ""):
+                    counts[term] += boost
+            point_ids.append(point_id)
+            payloads.append({k: v for k, v in payload.items() if k not in EXCLUDED_PAYLOAD_FIELDS})
+            doc_terms.append(counts)
+
+        n_docs = len(payloads)
+        lengths = np.array([sum(c.values()) for c in doc_terms], dtype=np.float64)
+        avgdl = float(lengths.mean()) if n_docs else 1.0
+
+        postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for doc, counts in enumerate(doc_terms):
+            norm = k1 * (1 - b + b * lengths[doc] / avgdl)
+            for term, tf in counts.items():
+                postings[term].append((doc, tf * (k1 + 1) / (tf + norm)))
+
+        vocabulary = sorted(postings)
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        docs, weights, idf = [], [], []
+        for i, term in enumerate(vocabulary):
+            entries = postings[term]
+            indptr[i + 1] = indptr[i] + len(entries)
+            docs.extend(doc for doc, _ in entries)
+            weights.extend(weight for _, weight in entries)
+            df = len(entries)
+            idf.append(math.log(1 + (n_docs - df + 0.5) / (df + 0.5)))
+
+        arrays = {
+            "indptr": indptr,
+            "postings_docs": np.array(docs, dtype=np.int32),
+            "postings_weights": np.array(weights, dtype=np.float32),
+            "idf": np.array(idf, dtype=np.float32),
+            "experience": np.array([_as_float(p.get("total_years_experience")) for p in payloads], dtype=np.float64),
+            "date_applied": np.array([_as_float(p.get("date_applied")) for p in payloads], dtype=np.float64),
+        }
+        meta = {"version": INDEX_VERSION, "k1": k1, "b": b, "avgdl": avgdl, "n_docs": n_docs}
+
+        logger.info(f"✓ Lexical index: {n_docs} applicants, {len(vocabulary)} terms, {len(docs)} postings")
+        return cls(vocabulary, arrays, point_ids, payloads, meta)
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), np.asarray(getattr(self, name)))
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        with open(os.path.join(directory, "vocabulary.json"), "w", encoding="utf-8") as f:
+            json.dump(self.vocabulary, f, ensure_ascii=False)
+        with open(os.path.join(directory, "payloads.json"), "w", encoding="utf-8") as f:
+            json.dump({"point_ids": self.point_ids, "payloads": self.payloads}, f, ensure_ascii=False, default=str)
+
+    @classmethod
+    def load(cls, directory: str) -> "LexicalIndex":
+        """Load an index; the postings arrays are memory-mapped, not read into RAM"""
+        with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported lexical index version: {meta.get('version')}")
+        with open(os.path.join(directory, "vocabulary.json"), "r", encoding="utf-8") as f:
+            vocabulary = json.load(f)
+        with open(os.path.join(directory, "payloads.json"), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in _ARRAYS}
+        index = cls(vocabulary, arrays, stored["point_ids"], stored["payloads"], meta)
+        logger.info(f"✓ Lexical index loaded: {len(index)} applicants from {directory}")
+        return index
+
+    @classmethod
+    def from_env(cls) -> Optional["LexicalIndex"]:
+        """Load LEXICAL_INDEX_PATH, or None when unset/missing (no degraded mode)"""
+        path = os.getenv("LEXICAL_INDEX_PATH")
+        if not path:
+            return None
+        if not os.path.exists(os.path.join(path, "meta.json")):
+            logger.warning(f"⚠ LEXICAL_INDEX_PATH not found: {path} - degraded mode disabled")
+            return None
+        return cls.load(path)
+
+    # ------------------------------------------------------------------
+    # Query side
+    # ------------------------------------------------------------------
+
+    def filter_mask(self, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Boolean mask of applicants passing the filters, mirroring _build_filter():
+        ranges on experience/date (missing values fail), exact location and
+        education, any-of job titles and companies where every word of the
+        title/company appears in the field (full-text MatchText semantics)
+        """
+        mask = np.ones(len(self), dtype=bool)
+
+        if filters.get('min_experience') is not None:
+            mask &= self.experience >= float(filters['min_experience'])
+        if filters.get('max_experience') is not None:
+            mask &= self.experience <= float(filters['max_experience'])
+        if filters.get('location'):
+            mask &= self._location == filters['location']
+        if filters.get('education_level'):
+            mask &= self._education == filters['education_level']
+        if filters.get('min_date_applied') is not None:
+            mask &= self.date_applied >= int(filters['min_date_applied'])
+        if filters.get('max_date_applied') is not None:
+            mask &= self.date_applied <= int(filters['max_date_applied'])
+
+        if filters.get('desired_job_titles'):
+            mask &= self._match_any_text(["job_title"], filters['desired_job_titles'], mask)
+        if filters.get('target_companies'):
+            mask &= self._match_any_text(["company_names", "current_company"], filters['target_companies'], mask)
+
+        return mask
+
+    def _match_any_text(self, fields: List[str], texts: List[str], candidates: np.ndarray) -> np.ndarray:
+        wanted = [frozenset(tokenize(text)) for text in texts]
+        wanted = [words for words in wanted if words]
+        result = np.zeros(len(self), dtype=bool)
+        for doc in np.flatnonzero(candidates):
+            result[doc] = any(
+                words <= self._words[field][doc] for field in fields for words in wanted
+            )
+        return result
+
+    def search(
+        self,
+        search_intent: str,
+        filters: Dict[str, Any],
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        BM25 search in the IntelligentSearchEngine candidate format
+
+        Query terms come from the search intent, required skills and desired
+        job titles. Returns up to `limit` candidates with a positive score.
+        """
+        texts = [search_intent] + list(filters.get('required_skills') or []) + list(filters.get('desired_job_titles') or [])
+        term_ids = {self.term_ids[t] for text in texts for t in tokenize(text) if t in self.term_ids}
+
+        scores = np.zeros(len(self), dtype=np.float64)
+        for term_id in term_ids:
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            scores[self.postings_docs[start:end]] += self.idf[term_id] * self.postings_weights[start:end]
+
+        scores[~self.filter_mask(filters)] = 0.0
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+        matched = matched[np.argsort(-scores[matched], kind="stable")]
+
+        candidates = []
+        for doc in matched:
+            score = float(scores[doc])
+            semantic = score / (score + SCORE_SATURATION)
+            candidates.append({
+                "id": self.point_ids[doc],
+                "semantic_score": semantic,
+                "vector_scores": {"lexical": round(score, 3)},
+                "payload": dict(self.payloads[doc])
+            })
+        return candidates
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else math.nan
+    except (TypeError, ValueError):
+        return math.nan
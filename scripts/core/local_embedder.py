@@ -0,0 +1,133 @@
+"""
+Local (On-Box) Query Embedder
+CPU sentence-transformer for the shadow vectors resume_local / skills_local /
+tasks_local in applicants_unified. Documents are embedded offline at upload;
+queries are embedded in-process, so a search in "local" mode makes no Gemini call.
+
+Configuration (from .env):
+    LOCAL_EMBED_MODEL   - sentence-transformers model (unset = local mode disabled)
+    LOCAL_EMBED_DEVICE  - torch device (default "cpu")
+"""
+import os
+import logging
+import threading
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCAL_MODEL = "sentence-transformers/all-mpnet-base-v2"
+
+# Gemini vector name -> local shadow vector name
+LOCAL_VECTOR_NAMES = {
+    "resume": "resume_local",
+    "skills": "skills_local",
+    "tasks": "tasks_local",
+}
+
+# Payload text embedded offline for each shadow vector
+LOCAL_TEXT_FIELDS = {
+    "resume_local": "resume_full_text",
+    "skills_local": "skills_extracted",
+    "tasks_local": "tasks_summary",
+}
+
+
+class LocalEmbedder:
+    """
+    Thread-safe, preloadable sentence-transformer
+
+    Loading the model takes seconds, so the API starts preload() in a
+    background thread and searches only use local mode once is_ready.
+    """
+
+    def __init__(self, model_name: Optional[str] = None, device: Optional[str] = None, model: Optional[Any] = None):
+        """
+        Args:
+            model_name: sentence-transformers model (defaults to LOCAL_EMBED_MODEL)
+            device: torch device (defaults to LOCAL_EMBED_DEVICE or "cpu")
+            model: Pre-built model with encode() (skips loading)
+        """
+        self.model_name = model_name or os.getenv("LOCAL_EMBED_MODEL") or DEFAULT_LOCAL_MODEL
+        self.device = device or os.getenv("LOCAL_EMBED_DEVICE", "cpu")
+        self._model = model
+        self._lock = threading.Lock()
+        self.load_error: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["LocalEmbedder"]:
+        """LocalEmbedder for LOCAL_EMBED_MODEL, or None when unset (local mode disabled)"""
+        if not os.getenv("LOCAL_EMBED_MODEL"):
+            return None
+        return cls()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._model is not None
+
+    @property
+    def model(self):
+        """The loaded model (loads it synchronously if preload has not finished)"""
+        if self._model is None:
+            self.load()
+        return self._model
+
+    @property
+    def dimension(self) -> int:
+        return int(self.model.get_sentence_embedding_dimension())
+
+    def load(self) -> None:
+        """Load the model (blocking, once)"""
+        with self._lock:
+            if self._model is not None:
+                return
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                self.load_error = "sentence-transformers not installed"
+                logger.error("sentence-transformers not installed. Install with: pip install sentence-transformers")
+                raise
+            logger.info(f"Loading local embedding model: {self.model_name} ({self.device})")
+            self._model = SentenceTransformer(self.model_name, device=self.device)
+            logger.info(f"✓ Local embedding model loaded ({self._model.get_sentence_embedding_dimension()}-dim)")
+
+    def preload(self) -> threading.Thread:
+        """Load the model in a background thread (failures are logged, not raised)"""
+        def _load():
+            try:
+                self.load()
+            except Exception as e:
+                self.load_error = str(e)
+                logger.warning(f"⚠ Local embedding model failed to load: {e} - local mode unavailable")
+
+        thread = threading.Thread(target=_load, name="local-embedder-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def embed(self, text: str) -> List[float]:
+        """Normalized embedding of one query"""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        """Normalized embeddings (cosine-ready) for a list of texts"""
+        embeddings = self.model.encode(
+            [text or "" for text in texts],
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            show_progress_bar=len(texts) > batch_size
+        )
+        return [list(map(float, embedding)) for embedding in embeddings]
+
+    def document_vectors(self, payloads: List[Dict[str, Any]], batch_size: int = 32) -> List[Dict[str, List[float]]]:
+        """Named shadow vectors for applicant payloads (offline, at upload)"""
+        by_name = {
+            name: self.embed_batch([payload.get(field) or "" for payload in payloads], batch_size)
+            for name, field in LOCAL_TEXT_FIELDS.items()
+        }
+        return [{name: by_name[name][i] for name in LOCAL_TEXT_FIELDS} for i in range(len(payloads))]
+
+
+def local_vectors_config(dimension: int) -> Dict[str, Any]:
+    """vectors_config entries for the shadow vectors (COSINE, like the Gemini vectors)"""
+    from qdrant_client.models import VectorParams, Distance
+
+    return {name: VectorParams(size=dimension, distance=Distance.COSINE) for name in LOCAL_TEXT_FIELDS}
@@ -3,7 +3,7 @@ Match Explanation Generator
 Generates human-readable explanations for why candidates match queries
 """
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +11,17 @@ logger = logging.getLogger(__name__)
 class MatchExplainer:
     """Generate human-readable match explanations for search results"""
 
+    def __init__(self, passage_index: Optional[Any] = None, text_store: Optional[Any] = None):
+        """
+        Args:
+            passage_index: core.passage_index.PassageIndex for query-aware snippets
+                (without it, snippets are the first 200 characters of the resume)
+            text_store: core.text_store.TextStore holding resume text that is not
+                in the Qdrant payload
+        """
+        self.passage_index = passage_index
+        self.text_store = text_store
+
     def explain(
         self,
         candidate: Dict[str, Any],
@@ -26,13 +37,76 @@ class MatchExplainer:
         Returns:
             Dictionary with candidate info, scores, and match reasons
         """
-        payload = candidate['payload']
+        return self.explain_batch([candidate], parsed_query)[0]
+
+    def explain_batch(
+        self,
+        candidates: List[Dict[str, Any]],
+        parsed_query: Dict[str, Any],
+        scores_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Explain a whole result page in one pass
+
+        Query-side matchers (skills, seniority, location, education) are
+        compiled once and reused for every candidate.
+
+        Args:
+            candidates: Results from IntelligentSearchEngine.search()
+            parsed_query: Output from GeminiQueryParser.parse()
+            scores_only: Skip match reasons and resume snippets (machine clients)
+
+        Returns:
+            One explain()-shaped dictionary per candidate, in input order
+        """
+        matchers = self._compile_matchers(parsed_query)
+        if self.text_store is not None and not scores_only:
+            # One batched lookup, only for candidates whose snippet needs the resume text:
+            # not in the payload, and no indexed passage to serve it instead
+            needed = [
+                candidate['payload'].get('id') for candidate in candidates
+                if not candidate['payload'].get('resume_full_text')
+                and not (self.passage_index is not None and candidate['payload'].get('id') in self.passage_index)
+            ]
+            if needed:
+                matchers['texts'] = self.text_store.get_many(needed)
+        return [self._explain_one(candidate, matchers, scores_only) for candidate in candidates]
+
+    def _compile_matchers(self, parsed_query: Dict[str, Any]) -> Dict[str, Any]:
+        """Pre-process the query filters (and snippet terms) once per batch"""
         filters = parsed_query['filters']
+        query_terms = None
+        if self.passage_index is not None:
+            query_terms = self.passage_index.compile_query(
+                parsed_query.get('search_intent', ''),
+                filters.get('required_skills')
+            )
+
+        return {
+            "query_terms": query_terms,
+            "texts": {},
+            "min_experience": filters.get('min_experience'),
+            "max_experience": filters.get('max_experience'),
+            "location": filters.get('location') or None,
+            "education_level": filters.get('education_level') or None,
+            "skills": [(skill, skill.lower()) for skill in (filters.get('required_skills') or [])],
+            "seniority": [(keyword, keyword.lower()) for keyword in (filters.get('seniority_keywords') or [])],
+        }
+
+    def _explain_one(
+        self,
+        candidate: Dict[str, Any],
+        matchers: Dict[str, Any],
+        scores_only: bool
+    ) -> Dict[str, Any]:
+        payload = candidate['payload']
+        semantic_score = candidate['semantic_score']
 
         # Extract candidate info
         result = {
             "candidate": {
                 "id": payload.get('id'),
+                "point_id": candidate.get('id'),
                 "name": payload.get('full_name'),
                 "email": payload.get('email'),
                 "job_title": payload.get('job_title'),
@@ -47,7 +121,7 @@ class MatchExplainer:
             },
             "scores": {
                 "final_score": round(candidate['final_score'], 3),
-                "semantic_score": round(candidate['semantic_score'], 3),
+                "semantic_score": round(semantic_score, 3),
                 "skills_match_score": round(candidate['skills_match_score'], 2),
                 "vector_breakdown": {
                     name: round(score, 3)
@@ -55,58 +129,58 @@ class MatchExplainer:
                 }
             },
             "match_reasons": [],
-            "resume_snippet": self._get_resume_snippet(payload)
+            "resume_snippet": ""
         }
 
+        if scores_only:
+            return result
+
+        result['resume_snippet'] = self._get_resume_snippet(
+            payload, query_terms=matchers['query_terms'], texts=matchers['texts'].get(str(payload.get('id')))
+        )
+
         # Generate match reasons
         reasons = []
 
         # Experience match
         exp = payload.get('total_years_experience', 0)
-        if filters.get('min_experience') is not None:
-            min_exp = filters['min_experience']
+        min_exp = matchers['min_experience']
+        if min_exp is not None:
             if exp >= min_exp:
-                years_over = exp - min_exp
-                reasons.append(f"✓ {exp:.1f} years experience (exceeds {min_exp}+ requirement by {years_over:.1f} years)")
+                reasons.append(f"✓ {exp:.1f} years experience (exceeds {min_exp}+ requirement by {exp - min_exp:.1f} years)")
             else:
                 reasons.append(f"⚠ {exp:.1f} years experience (below {min_exp}+ requirement)")
 
-        if filters.get('max_experience') is not None:
-            max_exp = filters['max_experience']
+        max_exp = matchers['max_experience']
+        if max_exp is not None:
             if exp <= max_exp:
                 reasons.append(f"✓ {exp:.1f} years experience (within 0-{max_exp} range)")
             else:
                 reasons.append(f"⚠ {exp:.1f} years experience (above {max_exp} maximum)")
 
         # Location match
-        location = payload.get('location', '')
-        if filters.get('location'):
-            required_location = filters['location']
+        required_location = matchers['location']
+        if required_location:
+            location = payload.get('location', '')
             if required_location in location:
                 reasons.append(f"✓ Located in {location}")
             else:
                 reasons.append(f"⚠ Located in {location} (requested: {required_location})")
 
         # Education match
-        education = payload.get('education_level', '')
-        if filters.get('education_level'):
-            required_edu = filters['education_level']
+        required_edu = matchers['education_level']
+        if required_edu:
+            education = payload.get('education_level', '')
             if education == required_edu:
                 reasons.append(f"✓ {education} (matches requirement)")
             else:
                 reasons.append(f"⚠ {education} (requested: {required_edu})")
 
         # Skills match
-        if filters.get('required_skills'):
-            skills_text = payload.get('skills_extracted', '').lower()
-            matched_skills = []
-            missing_skills = []
-
-            for skill in filters['required_skills']:
-                if skill.lower() in skills_text:
-                    matched_skills.append(skill)
-                else:
-                    missing_skills.append(skill)
+        if matchers['skills']:
+            skills_text = (payload.get('skills_extracted') or '').lower()
+            matched_skills = [skill for skill, lowered in matchers['skills'] if lowered in skills_text]
+            missing_skills = [skill for skill, lowered in matchers['skills'] if lowered not in skills_text]
 
             if matched_skills:
                 reasons.append(f"✓ Has required skills: {', '.join(matched_skills)}")
@@ -115,24 +189,19 @@ class MatchExplainer:
                 reasons.append(f"⚠ Missing skills: {', '.join(missing_skills)}")
 
         # Seniority match
-        if filters.get('seniority_keywords'):
-            job_title = payload.get('job_title', '').lower()
-            seniority_found = []
-
-            for keyword in filters['seniority_keywords']:
-                if keyword.lower() in job_title:
-                    seniority_found.append(keyword)
+        job_title = payload.get('job_title', '')
+        if matchers['seniority']:
+            job_title_lower = (job_title or '').lower()
+            seniority_found = [keyword for keyword, lowered in matchers['seniority'] if lowered in job_title_lower]
 
             if seniority_found:
                 reasons.append(f"✓ Seniority level: {', '.join(seniority_found)} position")
 
         # Job title relevance
-        job_title = payload.get('job_title', '')
         if job_title:
             reasons.append(f"📋 Current role: {job_title}")
 
         # Semantic match explanation
-        semantic_score = candidate['semantic_score']
         if semantic_score >= 0.7:
             reasons.append(f"🎯 Strong semantic match (score: {semantic_score:.2f})")
         elif semantic_score >= 0.5:
@@ -144,9 +213,21 @@ class MatchExplainer:
 
         return result
 
-    def _get_resume_snippet(self, payload: Dict[str, Any], max_length: int = 200) -> str:
-        """Extract relevant snippet from resume"""
-        resume_text = payload.get('resume_full_text', '')
+    def _get_resume_snippet(
+        self,
+        payload: Dict[str, Any],
+        max_length: int = 200,
+        query_terms: Optional[Dict[int, float]] = None,
+        texts: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Extract relevant snippet from resume (best indexed passage, else the resume head)"""
+        if query_terms is not None:
+            passage = self.passage_index.best_passage(payload.get('id'), query_terms)
+            if passage is not None:
+                text = passage['text']
+                return text[:max_length] + "..." if len(text) > max_length else text
+
+        resume_text = payload.get('resume_full_text') or (texts or {}).get('resume_full_text', '')
 
         if not resume_text:
             return ""
@@ -0,0 +1,233 @@
+"""
+Resume Passage Index
+Ingest-time split of each resume into short passages (with character offsets)
+plus a compact lexical index, so the explainer can pick a query-relevant
+snippet without downloading or scanning the full resume text per request.
+
+Build with: python3 scripts/migrations/build_passage_index.py
+"""
+import os
+import re
+import gzip
+import json
+import math
+import logging
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_PASSAGE_CHARS = 240
+SKILL_BOOST = 3.0
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or the to with
+experience years year work worked working using skills skill
+""".split())
+
+_BOUNDARY_RE = re.compile(r"(?<=[.!?;])\s+|\n+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase terms (keeps c++, c#, node.js), stopwords removed"""
+    return [t for t in TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+def split_passages(text: str, passage_chars: int = DEFAULT_PASSAGE_CHARS) -> List[Tuple[int, int]]:
+    """
+    Split text into passages of about `passage_chars` on line/sentence boundaries
+
+    Returns:
+        List of (start, end) character offsets into `text`
+    """
+    if not text:
+        return []
+
+    # Sentence/line spans with their offsets
+    spans = []
+    position = 0
+    for match in _BOUNDARY_RE.finditer(text):
+        if match.start() > position:
+            spans.append((position, match.start()))
+        position = match.end()
+    if position < len(text):
+        spans.append((position, len(text)))
+
+    passages = []
+    current_start, current_end = None, None
+    for start, end in spans:
+        # Hard-wrap very long spans (e.g. resumes without punctuation)
+        while end - start > passage_chars * 2:
+            cut = text.rfind(" ", start, start + passage_chars)
+            cut = cut if cut > start else start + passage_chars
+            if current_start is not None:
+                passages.append((current_start, current_end))
+                current_start = None
+            passages.append((start, cut))
+            start = cut + 1 if text[cut:cut + 1] == " " else cut
+
+        if current_start is None:
+            current_start, current_end = start, end
+        elif end - current_start <= passage_chars:
+            current_end = end
+        else:
+            passages.append((current_start, current_end))
+            current_start, current_end = start, end
+
+    if current_start is not None:
+        passages.append((current_start, current_end))
+    return passages
+
+
+class PassageIndex:
+    """
+    Per-applicant passages with term-id sets and corpus IDF
+
+    Snippet selection is a handful of set lookups per passage, so it stays
+    well under a millisecond per candidate.
+    """
+
+    def __init__(self, vocabulary: List[str], idf: List[float], documents: Dict[str, Dict[str, Any]],
+                 passage_chars: int = DEFAULT_PASSAGE_CHARS):
+        self.vocabulary = vocabulary
+        self.term_ids = {term: i for i, term in enumerate(vocabulary)}
+        self.idf = idf
+        self.passage_chars = passage_chars
+        self.documents = {
+            doc_id: {
+                "offsets": doc["offsets"],
+                "passages": doc["passages"],
+                "terms": [frozenset(ids) for ids in doc["terms"]],
+            }
+            for doc_id, doc in documents.items()
+        }
+
+    @classmethod
+    def build(cls, resumes: Iterable[Tuple[str, str]], passage_chars: int = DEFAULT_PASSAGE_CHARS) -> "PassageIndex":
+        """
+        Build an index from (applicant_id, resume_text) pairs
+
+        Args:
+            resumes: Iterable of (applicant id, full resume text)
+            passage_chars: Target passage length in characters
+        """
+        term_ids: Dict[str, int] = {}
+        passage_freq: List[int] = []
+        documents = {}
+        passage_count = 0
+
+        for doc_id, text in resumes:
+            if not doc_id or not text:
+                continue
+            offsets = split_passages(text, passage_chars)
+            passages, terms = [], []
+            for start, end in offsets:
+                ids = set()
+                for term in tokenize(text[start:end]):
+                    if term not in term_ids:
+                        term_ids[term] = len(term_ids)
+                        passage_freq.append(0)
+                    ids.add(term_ids[term])
+                for term_id in ids:
+                    passage_freq[term_id] += 1
+                passages.append(text[start:end])
+                terms.append(sorted(ids))
+            passage_count += len(offsets)
+            documents[str(doc_id)] = {"offsets": offsets, "passages": passages, "terms": terms}
+
+        vocabulary = [None] * len(term_ids)
+        for term, term_id in term_ids.items():
+            vocabulary[term_id] = term
+        idf = [math.log(1 + (passage_count - df + 0.5) / (df + 0.5)) for df in passage_freq]
+
+        logger.info(f"✓ Passage index: {len(documents)} resumes, {passage_count} passages, {len(vocabulary)} terms")
+        return cls(vocabulary, idf, documents, passage_chars)
+
+    # ------------------------------------------------------------------
+    # Persistence (gzip JSON)
+    # ------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "passage_chars": self.passage_chars,
+            "vocabulary": self.vocabulary,
+            "idf": [round(value, 4) for value in self.idf],
+            "documents": {
+                doc_id: {"offsets": doc["offsets"], "passages": doc["passages"], "terms": [sorted(t) for t in doc["terms"]]}
+                for doc_id, doc in self.documents.items()
+            },
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "PassageIndex":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported passage index version: {data.get('version')}")
+        index = cls(data["vocabulary"], data["idf"], data["documents"], data.get("passage_chars", DEFAULT_PASSAGE_CHARS))
+        logger.info(f"✓ Passage index loaded: {len(index.documents)} resumes from {path}")
+        return index
+
+    @classmethod
+    def from_env(cls) -> Optional["PassageIndex"]:
+        """Load PASSAGE_INDEX_PATH, or None when unset/missing (explainer falls back to the resume head)"""
+        path = os.getenv("PASSAGE_INDEX_PATH")
+        if not path:
+            return None
+        if not os.path.exists(path):
+            logger.warning(f"⚠ PASSAGE_INDEX_PATH not found: {path} - using resume head snippets")
+            return None
+        return cls.load(path)
+
+    # ------------------------------------------------------------------
+    # Query side
+    # ------------------------------------------------------------------
+
+    def compile_query(self, search_intent: str, required_skills: Optional[List[str]] = None) -> Dict[int, float]:
+        """
+        Weighted query term ids (IDF; required skills x3, so the snippet shows
+        evidence of the skills before general intent terms); unknown terms are dropped
+
+        Compile once per query and reuse for every candidate.
+        """
+        weights: Dict[int, float] = {}
+        for text, boost in [(search_intent, 1.0)] + [(skill, SKILL_BOOST) for skill in (required_skills or [])]:
+            for term in tokenize(text):
+                term_id = self.term_ids.get(term)
+                if term_id is not None:
+                    weights[term_id] = max(weights.get(term_id, 0.0), self.idf[term_id] * boost)
+        return weights
+
+    def __contains__(self, doc_id: Any) -> bool:
+        """Whether best_passage() has a passage for this resume"""
+        doc = self.documents.get(str(doc_id))
+        return bool(doc and doc["passages"])
+
+    def best_passage(self, doc_id: Any, query_terms: Dict[int, float]) -> Optional[Dict[str, Any]]:
+        """
+        Highest-scoring passage of one resume for compiled query terms
+
+        Returns:
+            {"text", "start", "end", "score"} or None when the resume is not indexed.
+            With no matching terms the first passage is returned (score 0).
+        """
+        doc = self.documents.get(str(doc_id))
+        if not doc or not doc["passages"]:
+            return None
+
+        best, best_score = 0, 0.0
+        if query_terms:
+            for i, terms in enumerate(doc["terms"]):
+                score = sum(weight for term_id, weight in query_terms.items() if term_id in terms)
+                if score > best_score:
+                    best, best_score = i, score
+
+        start, end = doc["offsets"][best]
+        return {"text": doc["passages"][best], "start": start, "end": end, "score": best_score}
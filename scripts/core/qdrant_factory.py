@@ -0,0 +1,151 @@
+"""
+Shared Qdrant Client Factory
+One pooled, keep-alive client per (url, transport) for the whole process,
+with gRPC (protobuf vectors) or REST (JSON) transport and per-operation timeouts.
+
+Configuration (from .env):
+    QDRANT_URL / QDRANT_API_KEY   - cluster and key
+    QDRANT_PREFER_GRPC            - "true" to send searches/upserts over gRPC (port QDRANT_GRPC_PORT, default 6334)
+    QDRANT_POOL_SIZE              - HTTP connections / gRPC channels (default 8)
+    QDRANT_KEEPALIVE_SECONDS      - idle keep-alive for pooled connections (default 60)
+    QDRANT_TIMEOUT                - transport timeout in seconds (default 120)
+    QDRANT_SEARCH_TIMEOUT         - server-side timeout for searches (default 10)
+    QDRANT_UPSERT_TIMEOUT         - server-side timeout for upserts (default 120)
+    QDRANT_ADMIN_TIMEOUT          - collection create/delete/index timeout (default 300)
+"""
+import os
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upsert batches of 3 x 3072-dim vectors plus resume text exceed gRPC's 4 MB default
+GRPC_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+OPERATION_TIMEOUT_DEFAULTS = {
+    "search": 10,
+    "upsert": 120,
+    "admin": 300,
+}
+
+_clients: Dict[Tuple, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+
+def operation_timeout(operation: str) -> int:
+    """
+    Server-side timeout (seconds) for an operation class
+
+    Args:
+        operation: "search", "upsert" or "admin" (reads QDRANT_{OPERATION}_TIMEOUT)
+    """
+    if operation not in OPERATION_TIMEOUT_DEFAULTS:
+        raise ValueError(f"Unknown Qdrant operation '{operation}'")
+    return int(os.getenv(f"QDRANT_{operation.upper()}_TIMEOUT", str(OPERATION_TIMEOUT_DEFAULTS[operation])))
+
+
+def create_qdrant_client(
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    prefer_grpc: Optional[bool] = None,
+    timeout: Optional[int] = None,
+    pool_size: Optional[int] = None
+):
+    """
+    Build a new pooled Qdrant client (prefer get_qdrant_client() for sharing)
+
+    Args:
+        url: Qdrant URL (defaults to QDRANT_URL)
+        api_key: Qdrant API key (defaults to QDRANT_API_KEY)
+        prefer_grpc: Use gRPC for point operations (defaults to QDRANT_PREFER_GRPC)
+        timeout: Transport timeout in seconds (defaults to QDRANT_TIMEOUT)
+        pool_size: Pooled HTTP connections / gRPC channels (defaults to QDRANT_POOL_SIZE)
+
+    Returns:
+        QdrantClient
+    """
+    from qdrant_client import QdrantClient
+
+    url = url or os.getenv('QDRANT_URL')
+    api_key = api_key or os.getenv('QDRANT_API_KEY')
+    if not url:
+        raise ValueError("QDRANT_URL required")
+
+    prefer_grpc = _env_flag('QDRANT_PREFER_GRPC') if prefer_grpc is None else prefer_grpc
+    timeout = timeout if timeout is not None else int(os.getenv('QDRANT_TIMEOUT', '120'))
+    pool_size = pool_size if pool_size is not None else int(os.getenv('QDRANT_POOL_SIZE', '8'))
+    keepalive = float(os.getenv('QDRANT_KEEPALIVE_SECONDS', '60'))
+
+    kwargs: Dict[str, Any] = {
+        "url": url,
+        "api_key": api_key,
+        "timeout": timeout,
+        "prefer_grpc": prefer_grpc,
+    }
+
+    if prefer_grpc:
+        kwargs["grpc_port"] = int(os.getenv('QDRANT_GRPC_PORT', '6334'))
+        kwargs["pool_size"] = pool_size
+        kwargs["grpc_options"] = {
+            "grpc.keepalive_time_ms": int(keepalive * 1000),
+            "grpc.keepalive_timeout_ms": 10000,
+            "grpc.keepalive_permit_without_calls": 1,
+            "grpc.max_send_message_length": GRPC_MAX_MESSAGE_BYTES,
+            "grpc.max_receive_message_length": GRPC_MAX_MESSAGE_BYTES,
+        }
+    else:
+        import httpx
+
+        kwargs["limits"] = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=keepalive
+        )
+
+    client = QdrantClient(**kwargs)
+    logger.info(f"✓ Qdrant client: {url} ({'gRPC' if prefer_grpc else 'REST'}, pool={pool_size}, timeout={timeout}s)")
+    return client
+
+
+def get_qdrant_client(
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    prefer_grpc: Optional[bool] = None,
+    timeout: Optional[int] = None,
+    pool_size: Optional[int] = None
+):
+    """
+    Process-wide shared Qdrant client for these settings (created on first use)
+
+    Same arguments as create_qdrant_client(); callers asking for the same
+    cluster and transport reuse one connection pool.
+    """
+    url = url or os.getenv('QDRANT_URL')
+    api_key = api_key or os.getenv('QDRANT_API_KEY')
+    prefer_grpc = _env_flag('QDRANT_PREFER_GRPC') if prefer_grpc is None else prefer_grpc
+    key = (url, api_key, prefer_grpc, timeout, pool_size)
+
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = create_qdrant_client(url, api_key, prefer_grpc, timeout, pool_size)
+                _clients[key] = client
+    return client
+
+
+def close_qdrant_clients() -> None:
+    """Close every shared client (e.g. on API shutdown)"""
+    with _clients_lock:
+        for client in _clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"⚠ Failed to close Qdrant client: {e}")
+        _clients.clear()
@@ -0,0 +1,148 @@
+"""
+Query Log Capture
+Records each API search (input, parsed query, query embedding, stage timings
+and ranked results) to a rotating JSONL file for deterministic replay.
+"""
+import os
+import json
+import glob
+import time
+import base64
+import hashlib
+import logging
+import logging.handlers
+from typing import List, Dict, Any, Optional, Iterator
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def encode_embedding(vector: List[float]) -> str:
+    """Pack an embedding as base64 float32 (about 4x smaller than JSON floats)"""
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode("ascii")
+
+
+def decode_embedding(encoded: str) -> List[float]:
+    """Inverse of encode_embedding()"""
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float32).tolist()
+
+
+def embedding_hash(vector: List[float]) -> str:
+    """Stable SHA-256 of the float32 embedding bytes"""
+    return hashlib.sha256(np.asarray(vector, dtype=np.float32).tobytes()).hexdigest()
+
+
+class QueryLogger:
+    """
+    Append-only JSONL query log with size-based rotation
+
+    Configuration (from .env):
+        QUERY_LOG_PATH          - log file; logging is disabled when unset
+        QUERY_LOG_MAX_BYTES     - rotate after this many bytes (default 50 MB)
+        QUERY_LOG_BACKUPS       - rotated files to keep (default 5)
+        QUERY_LOG_EMBEDDINGS    - "full" stores the vector (replayable), "hash" stores only its hash
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 50 * 1024 * 1024,
+        backup_count: int = 5,
+        store_embeddings: bool = True
+    ):
+        self.path = path
+        self.store_embeddings = store_embeddings
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Dedicated non-propagating logger so records never reach the app log
+        self._log = logging.getLogger(f"{__name__}.records.{os.path.abspath(path)}")
+        self._log.setLevel(logging.INFO)
+        self._log.propagate = False
+        if not self._log.handlers:
+            handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._log.addHandler(handler)
+
+        logger.info(f"✓ Query log enabled: {path} (embeddings: {'full' if store_embeddings else 'hash'})")
+
+    @classmethod
+    def from_env(cls) -> Optional["QueryLogger"]:
+        """Build a logger from environment variables, or None when disabled"""
+        path = os.getenv("QUERY_LOG_PATH")
+        if not path:
+            return None
+        return cls(
+            path,
+            max_bytes=int(os.getenv("QUERY_LOG_MAX_BYTES", str(50 * 1024 * 1024))),
+            backup_count=int(os.getenv("QUERY_LOG_BACKUPS", "5")),
+            store_embeddings=os.getenv("QUERY_LOG_EMBEDDINGS", "full").lower() != "hash"
+        )
+
+    def record(
+        self,
+        query: str,
+        request_options: Dict[str, Any],
+        parsed_query: Dict[str, Any],
+        query_vector: Optional[List[float]],
+        timings: Dict[str, float],
+        results: List[Dict[str, Any]],
+        tier: Optional[str] = None
+    ) -> None:
+        """
+        Append one search to the log
+
+        Args:
+            query: Raw natural language query
+            request_options: Search options (limit, enable_reranking, ...)
+            parsed_query: Output from GeminiQueryParser.parse()
+            query_vector: Query embedding used for the vector search
+            timings: Stage timings in milliseconds
+            results: Ranked candidates from IntelligentSearchEngine.search()
+            tier: Latency tier the search ran with (its settings are in request_options)
+        """
+        entry = {
+            "ts": time.time(),
+            "query": query,
+            "options": request_options,
+            "tier": tier,
+            "parsed_query": parsed_query,
+            "embedding_dim": len(query_vector) if query_vector else 0,
+            "embedding_sha256": embedding_hash(query_vector) if query_vector else None,
+            "embedding_b64": encode_embedding(query_vector) if (query_vector and self.store_embeddings) else None,
+            "timings_ms": {name: round(value, 2) for name, value in timings.items()},
+            "results": [
+                {"id": candidate["id"], "score": round(float(candidate["final_score"]), 6)}
+                for candidate in results
+            ],
+        }
+        self._log.info(json.dumps(entry, default=str, ensure_ascii=False))
+
+
+def read_query_log(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield log records oldest first, including rotated backups (path.N ... path.1, path)
+
+    Malformed lines (e.g. a partially written final line) are skipped.
+    """
+    backups = sorted(
+        (p for p in glob.glob(f"{glob.escape(path)}.*") if p.rsplit(".", 1)[-1].isdigit()),
+        key=lambda p: int(p.rsplit(".", 1)[-1]),
+        reverse=True
+    )
+    files = backups + ([path] if os.path.exists(path) else [])
+
+    for file_path in files:
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed query log line {file_path}:{line_number}")
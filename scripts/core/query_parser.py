@@ -3,12 +3,18 @@ Gemini-powered Natural Language Query Parser with OpenAI Fallback
 Extracts structured search intent and metadata filters from recruiter queries
 """
 import os
+import re
+import copy
 import json
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-from google import genai
-from openai import OpenAI
+
+try:
+    from core.cache import TTLCache
+except ImportError:  # run directly as scripts/core/query_parser.py
+    from cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -16,33 +22,69 @@ logger = logging.getLogger(__name__)
 class GeminiQueryParser:
     """Parse natural language recruiter queries into structured search parameters"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        gemini_client: Optional[Any] = None,
+        openai_client: Optional[Any] = None,
+        cache: Optional[TTLCache] = None
+    ):
         """
         Initialize query parser with Gemini and OpenAI fallback
 
+        SDK clients are created on first use, so constructing the parser
+        imports neither google.genai nor openai and makes no network calls.
+
         Args:
             api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
+            gemini_client: Pre-built Gemini client (skips the API key requirement)
+            openai_client: Pre-built OpenAI client for the fallback
+            cache: Parse cache (defaults to PARSE_CACHE_SIZE / PARSE_CACHE_TTL_SECONDS)
         """
         # Initialize Gemini
         self.gemini_key = api_key or os.getenv('GEMINI_API_KEY')
-        if not self.gemini_key:
+        if gemini_client is None and not self.gemini_key:
             raise ValueError("GEMINI_API_KEY not found in environment")
 
-        self.gemini_client = genai.Client(api_key=self.gemini_key)
+        self._gemini_client = gemini_client
+        self._client_lock = threading.Lock()
         logger.info("✓ Gemini query parser initialized")
 
         # Initialize OpenAI fallback
         self.openai_key = os.getenv('OPENAI_API_KEY')
         self.openai_model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+        self._openai_client = openai_client
 
-        if self.openai_key:
-            self.openai_client = OpenAI(api_key=self.openai_key)
+        if openai_client is not None or self.openai_key:
             logger.info(f"✓ OpenAI fallback initialized ({self.openai_model})")
         else:
-            self.openai_client = None
             logger.warning("⚠ OpenAI API key not found - fallback disabled")
 
-    def _parse_relative_date(self, date_string: str) -> Optional[int]:
+        # Cache of successful parses keyed by normalized query text
+        self.cache = cache if cache is not None else TTLCache.from_env("PARSE_CACHE", 1024, 600)
+
+    @property
+    def gemini_client(self):
+        """Gemini client, created (and google.genai imported) on first use"""
+        if self._gemini_client is None:
+            with self._client_lock:
+                if self._gemini_client is None:
+                    from google import genai
+                    self._gemini_client = genai.Client(api_key=self.gemini_key)
+        return self._gemini_client
+
+    @property
+    def openai_client(self):
+        """OpenAI fallback client (None when no key), created on first use"""
+        if self._openai_client is None and self.openai_key:
+            with self._client_lock:
+                if self._openai_client is None:
+                    from openai import OpenAI
+                    self._openai_client = OpenAI(api_key=self.openai_key)
+        return self._openai_client
+
+    @staticmethod
+    def _parse_relative_date(date_string: str) -> Optional[int]:
         """
         Convert relative date string to Unix timestamp
 
@@ -248,10 +290,17 @@ Return ONLY the JSON, no other text."""
 
         return parsed
 
+    @staticmethod
+    def _cache_key(natural_query: str) -> str:
+        return re.sub(r"\s+", " ", natural_query.strip().lower())
+
     def parse(self, natural_query: str) -> Dict[str, Any]:
         """
         Parse natural language query into structured search parameters
 
+        Successful parses are cached (see PARSE_CACHE_SIZE); last-resort
+        empty-filter responses are not, so a later retry can still succeed.
+
         Args:
             natural_query: Natural language query from recruiter
             Example: "Senior civil engineers in Manila with AutoCAD, 5+ years experience"
@@ -272,6 +321,22 @@ Return ONLY the JSON, no other text."""
             }
         }
         """
+        if self.cache is None:
+            return self._parse_uncached(natural_query)
+
+        key = self._cache_key(natural_query)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"\n📝 Parsing query: '{natural_query}' (cached)")
+            return copy.deepcopy(cached)
+
+        parsed = self._parse_uncached(natural_query)
+        if parsed.get('api_used') != 'none':
+            self.cache.set(key, copy.deepcopy(parsed))
+        return parsed
+
+    def _parse_uncached(self, natural_query: str) -> Dict[str, Any]:
+        """Parse with Gemini, falling back to OpenAI, then to empty filters"""
         logger.info(f"\n📝 Parsing query: '{natural_query}'")
 
         # Build prompt
@@ -0,0 +1,112 @@
+"""
+Local-to-Gemini Query Projection
+Linear map from a local encoder's embeddings into the 3072-dim Gemini space,
+so a query embedded on-box can search the existing Gemini vectors (no second
+set of document vectors). Fitted offline by ridge regression on corpus texts
+that already have stored Gemini embeddings; shipped as one .npy matrix.
+
+Train with: python3 scripts/migrations/train_query_projection.py
+"""
+import os
+import logging
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class QueryProjection:
+    """
+    y = [x, 1] @ W, then L2-normalized (cosine search)
+
+    The .npy holds W with shape (local_dim + 1, gemini_dim); the last row is the bias.
+    """
+
+    def __init__(self, weights: np.ndarray):
+        if weights.ndim != 2 or weights.shape[0] < 2:
+            raise ValueError(f"Projection weights must be (local_dim + 1, gemini_dim), got {weights.shape}")
+        self.weights = np.asarray(weights, dtype=np.float32)
+
+    @property
+    def input_dim(self) -> int:
+        return self.weights.shape[0] - 1
+
+    @property
+    def output_dim(self) -> int:
+        return self.weights.shape[1]
+
+    @classmethod
+    def fit(cls, local: np.ndarray, gemini: np.ndarray, alpha: float = 1.0) -> "QueryProjection":
+        """
+        Ridge regression from local embeddings to Gemini embeddings
+
+        Args:
+            local: (n, local_dim) local encoder embeddings
+            gemini: (n, gemini_dim) stored Gemini embeddings of the same texts
+            alpha: L2 penalty (bias row not penalized)
+        """
+        if len(local) != len(gemini):
+            raise ValueError(f"Got {len(local)} local and {len(gemini)} Gemini embeddings")
+        x = np.hstack([np.asarray(local, dtype=np.float64), np.ones((len(local), 1))])
+        y = _normalize(np.asarray(gemini, dtype=np.float64))
+
+        penalty = alpha * np.eye(x.shape[1])
+        penalty[-1, -1] = 0.0
+        weights = np.linalg.solve(x.T @ x + penalty, x.T @ y)
+
+        logger.info(f"✓ Projection fitted on {len(local)} pairs: {x.shape[1] - 1} -> {y.shape[1]} dims (alpha={alpha})")
+        return cls(weights)
+
+    def project(self, vectors: np.ndarray) -> np.ndarray:
+        """Project (n, local_dim) or (local_dim,) embeddings into the Gemini space"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        single = vectors.ndim == 1
+        vectors = np.atleast_2d(vectors)
+        if vectors.shape[1] != self.input_dim:
+            raise ValueError(f"Projection expects {self.input_dim}-dim input, got {vectors.shape[1]}")
+        projected = _normalize(vectors @ self.weights[:-1] + self.weights[-1])
+        return projected[0] if single else projected
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        np.save(path, self.weights)
+
+    @classmethod
+    def load(cls, path: str) -> "QueryProjection":
+        projection = cls(np.load(path))
+        logger.info(f"✓ Query projection loaded: {projection.input_dim} -> {projection.output_dim} dims from {path}")
+        return projection
+
+    @classmethod
+    def from_env(cls) -> Optional["QueryProjection"]:
+        """Load QUERY_PROJECTION_PATH, or None when unset/missing (projected mode disabled)"""
+        path = os.getenv("QUERY_PROJECTION_PATH")
+        if not path:
+            return None
+        if not os.path.exists(path):
+            logger.warning(f"⚠ QUERY_PROJECTION_PATH not found: {path} - projected embedding mode disabled")
+            return None
+        return cls.load(path)
+
+
+def recall_at_k(true_queries: np.ndarray, approx_queries: np.ndarray, corpus: np.ndarray, k: int = 10) -> float:
+    """
+    Mean overlap of the top-k corpus neighbours (cosine) found with the
+    approximate query vectors vs the true Gemini query vectors
+    """
+    corpus = _normalize(np.asarray(corpus, dtype=np.float32))
+    true_scores = _normalize(np.asarray(true_queries, dtype=np.float32)) @ corpus.T
+    approx_scores = _normalize(np.asarray(approx_queries, dtype=np.float32)) @ corpus.T
+    k = min(k, corpus.shape[0])
+
+    true_top = np.argpartition(-true_scores, k - 1, axis=1)[:, :k]
+    approx_top = np.argpartition(-approx_scores, k - 1, axis=1)[:, :k]
+    overlaps = [len(set(t) & set(a)) / k for t, a in zip(true_top, approx_top)]
+    return float(np.mean(overlaps)) if overlaps else 0.0
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
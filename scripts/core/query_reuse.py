@@ -0,0 +1,205 @@
+"""
+Near-Duplicate Query Reuse
+Recruiters phrase the same search many ways ("Python dev Manila 5 yrs" vs
+"5+ years python developer in manila"), which exact-key parse caches miss.
+Recent LLM parses are kept in a small in-memory vector index over cheap
+hashed word/character-trigram embeddings of the raw query (abbreviations
+expanded, stopwords, numbers and cities left out). A new query reuses a
+prior parse when its similarity clears QUERY_REUSE_THRESHOLD and the rule
+parser reads the same numbers, experience bounds, location, education,
+seniority and date phrase from both, so "up to 5 years" never reuses
+"5+ years". A reused parse has the same search intent, so the engine's
+embedding cache also serves the prior query embedding.
+
+Reuses and guard disagreements are counted and logged for audit (stats(),
+shown on /stats).
+
+Configuration (from .env):
+    QUERY_REUSE_SIZE        - recent parses indexed (default 2048, 0 disables)
+    QUERY_REUSE_THRESHOLD   - cosine similarity needed (default 0.9)
+    QUERY_REUSE_TTL_SECONDS - how long a parse can be reused (default 600)
+"""
+import os
+import re
+import copy
+import time
+import zlib
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from core.rule_parser import RuleQueryParser, DATE_PATTERN, LOCATIONS
+except ImportError:
+    from rule_parser import RuleQueryParser, DATE_PATTERN, LOCATIONS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIM = 1024
+AUDIT_SAMPLES = 50
+
+ABBREVIATIONS = {
+    "dev": "developer", "devs": "developer", "eng": "engineer", "engr": "engineer", "mgr": "manager",
+    "sr": "senior", "jr": "junior", "yrs": "years", "yr": "years", "exp": "experience",
+}
+STOPWORDS = frozenset("""
+a an and in with of for the at from who has have had plus based looking need needs want
+candidate candidates applicant applicants year years experience experienced
+""".split())
+PLACE_WORDS = frozenset(word for keyword in LOCATIONS for word in keyword.split()) | {"city", "philippines"}
+
+_WORD = re.compile(r"[a-z][a-z0-9+#.]*")
+_NUMBERS = re.compile(r"\d+(?:\.\d+)?")
+
+
+def query_terms(text: str) -> List[str]:
+    """Content words of a query: abbreviations expanded, crude plural stripping"""
+    terms = []
+    for word in _WORD.findall(text.lower()):
+        word = ABBREVIATIONS.get(word, word)
+        if word in STOPWORDS or word in PLACE_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def hashed_vector(text: str, dim: int = DEFAULT_DIM) -> np.ndarray:
+    """Unit vector of hashed content words (weight 2) and their character trigrams"""
+    vector = np.zeros(dim, dtype=np.float32)
+    for term in query_terms(text):
+        vector[zlib.crc32(f"w:{term}".encode()) % dim] += 2.0
+        padded = f"<{term}>"
+        for i in range(len(padded) - 2):
+            vector[zlib.crc32(padded[i:i + 3].encode()) % dim] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class QueryReuse:
+    """Recent parses by query similarity, reused when the rule-extracted constraints agree"""
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        max_size: int = 2048,
+        ttl_seconds: float = 600.0,
+        embed: Optional[Callable[[str], np.ndarray]] = None,
+        dim: int = DEFAULT_DIM
+    ):
+        """
+        Args:
+            embed: Query -> unit vector of size `dim` (defaults to hashed_vector)
+        """
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.embed = embed or (lambda text: hashed_vector(text, dim))
+        self.rule_parser = RuleQueryParser()
+
+        self._vectors = np.zeros((max_size, dim), dtype=np.float32)
+        self._entries: List[Optional[Dict[str, Any]]] = [None] * max_size
+        self._next = 0
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.reuses = 0
+        self.disagreements = 0
+        self.samples: deque = deque(maxlen=AUDIT_SAMPLES)
+
+    @classmethod
+    def from_env(cls) -> Optional["QueryReuse"]:
+        """Index from QUERY_REUSE_SIZE / _THRESHOLD / _TTL_SECONDS, or None when size is 0"""
+        size = int(os.getenv("QUERY_REUSE_SIZE", "2048"))
+        if size <= 0:
+            return None
+        return cls(
+            threshold=float(os.getenv("QUERY_REUSE_THRESHOLD", "0.9")),
+            max_size=size,
+            ttl_seconds=float(os.getenv("QUERY_REUSE_TTL_SECONDS", "600"))
+        )
+
+    def guard(self, query: str) -> Dict[str, Any]:
+        """Constraints two queries must share for a parse to be reused (rule parser, no LLM)"""
+        filters = self.rule_parser.parse(query)["filters"]
+        date = DATE_PATTERN.search(query)
+        return {
+            "numbers": sorted(float(n) for n in _NUMBERS.findall(query)),
+            "min_experience": filters["min_experience"],
+            "max_experience": filters["max_experience"],
+            "location": filters["location"],
+            "education_level": filters["education_level"],
+            "seniority_keywords": filters["seniority_keywords"],
+            "date": date.group(0).lower() if date else None,
+        }
+
+    def lookup(self, query: str) -> Optional[Tuple[Dict[str, Any], float, str]]:
+        """(copy of the prior parse, similarity, prior query) for a near-duplicate, else None"""
+        vector = self.embed(query)
+        guard = None
+        now = time.monotonic()
+        with self._lock:
+            self.lookups += 1
+            similarities = self._vectors @ vector
+            candidates = [i for i in np.argsort(-similarities)[:5] if similarities[i] >= self.threshold]
+            entries = [(self._entries[i], float(similarities[i])) for i in candidates]
+
+        for entry, similarity in entries:
+            if entry is None or now - entry["added"] > self.ttl_seconds:
+                continue
+            guard = guard if guard is not None else self.guard(query)
+            if guard == entry["guard"]:
+                with self._lock:
+                    self.reuses += 1
+                logger.info(f"♻ Reusing parse of '{entry['query']}' for '{query}' (similarity {similarity:.2f})")
+                return copy.deepcopy(entry["parsed"]), similarity, entry["query"]
+
+            disagreement = {
+                "query": query, "prior_query": entry["query"], "similarity": round(similarity, 3),
+                "fields": sorted(key for key in guard if guard[key] != entry["guard"][key]),
+            }
+            with self._lock:
+                self.disagreements += 1
+                self.samples.append(disagreement)
+            logger.info(f"⚠ Similar to '{entry['query']}' ({similarity:.2f}) but {', '.join(disagreement['fields'])} differ - not reused")
+        return None
+
+    def add(self, query: str, parsed: Dict[str, Any]) -> None:
+        entry = {"query": query, "parsed": copy.deepcopy(parsed), "guard": self.guard(query), "added": time.monotonic()}
+        vector = self.embed(query)
+        with self._lock:
+            slot = self._next % self.max_size
+            self._vectors[slot] = vector
+            self._entries[slot] = entry
+            self._next += 1
+
+    def parse(self, parser, query: str) -> Dict[str, Any]:
+        """parser.parse(query), unless a near-duplicate's parse can be reused"""
+        hit = self.lookup(query)
+        if hit is not None:
+            parsed, similarity, prior_query = hit
+            parsed["api_used"] = "reuse"
+            parsed["fallback_used"] = False
+            parsed["reused_from"] = {"query": prior_query, "similarity": round(similarity, 3)}
+            return parsed
+
+        parsed = parser.parse(query)
+        # Last-resort parses (both LLMs failed) are not worth repeating
+        if parsed.get("api_used") not in ("none", "reuse"):
+            self.add(query, parsed)
+        return parsed
+
+    def stats(self) -> Dict[str, Any]:
+        """Reuse rate and recent disagreement samples (audit)"""
+        with self._lock:
+            return {
+                "lookups": self.lookups,
+                "reuses": self.reuses,
+                "reuse_rate": round(self.reuses / self.lookups, 3) if self.lookups else 0.0,
+                "disagreements": self.disagreements,
+                "disagreement_samples": list(self.samples),
+            }
@@ -0,0 +1,229 @@
+"""
+Co-Located Read Replica
+Searches read from a Qdrant next to the API (a local server, or an embedded
+store at a path) instead of crossing to the primary cluster; writes keep
+going to the primary. The replica is loaded from a snapshot of the live
+applicants_unified version (a scroll copy for an embedded store), then kept
+in sync with scroll deltas on the payload `updated_at` (Unix seconds). When
+the primary's alias moves to a new version the replica reloads, which also
+picks up deleted applicants.
+
+If the last successful sync is older than REPLICA_MAX_LAG_SECONDS,
+searches fall back to the primary until the replica catches up.
+
+Configuration (from .env):
+    QDRANT_REPLICA_URL      - replica server (e.g. http://localhost:6333), or
+    QDRANT_REPLICA_PATH     - embedded replica store directory
+    QDRANT_REPLICA_API_KEY  - replica API key, if any
+    REPLICA_SYNC_SECONDS    - delta sync interval (default 60)
+    REPLICA_MAX_LAG_SECONDS - staleness before reads go to the primary (default 300)
+    REPLICA_SYNC_OVERLAP_SECONDS - re-read window covering in-flight writes (default 30)
+"""
+import os
+import time
+import logging
+import threading
+from typing import Any, Optional
+
+try:
+    from core.collection_versions import resolve_alias, switch_alias, prune_versions, bump_data_version
+    from core.snapshot_transfer import transfer_collection
+except ImportError:
+    from collection_versions import resolve_alias, switch_alias, prune_versions, bump_data_version
+    from snapshot_transfer import transfer_collection
+
+logger = logging.getLogger(__name__)
+
+
+class ReadReplica:
+    """Keeps a local copy of the live collection in sync and hands out the client to read from"""
+
+    def __init__(
+        self,
+        primary,
+        replica,
+        collection: str = "applicants_unified",
+        primary_url: Optional[str] = None,
+        primary_api_key: Optional[str] = None,
+        replica_url: Optional[str] = None,
+        replica_api_key: Optional[str] = None,
+        sync_seconds: Optional[float] = None,
+        max_lag_seconds: Optional[float] = None,
+        overlap_seconds: Optional[float] = None,
+        batch_size: int = 256
+    ):
+        """
+        Args:
+            primary / replica: Qdrant clients
+            primary_url / replica_url: REST URLs for the snapshot transfer; without
+                both the initial load copies points by scroll (embedded replica)
+        """
+        self.primary = primary
+        self.replica = replica
+        self.collection = collection
+        self.primary_url = primary_url
+        self.primary_api_key = primary_api_key
+        self.replica_url = replica_url
+        self.replica_api_key = replica_api_key
+        self.sync_seconds = sync_seconds if sync_seconds is not None else float(os.getenv("REPLICA_SYNC_SECONDS", "60"))
+        self.max_lag_seconds = (
+            max_lag_seconds if max_lag_seconds is not None else float(os.getenv("REPLICA_MAX_LAG_SECONDS", "300"))
+        )
+        self.overlap_seconds = (
+            overlap_seconds if overlap_seconds is not None else float(os.getenv("REPLICA_SYNC_OVERLAP_SECONDS", "30"))
+        )
+        self.batch_size = batch_size
+
+        self._source: Optional[str] = None
+        self._watermark: Optional[float] = None
+        self._synced_at: Optional[float] = None
+        self._fresh = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, collection: str = "applicants_unified") -> Optional["ReadReplica"]:
+        """Replica when QDRANT_REPLICA_URL or QDRANT_REPLICA_PATH is set, else None (read from the primary)"""
+        replica_url = os.getenv("QDRANT_REPLICA_URL")
+        replica_path = os.getenv("QDRANT_REPLICA_PATH")
+        if not replica_url and not replica_path:
+            return None
+
+        from qdrant_client import QdrantClient
+        try:
+            from core.qdrant_factory import get_qdrant_client
+        except ImportError:
+            from qdrant_factory import get_qdrant_client
+
+        replica_api_key = os.getenv("QDRANT_REPLICA_API_KEY")
+        if replica_url:
+            replica = get_qdrant_client(replica_url, replica_api_key)
+        else:
+            replica = QdrantClient(path=replica_path)
+        return cls(
+            get_qdrant_client(),
+            replica,
+            collection,
+            primary_url=os.getenv("QDRANT_URL"),
+            primary_api_key=os.getenv("QDRANT_API_KEY"),
+            replica_url=replica_url,
+            replica_api_key=replica_api_key
+        )
+
+    @property
+    def lag_seconds(self) -> Optional[float]:
+        """Seconds since the last successful sync started (None before the initial load)"""
+        return None if self._synced_at is None else time.time() - self._synced_at
+
+    def is_fresh(self) -> bool:
+        lag = self.lag_seconds
+        fresh = lag is not None and lag <= self.max_lag_seconds
+        if fresh != self._fresh:
+            if fresh:
+                logger.info(f"✓ Read replica in sync - searches read from the replica")
+            else:
+                logger.warning(f"⚠ Read replica stale (lag: {'no load yet' if lag is None else f'{lag:.0f}s'}) - reading from the primary")
+            self._fresh = fresh
+        return fresh
+
+    def client_for_reads(self):
+        """Replica client while fresh, else None (use the primary)"""
+        return self.replica if self.is_fresh() else None
+
+    def _copy_collection(self, source: str) -> int:
+        """Scroll-copy `source` into an embedded replica (no snapshot API there)"""
+        params = self.primary.get_collection(source).config.params
+        if self.replica.collection_exists(source):
+            self.replica.delete_collection(source)
+        self.replica.create_collection(
+            collection_name=source, vectors_config=params.vectors, sparse_vectors_config=params.sparse_vectors
+        )
+        return self._upsert_scroll(source)
+
+    def _upsert_scroll(self, source: str, query_filter: Optional[Any] = None) -> int:
+        from qdrant_client.models import PointStruct
+
+        copied = 0
+        offset = None
+        while True:
+            records, offset = self.primary.scroll(
+                source, scroll_filter=query_filter, limit=self.batch_size, offset=offset,
+                with_vectors=True, with_payload=True
+            )
+            if records:
+                self.replica.upsert(
+                    collection_name=source,
+                    points=[PointStruct(id=r.id, vector=r.vector, payload=r.payload) for r in records]
+                )
+                copied += len(records)
+            if offset is None:
+                return copied
+
+    def initial_load(self) -> int:
+        """Load the primary's live version into the replica and point the replica's alias at it"""
+        source = resolve_alias(self.primary, self.collection) or self.collection
+        started = time.time()
+        logger.info(f"Loading read replica from '{source}'...")
+        if self.primary_url and self.replica_url:
+            transfer_collection(
+                self.primary, self.primary_url, source, self.replica_url,
+                target_api_key=self.replica_api_key, build_api_key=self.primary_api_key
+            )
+        else:
+            self._copy_collection(source)
+        if source != self.collection:
+            switch_alias(self.replica, self.collection, source)
+            prune_versions(self.replica, self.collection, keep=0)
+
+        count = self.replica.count(source, exact=True).count
+        with self._lock:
+            self._source = source
+            self._watermark = started - self.overlap_seconds
+            self._synced_at = started
+        logger.info(f"✓ Read replica loaded: {count} points from '{source}'")
+        return count
+
+    def sync(self) -> int:
+        """
+        Bring the replica up to date: a reload if the primary switched versions,
+        else the points whose updated_at is at/after the watermark. Returns points written.
+        """
+        from qdrant_client.models import FieldCondition, Filter, Range
+
+        source = resolve_alias(self.primary, self.collection) or self.collection
+        if self._source is None or source != self._source:
+            return self.initial_load()
+
+        started = time.time()
+        delta = Filter(must=[FieldCondition(key="updated_at", range=Range(gte=int(self._watermark)))])
+        written = self._upsert_scroll(source, delta)
+        if written:
+            bump_data_version(self.replica, source)
+        with self._lock:
+            # Writes landing while we scrolled are re-read next time (overlap window)
+            self._watermark = started - self.overlap_seconds
+            self._synced_at = started
+        if written:
+            logger.info(f"✓ Read replica synced {written} updated points")
+        return written
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"⚠ Read replica sync failed: {e}")
+            self._stop.wait(self.sync_seconds)
+
+    def start(self) -> None:
+        """Initial load plus delta syncs every sync_seconds, on a background thread"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="read-replica-sync", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
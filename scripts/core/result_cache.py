@@ -0,0 +1,102 @@
+"""
+Final-Result Cache Stamped with the Collection Version
+The same parsed query, filters, limit and search settings give the same
+ranked list until the data changes. Entries are keyed on those (plus a
+fingerprint of the engine config) and stamped with the collection version:
+the collection the alias points to plus its `data_version` metadata, which
+ingestion and sync scripts bump (core.collection_versions.bump_data_version).
+An entry is only served while the stamp it was stored under is current.
+Collection metadata needs Qdrant server and client 1.16+ (see requirements.txt).
+
+The stamp is re-read at most every RESULT_CACHE_STAMP_SECONDS (one aliases
+call plus one collection info call per collection), so a hit costs no
+network round trip; that interval bounds how long a hit can lag a data change.
+
+Configuration (from .env):
+    RESULT_CACHE_SIZE         - cached result lists (default 1024, 0 disables)
+    RESULT_CACHE_TTL_SECONDS  - entry lifetime (default 3600)
+    RESULT_CACHE_STAMP_SECONDS - collection version re-read interval (default 1)
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from core.cache import TTLCache
+except ImportError:
+    from cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Ranked results by (query, options, engine config), valid for one collection version"""
+
+    def __init__(self, cache: TTLCache, stamp_seconds: float = 1.0):
+        self.cache = cache
+        self.stamp_seconds = stamp_seconds
+        self._stamps: Dict[Tuple, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResultCache"]:
+        """Cache from RESULT_CACHE_SIZE / _TTL_SECONDS / _STAMP_SECONDS, or None when size is 0"""
+        cache = TTLCache.from_env("RESULT_CACHE", 1024, 3600)
+        if cache is None:
+            return None
+        return cls(cache, float(os.getenv("RESULT_CACHE_STAMP_SECONDS", "1")))
+
+    @staticmethod
+    def key(parsed_query: Dict[str, Any], options: Dict[str, Any]) -> str:
+        """Digest of the search intent, filters and search options"""
+        material = {
+            "intent": parsed_query.get("search_intent"),
+            "filters": parsed_query.get("filters"),
+            "options": options,
+        }
+        encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+    def stamp(self, client, collections: List[str]) -> Optional[str]:
+        """
+        Current version of the collections (alias targets + data_version), re-read
+        every stamp_seconds; None when it cannot be read (the cache is bypassed)
+        """
+        stamp_key = (id(client), tuple(collections))
+        now = time.monotonic()
+        cached = self._stamps.get(stamp_key)
+        if cached is not None and now - cached[0] < self.stamp_seconds:
+            return cached[1]
+
+        try:
+            aliases = {a.alias_name: a.collection_name for a in client.get_aliases().aliases}
+            parts = []
+            for name in sorted(collections):
+                target = aliases.get(name, name)
+                metadata = client.get_collection(target).config.metadata or {}
+                parts.append(f"{target}@{metadata.get('data_version', 0)}")
+        except Exception as e:
+            logger.warning(f"⚠ Could not read the collection version - result cache bypassed: {e}")
+            return None
+
+        stamp = "|".join(parts)
+        with self._lock:
+            previous = self._stamps.get(stamp_key)
+            if previous is not None and previous[1] != stamp:
+                logger.info(f"✓ Collection version changed ({stamp}) - cached results invalidated")
+            self._stamps[stamp_key] = (now, stamp)
+        return stamp
+
+    def get(self, key: str, stamp: str) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """(results, trace) stored under this stamp, else None"""
+        entry = self.cache.get(key)
+        if entry is None or entry[0] != stamp:
+            return None
+        return entry[1], entry[2]
+
+    def put(self, key: str, stamp: str, results: List[Dict[str, Any]], trace: Dict[str, Any]) -> None:
+        self.cache.set(key, (stamp, results, trace))
@@ -0,0 +1,148 @@
+"""
+Rule-based Query Parser
+Regex parser used by the "fast" search tier instead of the LLM parser: no
+network call, ~0.1 ms. It only emits filters it can read unambiguously
+(experience, the main cities, education, application date, seniority) plus
+"with ..." skills for re-ranking; job titles and companies stay in the
+search intent for the vectors to match.
+"""
+import re
+import logging
+from typing import Dict, Any, List, Optional
+
+try:
+    from core.query_parser import GeminiQueryParser
+except ImportError:  # run directly as scripts/core/rule_parser.py
+    from query_parser import GeminiQueryParser
+
+logger = logging.getLogger(__name__)
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_YEARS = r"\s*(?:years?|yrs?)\b"
+
+EXPERIENCE_PATTERNS = [
+    (re.compile(_NUMBER + r"\s*(?:-|to)\s*" + _NUMBER + _YEARS, re.I), "range"),
+    (re.compile(r"\b(?:up to|at most|less than|under|maximum of|max\.?)\s*" + _NUMBER + _YEARS, re.I), "max"),
+    (re.compile(r"\b(?:at least|minimum of|min\.?|over|more than)\s*" + _NUMBER + _YEARS, re.I), "min"),
+    (re.compile(_NUMBER + r"\s*\+?" + _YEARS, re.I), "min"),
+]
+
+# Same canonical values the LLM parser is instructed to produce
+LOCATIONS = {
+    "quezon city": "Quezon City, Philippines",
+    "cebu": "Cebu City, Philippines",
+    "davao": "Davao City, Philippines",
+    "manila": "Manila, Philippines",
+}
+
+EDUCATION_LEVELS = [
+    (re.compile(r"\b(?:ph\.?d|doctorate|doctoral)\b", re.I), "Doctorate"),
+    (re.compile(r"\b(?:master'?s(?: degree)?|mba)\b", re.I), "Master's Degree"),
+    (re.compile(r"\bbachelor'?s?(?: degree)?\b", re.I), "Bachelor's Degree"),
+    (re.compile(r"\bassociate'?s? degree\b", re.I), "Associate's Degree"),
+    (re.compile(r"\b(?:vocational|diploma)\b", re.I), "Diploma/Vocational"),
+]
+
+SENIORITY_KEYWORDS = ("senior", "junior", "lead", "principal", "entry level", "mid level", "head")
+
+DATE_PATTERN = re.compile(
+    r"\b(?:(?:in the |within the )?(?:last|past) \d+ (?:days?|weeks?|months?)"
+    r"|(?:applied|applicants?|applications?) (?:recently|this month)"
+    r"|recent(?:ly)? (?:applied|applicants?|applications?))\b",
+    re.I
+)
+
+SKILLS_CLAUSE = re.compile(r"\b(?:with|skilled in|knowledge of|proficient in|experienced in)\s+(.+)$", re.I)
+SKILL_SEPARATORS = re.compile(r",|;|/|\band\b|\bor\b|&", re.I)
+CLAUSE_END = re.compile(r"\d|\b(?:in|from|at|who|based|for|applied|applicants?)\b", re.I)
+NON_SKILL = re.compile(r"\b(?:years?|yrs?|experience|degree)\b", re.I)
+
+
+class RuleQueryParser:
+    """Parse recruiter queries with regular expressions (same output shape as GeminiQueryParser)"""
+
+    cache = None  # nothing worth caching
+
+    def parse(self, natural_query: str) -> Dict[str, Any]:
+        """
+        Parse a natural language query into search intent and filters
+
+        Returns:
+            {"search_intent", "filters", "api_used": "rules", "fallback_used": False}
+        """
+        text = natural_query.strip()
+        intent = text
+        filters: Dict[str, Any] = {
+            "min_experience": None,
+            "max_experience": None,
+            "location": None,
+            "education_level": None,
+            "required_skills": None,
+            "seniority_keywords": None,
+            "desired_job_titles": None,
+            "target_companies": None,
+            "min_date_applied": None,
+        }
+
+        for pattern, kind in EXPERIENCE_PATTERNS:
+            match = pattern.search(text)
+            if not match:
+                continue
+            if kind == "range":
+                filters["min_experience"], filters["max_experience"] = float(match.group(1)), float(match.group(2))
+            elif kind == "max":
+                filters["max_experience"] = float(match.group(1))
+            else:
+                filters["min_experience"] = float(match.group(1))
+            intent = intent.replace(match.group(0), " ")
+            break
+
+        lower = text.lower()
+        for keyword, location in LOCATIONS.items():
+            if re.search(rf"\b{keyword}\b", lower):
+                filters["location"] = location
+                intent = re.sub(rf"\b(?:in |based in |from )?{keyword}(?: city)?\b", " ", intent, flags=re.I)
+                break
+
+        for pattern, level in EDUCATION_LEVELS:
+            if pattern.search(text):
+                filters["education_level"] = level
+                break
+
+        date_match = DATE_PATTERN.search(text)
+        if date_match:
+            phrase = date_match.group(0).lower()
+            filters["min_date_applied"] = GeminiQueryParser._parse_relative_date(
+                "recent" if "recent" in phrase or "this month" in phrase else phrase
+            )
+            intent = re.sub(r"\b(?:who )?applied\s*$", " ", intent.replace(date_match.group(0), " ").rstrip())
+
+        seniority = [keyword for keyword in SENIORITY_KEYWORDS if re.search(rf"\b{keyword}\b", lower)]
+        filters["seniority_keywords"] = seniority or None
+        filters["required_skills"] = self._skills(text)
+
+        intent = re.sub(r"\s+", " ", re.sub(r"\s*,(\s*,)+", ",", intent)).strip(" ,.;")
+        intent = re.sub(r"^(?:for|of)\s+", "", intent, flags=re.I)
+        parsed = {
+            "search_intent": intent or text,
+            "filters": filters,
+            "api_used": "rules",
+            "fallback_used": False,
+        }
+        logger.info(f"\n📝 Parsed query with rules: '{natural_query}' -> '{parsed['search_intent']}'")
+        return parsed
+
+    @staticmethod
+    def _skills(text: str) -> Optional[List[str]]:
+        """Skills listed after "with", "skilled in", ... (stops at numbers/years/locations)"""
+        match = SKILLS_CLAUSE.search(text)
+        if not match:
+            return None
+        skills = []
+        clause = CLAUSE_END.split(match.group(1))[0]
+        for part in SKILL_SEPARATORS.split(clause):
+            part = re.sub(r"\s+skills?$", "", part.strip(" ."), flags=re.I)
+            if not part or NON_SKILL.search(part) or len(part) > 40:
+                continue
+            skills.append(part)
+        return skills or None
@@ -0,0 +1,113 @@
+"""
+Search Latency Tiers
+Named presets (fast / balanced / exhaustive) bundling the engine settings that
+trade latency for recall: HNSW ef, exact search, over-fetch depth, quantization
+oversampling/rescoring, retrieval and which query parser runs.
+
+    fast        - rule-based parser (no LLM call), small ef, no over-fetch or rescoring
+    balanced    - LLM parser, engine defaults (the behaviour without a tier)
+    exhaustive  - LLM parser, exact (brute-force) search, deep over-fetch
+
+Configuration (from .env):
+    SEARCH_TIERS_FILE    - JSON {"tier": {setting: value}}; entries override the
+                           built-in tier of the same name or add new tiers
+    SEARCH_DEFAULT_TIER  - tier used when a request names none (default "balanced")
+"""
+import os
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from core.intelligent_search import IntelligentSearchEngine
+except ImportError:  # run directly as scripts/core/search_tiers.py
+    from intelligent_search import IntelligentSearchEngine
+
+logger = logging.getLogger(__name__)
+
+PARSERS = ("llm", "rules")
+
+# Tier setting -> expected type(s); everything except "parser" is an engine.search() kwarg
+TIER_SETTINGS = {
+    "parser": str,
+    "hnsw_ef": int,
+    "exact": bool,
+    "overfetch": int,
+    "oversampling": (int, float),
+    "rescore": bool,
+    "retrieval": str,
+}
+# Numeric settings that must be > 0
+POSITIVE_SETTINGS = ("hnsw_ef", "overfetch", "oversampling")
+
+DEFAULT_TIERS = {
+    "fast": {"parser": "rules", "hnsw_ef": 32, "overfetch": 1, "rescore": False},
+    "balanced": {"parser": "llm"},
+    "exhaustive": {"parser": "llm", "exact": True, "overfetch": 5, "rescore": True},
+}
+
+
+class SearchTiers:
+    """Resolves a tier name to its parser and engine.search() kwargs"""
+
+    def __init__(self, tiers: Optional[Dict[str, Dict[str, Any]]] = None, default: str = "balanced"):
+        """
+        Args:
+            tiers: Tier definitions merged over DEFAULT_TIERS
+            default: Tier used when a request names none
+        """
+        merged = {name: dict(settings) for name, settings in DEFAULT_TIERS.items()}
+        for name, settings in (tiers or {}).items():
+            merged[name] = {**merged.get(name, {}), **settings}
+        for name, settings in merged.items():
+            _validate(name, settings)
+        if default not in merged:
+            raise ValueError(f"Unknown default tier '{default}' (expected one of {sorted(merged)})")
+        self.tiers = merged
+        self.default = default
+
+    @classmethod
+    def from_env(cls) -> "SearchTiers":
+        """Built-in tiers plus SEARCH_TIERS_FILE overrides, default SEARCH_DEFAULT_TIER"""
+        path = os.getenv("SEARCH_TIERS_FILE")
+        tiers = None
+        if path:
+            with open(path, "r", encoding="utf-8") as f:
+                tiers = json.load(f)
+            logger.info(f"✓ Search tiers loaded from {path}: {', '.join(sorted(tiers))}")
+        return cls(tiers, default=os.getenv("SEARCH_DEFAULT_TIER", "balanced"))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tiers
+
+    def resolve(self, name: Optional[str] = None) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        (tier name, parser, engine.search kwargs) for `name` (or the default tier)
+
+        Raises:
+            ValueError: Unknown tier
+        """
+        name = name or self.default
+        if name not in self.tiers:
+            raise ValueError(f"Unknown search tier '{name}' (expected one of {sorted(self.tiers)})")
+        settings = dict(self.tiers[name])
+        parser = settings.pop("parser", "llm")
+        return name, parser, settings
+
+
+def _validate(name: str, settings: Dict[str, Any]) -> None:
+    for key, value in settings.items():
+        if key not in TIER_SETTINGS:
+            raise ValueError(f"Tier '{name}': unknown setting '{key}' (expected one of {list(TIER_SETTINGS)})")
+        expected = TIER_SETTINGS[key]
+        if value is not None and (not isinstance(value, expected) or (expected is not bool and isinstance(value, bool))):
+            raise ValueError(f"Tier '{name}': '{key}' must be {getattr(expected, '__name__', 'a number')}, got {value!r}")
+        if key in POSITIVE_SETTINGS and value is not None and value <= 0:
+            raise ValueError(f"Tier '{name}': '{key}' must be > 0, got {value!r}")
+    if settings.get("parser", "llm") not in PARSERS:
+        raise ValueError(f"Tier '{name}': parser must be one of {list(PARSERS)}, got '{settings['parser']}'")
+    retrieval = settings.get("retrieval")
+    if retrieval is not None and retrieval not in IntelligentSearchEngine.RETRIEVAL_MODES:
+        raise ValueError(
+            f"Tier '{name}': retrieval must be one of {list(IntelligentSearchEngine.RETRIEVAL_MODES)}, got '{retrieval}'"
+        )
@@ -5,12 +5,16 @@ Direct semantic search with metadata filtering (no Superlinked)
 import os
 import json
 from typing import List, Dict, Optional, Any
-from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, Range
 from dotenv import load_dotenv
 import logging
 from google import genai
 
+try:
+    from core.qdrant_factory import get_qdrant_client, operation_timeout
+except ImportError:  # run directly from scripts/core
+    from qdrant_factory import get_qdrant_client, operation_timeout
+
 logger = logging.getLogger(__name__)
 
 class SimpleQdrantSearch:
@@ -25,11 +29,7 @@ class SimpleQdrantSearch:
         load_dotenv()
 
         # Initialize Qdrant client
-        self.client = QdrantClient(
-            url=os.getenv('QDRANT_URL'),
-            api_key=os.getenv('QDRANT_API_KEY'),
-            timeout=120
-        )
+        self.client = get_qdrant_client(os.getenv('QDRANT_URL'), os.getenv('QDRANT_API_KEY'))
 
         # Initialize Gemini for query embeddings
         self.gemini_client = genai.Client(api_key=os.getenv('GEMINI_API_KEY'))
@@ -127,13 +127,13 @@ class SimpleQdrantSearch:
 
                 # Upload in batches
                 if len(points) >= batch_size:
-                    self.client.upsert(collection_name=collection_name, points=points)
+                    self.client.upsert(collection_name=collection_name, points=points, timeout=operation_timeout("upsert"))
                     logger.info(f"    ✓ Uploaded {len(points)} points (total: {i+1})")
                     points = []
 
             # Upload remaining points
             if points:
-                self.client.upsert(collection_name=collection_name, points=points)
+                self.client.upsert(collection_name=collection_name, points=points, timeout=operation_timeout("upsert"))
                 logger.info(f"    ✓ Uploaded final {len(points)} points")
 
             # Verify count
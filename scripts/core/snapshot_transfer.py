@@ -0,0 +1,145 @@
+"""
+Snapshot-Based Collection Builds
+A rebuild runs against a Qdrant next to the data (docker run -p 6333:6333
+qdrant/qdrant): upserts, payload indexes and optimized HNSW segments are
+all built locally. The finished collection is snapshotted and sent to the
+target cluster in one streaming upload, which restores it there, so there
+are no per-batch round trips to the cloud.
+
+Configuration (from .env):
+    COLLECTION_BUILD          - "snapshot" builds locally and uploads a snapshot (default "direct")
+    QDRANT_BUILD_URL          - Qdrant used for the build (default http://localhost:6333)
+    QDRANT_BUILD_API_KEY      - its API key, if any
+    SNAPSHOT_DIR              - where the snapshot file is written (default ./data/snapshots)
+    SNAPSHOT_UPLOAD_TIMEOUT   - seconds for the upload + restore request (default 3600)
+"""
+import os
+import time
+import logging
+from contextlib import contextmanager
+from typing import Any, Optional
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUILD_URL = "http://localhost:6333"
+CHUNK_BYTES = 1024 * 1024
+
+
+def build_mode() -> str:
+    """COLLECTION_BUILD: "direct" (upserts to QDRANT_URL) or "snapshot" """
+    mode = os.getenv("COLLECTION_BUILD", "direct").lower()
+    if mode not in ("direct", "snapshot"):
+        raise ValueError(f"COLLECTION_BUILD must be 'direct' or 'snapshot', got '{mode}'")
+    return mode
+
+
+def _headers(api_key: Optional[str]) -> dict:
+    return {"api-key": api_key} if api_key else {}
+
+
+@contextmanager
+def _http(http: Optional[Any], timeout: float):
+    """The caller's client, or a new httpx client closed on exit"""
+    if http is not None:
+        yield http
+        return
+    import httpx
+
+    with httpx.Client(timeout=timeout) as session:
+        yield session
+
+
+def create_snapshot(client, collection: str) -> str:
+    """Snapshot a collection (all segments optimized beforehand); returns the snapshot name"""
+    description = client.create_snapshot(collection_name=collection, wait=True)
+    logger.info(f"✓ Snapshot '{description.name}' of '{collection}' ({description.size / 1e6:.1f} MB)")
+    return description.name
+
+
+def download_snapshot(
+    url: str,
+    collection: str,
+    snapshot: str,
+    path: str,
+    api_key: Optional[str] = None,
+    http: Optional[Any] = None
+) -> int:
+    """Stream a snapshot from a Qdrant server into `path`; returns the bytes written"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    endpoint = f"{url.rstrip('/')}/collections/{quote(collection)}/snapshots/{quote(snapshot)}"
+    written = 0
+    with _http(http, timeout=float(os.getenv("SNAPSHOT_UPLOAD_TIMEOUT", "3600"))) as session:
+        with session.stream("GET", endpoint, headers=_headers(api_key)) as response:
+            response.raise_for_status()
+            with open(path, "wb") as f:
+                for chunk in response.iter_bytes(CHUNK_BYTES):
+                    f.write(chunk)
+                    written += len(chunk)
+    logger.info(f"✓ Downloaded snapshot to {path} ({written / 1e6:.1f} MB)")
+    return written
+
+
+def upload_snapshot(
+    url: str,
+    collection: str,
+    path: str,
+    api_key: Optional[str] = None,
+    http: Optional[Any] = None,
+    timeout: Optional[float] = None
+) -> float:
+    """
+    Upload a snapshot file to the target cluster, which restores it as
+    `collection` (created, or replaced if it exists); one streaming request
+
+    Returns:
+        Seconds taken
+
+    Raises:
+        RuntimeError: The cluster rejected the snapshot
+    """
+    timeout = timeout if timeout is not None else float(os.getenv("SNAPSHOT_UPLOAD_TIMEOUT", "3600"))
+    endpoint = f"{url.rstrip('/')}/collections/{quote(collection)}/snapshots/upload"
+    size = os.path.getsize(path)
+    logger.info(f"Uploading {path} ({size / 1e6:.1f} MB) to '{collection}'...")
+
+    started = time.perf_counter()
+    with _http(http, timeout) as session, open(path, "rb") as f:
+        # priority=snapshot: the uploaded data wins over anything already in the collection
+        response = session.post(
+            endpoint,
+            params={"priority": "snapshot", "wait": "true"},
+            headers=_headers(api_key),
+            files={"snapshot": (os.path.basename(path), f, "application/octet-stream")},
+            timeout=timeout
+        )
+    if response.status_code >= 400:
+        raise RuntimeError(f"Snapshot upload to '{collection}' failed ({response.status_code}): {response.text[:500]}")
+    elapsed = time.perf_counter() - started
+    logger.info(f"✓ Restored '{collection}' from snapshot in {elapsed:.0f}s")
+    return elapsed
+
+
+def transfer_collection(
+    build_client,
+    build_url: str,
+    collection: str,
+    target_url: str,
+    target_api_key: Optional[str] = None,
+    build_api_key: Optional[str] = None,
+    snapshot_dir: Optional[str] = None,
+    keep_file: bool = False
+) -> str:
+    """
+    Snapshot `collection` on the build server, download it and restore it on
+    the target under the same name; returns the snapshot file path
+    """
+    snapshot_dir = snapshot_dir or os.getenv("SNAPSHOT_DIR", "./data/snapshots")
+    snapshot = create_snapshot(build_client, collection)
+    path = os.path.join(snapshot_dir, snapshot)
+    download_snapshot(build_url, collection, snapshot, path, api_key=build_api_key)
+    build_client.delete_snapshot(collection_name=collection, snapshot_name=snapshot, wait=True)
+    upload_snapshot(target_url, collection, path, api_key=target_api_key)
+    if not keep_file:
+        os.remove(path)
+    return path
@@ -0,0 +1,100 @@
+"""
+BM25 Sparse Encoder
+Encodes skills, job titles and company names as sparse vectors for the
+named sparse vectors in applicants_unified. Documents carry the BM25
+term-frequency part; Qdrant applies IDF server-side (Modifier.IDF), so no
+vocabulary or corpus statistics are needed at query time.
+"""
+import zlib
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+try:
+    from core.passage_index import tokenize
+except ImportError:  # run directly from scripts/core
+    from passage_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Named sparse vector -> payload field it is built from
+SPARSE_FIELDS = {
+    "skills_sparse": "skills_extracted",
+    "title_sparse": "job_title",
+    "company_sparse": "company_names",
+}
+
+# Typical field lengths in tokens (replaced by fit() at ingest time)
+DEFAULT_AVG_LENGTHS = {
+    "skills_sparse": 30.0,
+    "title_sparse": 3.0,
+    "company_sparse": 6.0,
+}
+
+
+def term_index(term: str) -> int:
+    """Stable 31-bit sparse index for a term (no vocabulary file to keep in sync)"""
+    return zlib.crc32(term.encode("utf-8")) & 0x7FFFFFFF
+
+
+class SparseEncoder:
+    """
+    BM25-style sparse vectors (k1 saturation, b length normalization)
+
+    The fields are short lists (skills, titles, companies), so length
+    normalization is kept mild: a long skills list is not much weaker evidence.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.3, avg_lengths: Optional[Dict[str, float]] = None):
+        self.k1 = k1
+        self.b = b
+        self.avg_lengths = dict(DEFAULT_AVG_LENGTHS, **(avg_lengths or {}))
+
+    def fit(self, payloads: Iterable[Dict[str, Any]]) -> "SparseEncoder":
+        """Measure average token length of each field over the corpus"""
+        totals = {name: 0 for name in SPARSE_FIELDS}
+        count = 0
+        for payload in payloads:
+            count += 1
+            for name, field in SPARSE_FIELDS.items():
+                totals[name] += len(tokenize(payload.get(field) or ""))
+        if count:
+            self.avg_lengths = {name: max(1.0, total / count) for name, total in totals.items()}
+        logger.info(f"✓ Sparse encoder fitted on {count} applicants: {self.avg_lengths}")
+        return self
+
+    def encode_document(self, text: str, vector_name: str) -> Tuple[List[int], List[float]]:
+        """BM25 term weights (without IDF) for one field"""
+        terms = tokenize(text or "")
+        if not terms:
+            return [], []
+
+        counts = Counter(term_index(term) for term in terms)
+        norm = self.k1 * (1 - self.b + self.b * len(terms) / self.avg_lengths[vector_name])
+        indices = sorted(counts)
+        values = [counts[i] * (self.k1 + 1) / (counts[i] + norm) for i in indices]
+        return indices, values
+
+    @staticmethod
+    def encode_query(texts: Iterable[str]) -> Tuple[List[int], List[float]]:
+        """Unique query terms with weight 1 (Qdrant multiplies in the IDF)"""
+        indices = sorted({term_index(term) for text in texts for term in tokenize(text or "")})
+        return indices, [1.0] * len(indices)
+
+    def document_vectors(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Named SparseVectors for an applicant payload (empty fields are omitted)"""
+        from qdrant_client.models import SparseVector
+
+        vectors = {}
+        for name, field in SPARSE_FIELDS.items():
+            indices, values = self.encode_document(payload.get(field) or "", name)
+            if indices:
+                vectors[name] = SparseVector(indices=indices, values=values)
+        return vectors
+
+
+def sparse_vectors_config() -> Dict[str, Any]:
+    """sparse_vectors_config for create_collection (server-side IDF)"""
+    from qdrant_client.models import SparseVectorParams, Modifier
+
+    return {name: SparseVectorParams(modifier=Modifier.IDF) for name in SPARSE_FIELDS}
@@ -0,0 +1,152 @@
+"""
+Compressed Side Store for Long Applicant Text
+resume_full_text, work_history_text and tasks_summary live in an id-keyed
+SQLite file (one zstd-compressed JSON blob per applicant) instead of the
+Qdrant payload. Points keep only the small filter/display fields, so cluster
+RAM, snapshots and every with_payload response shrink. The explainer fetches
+text for the displayed candidates in one batched, cached lookup.
+
+Written at upload time: TEXT_STORE_PATH=./data/applicant_text.db python3
+scripts/migrations/create_unified_collection.py
+
+Configuration (from .env):
+    TEXT_STORE_PATH         - SQLite file; unset keeps the text in the payload
+    TEXT_STORE_LEVEL        - zstd level (default 9)
+    TEXT_CACHE_SIZE / TEXT_CACHE_TTL_SECONDS - per-applicant cache (default 2048 / 3600)
+"""
+import os
+import json
+import zlib
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from core.cache import TTLCache
+except ImportError:
+    from cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+TEXT_FIELDS = ("resume_full_text", "work_history_text", "tasks_summary")
+
+# First byte of every blob: how it was compressed
+CODEC_ZSTD = b"z"
+CODEC_ZLIB = b"d"
+
+# SQLite's default limit on bound parameters is 999
+MAX_IDS_PER_QUERY = 900
+
+
+def split_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """(payload without the long text fields, the long text fields)"""
+    small = {key: value for key, value in payload.items() if key not in TEXT_FIELDS}
+    texts = {key: payload[key] for key in TEXT_FIELDS if payload.get(key)}
+    return small, texts
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class TextStore:
+    """Id-keyed, compressed long-text store (SQLite)"""
+
+    def __init__(self, path: str, level: Optional[int] = None, cache: Optional[TTLCache] = None, codec: Optional[str] = None):
+        """
+        Args:
+            path: SQLite file (created if missing)
+            level: zstd level (defaults to TEXT_STORE_LEVEL, else 9)
+            cache: Decoded texts by applicant id (defaults to TEXT_CACHE_SIZE / TEXT_CACHE_TTL_SECONDS)
+            codec: "zstd" (default) or "zlib"; zstd falls back to zlib when
+                zstandard is not installed
+        """
+        self.path = path
+        self.level = level if level is not None else int(os.getenv("TEXT_STORE_LEVEL", "9"))
+        self.cache = cache if cache is not None else TTLCache.from_env("TEXT_CACHE", 2048, 3600)
+
+        zstandard = _zstd() if codec in (None, "zstd") else None
+        if codec in (None, "zstd") and zstandard is None:
+            logger.warning("⚠ zstandard not installed - compressing text with zlib (pip install zstandard)")
+        self.codec = "zstd" if zstandard is not None else "zlib"
+        self._compressor = zstandard.ZstdCompressor(level=self.level) if zstandard is not None else None
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS texts (id TEXT PRIMARY KEY, blob BLOB NOT NULL)")
+        self._db.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional["TextStore"]:
+        """Store at TEXT_STORE_PATH, or None when unset (text stays in the payload)"""
+        path = os.getenv("TEXT_STORE_PATH")
+        if not path:
+            return None
+        return cls(path)
+
+    def _encode(self, texts: Dict[str, str]) -> bytes:
+        raw = json.dumps(texts, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if self._compressor is not None:
+            return CODEC_ZSTD + self._compressor.compress(raw)
+        return CODEC_ZLIB + zlib.compress(raw, min(self.level, 9))
+
+    def _decode(self, blob: bytes) -> Dict[str, str]:
+        codec, data = blob[:1], blob[1:]
+        if codec == CODEC_ZSTD:
+            if self._decompressor is None:
+                raise RuntimeError("Text store entry is zstd-compressed but zstandard is not installed")
+            raw = self._decompressor.decompress(data)
+        else:
+            raw = zlib.decompress(data)
+        return json.loads(raw.decode("utf-8"))
+
+    def put_many(self, items: Iterable[Tuple[Any, Dict[str, str]]]) -> int:
+        """Store (applicant id, {field: text}) pairs, replacing existing ones; returns the count"""
+        items = [(str(applicant_id), texts) for applicant_id, texts in items]
+        rows = [(applicant_id, self._encode(texts)) for applicant_id, texts in items]
+        with self._lock:
+            self._db.executemany("INSERT OR REPLACE INTO texts (id, blob) VALUES (?, ?)", rows)
+            self._db.commit()
+        if self.cache is not None:
+            for applicant_id, texts in items:
+                self.cache.set(applicant_id, texts)
+        return len(rows)
+
+    def get_many(self, applicant_ids: Iterable[Any]) -> Dict[str, Dict[str, str]]:
+        """{applicant id: {field: text}} for the ids found (one query for the cache misses)"""
+        found: Dict[str, Dict[str, str]] = {}
+        missing: List[str] = []
+        for applicant_id in dict.fromkeys(str(i) for i in applicant_ids if i is not None):
+            cached = self.cache.get(applicant_id) if self.cache is not None else None
+            if cached is not None:
+                found[applicant_id] = cached
+            else:
+                missing.append(applicant_id)
+
+        for start in range(0, len(missing), MAX_IDS_PER_QUERY):
+            chunk = missing[start:start + MAX_IDS_PER_QUERY]
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT id, blob FROM texts WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+            for applicant_id, blob in rows:
+                texts = self._decode(blob)
+                found[applicant_id] = texts
+                if self.cache is not None:
+                    self.cache.set(applicant_id, texts)
+        return found
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM texts").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,124 @@
+"""
+Time-Partitioned Applicant Collections
+Applicants split by date_applied into quarterly collections
+(applicants_unified_2025q3, ...) plus applicants_unified_undated. The router
+sends a search only to the partitions overlapping its min/max_date_applied
+range; IntelligentSearchEngine merges their top-k. Recent quarters stay in
+RAM ("hot"); older ones move to on-disk, quantized storage ("cold").
+
+Split / maintain with: python3 scripts/migrations/partition_by_quarter.py
+
+Configuration (from .env):
+    SEARCH_PARTITIONED      - "true" routes searches over the partitions
+    PARTITION_HOT_QUARTERS  - newest quarters kept in RAM (default 2)
+    PARTITION_COLD_QUANTIZATION - quantization of cold partitions: "scalar" (default), "binary" or "none"
+    PARTITION_REFRESH_SECONDS - how often new partitions are discovered (default 60)
+"""
+import os
+import re
+import time
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+UNDATED = "undated"
+DEFAULT_HOT_QUARTERS = 2
+
+
+def quarter_key(timestamp: Optional[int]) -> str:
+    """'2025q3' for a Unix timestamp (UTC), 'undated' without one"""
+    if timestamp is None:
+        return UNDATED
+    moment = datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
+    return f"{moment.year}q{(moment.month - 1) // 3 + 1}"
+
+
+def quarter_bounds(key: str) -> Tuple[int, int]:
+    """[start, end) Unix timestamps of a quarter key"""
+    year, quarter = int(key[:4]), int(key[5:])
+    start = datetime(year, 3 * quarter - 2, 1, tzinfo=timezone.utc)
+    end = datetime(year + quarter // 4, (3 * quarter) % 12 + 1, 1, tzinfo=timezone.utc)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+def partition_name(base: str, key: str) -> str:
+    return f"{base}_{key}"
+
+
+def hot_keys(keys: List[str], hot_quarters: Optional[int] = None) -> List[str]:
+    """Quarter keys kept in RAM: the newest PARTITION_HOT_QUARTERS (the undated partition is always hot)"""
+    hot_quarters = hot_quarters if hot_quarters is not None else int(
+        os.getenv("PARTITION_HOT_QUARTERS", str(DEFAULT_HOT_QUARTERS))
+    )
+    quarters = sorted(key for key in keys if key != UNDATED)
+    return quarters[-hot_quarters:] if hot_quarters > 0 else []
+
+
+def cold_quantization() -> str:
+    """Quantization mode for cold partitions (PARTITION_COLD_QUANTIZATION, default scalar)"""
+    return os.getenv("PARTITION_COLD_QUANTIZATION", "scalar").lower()
+
+
+class PartitionRouter:
+    """Discovers the quarterly partitions of a base collection and picks the ones a query needs"""
+
+    def __init__(self, base: str = "applicants_unified", refresh_seconds: Optional[float] = None):
+        self.base = base
+        self.refresh_seconds = (
+            refresh_seconds if refresh_seconds is not None
+            else float(os.getenv("PARTITION_REFRESH_SECONDS", "60"))
+        )
+        self._pattern = re.compile(rf"^{re.escape(base)}_(\d{{4}}q[1-4]|{UNDATED})$")
+        self._partitions: Dict[str, str] = {}
+        self._refreshed = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, base: str = "applicants_unified") -> Optional["PartitionRouter"]:
+        """Router when SEARCH_PARTITIONED is on, else None (single collection)"""
+        if os.getenv("SEARCH_PARTITIONED", "false").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(base)
+
+    def partitions(self, client) -> Dict[str, str]:
+        """Partition key -> collection name, re-listed every refresh_seconds"""
+        now = time.monotonic()
+        if self._refreshed and now - self._refreshed < self.refresh_seconds:
+            return self._partitions
+        with self._lock:
+            if not self._refreshed or now - self._refreshed >= self.refresh_seconds:
+                found = {}
+                for collection in client.get_collections().collections:
+                    match = self._pattern.match(collection.name)
+                    if match:
+                        found[match.group(1)] = collection.name
+                if found.keys() != self._partitions.keys():
+                    logger.info(f"✓ {len(found)} partitions of '{self.base}': {', '.join(sorted(found))}")
+                self._partitions = found
+                self._refreshed = now
+        return self._partitions
+
+    def route(self, client, min_date: Optional[int] = None, max_date: Optional[int] = None) -> List[str]:
+        """Collections whose quarter overlaps [min_date, max_date], newest first"""
+        selected = []
+        for key, collection in self.partitions(client).items():
+            if key == UNDATED:
+                # Undated applicants can only match a search without a date filter
+                if min_date is None and max_date is None:
+                    selected.append((key, collection))
+                continue
+            start, end = quarter_bounds(key)
+            if (min_date is None or end > min_date) and (max_date is None or start <= max_date):
+                selected.append((key, collection))
+        selected.sort(key=lambda item: (item[0] != UNDATED, item[0]), reverse=True)
+        return [collection for _, collection in selected]
+
+    def newest(self, client) -> Optional[str]:
+        """Most recent dated partition (its config stands for all of them)"""
+        quarters = sorted(key for key in self.partitions(client) if key != UNDATED)
+        if quarters:
+            return self._partitions[quarters[-1]]
+        return self._partitions.get(UNDATED)
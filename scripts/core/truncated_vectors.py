@@ -0,0 +1,66 @@
+"""
+Truncated (Matryoshka) Vectors
+gemini-embedding-001 is trained so that a prefix of the 3072-dim embedding is
+itself a usable embedding. applicants_unified can carry truncated copies of the
+resume/skills/tasks vectors (e.g. resume_768) built from the stored full vectors
+at ingest (no re-embedding). Searches traverse HNSW on the small vectors and
+Qdrant rescores the top candidates on the full vectors.
+
+Configuration (from .env):
+    TRUNCATED_DIMS        - dims stored at ingest, e.g. "256,768" (unset = none)
+    SEARCH_RETRIEVAL      - "full" (default) or "truncated"
+    SEARCH_TRUNCATED_DIM  - dim searched in truncated mode (default 768)
+    RESCORE_LIMIT         - candidates rescored on the full vectors (default 300)
+"""
+import os
+import logging
+from typing import List, Dict, Any, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FULL_VECTORS = ("resume", "skills", "tasks")
+DEFAULT_TRUNCATED_DIM = 768
+DEFAULT_RESCORE_LIMIT = 300
+
+
+def truncated_vector_name(name: str, dim: int) -> str:
+    """Named vector holding the first `dim` components of `name`"""
+    return f"{name}_{dim}"
+
+
+def truncate(vector: Iterable[float], dim: int) -> List[float]:
+    """First `dim` components, re-normalized to unit length (cosine)"""
+    prefix = np.asarray(vector, dtype=np.float32)[:dim]
+    norm = float(np.linalg.norm(prefix))
+    return (prefix / norm if norm else prefix).tolist()
+
+
+def truncated_dims_from_env() -> List[int]:
+    """TRUNCATED_DIMS as sorted ints (empty when unset)"""
+    value = os.getenv("TRUNCATED_DIMS", "")
+    dims = sorted({int(part) for part in value.split(",") if part.strip()})
+    if any(dim <= 0 for dim in dims):
+        raise ValueError(f"TRUNCATED_DIMS must be positive integers, got '{value}'")
+    return dims
+
+
+def truncated_document_vectors(vectors: Dict[str, List[float]], dims: Iterable[int]) -> Dict[str, List[float]]:
+    """Truncated copies of the full named vectors of one point"""
+    return {
+        truncated_vector_name(name, dim): truncate(vectors[name], dim)
+        for name in FULL_VECTORS if name in vectors
+        for dim in dims
+    }
+
+
+def truncated_vectors_config(dims: Iterable[int]) -> Dict[str, Any]:
+    """vectors_config entries for the truncated vectors (COSINE, in RAM)"""
+    from qdrant_client.models import VectorParams, Distance
+
+    return {
+        truncated_vector_name(name, dim): VectorParams(size=dim, distance=Distance.COSINE)
+        for name in FULL_VECTORS
+        for dim in dims
+    }
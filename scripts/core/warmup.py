@@ -0,0 +1,211 @@
+"""
+Startup Warm-Up and Health Checks
+Opens pooled connections to Gemini, OpenAI and Qdrant, pages in each named
+vector's index and prefills the parse/embedding caches before the API
+reports ready. Component health checks are measured and cached.
+"""
+import os
+import time
+import logging
+import threading
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXT = "senior software engineer with python experience"
+GEMINI_HEALTH_MODEL = "models/gemini-embedding-001"
+
+
+def load_warmup_queries(path: Optional[str] = None, limit: Optional[int] = None) -> List[str]:
+    """
+    Queries used to prefill the caches at startup
+
+    WARMUP_QUERIES_FILE may be a plain text file (one query per line) or a
+    query log (.jsonl, see QUERY_LOG_PATH); for a log, the most frequent
+    queries are used. Falls back to QUERY_LOG_PATH when unset.
+
+    Args:
+        path: File to read (defaults to WARMUP_QUERIES_FILE, then QUERY_LOG_PATH)
+        limit: Maximum queries (defaults to WARMUP_QUERY_LIMIT, 20)
+
+    Returns:
+        List of raw recruiter queries, most important first
+    """
+    path = path or os.getenv("WARMUP_QUERIES_FILE") or os.getenv("QUERY_LOG_PATH")
+    limit = limit if limit is not None else int(os.getenv("WARMUP_QUERY_LIMIT", "20"))
+    if not path or not os.path.exists(path) or limit <= 0:
+        return []
+
+    if path.endswith(".jsonl"):
+        from core.query_log import read_query_log
+
+        counts = Counter(
+            record["query"].strip() for record in read_query_log(path) if record.get("query")
+        )
+        return [query for query, _ in counts.most_common(limit)]
+
+    with open(path, "r", encoding="utf-8") as f:
+        queries = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return queries[:limit]
+
+
+def _timed(check: Callable[[], Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        detail = check()
+        result = {"status": "ok"}
+        if detail is not None:
+            result["detail"] = detail
+    except Exception as e:
+        result = {"status": "error", "error": str(e)}
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def warm_up(parser, engine, queries: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Warm every dependency of the search path
+
+    1. Qdrant: collection check (opens the pooled connection)
+    2. Gemini: one canned embedding, then a small search on each named vector
+    3. OpenAI: one metadata call to open the fallback connection (if configured)
+    4. Caches: parse + embed the top queries
+
+    Raises:
+        ValueError: If the collection is missing (the API must not become ready)
+
+    Returns:
+        Report with per-step latencies (ms)
+    """
+    report: Dict[str, Any] = {"steps": {}}
+    started = time.perf_counter()
+
+    stage = time.perf_counter()
+    report["points_count"] = engine.verify_collection()
+    report["steps"]["qdrant_connect_ms"] = (time.perf_counter() - stage) * 1000
+
+    stage = time.perf_counter()
+    try:
+        query_vector = engine._embed_query(WARMUP_TEXT)
+    except Exception as e:
+        # With a lexical index the API can still serve (degraded) results
+        if getattr(engine, "lexical_index", None) is None:
+            raise
+        logger.warning(f"⚠ Warm-up embedding failed ({e}) - starting in lexical degraded mode")
+        query_vector = None
+        report["degraded"] = True
+    report["steps"]["gemini_embed_ms"] = (time.perf_counter() - stage) * 1000
+
+    if query_vector is not None:
+        report["steps"]["vector_search_ms"] = engine.warm_up(query_vector)
+
+    if parser.openai_client is not None:
+        check = _timed(lambda: parser.openai_client.models.retrieve(parser.openai_model).id)
+        report["steps"]["openai_connect_ms"] = check["latency_ms"]
+        if check["status"] != "ok":
+            logger.warning(f"⚠ OpenAI warm-up failed: {check['error']}")
+
+    queries = queries if queries is not None else load_warmup_queries()
+    stage = time.perf_counter()
+    warmed = 0
+    for query in queries:
+        try:
+            parsed = parser.parse(query)
+            engine._embed_query(parsed["search_intent"])
+            warmed += 1
+        except Exception as e:
+            logger.warning(f"⚠ Warm-up query failed '{query}': {e}")
+    report["steps"]["prefill_ms"] = (time.perf_counter() - stage) * 1000
+    report["queries_prefilled"] = warmed
+
+    report["total_ms"] = (time.perf_counter() - started) * 1000
+    logger.info(f"✓ Warm-up complete in {report['total_ms']:.0f}ms ({warmed} queries prefilled)")
+    return report
+
+
+class HealthMonitor:
+    """
+    Real component checks with measured latencies, cached for `ttl_seconds`
+    so frequent probes don't hammer Qdrant or the LLM APIs
+
+    Qdrant and Gemini are required (no search without them); OpenAI is only
+    the parse fallback, so its failure marks the system degraded. Gemini is
+    not required when the engine has a lexical index to fall back on.
+    """
+
+    REQUIRED = ("qdrant", "gemini")
+
+    def __init__(self, parser, engine, ttl_seconds: Optional[float] = None):
+        self.parser = parser
+        self.engine = engine
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv("HEALTH_CHECK_TTL_SECONDS", "30"))
+        self._lock = threading.Lock()
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+
+    def _check_qdrant(self) -> Dict[str, Any]:
+        router = getattr(self.engine, "partition_router", None)
+        if router is not None:
+            partitions = list(router.partitions(self.engine.client).values())
+            points = sum(self.engine.client.get_collection(name).points_count or 0 for name in partitions)
+            return {"collection": self.engine.COLLECTION_NAME, "partitions": len(partitions), "points_count": points}
+        info = self.engine.client.get_collection(self.engine.COLLECTION_NAME)
+        return {"collection": self.engine.COLLECTION_NAME, "points_count": info.points_count}
+
+    def _check_gemini(self) -> str:
+        return self.engine.gemini_client.models.get(model=GEMINI_HEALTH_MODEL).name
+
+    def _check_openai(self) -> str:
+        return self.parser.openai_client.models.retrieve(self.parser.openai_model).id
+
+    def check(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Return cached component checks, re-running them when stale
+
+        Returns:
+            {"status": "healthy"|"degraded"|"unhealthy", "checked_at", "components": {...}}
+        """
+        with self._lock:
+            if not force and self._result and time.time() - self._checked_at < self.ttl_seconds:
+                return self._result
+
+            components = {
+                "qdrant": _timed(self._check_qdrant),
+                "gemini": _timed(self._check_gemini),
+            }
+            if self.parser.openai_client is not None:
+                components["openai"] = _timed(self._check_openai)
+            else:
+                components["openai"] = {"status": "disabled"}
+            local_embedder = getattr(self.engine, "local_embedder", None)
+            if local_embedder is not None:
+                if local_embedder.is_ready:
+                    components["local_embedder"] = {"status": "ok", "model": local_embedder.model_name}
+                elif local_embedder.load_error:
+                    components["local_embedder"] = {"status": "error", "error": local_embedder.load_error}
+                else:
+                    components["local_embedder"] = {"status": "loading", "model": local_embedder.model_name}
+            read_replica = getattr(self.engine, "read_replica", None)
+            if read_replica is not None:
+                # A stale replica is not an error: searches read from the primary meanwhile
+                lag = read_replica.lag_seconds
+                components["read_replica"] = {
+                    "status": "ok" if read_replica.is_fresh() else "stale",
+                    "lag_seconds": None if lag is None else round(lag, 1)
+                }
+
+            failed = [name for name, result in components.items() if result["status"] == "error"]
+            required = self.REQUIRED
+            if getattr(self.engine, "lexical_index", None) is not None:
+                required = tuple(name for name in required if name != "gemini")
+            if any(name in required for name in failed):
+                status = "unhealthy"
+            elif failed:
+                status = "degraded"
+            else:
+                status = "healthy"
+
+            self._checked_at = time.time()
+            self._result = {"status": status, "checked_at": self._checked_at, "components": components}
+            return self._result
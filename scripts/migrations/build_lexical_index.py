@@ -0,0 +1,77 @@
+"""
+Build the local BM25 lexical index used in degraded mode (Gemini embeddings down)
+Run after create_unified_collection.py (same data file), then set LEXICAL_INDEX_PATH
+"""
+import sys
+import os
+import json
+import argparse
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(__file__))
+
+from core.load_env import load_env
+from core.lexical_index import LexicalIndex
+from create_unified_collection import has_valid_embeddings, applicant_payload
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+DATA_FILE = "/mnt/c/Users/prita/Downloads/SuperLinked/data/processed/applicants_with_embeddings_clean.json"
+DEFAULT_OUTPUT = "data/lexical_index"
+
+
+def build_lexical_index(data_file: str, output: str) -> LexicalIndex:
+    """Index every uploaded applicant (same point ids and payloads as applicants_unified)"""
+
+    logger.info("\n" + "=" * 80)
+    logger.info("BUILDING LEXICAL (BM25) INDEX")
+    logger.info("=" * 80)
+
+    logger.info(f"\nLoading data from: {data_file}")
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    logger.info(f"  ✓ Loaded {len(data)} applicants")
+
+    # Point id = position in the data file; applicants skipped at upload are skipped here too
+    index = LexicalIndex.build(
+        (i, applicant_payload(applicant))
+        for i, applicant in enumerate(data)
+        if has_valid_embeddings(applicant)
+    )
+    index.save(output)
+
+    size_mb = sum(
+        os.path.getsize(os.path.join(output, name)) for name in os.listdir(output)
+    ) / (1024 * 1024)
+    logger.info(f"\n  ✓ Wrote {output}/ ({size_mb:.1f} MB)")
+    logger.info(f"  Set LEXICAL_INDEX_PATH={output} for the search API")
+
+    return index
+
+
+def main():
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Build the local BM25 lexical index")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Applicants JSON (same file as the upload)")
+    parser.add_argument("--output", default=os.getenv("LEXICAL_INDEX_PATH", DEFAULT_OUTPUT))
+    args = parser.parse_args()
+
+    build_lexical_index(args.data_file, args.output)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,72 @@
+"""
+Build the resume passage index used for query-aware snippets
+Run after create_unified_collection.py (same data file), then set PASSAGE_INDEX_PATH
+"""
+import sys
+import os
+import json
+import argparse
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.load_env import load_env
+from core.passage_index import PassageIndex, DEFAULT_PASSAGE_CHARS
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+DATA_FILE = "/mnt/c/Users/prita/Downloads/SuperLinked/data/processed/applicants_with_embeddings_clean.json"
+DEFAULT_OUTPUT = "data/passage_index.json.gz"
+
+
+def build_passage_index(data_file: str, output: str, passage_chars: int = DEFAULT_PASSAGE_CHARS) -> PassageIndex:
+    """Split every resume into passages and write the compact index"""
+
+    logger.info("\n" + "=" * 80)
+    logger.info("BUILDING RESUME PASSAGE INDEX")
+    logger.info("=" * 80)
+
+    logger.info(f"\nLoading data from: {data_file}")
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    logger.info(f"  ✓ Loaded {len(data)} applicants")
+
+    index = PassageIndex.build(
+        ((applicant.get("id"), applicant.get("resume_full_text")) for applicant in data),
+        passage_chars=passage_chars
+    )
+    index.save(output)
+
+    size_mb = os.path.getsize(output) / (1024 * 1024)
+    logger.info(f"\n  ✓ Wrote {output} ({size_mb:.1f} MB)")
+    logger.info(f"  Set PASSAGE_INDEX_PATH={output} for the search API")
+
+    return index
+
+
+def main():
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Build the resume passage index")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Applicants JSON (same file as the upload)")
+    parser.add_argument("--output", default=os.getenv("PASSAGE_INDEX_PATH", DEFAULT_OUTPUT))
+    parser.add_argument("--passage-chars", type=int, default=DEFAULT_PASSAGE_CHARS)
+    args = parser.parse_args()
+
+    build_passage_index(args.data_file, args.output, args.passage_chars)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}", exc_info=True)
+        sys.exit(1)
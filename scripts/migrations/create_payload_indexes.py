@@ -8,9 +8,10 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from qdrant_client import QdrantClient
 from qdrant_client.models import PayloadSchemaType
 from core.load_env import load_env
+from core.qdrant_factory import get_qdrant_client, operation_timeout
+from core.collection_versions import resolve_alias
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -19,48 +20,33 @@ logger = logging.getLogger(__name__)
 
 COLLECTION_NAME = "applicants_unified"
 
+PAYLOAD_INDEXES = [
+    ("total_years_experience", PayloadSchemaType.FLOAT, "Enables experience range filtering"),
+    ("longest_tenure_years", PayloadSchemaType.FLOAT, "Enables tenure range filtering"),
+    ("location", PayloadSchemaType.KEYWORD, "Enables exact location matching"),
+    ("education_level", PayloadSchemaType.KEYWORD, "Enables exact education matching"),
+    ("current_stage", PayloadSchemaType.KEYWORD, "Enables application stage filtering"),
+    ("date_applied", PayloadSchemaType.INTEGER, "Enables date range filtering (Unix timestamp)"),
+    ("job_title", PayloadSchemaType.TEXT, "Enables fuzzy job title matching"),
+    ("company_names", PayloadSchemaType.TEXT, "Enables fuzzy company name matching"),
+    ("updated_at", PayloadSchemaType.INTEGER, "Enables read replica delta sync (Unix timestamp)"),
+]
 
-def create_indexes():
-    """Create payload indexes for filtering fields"""
 
-    load_env()
+def create_payload_indexes(client, collection_name: str) -> None:
+    """Create the filter indexes on one collection (existing ones are skipped)"""
+    logger.info(f"\nCreating indexes on collection '{collection_name}'...")
 
-    # Connect to Qdrant
-    logger.info("\n" + "=" * 80)
-    logger.info("CREATING PAYLOAD INDEXES")
-    logger.info("=" * 80)
-
-    url = os.getenv('QDRANT_URL')
-    api_key = os.getenv('QDRANT_API_KEY')
-
-    logger.info(f"\nConnecting to Qdrant Cloud...")
-    logger.info(f"  URL: {url}")
-
-    client = QdrantClient(url=url, api_key=api_key, timeout=120)
-
-    # Create indexes for filtering fields
-    logger.info(f"\nCreating indexes on collection '{COLLECTION_NAME}'...")
-
-    indexes = [
-        ("total_years_experience", PayloadSchemaType.FLOAT, "Enables experience range filtering"),
-        ("longest_tenure_years", PayloadSchemaType.FLOAT, "Enables tenure range filtering"),
-        ("location", PayloadSchemaType.KEYWORD, "Enables exact location matching"),
-        ("education_level", PayloadSchemaType.KEYWORD, "Enables exact education matching"),
-        ("current_stage", PayloadSchemaType.KEYWORD, "Enables application stage filtering"),
-        ("date_applied", PayloadSchemaType.INTEGER, "Enables date range filtering (Unix timestamp)"),
-        ("job_title", PayloadSchemaType.TEXT, "Enables fuzzy job title matching"),
-        ("company_names", PayloadSchemaType.TEXT, "Enables fuzzy company name matching"),
-    ]
-
-    for field_name, field_type, description in indexes:
+    for field_name, field_type, description in PAYLOAD_INDEXES:
         try:
             logger.info(f"\n  Creating index: {field_name} ({field_type})")
             logger.info(f"    Purpose: {description}")
 
             client.create_payload_index(
-                collection_name=COLLECTION_NAME,
+                collection_name=collection_name,
                 field_name=field_name,
-                field_schema=field_type
+                field_schema=field_type,
+                timeout=operation_timeout("admin")
             )
 
             logger.info(f"    ✓ Index created")
@@ -72,9 +58,32 @@ def create_indexes():
                 logger.error(f"    ✗ Failed to create index: {e}")
                 raise
 
+
+def create_indexes():
+    """Create payload indexes for filtering fields on the live collection"""
+
+    load_env()
+
+    # Connect to Qdrant
+    logger.info("\n" + "=" * 80)
+    logger.info("CREATING PAYLOAD INDEXES")
+    logger.info("=" * 80)
+
+    url = os.getenv('QDRANT_URL')
+    api_key = os.getenv('QDRANT_API_KEY')
+
+    logger.info(f"\nConnecting to Qdrant Cloud...")
+    logger.info(f"  URL: {url}")
+
+    client = get_qdrant_client(url, api_key)
+
+    # applicants_unified is an alias of the live version (blue/green rebuilds)
+    collection_name = resolve_alias(client, COLLECTION_NAME) or COLLECTION_NAME
+    create_payload_indexes(client, collection_name)
+
     # Verify indexes
     logger.info(f"\nVerifying indexes...")
-    collection_info = client.get_collection(COLLECTION_NAME)
+    collection_info = client.get_collection(collection_name)
 
     logger.info(f"  Collection status: {collection_info.status}")
     logger.info(f"  Total points: {collection_info.points_count}")
@@ -1,28 +1,65 @@
 """
 Create unified Qdrant collection with 3 named vectors and upload data
+
+Blue/green: each run builds a new applicants_unified_v{n} (payload indexes,
+optimizers green, smoke search) and only then switches the applicants_unified
+alias to it, so searches never see a partial collection. Older versions are
+kept for rollback (COLLECTION_VERSIONS_KEEP).
+
+COLLECTION_BUILD=snapshot builds the version on QDRANT_BUILD_URL (a local
+Qdrant) instead and restores it on QDRANT_URL from one snapshot upload.
 """
 import sys
 import os
 import json
+import time
+from typing import List, Optional
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(__file__))
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
 from core.load_env import load_env
+from core.qdrant_factory import get_qdrant_client, operation_timeout
+from core.snapshot_transfer import build_mode, transfer_collection, DEFAULT_BUILD_URL
+from core.text_store import TextStore, split_payload
+from core.sparse_encoder import SparseEncoder, sparse_vectors_config
+from core.local_embedder import LocalEmbedder, local_vectors_config
+from core.truncated_vectors import truncated_dims_from_env, truncated_document_vectors, truncated_vectors_config
+from core.collection_config import collection_storage_kwargs, vectors_on_disk
+from core.intelligent_search import IntelligentSearchEngine
+from core.collection_versions import (
+    next_version_name, wait_until_green, smoke_search, switch_alias, prune_versions
+)
+from create_payload_indexes import create_payload_indexes
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-COLLECTION_NAME = "applicants_unified"
+COLLECTION_NAME = "applicants_unified"  # alias of the live applicants_unified_v{n}
 DATA_FILE = "/mnt/c/Users/prita/Downloads/SuperLinked/data/processed/applicants_with_embeddings_clean.json"
 
 
-def create_unified_collection():
-    """Create single Qdrant collection with 3 named vectors"""
+def create_unified_collection(
+    local_embedder: Optional[LocalEmbedder] = None,
+    truncated_dims: Optional[List[int]] = None,
+    profile: bool = False,
+    collection_name: Optional[str] = None,
+    client: Optional[QdrantClient] = None
+):
+    """
+    Create single Qdrant collection with 3 named vectors (plus *_local shadow
+    vectors with a local embedder, {name}_{dim} truncated copies and the fused
+    profile vector)
+
+    Creates the next applicants_unified_v{n} unless collection_name is given;
+    the live collection is untouched. Builds on `client` (e.g. the local
+    build server) when given, else on QDRANT_URL. Returns (client, collection_name).
+    """
 
     load_env()
 
@@ -31,51 +68,117 @@ def create_unified_collection():
     logger.info("CREATING UNIFIED QDRANT COLLECTION")
     logger.info("=" * 80)
 
-    url = os.getenv('QDRANT_URL')
-    api_key = os.getenv('QDRANT_API_KEY')
+    if client is None:
+        url = os.getenv('QDRANT_URL')
+        api_key = os.getenv('QDRANT_API_KEY')
 
-    logger.info(f"\nConnecting to Qdrant Cloud...")
-    logger.info(f"  URL: {url}")
+        logger.info(f"\nConnecting to Qdrant Cloud...")
+        logger.info(f"  URL: {url}")
 
-    client = QdrantClient(url=url, api_key=api_key, timeout=120)
+        # gRPC (QDRANT_PREFER_GRPC=true) sends the 3 x 3072-dim vectors as protobuf instead of JSON
+        client = get_qdrant_client(url, api_key)
 
-    # Delete collection if it already exists
-    try:
-        client.delete_collection(COLLECTION_NAME)
-        logger.info(f"\n  Deleted existing '{COLLECTION_NAME}' collection")
-    except:
-        pass
+    # New version next to the live one (searches keep using the alias meanwhile)
+    collection_name = collection_name or next_version_name(client, COLLECTION_NAME)
 
     # Create collection with 3 named vectors
-    logger.info(f"\nCreating collection: '{COLLECTION_NAME}'")
+    logger.info(f"\nCreating collection: '{collection_name}'")
     logger.info(f"  Configuration:")
     logger.info(f"    - resume vector: 3072 dimensions, COSINE distance")
     logger.info(f"    - skills vector: 3072 dimensions, COSINE distance")
     logger.info(f"    - tasks vector: 3072 dimensions, COSINE distance")
+    logger.info(f"    - skills_sparse / title_sparse / company_sparse: BM25 sparse vectors (server-side IDF)")
+    if local_embedder is not None:
+        logger.info(f"    - resume_local / skills_local / tasks_local: {local_embedder.dimension} dimensions ({local_embedder.model_name})")
+    for dim in truncated_dims or []:
+        logger.info(f"    - resume_{dim} / skills_{dim} / tasks_{dim}: truncated copies for two-stage search")
+    if profile:
+        logger.info(f"    - profile vector: 3072 dimensions, DOT distance (unit weighted sum {IntelligentSearchEngine.WEIGHTS})")
+
+    # Quantization (QDRANT_QUANTIZATION) and HNSW m / ef_construct (QDRANT_HNSW_*)
+    storage = collection_storage_kwargs()
+    on_disk = vectors_on_disk("quantization_config" in storage) or bool(truncated_dims)
+    if "quantization_config" in storage:
+        logger.info(f"    - quantization: {os.getenv('QDRANT_QUANTIZATION')} (quantized vectors in RAM)")
+    if "hnsw_config" in storage:
+        logger.info(f"    - HNSW: {storage['hnsw_config']}")
+    if on_disk:
+        logger.info(f"    - full 3072-dim vectors stored on disk (only read to rescore candidates)")
 
     client.create_collection(
-        collection_name=COLLECTION_NAME,
+        collection_name=collection_name,
         vectors_config={
-            "resume": VectorParams(size=3072, distance=Distance.COSINE),
-            "skills": VectorParams(size=3072, distance=Distance.COSINE),
-            "tasks": VectorParams(size=3072, distance=Distance.COSINE)
-        }
+            "resume": VectorParams(size=3072, distance=Distance.COSINE, on_disk=on_disk),
+            "skills": VectorParams(size=3072, distance=Distance.COSINE, on_disk=on_disk),
+            "tasks": VectorParams(size=3072, distance=Distance.COSINE, on_disk=on_disk),
+            **(local_vectors_config(local_embedder.dimension) if local_embedder is not None else {}),
+            **truncated_vectors_config(truncated_dims or []),
+            **({IntelligentSearchEngine.PROFILE_VECTOR: VectorParams(size=3072, distance=Distance.DOT)} if profile else {})
+        },
+        sparse_vectors_config=sparse_vectors_config(),
+        timeout=operation_timeout("admin"),
+        **storage
     )
 
     logger.info(f"  ✓ Collection created successfully!")
 
     # Verify collection
-    collection_info = client.get_collection(COLLECTION_NAME)
+    collection_info = client.get_collection(collection_name)
     logger.info(f"\nCollection info:")
     logger.info(f"  Name: {collection_info.config.params}")
     logger.info(f"  Status: {collection_info.status}")
     logger.info(f"  Vectors: {collection_info.config.params.vectors}")
 
-    return client
+    return client, collection_name
 
 
-def upload_data(client: QdrantClient, batch_size: int = 50):
-    """Upload applicant data with 3 vectors per point"""
+def has_valid_embeddings(applicant: dict) -> bool:
+    """Whether all three embeddings are 3072-dim (others are skipped at upload)"""
+    return all(
+        len(applicant.get(field) or []) == 3072
+        for field in ("embedding_resume", "embedding_skills", "embedding_tasks")
+    )
+
+
+def applicant_payload(applicant: dict) -> dict:
+    """Point payload (metadata) for an applicant"""
+    return {
+        "id": applicant.get("id"),
+        "full_name": applicant.get("full_name"),
+        "email": applicant.get("email"),
+        "job_title": applicant.get("job_title"),
+        "current_stage": applicant.get("current_stage"),
+        "education_level": applicant.get("education_level"),
+        "total_years_experience": float(applicant.get("total_years_experience", 0)),
+        "longest_tenure_years": float(applicant.get("longest_tenure_years", 0)),
+        "current_company": applicant.get("current_company"),
+        "location": applicant.get("location"),
+        "skills_extracted": applicant.get("skills_extracted"),
+        "tasks_summary": applicant.get("tasks_summary"),
+        "resume_full_text": applicant.get("resume_full_text"),
+        "resume_url": applicant.get("resume_url"),
+        "date_applied": applicant.get("date_applied"),
+        "company_names": applicant.get("company_names", ""),
+        "work_history_text": applicant.get("work_history_text", ""),
+        # Read replicas sync points changed since their last sync (core.read_replica)
+        "updated_at": applicant.get("updated_at") or int(time.time())
+    }
+
+
+def upload_data(
+    client: QdrantClient,
+    collection_name: str,
+    batch_size: int = 50,
+    local_embedder: Optional[LocalEmbedder] = None,
+    truncated_dims: Optional[List[int]] = None,
+    profile: bool = False,
+    text_store: Optional[TextStore] = None
+):
+    """
+    Upload applicant data with 3 vectors per point (plus the local shadow,
+    truncated and profile vectors); with a text store the long text fields go
+    there instead of the payload
+    """
 
     logger.info("\n" + "=" * 80)
     logger.info("UPLOADING DATA TO UNIFIED COLLECTION")
@@ -89,68 +192,73 @@ def upload_data(client: QdrantClient, batch_size: int = 50):
     total = len(data)
     logger.info(f"  ✓ Loaded {total} applicants")
 
+    # BM25 length normalization uses the corpus average field lengths
+    sparse_encoder = SparseEncoder().fit(data)
+
+    # Local shadow vectors are embedded offline on CPU, all applicants in one pass
+    local_vectors = {}
+    if local_embedder is not None:
+        logger.info(f"\nEmbedding resume/skills/tasks with {local_embedder.model_name}...")
+        valid = [i for i, applicant in enumerate(data) if has_valid_embeddings(applicant)]
+        vectors = local_embedder.document_vectors([applicant_payload(data[i]) for i in valid])
+        local_vectors = dict(zip(valid, vectors))
+        logger.info(f"  ✓ Embedded {len(local_vectors)} applicants locally")
+
     # Upload in batches
     logger.info(f"\nUploading {total} applicants in batches of {batch_size}...")
 
     points = []
+    texts = []
     uploaded = 0
     skipped = 0
 
     for i, applicant in enumerate(data):
-        # Validate embeddings
-        resume_emb = applicant.get("embedding_resume", [])
-        skills_emb = applicant.get("embedding_skills", [])
-        tasks_emb = applicant.get("embedding_tasks", [])
-
-        if len(resume_emb) != 3072 or len(skills_emb) != 3072 or len(tasks_emb) != 3072:
+        if not has_valid_embeddings(applicant):
             logger.warning(f"  ⚠️  Skipping applicant {i}: invalid embedding dimensions")
             skipped += 1
             continue
 
-        # Prepare payload (metadata)
-        payload = {
-            "id": applicant.get("id"),
-            "full_name": applicant.get("full_name"),
-            "email": applicant.get("email"),
-            "job_title": applicant.get("job_title"),
-            "current_stage": applicant.get("current_stage"),
-            "education_level": applicant.get("education_level"),
-            "total_years_experience": float(applicant.get("total_years_experience", 0)),
-            "longest_tenure_years": float(applicant.get("longest_tenure_years", 0)),
-            "current_company": applicant.get("current_company"),
-            "location": applicant.get("location"),
-            "skills_extracted": applicant.get("skills_extracted"),
-            "tasks_summary": applicant.get("tasks_summary"),
-            "resume_full_text": applicant.get("resume_full_text"),
-            "resume_url": applicant.get("resume_url"),
-            "date_applied": applicant.get("date_applied"),
-            "company_names": applicant.get("company_names", ""),
-            "work_history_text": applicant.get("work_history_text", "")
-        }
+        payload = applicant_payload(applicant)
 
-        # Create point with 3 named vectors
+        # Create point with 3 named dense vectors + BM25 sparse vectors
+        dense = {
+            "resume": applicant["embedding_resume"],
+            "skills": applicant["embedding_skills"],
+            "tasks": applicant["embedding_tasks"],
+        }
         point = PointStruct(
             id=i,
             vector={
-                "resume": resume_emb,
-                "skills": skills_emb,
-                "tasks": tasks_emb
+                **dense,
+                **truncated_document_vectors(dense, truncated_dims or []),
+                **({IntelligentSearchEngine.PROFILE_VECTOR: IntelligentSearchEngine.profile_vector(dense)} if profile else {}),
+                **sparse_encoder.document_vectors(payload),
+                **local_vectors.get(i, {})
             },
             payload=payload
         )
 
+        # Vectors above are built from the full text; only the small fields stay in Qdrant
+        if text_store is not None:
+            point.payload, applicant_texts = split_payload(payload)
+            texts.append((payload["id"], applicant_texts))
+
         points.append(point)
 
         # Upload batch
         if len(points) >= batch_size:
             try:
                 client.upsert(
-                    collection_name=COLLECTION_NAME,
-                    points=points
+                    collection_name=collection_name,
+                    points=points,
+                    timeout=operation_timeout("upsert")
                 )
                 uploaded += len(points)
                 logger.info(f"  ✓ Uploaded batch: {uploaded}/{total} applicants")
                 points = []
+                if text_store is not None:
+                    text_store.put_many(texts)
+                    texts = []
             except Exception as e:
                 logger.error(f"  ✗ Batch upload failed: {e}")
                 raise
@@ -159,18 +267,21 @@ def upload_data(client: QdrantClient, batch_size: int = 50):
     if points:
         try:
             client.upsert(
-                collection_name=COLLECTION_NAME,
-                points=points
+                collection_name=collection_name,
+                points=points,
+                timeout=operation_timeout("upsert")
             )
             uploaded += len(points)
             logger.info(f"  ✓ Uploaded final batch: {uploaded}/{total} applicants")
+            if text_store is not None:
+                text_store.put_many(texts)
         except Exception as e:
             logger.error(f"  ✗ Final batch upload failed: {e}")
             raise
 
     # Verify upload
     logger.info(f"\nVerifying upload...")
-    count = client.count(COLLECTION_NAME).count
+    count = client.count(collection_name).count
     logger.info(f"  ✓ Total points in collection: {count}")
 
     if skipped > 0:
@@ -179,24 +290,97 @@ def upload_data(client: QdrantClient, batch_size: int = 50):
     logger.info("\n" + "=" * 80)
     logger.info("UPLOAD COMPLETE")
     logger.info("=" * 80)
-    logger.info(f"  Collection: {COLLECTION_NAME}")
+    logger.info(f"  Collection: {collection_name}")
     logger.info(f"  Total applicants: {count}")
     logger.info(f"  Vectors per applicant: 3 (resume, skills, tasks)")
     logger.info(f"  Vector dimensions: 3072 (Gemini)")
+    if text_store is not None:
+        logger.info(f"  Long text: {text_store.path} ({len(text_store)} applicants, {text_store.codec})")
 
     return count
 
 
+def delete_failed_build(clients, collection_name: str) -> None:
+    """Delete a version that failed before going live (best effort, on the target and build servers)"""
+    for client in clients:
+        if client is None:
+            continue
+        try:
+            if client.collection_exists(collection_name):
+                client.delete_collection(collection_name)
+                logger.info(f"  ✓ Deleted failed build '{collection_name}'")
+        except Exception as e:
+            logger.warning(f"⚠ Could not delete failed build '{collection_name}': {e}")
+
+
 def main():
     """Create collection and upload data"""
 
-    # Create collection
-    client = create_unified_collection()
+    load_env()
+
+    # LOCAL_EMBED_MODEL adds the on-box shadow vectors (resume_local, skills_local, tasks_local)
+    local_embedder = LocalEmbedder.from_env()
+
+    # TRUNCATED_DIMS (e.g. "256,768") adds truncated copies of the Gemini vectors
+    truncated_dims = truncated_dims_from_env()
+
+    # STORE_PROFILE_VECTOR=true adds the fused profile vector for retrieval="profile"
+    profile = os.getenv('STORE_PROFILE_VECTOR', 'false').lower() in ('1', 'true', 'yes')
+
+    # COLLECTION_BUILD=snapshot: build next to the data, ship one snapshot
+    snapshot = build_mode() == "snapshot"
+    client = get_qdrant_client()
+    build_client = None
+    if snapshot:
+        build_url = os.getenv('QDRANT_BUILD_URL', DEFAULT_BUILD_URL)
+        build_api_key = os.getenv('QDRANT_BUILD_API_KEY')
+        logger.info(f"\nSnapshot build: building on {build_url}, then restoring on {os.getenv('QDRANT_URL')}")
+        build_client = get_qdrant_client(build_url, build_api_key)
+
+    # Create the next version (the live one keeps serving searches); named after the target's versions
+    collection_name = next_version_name(client, COLLECTION_NAME)
+    try:
+        build_client, collection_name = create_unified_collection(
+            local_embedder, truncated_dims, profile, collection_name=collection_name, client=build_client or client
+        )
+
+        # Upload data (localhost round trips in snapshot mode, so bigger batches);
+        # TEXT_STORE_PATH moves resume/work history/tasks text into the side store
+        count = upload_data(
+            build_client, collection_name, batch_size=256 if snapshot else 50,
+            local_embedder=local_embedder, truncated_dims=truncated_dims, profile=profile,
+            text_store=TextStore.from_env()
+        )
+
+        # Filter indexes, then wait for the optimizers before going live
+        create_payload_indexes(build_client, collection_name)
+        logger.info(f"\nWaiting for '{collection_name}' indexing to finish...")
+        wait_until_green(build_client, collection_name)
+
+        if snapshot:
+            # Indexed segments travel in the snapshot; the target restores them as they are
+            smoke_search(build_client, collection_name, min_points=count)
+            transfer_collection(
+                build_client, build_url, collection_name, os.getenv('QDRANT_URL'),
+                target_api_key=os.getenv('QDRANT_API_KEY'), build_api_key=build_api_key
+            )
+            build_client.delete_collection(collection_name)
+            wait_until_green(client, collection_name)
+
+        smoke_search(client, collection_name, min_points=count)
+        logger.info(f"  ✓ Indexed and smoke search passed")
+
+        # Atomic switch: searches move to the new version in one alias update
+        previous = switch_alias(client, COLLECTION_NAME, collection_name)
+    except BaseException:
+        # A failed build is deleted, never left behind as the newest version
+        delete_failed_build([client, build_client], collection_name)
+        raise
 
-    # Upload data
-    count = upload_data(client)
+    prune_versions(client, COLLECTION_NAME)
 
     logger.info(f"\n🎉 SUCCESS! {count} applicants ready for intelligent search!")
+    logger.info(f"  '{COLLECTION_NAME}' -> '{collection_name}' (previous: {previous or 'none'})")
 
     return True
 
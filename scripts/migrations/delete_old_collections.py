@@ -7,8 +7,8 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from qdrant_client import QdrantClient
 from core.load_env import load_env
+from core.qdrant_factory import get_qdrant_client, operation_timeout
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -31,7 +31,7 @@ def delete_old_collections():
     logger.info(f"\nConnecting to Qdrant Cloud...")
     logger.info(f"  URL: {url}")
 
-    client = QdrantClient(url=url, api_key=api_key, timeout=60)
+    client = get_qdrant_client(url, api_key, timeout=60)
 
     # List all collections
     logger.info(f"\nListing current collections...")
@@ -58,7 +58,7 @@ def delete_old_collections():
     logger.info(f"\nDeleting collections...")
     for col in collections.collections:
         try:
-            client.delete_collection(col.name)
+            client.delete_collection(col.name, timeout=operation_timeout("admin"))
             logger.info(f"  ✓ Deleted '{col.name}'")
         except Exception as e:
             logger.error(f"  ✗ Failed to delete '{col.name}': {e}")
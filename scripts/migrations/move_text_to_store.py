@@ -0,0 +1,111 @@
+"""
+Move resume_full_text / work_history_text / tasks_summary out of an existing
+collection's payload into the compressed text store (TEXT_STORE_PATH)
+
+New uploads with TEXT_STORE_PATH set write the store directly; this is for
+collections built before. Deploy the API with the same TEXT_STORE_PATH.
+
+    python3 scripts/migrations/move_text_to_store.py --store ./data/applicant_text.db
+"""
+import sys
+import os
+import time
+import argparse
+from typing import Dict
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.load_env import load_env
+from core.qdrant_factory import get_qdrant_client, operation_timeout
+from core.collection_versions import resolve_alias, bump_data_version
+from core.text_store import TextStore, TEXT_FIELDS, split_payload
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+COLLECTION_NAME = "applicants_unified"
+
+
+def move_text(client, collection: str, store: TextStore, batch_size: int = 256) -> Dict[str, int]:
+    """
+    Copy each point's long text into the store, then delete those payload keys
+    (and set updated_at, so co-located read replicas sync the smaller payloads)
+
+    Returns:
+        {"points", "moved", "payload_bytes_before", "payload_bytes_after"}
+    """
+    import json
+    from qdrant_client.models import DeletePayload, DeletePayloadOperation, SetPayload, SetPayloadOperation
+
+    stats = {"points": 0, "moved": 0, "payload_bytes_before": 0, "payload_bytes_after": 0}
+    offset = None
+    while True:
+        records, offset = client.scroll(collection, limit=batch_size, offset=offset, with_payload=True, with_vectors=False)
+        texts = []
+        point_ids = []
+        for record in records:
+            small, applicant_texts = split_payload(record.payload or {})
+            stats["payload_bytes_before"] += len(json.dumps(record.payload or {}))
+            stats["payload_bytes_after"] += len(json.dumps(small))
+            if applicant_texts:
+                texts.append((record.payload.get("id", record.id), applicant_texts))
+                point_ids.append(record.id)
+
+        # Store first: a crash in between leaves the text in both places, never in neither
+        if texts:
+            store.put_many(texts)
+            # Same request bumps updated_at so read replicas pick the change up in their delta sync
+            client.batch_update_points(
+                collection_name=collection,
+                update_operations=[
+                    DeletePayloadOperation(delete_payload=DeletePayload(keys=list(TEXT_FIELDS), points=point_ids)),
+                    SetPayloadOperation(set_payload=SetPayload(payload={"updated_at": int(time.time())}, points=point_ids)),
+                ],
+                timeout=operation_timeout("upsert")
+            )
+        stats["points"] += len(records)
+        stats["moved"] += len(texts)
+        if offset is None:
+            if stats["moved"]:
+                bump_data_version(client, collection)
+            return stats
+
+
+def main():
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Move long payload text into the compressed text store")
+    parser.add_argument("--store", default=os.getenv("TEXT_STORE_PATH"), help="SQLite file (TEXT_STORE_PATH)")
+    parser.add_argument("--collection", default=COLLECTION_NAME, help="Collection or alias")
+    args = parser.parse_args()
+    if not args.store:
+        logger.error("❌ --store or TEXT_STORE_PATH required")
+        return False
+
+    client = get_qdrant_client()
+    collection = resolve_alias(client, args.collection) or args.collection
+    store = TextStore(args.store)
+    logger.info(f"\nMoving long text from '{collection}' to {args.store} ({store.codec})...")
+
+    stats = move_text(client, collection, store)
+    before, after = stats["payload_bytes_before"], stats["payload_bytes_after"]
+    logger.info(f"  ✓ {stats['moved']}/{stats['points']} applicants moved")
+    logger.info(f"  ✓ Payload JSON: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB "
+                f"({100 * (1 - after / before) if before else 0:.0f}% smaller)")
+    logger.info(f"  ✓ Text store: {os.path.getsize(args.store) / 1e6:.1f} MB on disk")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}", exc_info=True)
+        sys.exit(1)
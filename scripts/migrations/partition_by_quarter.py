@@ -0,0 +1,143 @@
+"""
+Split applicants_unified into quarterly partitions by date_applied and keep
+their storage tiered: the newest PARTITION_HOT_QUARTERS in RAM, older ones
+with on-disk full vectors and quantization (PARTITION_COLD_QUANTIZATION).
+Then set SEARCH_PARTITIONED=true.
+
+    python3 scripts/migrations/partition_by_quarter.py split     # from the live collection
+    python3 scripts/migrations/partition_by_quarter.py retier    # after a quarter rolls over
+"""
+import sys
+import os
+import argparse
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(__file__))
+
+from qdrant_client.models import PointStruct, VectorParamsDiff
+from core.load_env import load_env
+from core.qdrant_factory import get_qdrant_client, operation_timeout
+from core.collection_config import quantization_config, quantization_update
+from core.time_partitions import (
+    PartitionRouter, quarter_key, partition_name, hot_keys, cold_quantization, UNDATED
+)
+from core.collection_versions import bump_data_version
+from create_payload_indexes import create_payload_indexes
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+COLLECTION_NAME = "applicants_unified"
+FULL_VECTORS = ("resume", "skills", "tasks")
+
+
+def create_partition(client, template: str, name: str, cold: bool) -> None:
+    """New partition with the template collection's vectors; cold ones on disk + quantized"""
+    params = client.get_collection(template).config.params
+    vectors_config = {
+        vector_name: config.model_copy(update={"on_disk": True}) if cold and vector_name in FULL_VECTORS else config
+        for vector_name, config in params.vectors.items()
+    }
+    client.create_collection(
+        collection_name=name,
+        vectors_config=vectors_config,
+        sparse_vectors_config=params.sparse_vectors,
+        quantization_config=quantization_config(cold_quantization()) if cold else None,
+        timeout=operation_timeout("admin")
+    )
+    create_payload_indexes(client, name)
+    logger.info(f"  ✓ Created {name} ({'cold: on disk, ' + cold_quantization() if cold else 'hot: in RAM'})")
+
+
+def upsert_partitioned(client, points: List[PointStruct], template: str, base: str = COLLECTION_NAME) -> Dict[str, int]:
+    """
+    Route points to their quarter's partition by payload date_applied (creating
+    partitions as needed, from `template`'s config); returns points per partition
+    """
+    existing = PartitionRouter(base, refresh_seconds=0).partitions(client)
+    by_key = defaultdict(list)
+    for point in points:
+        by_key[quarter_key((point.payload or {}).get("date_applied"))].append(point)
+
+    hot = set(hot_keys(list(by_key) + list(existing)))
+    written = {}
+    for key, key_points in by_key.items():
+        name = partition_name(base, key)
+        if key not in existing:
+            # A new quarter can push an older one out of the hot window - run `retier` afterwards
+            create_partition(client, template, name, cold=key != UNDATED and key not in hot)
+            existing[key] = name
+        client.upsert(collection_name=name, points=key_points, timeout=operation_timeout("upsert"))
+        bump_data_version(client, name)
+        written[name] = len(key_points)
+    return written
+
+
+def split(client, source: str = COLLECTION_NAME, base: str = COLLECTION_NAME, batch_size: int = 256) -> Dict[str, int]:
+    """Copy every point of `source` (the alias of the live version) into its quarterly partition"""
+    logger.info(f"\nSplitting '{source}' into quarterly partitions...")
+    totals: Dict[str, int] = defaultdict(int)
+    offset = None
+    while True:
+        records, offset = client.scroll(source, limit=batch_size, offset=offset, with_vectors=True, with_payload=True)
+        points = [PointStruct(id=record.id, vector=record.vector, payload=record.payload) for record in records]
+        for name, count in upsert_partitioned(client, points, template=source, base=base).items():
+            totals[name] += count
+        if offset is None:
+            break
+    for name in sorted(totals):
+        logger.info(f"  {name}: {totals[name]} applicants")
+    return dict(totals)
+
+
+def retier(client, base: str = COLLECTION_NAME, hot_quarters: Optional[int] = None) -> Dict[str, str]:
+    """Move quarters that aged out of the hot window to on-disk + quantized storage (and back)"""
+    partitions = PartitionRouter(base, refresh_seconds=0).partitions(client)
+    hot = set(hot_keys(list(partitions), hot_quarters))
+    tiers = {}
+    for key, name in sorted(partitions.items()):
+        cold = key != UNDATED and key not in hot
+        client.update_collection(
+            collection_name=name,
+            vectors_config={vector_name: VectorParamsDiff(on_disk=cold) for vector_name in FULL_VECTORS},
+            # Hot partitions (and PARTITION_COLD_QUANTIZATION=none) explicitly disable quantization
+            quantization_config=quantization_update(cold_quantization() if cold else "none"),
+            timeout=operation_timeout("admin")
+        )
+        tiers[name] = "cold" if cold else "hot"
+        logger.info(f"  ✓ {name}: {tiers[name]}")
+    return tiers
+
+
+def main():
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Quarterly partitions of applicants_unified")
+    parser.add_argument("command", choices=["split", "retier"])
+    parser.add_argument("--source", default=COLLECTION_NAME, help="Collection (or alias) to split")
+    args = parser.parse_args()
+
+    client = get_qdrant_client()
+    if args.command == "split":
+        split(client, args.source)
+        logger.info("\n  Set SEARCH_PARTITIONED=true to route searches over the partitions")
+    else:
+        retier(client)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,76 @@
+"""
+Show, roll back or re-point the applicants_unified alias (blue/green versions)
+
+    python3 scripts/migrations/switch_collection_alias.py              # list versions
+    python3 scripts/migrations/switch_collection_alias.py --rollback   # previous version
+    python3 scripts/migrations/switch_collection_alias.py --to 3       # applicants_unified_v3
+"""
+import sys
+import os
+import argparse
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.load_env import load_env
+from core.qdrant_factory import get_qdrant_client
+from core.collection_versions import (
+    list_versions, resolve_alias, rollback_target, smoke_search, switch_alias, versioned_name
+)
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+COLLECTION_NAME = "applicants_unified"
+
+
+def main():
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Inspect or switch the applicants_unified alias")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--rollback", action="store_true", help="Point the alias at the previous version")
+    group.add_argument("--to", type=int, metavar="N", help="Point the alias at applicants_unified_vN")
+    args = parser.parse_args()
+
+    client = get_qdrant_client()
+    live = resolve_alias(client, COLLECTION_NAME)
+
+    logger.info(f"\nVersions of '{COLLECTION_NAME}':")
+    for version in list_versions(client, COLLECTION_NAME):
+        name = versioned_name(COLLECTION_NAME, version)
+        points = client.get_collection(name).points_count
+        logger.info(f"  {'→' if name == live else ' '} {name} ({points} points)")
+    if live is None:
+        logger.warning(f"  ⚠️  '{COLLECTION_NAME}' is not an alias yet (built before blue/green rebuilds)")
+
+    if args.rollback:
+        target = rollback_target(client, COLLECTION_NAME)
+        if target is None:
+            logger.error("❌ No older version to roll back to")
+            return False
+    elif args.to is not None:
+        target = versioned_name(COLLECTION_NAME, args.to)
+        if not client.collection_exists(target):
+            logger.error(f"❌ '{target}' does not exist")
+            return False
+    else:
+        return True
+
+    smoke_search(client, target)
+    switch_alias(client, COLLECTION_NAME, target)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,157 @@
+"""
+Train the local -> Gemini query projection used by embedding_mode="projected"
+Fits a ridge projection on corpus texts with stored Gemini embeddings
+(resume/skills/tasks), reports recall@k on held-out texts and, with
+--query-log, against the true Gemini vectors of logged queries.
+Then set QUERY_PROJECTION_PATH (and LOCAL_EMBED_MODEL to the same model).
+"""
+import sys
+import os
+import json
+import argparse
+from typing import Optional
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(__file__))
+
+from core.load_env import load_env
+from core.local_embedder import LocalEmbedder
+from core.query_projection import QueryProjection, recall_at_k
+from core.query_log import read_query_log, decode_embedding
+from create_unified_collection import has_valid_embeddings
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+DATA_FILE = "/mnt/c/Users/prita/Downloads/SuperLinked/data/processed/applicants_with_embeddings_clean.json"
+DEFAULT_OUTPUT = "data/query_projection.npy"
+
+# Text field -> stored Gemini embedding of that text
+TRAINING_FIELDS = {
+    "resume_full_text": "embedding_resume",
+    "skills_extracted": "embedding_skills",
+    "tasks_summary": "embedding_tasks",
+}
+
+
+def logged_query_pairs(path: str):
+    """(search intent, Gemini query vector) pairs from a query log with stored embeddings"""
+    texts, vectors = [], []
+    for record in read_query_log(path):
+        options = record.get("options") or {}
+        if not record.get("embedding_b64") or options.get("embedding_mode", "gemini") != "gemini":
+            continue
+        texts.append(record["parsed_query"]["search_intent"])
+        vectors.append(decode_embedding(record["embedding_b64"]))
+    return texts, np.array(vectors, dtype=np.float32)
+
+
+def train_query_projection(
+    data_file: str,
+    output: str,
+    embedder: LocalEmbedder,
+    alpha: float = 1.0,
+    holdout: float = 0.1,
+    ks=(10, 50),
+    query_log: Optional[str] = None,
+    seed: int = 42
+) -> dict:
+    """Fit, evaluate and save the projection; returns the evaluation report"""
+
+    logger.info("\n" + "=" * 80)
+    logger.info("TRAINING LOCAL -> GEMINI QUERY PROJECTION")
+    logger.info("=" * 80)
+
+    logger.info(f"\nLoading data from: {data_file}")
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = [applicant for applicant in json.load(f) if has_valid_embeddings(applicant)]
+    logger.info(f"  ✓ Loaded {len(data)} applicants with Gemini embeddings")
+
+    rng = np.random.default_rng(seed)
+    is_test = rng.random(len(data)) < holdout
+
+    logger.info(f"\nEmbedding training texts with {embedder.model_name}...")
+    local, gemini, field_of, test_of = [], [], [], []
+    for field, embedding_field in TRAINING_FIELDS.items():
+        rows = [i for i, applicant in enumerate(data) if applicant.get(field)]
+        local.extend(embedder.embed_batch([data[i][field] for i in rows]))
+        gemini.extend(data[i][embedding_field] for i in rows)
+        field_of.extend([field] * len(rows))
+        test_of.extend(is_test[rows])
+    local = np.array(local, dtype=np.float32)
+    gemini = np.array(gemini, dtype=np.float32)
+    field_of = np.array(field_of)
+    test_of = np.array(test_of, dtype=bool)
+
+    projection = QueryProjection.fit(local[~test_of], gemini[~test_of], alpha=alpha)
+
+    # Held-out texts used as queries against the resume vectors (what search weights most)
+    corpus = np.array([applicant["embedding_resume"] for applicant in data], dtype=np.float32)
+    report = {"model": embedder.model_name, "alpha": alpha, "pairs": int((~test_of).sum()), "recall": {}}
+    for field in TRAINING_FIELDS:
+        rows = test_of & (field_of == field)
+        if not rows.any():
+            continue
+        projected = projection.project(local[rows])
+        report["recall"][f"heldout_{field}"] = {
+            f"@{k}": round(recall_at_k(gemini[rows], projected, corpus, k), 4) for k in ks
+        }
+
+    if query_log and os.path.exists(query_log):
+        texts, true_vectors = logged_query_pairs(query_log)
+        if texts:
+            projected = projection.project(np.array(embedder.embed_batch(texts), dtype=np.float32))
+            report["recall"]["logged_queries"] = {
+                f"@{k}": round(recall_at_k(true_vectors, projected, corpus, k), 4) for k in ks
+            }
+            report["logged_queries"] = len(texts)
+        else:
+            logger.warning(f"  ⚠️  No Gemini query embeddings in {query_log} (QUERY_LOG_EMBEDDINGS=hash?)")
+
+    projection.save(output)
+    with open(f"{os.path.splitext(output)[0]}.report.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    logger.info(f"\n  ✓ Wrote {output} ({os.path.getsize(output) / (1024 * 1024):.1f} MB)")
+    for name, recalls in report["recall"].items():
+        logger.info(f"    {name:<30} " + "  ".join(f"recall{k}={v:.3f}" for k, v in recalls.items()))
+    logger.info(f"  Set QUERY_PROJECTION_PATH={output} and LOCAL_EMBED_MODEL={embedder.model_name}")
+
+    return report
+
+
+def main():
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Train the local -> Gemini query projection")
+    parser.add_argument("--data-file", default=DATA_FILE, help="Applicants JSON with stored Gemini embeddings")
+    parser.add_argument("--output", default=os.getenv("QUERY_PROJECTION_PATH", DEFAULT_OUTPUT))
+    parser.add_argument("--model", default=None, help="Local encoder (defaults to LOCAL_EMBED_MODEL)")
+    parser.add_argument("--alpha", type=float, default=1.0, help="Ridge L2 penalty")
+    parser.add_argument("--holdout", type=float, default=0.1, help="Share of applicants held out for evaluation")
+    parser.add_argument("--k", type=int, nargs="+", default=[10, 50], help="recall@k cutoffs")
+    parser.add_argument("--query-log", default=os.getenv("QUERY_LOG_PATH"), help="Evaluate on logged Gemini query vectors")
+    args = parser.parse_args()
+
+    train_query_projection(
+        args.data_file, args.output, LocalEmbedder(model_name=args.model),
+        alpha=args.alpha, holdout=args.holdout, ks=args.k, query_log=args.query_log
+    )
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}", exc_info=True)
+        sys.exit(1)
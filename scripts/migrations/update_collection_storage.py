@@ -0,0 +1,72 @@
+"""
+Apply quantization / HNSW / on-disk settings to the live applicants_unified
+collection (the version behind the alias) in place (Qdrant rebuilds the indexes in the background; no re-upload)
+
+Uses the same settings as create_unified_collection.py:
+QDRANT_QUANTIZATION, QDRANT_QUANTIZATION_ALWAYS_RAM, QDRANT_ON_DISK_VECTORS,
+QDRANT_HNSW_M, QDRANT_HNSW_EF_CONSTRUCT
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from qdrant_client.models import VectorParamsDiff
+from core.load_env import load_env
+from core.qdrant_factory import get_qdrant_client, operation_timeout
+from core.collection_config import collection_storage_kwargs, quantization_update, vectors_on_disk
+from core.collection_versions import resolve_alias, bump_data_version
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+COLLECTION_NAME = "applicants_unified"
+FULL_VECTORS = ("resume", "skills", "tasks")
+
+
+def main():
+    load_env()
+
+    logger.info("\n" + "=" * 80)
+    logger.info(f"UPDATING STORAGE SETTINGS OF '{COLLECTION_NAME}'")
+    logger.info("=" * 80)
+
+    client = get_qdrant_client()
+    collection_name = resolve_alias(client, COLLECTION_NAME) or COLLECTION_NAME
+    logger.info(f"  - collection: {collection_name}")
+    storage = collection_storage_kwargs()
+    on_disk = vectors_on_disk("quantization_config" in storage)
+    # QDRANT_QUANTIZATION=none turns existing quantization off (omitting it would keep it)
+    storage["quantization_config"] = quantization_update()
+
+    for name, value in storage.items():
+        logger.info(f"  - {name}: {value}")
+    logger.info(f"  - original {', '.join(FULL_VECTORS)} vectors on disk: {on_disk}")
+
+    client.update_collection(
+        collection_name=collection_name,
+        vectors_config={name: VectorParamsDiff(on_disk=on_disk) for name in FULL_VECTORS},
+        timeout=operation_timeout("admin"),
+        **storage
+    )
+    # Quantization/HNSW changes can reorder results: drop cached ones
+    bump_data_version(client, collection_name)
+
+    info = client.get_collection(collection_name)
+    logger.info(f"\n  ✓ Updated (status: {info.status}; optimizers rebuild segments in the background)")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        logger.info("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Error: {e}", exc_info=True)
+        sys.exit(1)
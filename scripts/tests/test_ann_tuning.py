@@ -0,0 +1,56 @@
+"""
+ANN Tuning Harness Tests
+Exact NumPy ground truth, collection cloning and the sweep report (local stand-in)
+"""
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from benchmarks.ann_tuning import (
+    load_stored_vectors, ground_truth, exact_top_k, sweep, pareto_front, format_table
+)
+from benchmarks.recall_harness import sample_point_queries
+from benchmarks.stand_ins import build_synthetic_corpus, create_local_qdrant
+
+
+def test_ground_truth_matches_qdrant_exact_search():
+    from qdrant_client.models import SearchParams
+
+    client = create_local_qdrant(build_synthetic_corpus(150, dim=32, seed=5))
+    ids, matrices = load_stored_vectors(client, "applicants_unified")
+    assert len(ids) == 150 and matrices["skills"].shape == (150, 32)
+
+    query = sample_point_queries(client, "applicants_unified", "tasks", 1)[0]
+    truth = ground_truth(ids, matrices, query, 10)
+    points = client.query_points(
+        "applicants_unified", query=query, using="tasks", limit=10, search_params=SearchParams(exact=True)
+    ).points
+    assert truth["tasks"] == [point.id for point in points]
+    assert list(exact_top_k(np.array([0.1, 0.9, 0.5]), 2)) == [1, 2]
+
+
+def test_sweep_reports_recall_loss_and_pareto_front():
+    client = create_local_qdrant(build_synthetic_corpus(300, dim=32, seed=6))
+    queries = sample_point_queries(client, "applicants_unified", "resume", 5)
+    grid = [
+        {"name": "exact", "search": {"exact": True}},
+        {"name": "scalar", "collection": {"quantization": "scalar"}, "search": {"oversampling": 2.0, "rescore": True}},
+        {"name": "trunc8", "collection": {"truncated_dims": [8]},
+         "engine": {"truncated_dim": 8, "rescore_limit": 20}, "search": {"retrieval": "truncated"}},
+    ]
+
+    report = sweep(client, queries, grid, ks=(10, 20))
+    rows = {row["name"]: row for row in report["configs"]}
+    assert rows["exact"]["vector_recall@10"] == 1.0 and rows["exact"]["overlap@10"] == 1.0
+    assert rows["scalar"]["vector_recall@10"] == 1.0  # in-process Qdrant ignores quantization
+    assert rows["trunc8"]["vector_recall@20"] < 1.0
+    assert [c.name for c in client.get_collections().collections] == ["applicants_unified"]  # clones dropped
+    assert any(row["pareto"] for row in report["configs"])
+    assert "trunc8" in format_table(report)
+
+    assert pareto_front(
+        [{"r": 0.9, "p50_ms": 5.0}, {"r": 0.8, "p50_ms": 6.0}, {"r": 1.0, "p50_ms": 9.0}], "r"
+    ) == [True, False, True]
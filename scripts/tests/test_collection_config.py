@@ -0,0 +1,74 @@
+"""
+Quantization, HNSW and Search Parameter Tests
+Collection storage settings and per-request search params (local stand-in)
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.collection_config import quantization_config, hnsw_config, collection_storage_kwargs, search_params
+from core.intelligent_search import IntelligentSearchEngine
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+
+class RecordingClient:
+    """Passes calls through to a client, keeping query_points kwargs"""
+
+    def __init__(self, target):
+        self._target = target
+        self.queries = []
+
+    def query_points(self, **kwargs):
+        self.queries.append(kwargs)
+        return self._target.query_points(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def test_storage_settings_from_env(monkeypatch):
+    from qdrant_client.models import ScalarQuantization, BinaryQuantization
+
+    assert quantization_config("none") is None
+    assert isinstance(quantization_config("scalar"), ScalarQuantization)
+    assert quantization_config("binary").binary.always_ram is True
+    try:
+        quantization_config("pq8")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+    assert hnsw_config() is None
+    monkeypatch.setenv("QDRANT_QUANTIZATION", "binary")
+    monkeypatch.setenv("QDRANT_HNSW_M", "32")
+    kwargs = collection_storage_kwargs()
+    assert isinstance(kwargs["quantization_config"], BinaryQuantization)
+    assert kwargs["hnsw_config"].m == 32 and kwargs["hnsw_config"].ef_construct is None
+
+
+def test_search_params_reach_qdrant(monkeypatch):
+    assert search_params() is None
+
+    monkeypatch.setenv("SEARCH_HNSW_EF", "64")
+    client = RecordingClient(create_local_qdrant(build_synthetic_corpus(100, dim=16, seed=2)))
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=16))
+    parsed = rule_parse("Python developer with Django")
+
+    trace = {}
+    engine.search(parsed, limit=5, trace=trace)
+    assert trace["search_params"] == {"hnsw_ef": 64}
+    assert all(query["search_params"].hnsw_ef == 64 for query in client.queries)
+
+    client.queries.clear()
+    engine.search(parsed, limit=5, oversampling=3.0, rescore=True, hnsw_ef=200, trace=trace)
+    params = client.queries[0]["search_params"]
+    assert params.hnsw_ef == 200
+    assert params.quantization.oversampling == 3.0 and params.quantization.rescore is True
+
+    client.queries.clear()
+    engine.search(parsed, limit=5, hybrid=True, rescore=False)
+    dense_prefetches = [p for p in client.queries[0]["prefetch"] if p.using in engine.WEIGHTS]
+    assert len(dense_prefetches) == 3
+    assert all(p.params.quantization.rescore is False for p in dense_prefetches)
@@ -0,0 +1,80 @@
+"""
+Blue/Green Collection Version Tests
+Alias switching, smoke search, rollback and pruning (local stand-in)
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.collection_versions import (
+    list_versions, next_version_name, resolve_alias, smoke_search, switch_alias,
+    rollback_target, prune_versions, wait_until_green
+)
+from core.intelligent_search import IntelligentSearchEngine
+from benchmarks.ann_tuning import clone_collection
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+ALIAS = "applicants_unified"
+
+
+def test_rebuild_switches_alias_without_a_gap():
+    client = create_local_qdrant(build_synthetic_corpus(120, dim=16, seed=3), collection_name=f"{ALIAS}_v1")
+    assert next_version_name(client, ALIAS) == f"{ALIAS}_v2"
+    switch_alias(client, ALIAS, f"{ALIAS}_v1")
+
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=16))
+    engine.ALIAS_CHECK_SECONDS = 0.0
+    parsed = rule_parse("Python developer with Django")
+    assert engine.search(parsed, limit=5)
+    assert not engine.has_dense_vectors([engine.PROFILE_VECTOR])
+
+    # v2 is built next to the live version; searches keep hitting v1 meanwhile
+    clone_collection(client, f"{ALIAS}_v1", f"{ALIAS}_v2", profile=True)
+    assert resolve_alias(client, ALIAS) == f"{ALIAS}_v1"
+    wait_until_green(client, f"{ALIAS}_v2")
+    assert smoke_search(client, f"{ALIAS}_v2", min_points=120) == 120
+
+    assert switch_alias(client, ALIAS, f"{ALIAS}_v2") == f"{ALIAS}_v1"
+    trace = {}
+    assert engine.search(parsed, limit=5, retrieval="profile", trace=trace)
+    assert trace["retrieval"] == "profile"  # new version's vector config picked up
+
+    assert rollback_target(client, ALIAS) == f"{ALIAS}_v1"
+    assert list_versions(client, ALIAS) == [1, 2]
+    assert prune_versions(client, ALIAS, keep=0) == [f"{ALIAS}_v1"]
+    assert list_versions(client, ALIAS) == [2] and rollback_target(client, ALIAS) is None
+
+
+def test_plain_collection_is_replaced_by_the_alias():
+    client = create_local_qdrant(build_synthetic_corpus(40, dim=16, seed=4))
+    clone_collection(client, ALIAS, f"{ALIAS}_v1")
+    assert resolve_alias(client, ALIAS) is None
+
+    switch_alias(client, ALIAS, f"{ALIAS}_v1")
+    assert resolve_alias(client, ALIAS) == f"{ALIAS}_v1"
+    assert [c.name for c in client.get_collections().collections] == [f"{ALIAS}_v1"]
+
+    try:
+        smoke_search(client, f"{ALIAS}_v1", min_points=41)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the smoke search to fail")
+
+
+def test_failed_newest_build_never_displaces_the_rollback_target():
+    from migrations.create_unified_collection import delete_failed_build
+
+    client = create_local_qdrant(build_synthetic_corpus(40, dim=16, seed=5), collection_name=f"{ALIAS}_v1")
+    clone_collection(client, f"{ALIAS}_v1", f"{ALIAS}_v2")
+    switch_alias(client, ALIAS, f"{ALIAS}_v2")
+    # v3 was created, then the build failed before the alias switch
+    clone_collection(client, f"{ALIAS}_v1", f"{ALIAS}_v3")
+
+    assert prune_versions(client, ALIAS, keep=1) == []
+    assert rollback_target(client, ALIAS) == f"{ALIAS}_v1"
+    assert list_versions(client, ALIAS) == [1, 2, 3]
+
+    delete_failed_build([client, client], f"{ALIAS}_v3")
+    assert list_versions(client, ALIAS) == [1, 2] and resolve_alias(client, ALIAS) == f"{ALIAS}_v2"
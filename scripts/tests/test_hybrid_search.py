@@ -0,0 +1,63 @@
+"""
+Hybrid Sparse + Dense Search Tests
+BM25 sparse vectors fused with dense vectors in one Qdrant query (local stand-in)
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.intelligent_search import IntelligentSearchEngine
+from core.sparse_encoder import SparseEncoder, term_index
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+QUERY = "AutoCAD Revit SketchUp"
+SKILLS = ["autocad", "revit", "sketchup"]
+
+
+def _skill_hits(candidate):
+    skills = candidate["payload"]["skills_extracted"].lower()
+    return sum(skill in skills for skill in SKILLS)
+
+
+def test_sparse_encoding_aligns_query_and_document():
+    encoder = SparseEncoder()
+    indices, values = encoder.encode_document("AutoCAD, Revit, AutoCAD", "skills_sparse")
+    assert indices == sorted([term_index("autocad"), term_index("revit")])
+    weights = dict(zip(indices, values))
+    assert weights[term_index("autocad")] > weights[term_index("revit")]  # tf saturates but still grows
+
+    query_indices, query_values = SparseEncoder.encode_query(["autocad", "Revit"])
+    assert query_indices == indices and query_values == [1.0, 1.0]
+
+
+def test_hybrid_ranks_keyword_matches_first():
+    client = create_local_qdrant(build_synthetic_corpus(300, dim=32, seed=3))
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=32))
+    parsed = rule_parse(QUERY)
+
+    trace = {}
+    hybrid = engine.search(parsed, limit=5, hybrid=True, trace=trace)
+    assert trace["hybrid"] is True
+    assert len(hybrid) == 5
+    assert [_skill_hits(candidate) for candidate in hybrid[:2]] == [3, 3]
+    assert [c["final_score"] for c in hybrid] == sorted((c["final_score"] for c in hybrid), reverse=True)
+
+    dense = engine.search(parsed, limit=5, enable_reranking=False)
+    assert sum(map(_skill_hits, hybrid)) > sum(map(_skill_hits, dense))
+
+
+def test_hybrid_falls_back_without_sparse_vectors():
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import Distance, VectorParams
+
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        IntelligentSearchEngine.COLLECTION_NAME,
+        vectors_config={name: VectorParams(size=8, distance=Distance.COSINE) for name in ("resume", "skills", "tasks")}
+    )
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=8))
+
+    trace = {}
+    assert engine.search(rule_parse(QUERY), limit=5, hybrid=True, trace=trace) == []
+    assert trace["hybrid"] is False
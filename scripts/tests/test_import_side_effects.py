@@ -0,0 +1,41 @@
+"""
+Import Side-Effect Tests
+Modules must import without credentials, network, log files or heavy SDKs
+"""
+import os
+import sys
+import json
+import subprocess
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, json, time
+sys.path.insert(0, {scripts_dir!r})
+started = time.perf_counter()
+import api.search_api
+import core.gemini_embedder_prod
+import core.batch_preprocess_gpt_prod
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "import_s": elapsed,
+    "loaded": [m for m in ("google.genai", "openai", "qdrant_client") if m in sys.modules],
+}}))
+"""
+
+
+def test_imports_have_no_side_effects(tmp_path):
+    env = {key: value for key, value in os.environ.items()
+           if not key.endswith("_API_KEY") and not key.startswith("QDRANT_") and key != "QUERY_LOG_PATH"}
+
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE.format(scripts_dir=SCRIPTS_DIR)],
+        cwd=str(tmp_path), env=env, capture_output=True, text=True, timeout=60
+    )
+    assert completed.returncode == 0, completed.stderr
+
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+    print(f"cold import: {report['import_s'] * 1000:.0f}ms")
+
+    assert report["loaded"] == []
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,153 @@
+"""
+Job Description Match Tests
+Section splitting, JD skills/filters, one embedding call + one Qdrant batch (local stand-ins)
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.jd_parser import split_sections, extract_skills, parse_job_description, MAX_SECTION_CHARS
+from core.intelligent_search import IntelligentSearchEngine
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant
+
+JOB_DESCRIPTION = """Senior Python Developer - Manila
+
+Acme Corp is hiring a senior backend developer to build our payments platform.
+
+About Us
+Acme is a fast-growing fintech founded in 2010 with over 20 years of combined banking experience.
+
+Responsibilities:
+- Design and build REST APIs for the payments platform
+- Own services end to end, from design to on-call
+- Mentor junior engineers
+
+Requirements:
+- 5+ years of professional software development
+- Strong experience with Python, Django and SQL
+- Docker
+- Familiarity with FastAPI
+
+Nice to have:
+- Kubernetes
+
+Benefits
+- HMO from day one
+- 20 days of paid leave
+"""
+
+
+class CountingClient:
+    """Passes calls through to a Qdrant client, counting the search calls"""
+
+    def __init__(self, target):
+        self._target = target
+        self.calls = []
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if name not in ("query_points", "query_batch_points"):
+            return attribute
+
+        def call(**kwargs):
+            self.calls.append((name, len(kwargs.get("requests", [None]))))
+            return attribute(**kwargs)
+
+        return call
+
+
+def counting_gemini(dim: int = 16) -> FakeGeminiClient:
+    gemini = FakeGeminiClient(dim=dim)
+    embed = gemini.models.embed_content
+    gemini.embed_calls = []
+
+    def embed_content(model, contents, config=None):
+        gemini.embed_calls.append(len(contents) if isinstance(contents, list) else 1)
+        return embed(model=model, contents=contents, config=config)
+
+    gemini.models.embed_content = embed_content
+    return gemini
+
+
+def test_sections_skills_and_filters():
+    parsed = parse_job_description(JOB_DESCRIPTION)
+    titles = [section["title"] for section in parsed["sections"]]
+    assert titles == ["Overview", "Responsibilities", "Requirements"]  # boilerplate dropped
+
+    filters = parsed["filters"]
+    assert filters["required_skills"] == ["Python", "Django", "SQL", "Docker", "FastAPI"]  # not "nice to have"
+    assert filters["min_experience"] == 5.0 and filters["location"] == "Manila, Philippines"
+    assert filters["education_level"] is None and filters["max_experience"] is None
+
+    assert extract_skills("Tech stack: React, TypeScript and CSS") == ["React", "TypeScript", "CSS"]
+
+
+def test_long_and_unstructured_descriptions_are_bounded():
+    long_jd = "Requirements:\n" + "\n".join(f"- Requirement number {i} for the role" for i in range(400))
+    sections = split_sections(long_jd)
+    assert len(sections) > 1 and all(len(s["text"]) <= MAX_SECTION_CHARS for s in sections)
+    assert sum(len(s["text"]) for s in sections) > 0.95 * len(long_jd) - len("Requirements:")  # nothing truncated
+
+    many = "\n".join(f"Section {i}:\n{'Some details about the work. ' * 3}" for i in range(20))
+    many += "\nRequirements:\n- Python and Django for backend services"
+    sections = split_sections(many, max_sections=5)
+    assert len(sections) == 5 and sections[-1]["title"] == "Requirements"
+
+    plain = "We need an accountant who knows QuickBooks and payroll for a growing team."
+    assert split_sections(plain) == [{"title": "Overview", "text": plain}]
+
+
+def test_sections_embed_once_and_search_in_one_batch():
+    client = CountingClient(create_local_qdrant(build_synthetic_corpus(200, dim=16, seed=30)))
+    gemini = counting_gemini()
+    engine = IntelligentSearchEngine(client=client, gemini_client=gemini)
+    parsed = parse_job_description(JOB_DESCRIPTION)
+    filters = {**parsed["filters"], "location": None, "min_experience": None}
+    sections = [section["text"] for section in parsed["sections"]]
+
+    trace = {}
+    results = engine.search_sections(sections, filters, limit=10, trace=trace)
+    assert gemini.embed_calls == [3]
+    assert client.calls == [("query_batch_points", 3)]
+    assert len(results) == 10 and trace["sections"] == 3
+    assert sum("Python Developer" in c["payload"]["job_title"] for c in results) >= 8
+
+    for candidate in results:
+        scores = list(candidate["vector_scores"].values())
+        expected = 0.5 * max(scores) + 0.5 * sum(scores) / 3
+        assert abs(candidate["semantic_score"] - expected) < 1e-9
+        assert candidate["final_score"] == candidate["semantic_score"] * 0.7 + candidate["skills_match_score"] * 0.3
+    assert [c["final_score"] for c in results] == sorted((c["final_score"] for c in results), reverse=True)
+
+    # Section embeddings are cached like query embeddings
+    engine.search_sections(sections, filters, limit=10)
+    assert gemini.embed_calls == [3]
+
+    try:
+        engine.search_sections(sections, filters, max_weight=1.5)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for max_weight > 1")
+
+
+def test_api_match_jd():
+    from fastapi.testclient import TestClient
+    from benchmarks.load_test import install_stand_ins
+    from api import search_api
+
+    install_stand_ins(corpus_size=200, dim=16)
+    client = TestClient(search_api.app)
+
+    body = client.post("/match/jd", json={
+        "job_description": JOB_DESCRIPTION, "limit": 5, "filters": {"min_experience": 1.0}
+    }).json()
+    assert body["sections"] == ["Overview", "Responsibilities", "Requirements"]
+    assert body["parsed_filters"]["min_experience"] == 1.0  # request filters override the JD's
+    assert body["parsed_filters"]["required_skills"][0] == "Python"
+    assert 0 < body["total_results"] <= 5
+    assert all(r["candidate"]["experience_years"] >= 1.0 for r in body["results"])
+    assert set(body["results"][0]["scores"]["vector_breakdown"]) <= {"section_1", "section_2", "section_3"}
+
+    assert client.post("/match/jd", json={"job_description": "x" * 20001}).status_code == 422
@@ -0,0 +1,93 @@
+"""
+Lexical Degraded Mode Tests
+Local BM25 index answering searches when Gemini embeddings fail (no network)
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.intelligent_search import IntelligentSearchEngine
+from core.lexical_index import LexicalIndex
+from benchmarks.stand_ins import (
+    FakeGeminiClient, build_payload, build_synthetic_corpus, create_local_qdrant, rule_parse
+)
+
+FILTER_CASES = [
+    {"min_experience": 5},
+    {"min_experience": 2, "max_experience": 8, "location": "Manila, Philippines"},
+    {"education_level": "Bachelor's Degree"},
+    {"desired_job_titles": ["Civil Engineer", "React Developer"]},
+    {"target_companies": ["Accenture"]},
+]
+
+
+def _index_and_client(records):
+    index = LexicalIndex.build((i, build_payload(applicant)) for i, applicant in enumerate(records))
+    return index, create_local_qdrant(records)
+
+
+def test_filters_match_qdrant(tmp_path):
+    records = build_synthetic_corpus(300, dim=8, seed=5)
+    index, client = _index_and_client(records)
+    index.save(str(tmp_path / "lexical"))
+    index = LexicalIndex.load(str(tmp_path / "lexical"))
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=8))
+
+    min_date = sorted(r["date_applied"] for r in records)[150]
+    for filters in FILTER_CASES + [{"min_date_applied": min_date}]:
+        points, _ = client.scroll(
+            engine.COLLECTION_NAME, scroll_filter=engine._build_filter(filters), limit=1000, with_payload=False
+        )
+        expected = {point.id for point in points}
+        assert expected, filters
+        assert set(index.point_ids[i] for i in index.filter_mask(filters).nonzero()[0]) == expected, filters
+
+
+def test_search_degrades_to_lexical_when_embeddings_fail():
+    records = build_synthetic_corpus(300, dim=8, seed=5)
+    index, client = _index_and_client(records)
+    engine = IntelligentSearchEngine(
+        client=client, gemini_client=FakeGeminiClient(dim=8, error_rate=1.0), lexical_index=index
+    )
+    parsed = rule_parse("AutoCAD Revit drafter, 3+ years")
+
+    trace = {}
+    started = time.perf_counter()
+    results = engine.search(parsed, limit=5, trace=trace)
+    assert (time.perf_counter() - started) * 1000 < 250
+    assert trace["degraded"] is True and trace["embedding_source"] == "none"
+    assert len(results) == 5
+    for candidate in results:
+        assert candidate["payload"]["total_years_experience"] >= 3
+        assert "autocad" in candidate["payload"]["skills_extracted"].lower()
+
+    # Without an index, embedding failures still surface
+    strict = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=8, error_rate=1.0))
+    try:
+        strict.search(parsed, limit=5)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the embedding failure to propagate")
+
+
+def test_api_reports_degraded_results():
+    from fastapi.testclient import TestClient
+    from benchmarks.load_test import install_stand_ins
+    from api import search_api
+
+    install_stand_ins(corpus_size=200, dim=16, gemini_error_rate=1.0)
+    engine = search_api.get_engine()
+    engine.lexical_index = LexicalIndex.build(
+        (i, build_payload(applicant)) for i, applicant in enumerate(build_synthetic_corpus(200, 16, 42))
+    )
+
+    client = TestClient(search_api.app)
+    response = client.post("/search", json={"query": "Python developer with Django", "limit": 5})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["degraded"] is True
+    assert "lexical" in body["warning"]
+    assert body["total_results"] > 0
@@ -0,0 +1,82 @@
+"""
+Load-Test Harness Tests
+Offline checks for latency specs, statistics and a short closed-loop run
+"""
+import sys
+import os
+import asyncio
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+from benchmarks.stand_ins import LatencyModel, build_synthetic_corpus, text_embedding
+from benchmarks.load_test import percentile, summarize, find_saturation, run_closed_loop, install_stand_ins
+
+
+def test_latency_spec_parsing():
+    assert LatencyModel.parse("0").sample_ms() == 0.0
+    assert LatencyModel.parse("const:25").sample_ms() == 25.0
+
+    uniform = LatencyModel.parse("uniform:10,20", seed=1)
+    assert all(10.0 <= uniform.sample_ms() <= 20.0 for _ in range(100))
+
+    assert LatencyModel.parse("lognormal:300,0.3", seed=1).sample_ms() > 0
+
+    with pytest.raises(ValueError):
+        LatencyModel.parse("gamma:1,2")
+    with pytest.raises(ValueError):
+        LatencyModel.parse("uniform:10")
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([], 95) == 0.0
+
+
+def test_summarize_and_saturation():
+    samples = [{"name": "POST /search", "latency_ms": 100.0, "ok": True, "status": 200, "error": None}] * 9
+    samples.append({"name": "POST /search", "latency_ms": 5.0, "ok": False, "status": 500, "error": None})
+
+    report = summarize(samples, elapsed=2.0)
+    search = report["endpoints"]["POST /search"]
+    assert search["requests"] == 10
+    assert search["error_rate"] == 0.1
+    assert search["throughput_rps"] == 4.5
+    assert search["error_kinds"] == {"HTTP 500": 1}
+
+    fast = {"overall": {"p95_ms": 200.0, "error_rate": 0.0, "throughput_rps": 5.0}, "load": {"concurrency": 2}}
+    slow = {"overall": {"p95_ms": 900.0, "error_rate": 0.0, "throughput_rps": 6.0}, "load": {"concurrency": 8}}
+    assert find_saturation([fast, slow], slo_ms=500)["saturation_rps"] == 5.0
+    assert find_saturation([fast, slow], slo_ms=1000)["step"] == {"concurrency": 8}
+
+
+def test_synthetic_queries_hit_their_topic():
+    corpus = build_synthetic_corpus(count=50, dim=64, seed=3)
+    query = text_embedding("civil engineer with AutoCAD", dim=64)
+
+    def score(record):
+        return sum(a * b for a, b in zip(query, record["embedding_resume"]))
+
+    best = max(corpus, key=score)
+    assert "Civil Engineer" in best["job_title"]
+
+
+def test_closed_loop_against_stand_in_api():
+    import httpx
+
+    app = install_stand_ins(corpus_size=200, dim=64)
+    mix = [{"name": "POST /search", "method": "POST", "path": "/search", "weight": 1,
+            "bodies": [{"query": "Python developer with Django", "limit": 5}]}]
+
+    async def drive():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await run_closed_loop(client, mix, concurrency=2, duration=0.5)
+
+    report = asyncio.run(drive())
+    assert report["overall"]["requests"] > 0
+    assert report["overall"]["errors"] == 0
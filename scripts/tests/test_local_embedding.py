@@ -0,0 +1,54 @@
+"""
+Local Embedding Mode Tests
+On-box query embeddings searched against the *_local shadow vectors (no Gemini call)
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.intelligent_search import IntelligentSearchEngine
+from core.local_embedder import LocalEmbedder
+from benchmarks.stand_ins import (
+    FakeGeminiClient, FakeSentenceModel, build_synthetic_corpus, create_local_qdrant, rule_parse
+)
+
+
+def _engine(gemini_error_rate=0.0, **kwargs):
+    embedder = LocalEmbedder(model=FakeSentenceModel(dim=64))
+    client = create_local_qdrant(build_synthetic_corpus(200, dim=16, seed=9), local_embedder=embedder)
+    gemini = FakeGeminiClient(dim=16, error_rate=gemini_error_rate)
+    return IntelligentSearchEngine(client=client, gemini_client=gemini, local_embedder=embedder, **kwargs)
+
+
+def test_local_mode_searches_shadow_vectors_without_gemini():
+    engine = _engine(gemini_error_rate=1.0)
+    parsed = rule_parse("Python developer with Django and FastAPI")
+
+    trace = {}
+    results = engine.search(parsed, limit=5, embedding_mode="local", trace=trace)
+    assert trace["embedding_source"] == "local" and trace["embedding_mode"] == "local"
+    assert len(trace["query_vector"]) == 64
+    assert len(results) == 5
+    assert all("python" in c["payload"]["skills_extracted"].lower() for c in results)
+
+    hybrid = engine.search(parsed, limit=5, embedding_mode="local", hybrid=True, trace=trace)
+    assert trace["hybrid"] is True and len(hybrid) == 5
+
+
+def test_local_mode_falls_back_to_gemini_until_ready():
+    engine = _engine(embedding_mode="local")
+    engine.local_embedder = LocalEmbedder(model_name="not-loaded")
+    trace = {}
+    engine.search(rule_parse("Graphic designer with Figma"), limit=3, trace=trace)
+    assert trace["embedding_source"] == "gemini" and trace["embedding_mode"] == "gemini"
+    assert len(trace["query_vector"]) == 16
+
+
+def test_unknown_mode_rejected():
+    try:
+        _engine(embedding_mode="openai")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
@@ -0,0 +1,70 @@
+"""
+Match Explainer Tests
+Batch explanations match the per-candidate output; scores-only skips text
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.match_explainer import MatchExplainer
+from benchmarks.stand_ins import build_synthetic_corpus, build_payload
+
+PARSED_QUERY = {
+    "search_intent": "senior python developer",
+    "filters": {
+        "min_experience": 3.0,
+        "max_experience": 10.0,
+        "location": "Manila",
+        "education_level": "Bachelor's Degree",
+        "required_skills": ["Python", "Django", "AutoCAD"],
+        "seniority_keywords": ["Senior", "Lead"],
+    },
+}
+
+
+def _candidates(count=100):
+    candidates = []
+    for i, applicant in enumerate(build_synthetic_corpus(count, dim=8, seed=7)):
+        semantic = 0.4 + (i % 5) * 0.1
+        candidates.append({
+            "id": i,
+            "payload": build_payload(applicant),
+            "semantic_score": semantic,
+            "skills_match_score": 0.5,
+            "final_score": semantic * 0.7 + 0.15,
+            "vector_scores": {"resume": semantic, "skills": 0.5},
+        })
+    return candidates
+
+
+def test_batch_matches_single_explanations():
+    explainer = MatchExplainer()
+    candidates = _candidates()
+
+    batch = explainer.explain_batch(candidates, PARSED_QUERY)
+    assert batch == [explainer.explain(candidate, PARSED_QUERY) for candidate in candidates]
+    assert any(reason.startswith("✓ Has required skills") for result in batch for reason in result["match_reasons"])
+
+
+def test_scores_only_skips_text():
+    explainer = MatchExplainer()
+    candidates = _candidates(10)
+
+    full = explainer.explain_batch(candidates, PARSED_QUERY)
+    lean = explainer.explain_batch(candidates, PARSED_QUERY, scores_only=True)
+
+    for f, l in zip(full, lean):
+        assert l["candidate"] == f["candidate"]
+        assert l["scores"] == f["scores"]
+        assert l["match_reasons"] == [] and l["resume_snippet"] == ""
+
+
+def test_explain_batch_limit_100_is_cheap():
+    explainer = MatchExplainer()
+    candidates = _candidates(100)
+
+    started = time.perf_counter()
+    explainer.explain_batch(candidates, PARSED_QUERY)
+    assert (time.perf_counter() - started) * 1000 < 50
@@ -0,0 +1,99 @@
+"""
+Passage Index Tests
+Passage splitting, persistence and query-aware snippet selection
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.passage_index import PassageIndex, split_passages, tokenize
+from core.match_explainer import MatchExplainer
+
+RESUME = (
+    "Maria Santos\n123 Rizal Street, Quezon City\nmaria@example.com\n\n"
+    "Summary: Structural engineer focused on high-rise projects. "
+    "Prepared shop drawings in AutoCAD and Revit for 40-storey towers. "
+    "Coordinated site inspections with contractors.\n"
+    "Earlier: taught mathematics at a public high school for two years."
+)
+
+
+def test_split_passages_covers_text_with_offsets():
+    passages = split_passages(RESUME, passage_chars=80)
+    assert len(passages) > 2
+    assert all(0 <= start < end <= len(RESUME) for start, end in passages)
+    assert passages == sorted(passages)
+
+    unpunctuated = "word " * 200
+    assert all(end - start <= 160 for start, end in split_passages(unpunctuated, passage_chars=80))
+
+
+def test_tokenize_keeps_tech_terms():
+    assert tokenize("C++, C# and Node.js with 5 years") == ["c++", "c#", "node.js", "5"]
+
+
+def test_best_passage_follows_query(tmp_path):
+    index = PassageIndex.build([("a1", RESUME), ("a2", "Python developer. Django and React.")], passage_chars=80)
+    path = str(tmp_path / "passages.json.gz")
+    index.save(path)
+    index = PassageIndex.load(path)
+
+    autocad = index.best_passage("a1", index.compile_query("structural engineer", ["AutoCAD"]))
+    assert "AutoCAD" in autocad["text"]
+    assert RESUME[autocad["start"]:autocad["end"]] == autocad["text"]
+
+    teaching = index.best_passage("a1", index.compile_query("mathematics teacher"))
+    assert "mathematics" in teaching["text"]
+
+    assert index.best_passage("missing", {}) is None
+
+
+def test_explainer_uses_index_without_full_text():
+    index = PassageIndex.build([("a1", RESUME)], passage_chars=80)
+    explainer = MatchExplainer(passage_index=index)
+    candidate = {
+        "payload": {"id": "a1", "full_name": "Maria Santos", "job_title": "Structural Engineer"},
+        "semantic_score": 0.6, "skills_match_score": 1.0, "final_score": 0.72,
+    }
+    parsed = {"search_intent": "structural engineer", "filters": {"required_skills": ["AutoCAD"]}}
+
+    started = time.perf_counter()
+    snippet = explainer.explain(candidate, parsed)["resume_snippet"]
+    assert (time.perf_counter() - started) * 1000 < 5
+    assert "AutoCAD" in snippet
+
+    unindexed = dict(candidate, payload={"id": "zz", "resume_full_text": "Head of resume"})
+    assert explainer.explain(unindexed, parsed)["resume_snippet"] == "Head of resume"
+
+
+def test_api_keeps_resume_text_for_unindexed_applicants_without_a_store(tmp_path, monkeypatch):
+    from functools import partial
+    from core.intelligent_search import IntelligentSearchEngine
+    from core.text_store import TextStore
+    from api import search_api
+    from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+    records = build_synthetic_corpus(40, dim=16, seed=13)
+    monkeypatch.setattr(search_api, "IntelligentSearchEngine", partial(
+        IntelligentSearchEngine, client=create_local_qdrant(records), gemini_client=FakeGeminiClient(dim=16)
+    ))
+    parsed = rule_parse("Python developer with Django")
+    # Index built before the top result was added
+    newest = search_api._build_engine().search(parsed, limit=5)[0]["payload"]["id"]
+    index = PassageIndex.build([(r["id"], r["resume_full_text"]) for r in records if r["id"] != newest])
+
+    try:
+        search_api.configure(explainer=MatchExplainer(passage_index=index))
+        engine = search_api._build_engine()
+        assert engine.payload_exclude == []
+        explained = search_api.get_explainer().explain_batch(engine.search(parsed, limit=5), parsed)
+        assert explained[0]["candidate"]["id"] == newest
+        assert all(result["resume_snippet"] for result in explained)
+
+        # A text store serves the unindexed applicants, so the payload can skip the text
+        search_api.configure(explainer=MatchExplainer(passage_index=index, text_store=TextStore(str(tmp_path / "t.db"))))
+        assert search_api._build_engine().payload_exclude == ["resume_full_text"]
+    finally:
+        search_api.configure(explainer=MatchExplainer())
@@ -0,0 +1,79 @@
+"""
+Profile Vector Tests
+One ANN query on the precomputed weighted sum of resume/skills/tasks (local stand-in)
+"""
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.intelligent_search import IntelligentSearchEngine
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+QUERY = "Accountant with QuickBooks"
+
+
+def _weighted_cosines(records, query_vector):
+    query = np.asarray(query_vector)
+    return np.array([
+        sum(weight * float(np.dot(query, record[f"embedding_{name}"]))
+            for name, weight in IntelligentSearchEngine.WEIGHTS.items())
+        for record in records
+    ])
+
+
+def _profile_cosines(records, query_vector):
+    query = np.asarray(query_vector) / np.linalg.norm(query_vector)
+    return np.array([
+        float(np.dot(query, IntelligentSearchEngine.profile_vector(
+            {name: record[f"embedding_{name}"] for name in IntelligentSearchEngine.WEIGHTS}
+        )))
+        for record in records
+    ])
+
+
+def test_profile_vector_is_unit_length():
+    vectors = {"resume": [3.0, 0.0], "skills": [0.0, 2.0], "tasks": [1.0, 1.0]}  # not unit (e.g. old JSON rows)
+    profile = np.asarray(IntelligentSearchEngine.profile_vector(vectors))
+    assert np.isclose(np.linalg.norm(profile), 1.0)
+    expected = 0.5 * np.array([1.0, 0.0]) + 0.3 * np.array([0.0, 1.0]) + 0.2 * np.array([1.0, 1.0]) / np.sqrt(2)
+    assert np.allclose(profile, expected / np.linalg.norm(expected))
+
+
+def test_profile_search_matches_weighted_sum_of_cosines():
+    records = build_synthetic_corpus(250, dim=32, seed=6)
+    client = create_local_qdrant(records, profile=True)
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=32))
+    parsed = rule_parse(QUERY)
+    parsed["filters"]["required_skills"] = None
+
+    for rescore_components in (False, True):
+        trace = {}
+        results = engine.search(parsed, limit=10, retrieval="profile", profile_rescore=rescore_components, trace=trace)
+        assert trace["retrieval"] == "profile"
+
+        # Profile ANN alone scores the cosine to the unit profile; component rescoring the weighted sum
+        score = _weighted_cosines if rescore_components else _profile_cosines
+        expected = score(records, trace["query_vector"])
+        assert [c["id"] for c in results] == list(np.argsort(-expected, kind="stable")[:10])
+        assert np.allclose([c["semantic_score"] for c in results], np.sort(expected)[::-1][:10], atol=1e-4)
+
+    # A query vector that is not unit length gets the same (cosine) scores
+    unit = engine.search(parsed, limit=10, retrieval="profile", query_vector=trace["query_vector"])
+    scaled = engine.search(
+        parsed, limit=10, retrieval="profile", query_vector=[3.0 * x for x in trace["query_vector"]]
+    )
+    assert np.allclose([c["semantic_score"] for c in scaled], [c["semantic_score"] for c in unit], atol=1e-5)
+
+    hybrid = engine.search(parsed, limit=5, retrieval="profile", hybrid=True, trace=trace)
+    assert trace["hybrid"] is True and len(hybrid) == 5
+
+
+def test_profile_falls_back_without_profile_vector():
+    client = create_local_qdrant(build_synthetic_corpus(50, dim=8, seed=1))
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=8), retrieval="profile")
+    trace = {}
+    engine.search(rule_parse(QUERY), limit=5, trace=trace)
+    assert trace["retrieval"] == "full"
@@ -0,0 +1,44 @@
+"""
+Qdrant Client Factory Tests
+Transport selection, client sharing and per-operation timeouts (no server needed)
+"""
+import sys
+import os
+import warnings
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core import qdrant_factory
+from core.qdrant_factory import get_qdrant_client, operation_timeout, close_qdrant_clients
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # no server: version check warns
+        yield
+        close_qdrant_clients()
+
+
+def test_clients_are_shared_per_transport(monkeypatch):
+    monkeypatch.setenv("QDRANT_PREFER_GRPC", "true")
+    monkeypatch.setenv("QDRANT_POOL_SIZE", "4")
+
+    grpc_client = get_qdrant_client("http://localhost:6399", "key")
+    assert get_qdrant_client("http://localhost:6399", "key") is grpc_client
+    assert grpc_client._client._prefer_grpc
+    assert grpc_client._client._grpc_options["grpc.max_send_message_length"] == qdrant_factory.GRPC_MAX_MESSAGE_BYTES
+
+    rest_client = get_qdrant_client("http://localhost:6399", "key", prefer_grpc=False)
+    assert rest_client is not grpc_client
+    assert rest_client._client._rest_args["limits"].max_keepalive_connections == 4
+
+
+def test_operation_timeouts(monkeypatch):
+    monkeypatch.setenv("QDRANT_SEARCH_TIMEOUT", "3")
+    assert operation_timeout("search") == 3
+    assert operation_timeout("upsert") == 120
+    with pytest.raises(ValueError):
+        operation_timeout("bulk")
@@ -0,0 +1,59 @@
+"""
+Query Projection Tests
+Ridge projection from a local encoder into the Gemini space (stand-in corpus)
+"""
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.intelligent_search import IntelligentSearchEngine
+from core.local_embedder import LocalEmbedder
+from core.query_projection import QueryProjection, recall_at_k
+from benchmarks.stand_ins import (
+    FakeGeminiClient, FakeSentenceModel, build_payload, build_synthetic_corpus, create_local_qdrant, rule_parse
+)
+
+
+def test_fit_recovers_linear_map(tmp_path):
+    rng = np.random.default_rng(0)
+    local = rng.standard_normal((400, 24))
+    gemini = local @ rng.standard_normal((24, 96)) + 0.01 * rng.standard_normal((400, 96))
+
+    projection = QueryProjection.fit(local[:300], gemini[:300], alpha=0.1)
+    path = str(tmp_path / "projection.npy")
+    projection.save(path)
+    projection = QueryProjection.load(path)
+    assert (projection.input_dim, projection.output_dim) == (24, 96)
+
+    projected = projection.project(local[300:])
+    assert recall_at_k(gemini[300:], projected, gemini[:300], k=10) > 0.9
+    assert abs(np.linalg.norm(projection.project(local[0])) - 1.0) < 1e-5
+
+
+def test_projected_mode_searches_gemini_vectors_without_gemini():
+    records = build_synthetic_corpus(300, dim=32, seed=11)
+    embedder = LocalEmbedder(model=FakeSentenceModel(dim=64))
+    skills = [build_payload(r)["skills_extracted"] for r in records]
+    local = np.array(embedder.embed_batch(skills), dtype=np.float32)
+    gemini = np.array([r["embedding_skills"] for r in records], dtype=np.float32)
+    projection = QueryProjection.fit(local[:250], gemini[:250], alpha=1.0)
+
+    resumes = np.array([r["embedding_resume"] for r in records], dtype=np.float32)
+    random_recall = 10 / len(records)
+    assert recall_at_k(gemini[250:], projection.project(local[250:]), resumes, k=10) > 5 * random_recall
+
+    engine = IntelligentSearchEngine(
+        client=create_local_qdrant(records),
+        gemini_client=FakeGeminiClient(dim=32, error_rate=1.0),
+        local_embedder=embedder,
+        query_projection=projection,
+        embedding_mode="projected"
+    )
+    trace = {}
+    results = engine.search(rule_parse("React TypeScript frontend developer"), limit=5, trace=trace)
+    assert trace["embedding_source"] == "projected" and trace["embedding_mode"] == "projected"
+    assert len(trace["query_vector"]) == 32
+    assert results
@@ -0,0 +1,65 @@
+"""
+Query Log + Replay Tests
+Captures searches through the API with stand-ins, then replays them offline
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.query_log import QueryLogger, read_query_log, encode_embedding, decode_embedding, embedding_hash
+from benchmarks.load_test import install_stand_ins
+from benchmarks.replay_queries import replay, log_as_run, diff_runs, overlap_at_k
+
+
+def test_embedding_round_trip():
+    vector = [0.25, -1.5, 3.0]
+    assert decode_embedding(encode_embedding(vector)) == vector
+    assert embedding_hash(vector) == embedding_hash(list(vector))
+
+
+def test_overlap_at_k():
+    assert overlap_at_k([1, 2, 3], [1, 2, 3], 3) == 1.0
+    assert overlap_at_k([1, 2, 3, 4], [4, 3, 9, 8], 2) == 0.0
+    assert overlap_at_k([], [], 10) == 1.0
+
+
+def test_log_rotation_and_ordering(tmp_path):
+    path = str(tmp_path / "queries.jsonl")
+    query_logger = QueryLogger(path, max_bytes=2000, backup_count=10, store_embeddings=False)
+    for i in range(20):
+        query_logger.record(f"query {i}", {"limit": 5}, {"search_intent": "x", "filters": {}},
+                            [0.1] * 8, {"total_ms": 1.0}, [])
+
+    records = list(read_query_log(path))
+    assert [r["query"] for r in records] == [f"query {i}" for i in range(20)]
+    assert records[0]["embedding_b64"] is None
+    assert records[0]["embedding_sha256"]
+    assert os.path.exists(path + ".1")
+
+
+def test_capture_then_replay_is_deterministic(tmp_path):
+    from fastapi.testclient import TestClient
+
+    install_stand_ins(corpus_size=200, dim=64)
+    from api import search_api
+
+    path = str(tmp_path / "queries.jsonl")
+    search_api.configure(query_logger=QueryLogger(path))
+    try:
+        client = TestClient(search_api.app)
+        for query in ("Python developer with Django", "Civil engineer with AutoCAD, 5+ years"):
+            assert client.post("/search", json={"query": query, "limit": 5}).status_code == 200
+    finally:
+        search_api.configure(query_logger=None)
+
+    records = list(read_query_log(path))
+    assert len(records) == 2
+    assert records[0]["parsed_query"]["search_intent"]
+    assert {"parse_ms", "embed_ms", "vector_search_ms", "explain_ms"} <= set(records[0]["timings_ms"])
+
+    run = replay(search_api.get_engine(), records)
+    assert run["skipped"] == 0
+    report = diff_runs(log_as_run(records), run, k=5)
+    assert report["queries_compared"] == 2
+    assert report["results"]["identical_rankings"] == 1.0
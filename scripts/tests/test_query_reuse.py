@@ -0,0 +1,64 @@
+"""
+Query Reuse Tests
+Paraphrases reuse a prior parse; differing numbers, bounds or cities never do
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.query_reuse import QueryReuse, hashed_vector
+from benchmarks.stand_ins import rule_parse
+
+
+class CountingParser:
+    """Stand-in LLM parser (rule output labelled 'gemini') counting its calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def parse(self, query):
+        self.calls += 1
+        return {**rule_parse(query), "api_used": "gemini", "fallback_used": False}
+
+
+def test_paraphrase_reuses_the_prior_parse():
+    reuse, parser = QueryReuse(), CountingParser()
+    first = reuse.parse(parser, "Python dev Manila 5 yrs")
+    again = reuse.parse(parser, "5+ years python developer in manila")
+
+    assert parser.calls == 1
+    assert again["api_used"] == "reuse" and again["reused_from"]["query"] == "Python dev Manila 5 yrs"
+    assert again["search_intent"] == first["search_intent"]  # same intent: embedding cache hit too
+    assert again["filters"] == first["filters"]
+
+    again["filters"]["location"] = "changed"
+    assert reuse.parse(parser, "python developers, manila, 5 years")["filters"]["location"] != "changed"
+    assert reuse.stats()["reuse_rate"] == round(2 / 3, 3)
+
+
+def test_constraints_must_agree():
+    reuse, parser = QueryReuse(), CountingParser()
+    reuse.parse(parser, "Python dev Manila 5 yrs")
+
+    # Same words, other meaning: experience bound or city differ
+    assert reuse.parse(parser, "python developer in manila up to 5 years")["api_used"] == "gemini"
+    assert reuse.parse(parser, "Python dev Cebu 5 yrs")["api_used"] == "gemini"
+    assert reuse.parse(parser, "Python dev Manila 8 yrs")["api_used"] == "gemini"
+    # Different role: below the similarity threshold
+    assert reuse.parse(parser, "Java developer in Manila 5 years")["api_used"] == "gemini"
+    assert parser.calls == 5
+
+    stats = reuse.stats()
+    assert stats["reuses"] == 0 and stats["disagreements"] >= 2
+    fields = {field for sample in stats["disagreement_samples"] for field in sample["fields"]}
+    assert {"location", "numbers"} <= fields
+
+
+def test_similarity_separates_skills_and_expires():
+    assert hashed_vector("Python developer with Django") @ hashed_vector("Django python developers") > 0.99
+    assert hashed_vector("Python developer with Django") @ hashed_vector("Python developer with Flask") < 0.9
+
+    reuse, parser = QueryReuse(ttl_seconds=0.0), CountingParser()
+    reuse.parse(parser, "accountant in cebu")
+    assert reuse.parse(parser, "accountants cebu")["api_used"] == "gemini"
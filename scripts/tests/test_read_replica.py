@@ -0,0 +1,109 @@
+"""
+Read Replica Tests
+Initial load, updated_at delta sync, version reload and primary fallback (local stand-ins)
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+from core.read_replica import ReadReplica
+from core.collection_versions import switch_alias, resolve_alias
+from core.intelligent_search import IntelligentSearchEngine
+from benchmarks.ann_tuning import clone_collection
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+ALIAS = "applicants_unified"
+
+
+def primary_with_alias(n: int = 60):
+    primary = create_local_qdrant(build_synthetic_corpus(n, dim=16, seed=8), collection_name=f"{ALIAS}_v1")
+    primary.set_payload(f"{ALIAS}_v1", payload={"updated_at": int(time.time()) - 3600}, points=list(range(n)))
+    switch_alias(primary, ALIAS, f"{ALIAS}_v1")
+    return primary
+
+
+def test_replica_loads_and_syncs_deltas():
+    primary = primary_with_alias()
+    replica = ReadReplica(primary, QdrantClient(location=":memory:"), ALIAS, sync_seconds=0, overlap_seconds=0)
+    assert replica.client_for_reads() is None  # nothing loaded yet
+
+    assert replica.sync() == 60
+    assert resolve_alias(replica.replica, ALIAS) == f"{ALIAS}_v1"
+    assert replica.client_for_reads() is replica.replica
+
+    # Only points written since the last sync are copied
+    record = primary.retrieve(f"{ALIAS}_v1", ids=[5], with_vectors=True)[0]
+    time.sleep(1.1)
+    primary.upsert(f"{ALIAS}_v1", points=[PointStruct(
+        id=5, vector=record.vector, payload={**record.payload, "location": "Remote", "updated_at": int(time.time())}
+    )])
+    assert replica.sync() == 1
+    assert replica.replica.retrieve(ALIAS, ids=[5])[0].payload["location"] == "Remote"
+
+    # A blue/green switch on the primary triggers a full reload
+    clone_collection(primary, f"{ALIAS}_v1", f"{ALIAS}_v2")
+    switch_alias(primary, ALIAS, f"{ALIAS}_v2")
+    replica.sync()
+    assert resolve_alias(replica.replica, ALIAS) == f"{ALIAS}_v2"
+    assert not replica.replica.collection_exists(f"{ALIAS}_v1")
+
+
+def test_engine_reads_replica_until_it_lags():
+    primary = primary_with_alias()
+    replica = ReadReplica(primary, QdrantClient(location=":memory:"), ALIAS, max_lag_seconds=60)
+    engine = IntelligentSearchEngine(client=primary, gemini_client=FakeGeminiClient(dim=16), read_replica=replica)
+    parsed = rule_parse("Python developer with Django")
+
+    trace = {}
+    engine.search(parsed, limit=5, trace=trace)
+    assert trace["read_from"] == "primary"
+
+    replica.initial_load()
+    trace = {}
+    from_replica = engine.search(parsed, limit=5, trace=trace)
+    assert trace["read_from"] == "replica"
+    assert [c["id"] for c in from_replica] == [c["id"] for c in IntelligentSearchEngine(
+        client=primary, gemini_client=FakeGeminiClient(dim=16)
+    ).search(parsed, limit=5)]
+
+    replica._synced_at = time.time() - 61  # sync thread stalled
+    trace = {}
+    engine.search(parsed, limit=5, trace=trace)
+    assert trace["read_from"] == "primary"
+
+
+def test_replica_is_disabled_with_partitions(tmp_path, monkeypatch):
+    from functools import partial
+    from core.time_partitions import PartitionRouter
+    from migrations.partition_by_quarter import split
+    from api import search_api
+
+    primary = create_local_qdrant(build_synthetic_corpus(60, dim=16, seed=9))
+    split(primary, ALIAS)
+    replica = ReadReplica(primary, QdrantClient(location=":memory:"), ALIAS)
+    try:
+        IntelligentSearchEngine(
+            client=primary, gemini_client=FakeGeminiClient(dim=16), read_replica=replica, partition_router=PartitionRouter(ALIAS)
+        )
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for a replica with partitions")
+
+    # The API keeps partitioned search and skips the replica (which would have no partitions)
+    monkeypatch.setenv("SEARCH_PARTITIONED", "true")
+    monkeypatch.setenv("QDRANT_REPLICA_PATH", str(tmp_path / "replica"))
+    monkeypatch.setattr(search_api, "IntelligentSearchEngine", partial(
+        IntelligentSearchEngine, client=primary, gemini_client=FakeGeminiClient(dim=16)
+    ))
+    engine = search_api._build_engine()
+    assert engine.read_replica is None and engine.partition_router is not None
+    trace = {}
+    assert len(engine.search(rule_parse("Python developer with Django"), limit=5, trace=trace)) == 5
+    assert "read_from" not in trace
+    assert trace["partitions"] and all(name.startswith(f"{ALIAS}_20") for name in trace["partitions"])
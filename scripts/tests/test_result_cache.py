@@ -0,0 +1,86 @@
+"""
+Result Cache Tests
+Hits skip the search, and a bumped or switched collection version invalidates them (local stand-in)
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.cache import TTLCache
+from core.result_cache import ResultCache
+from core.collection_versions import bump_data_version, switch_alias
+from core.intelligent_search import IntelligentSearchEngine
+from benchmarks.ann_tuning import clone_collection
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+ALIAS = "applicants_unified"
+
+
+def cached_engine(client, stamp_seconds: float = 0.0):
+    return IntelligentSearchEngine(
+        client=client, gemini_client=FakeGeminiClient(dim=16),
+        result_cache=ResultCache(TTLCache(64, 600), stamp_seconds=stamp_seconds)
+    )
+
+
+def cache_state(engine, parsed, **kwargs) -> str:
+    trace = {}
+    engine.search(parsed, trace=trace, **kwargs)
+    return trace["result_cache"]
+
+
+def test_hits_are_served_without_searching():
+    client = create_local_qdrant(build_synthetic_corpus(80, dim=16, seed=10))
+    engine = cached_engine(client, stamp_seconds=60)
+    parsed = rule_parse("Python developer with Django")
+
+    trace = {}
+    first = engine.search(parsed, limit=5, trace=trace)
+    assert trace["result_cache"] == "miss"
+
+    fastest = float("inf")
+    for _ in range(5):
+        trace = {}
+        again = engine.search(parsed, limit=5, trace=trace)
+        fastest = min(fastest, trace["timings"]["total_ms"])
+    assert trace["result_cache"] == "hit"
+    assert [c["id"] for c in again] == [c["id"] for c in first]
+    assert trace["query_vector"] is not None  # query log still gets the vector
+    assert fastest < 1.0
+
+    # Callers may mutate what they get back
+    again[0]["payload"]["full_name"] = "changed"
+    assert engine.search(parsed, limit=5)[0]["payload"]["full_name"] != "changed"
+
+    # Other options are other entries
+    assert cache_state(engine, parsed, limit=6) == "miss"
+    assert cache_state(engine, parsed, limit=5, enable_reranking=False) == "miss"
+
+
+def test_version_changes_invalidate():
+    client = create_local_qdrant(build_synthetic_corpus(80, dim=16, seed=11), collection_name=f"{ALIAS}_v1")
+    switch_alias(client, ALIAS, f"{ALIAS}_v1")
+    engine = cached_engine(client)
+    parsed = rule_parse("Python developer with Django")
+
+    assert cache_state(engine, parsed, limit=5) == "miss"
+    assert cache_state(engine, parsed, limit=5) == "hit"
+
+    # Ingestion bumps the data version of the live collection
+    bump_data_version(client, f"{ALIAS}_v1")
+    assert cache_state(engine, parsed, limit=5) == "miss"
+    assert cache_state(engine, parsed, limit=5) == "hit"
+
+    # A blue/green switch changes the alias target
+    clone_collection(client, f"{ALIAS}_v1", f"{ALIAS}_v2")
+    switch_alias(client, ALIAS, f"{ALIAS}_v2")
+    assert cache_state(engine, parsed, limit=5) == "miss"
+
+
+def test_failed_bump_does_not_break_the_write():
+    class NoMetadataClient:
+        def update_collection(self, **kwargs):
+            raise RuntimeError("Unknown field 'metadata'")  # server < 1.16
+
+    assert bump_data_version(NoMetadataClient(), f"{ALIAS}_v1") is None
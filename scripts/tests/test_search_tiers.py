@@ -0,0 +1,110 @@
+"""
+Latency Tier Tests
+Tier presets, the rule-based parser and the API "mode" field (local stand-ins)
+"""
+import sys
+import os
+import json
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.search_tiers import SearchTiers
+from core.rule_parser import RuleQueryParser
+from core.intelligent_search import IntelligentSearchEngine
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+from tests.test_collection_config import RecordingClient
+
+
+def test_tiers_resolve_and_load_overrides(tmp_path, monkeypatch):
+    tiers = SearchTiers()
+    assert tiers.resolve() == ("balanced", "llm", {})
+    name, parser, kwargs = tiers.resolve("exhaustive")
+    assert parser == "llm" and kwargs["exact"] is True and kwargs["overfetch"] == 5
+
+    path = tmp_path / "tiers.json"
+    path.write_text(json.dumps({"fast": {"hnsw_ef": 16}, "recall": {"hnsw_ef": 512, "overfetch": 3}}))
+    monkeypatch.setenv("SEARCH_TIERS_FILE", str(path))
+    monkeypatch.setenv("SEARCH_DEFAULT_TIER", "recall")
+    tiers = SearchTiers.from_env()
+    assert tiers.resolve("fast") == ("fast", "rules", {"hnsw_ef": 16, "overfetch": 1, "rescore": False})
+    assert tiers.resolve() == ("recall", "llm", {"hnsw_ef": 512, "overfetch": 3})
+
+    for bad in (
+        {"fast": {"parser": "gpt"}}, {"fast": {"ef": 10}}, {"fast": {"overfetch": 0}},
+        {"fast": {"retrieval": "truncatd"}}, {"fast": {"hnsw_ef": -8}}, {"recall": {"oversampling": 0.0}},
+        {"fast": {"hnsw_ef": True}}
+    ):
+        try:
+            SearchTiers(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {bad}")
+
+
+def test_rule_parser_extracts_safe_filters():
+    parsed = RuleQueryParser().parse("Senior civil engineer in Manila with AutoCAD, 5+ years")
+    filters = parsed["filters"]
+    assert parsed["api_used"] == "rules"
+    assert parsed["search_intent"] == "Senior civil engineer with AutoCAD"
+    assert filters["min_experience"] == 5.0
+    assert filters["location"] == "Manila, Philippines"
+    assert filters["required_skills"] == ["AutoCAD"]
+    assert filters["seniority_keywords"] == ["senior"]
+
+    filters = RuleQueryParser().parse("Accountant 3-5 years with QuickBooks and Excel, applied in the last 30 days")["filters"]
+    assert (filters["min_experience"], filters["max_experience"]) == (3.0, 5.0)
+    assert filters["required_skills"] == ["QuickBooks", "Excel"]
+    assert filters["min_date_applied"] is not None
+
+
+def test_overfetch_sets_candidate_depth():
+    client = RecordingClient(create_local_qdrant(build_synthetic_corpus(100, dim=16, seed=2)))
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=16))
+    parsed = rule_parse("Python developer with Django")
+
+    engine.search(parsed, limit=5)
+    assert all(query["limit"] == 10 for query in client.queries)
+
+    client.queries.clear()
+    trace = {}
+    engine.search(parsed, limit=5, overfetch=4, exact=True, trace=trace)
+    assert all(query["limit"] == 20 for query in client.queries)
+    assert trace["overfetch"] == 4 and trace["search_params"] == {"exact": True}
+
+
+def test_api_mode_selects_tier():
+    from fastapi.testclient import TestClient
+    from benchmarks.load_test import install_stand_ins
+    from api import search_api
+
+    install_stand_ins(corpus_size=200, dim=16)
+    search_api.configure(search_tiers=SearchTiers({"fast": {"hnsw_ef": 24}}))
+    client = TestClient(search_api.app)
+
+    body = client.post("/search", json={"query": "Python developer with Django", "limit": 5, "mode": "fast"}).json()
+    assert body["tier"] == "fast" and body["api_used"] == "rules"
+    assert body["total_results"] > 0
+
+    body = client.post("/search", json={"query": "Python developer with Django", "limit": 5}).json()
+    assert body["tier"] == "balanced" and body["api_used"] == "gemini"
+
+    response = client.post("/search", json={"query": "Python developer", "mode": "ludicrous"})
+    assert response.status_code == 400
+
+
+def test_bad_tiers_file_fails_warmup(tmp_path, monkeypatch):
+    from benchmarks.load_test import install_stand_ins
+    from api import search_api
+
+    install_stand_ins(corpus_size=50, dim=16)
+    path = tmp_path / "tiers.json"
+    path.write_text(json.dumps({"fast": {"retrieval": "truncatd"}}))
+    monkeypatch.setenv("SEARCH_TIERS_FILE", str(path))
+    monkeypatch.delitem(search_api._components, "search_tiers", raising=False)
+    monkeypatch.setitem(search_api._readiness, "ready", False)
+    monkeypatch.setitem(search_api._readiness, "error", None)
+
+    search_api.run_warmup([])
+    assert not search_api._readiness["ready"]
+    assert "truncatd" in search_api._readiness["error"]
@@ -0,0 +1,113 @@
+"""
+Find-Similar Tests
+Recommend by stored vectors: one Qdrant query, weighted fusion, filters, no embedding call (local stand-in)
+"""
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.intelligent_search import IntelligentSearchEngine, ApplicantNotFound
+from core.time_partitions import PartitionRouter
+from migrations.partition_by_quarter import split
+from benchmarks.stand_ins import build_synthetic_corpus, create_local_qdrant
+from tests.test_collection_config import RecordingClient
+
+
+class NoEmbeddings:
+    """Gemini client that fails the test if anything is embedded"""
+
+    @property
+    def models(self):
+        raise AssertionError("find-similar must not call Gemini")
+
+
+def test_similar_fuses_stored_vectors_in_one_query():
+    client = RecordingClient(create_local_qdrant(build_synthetic_corpus(120, dim=16, seed=20)))
+    # Depth covering the corpus: per-vector top-k fusion is then exact
+    engine = IntelligentSearchEngine(client=client, gemini_client=NoEmbeddings(), overfetch=30)
+
+    results = engine.similar([3], limit=5)
+    assert len(client.queries) == 1
+    assert len(results) == 5 and 3 not in [c["id"] for c in results]
+
+    # Same ranking and scores as sum(w * cosine) against the seed's stored vectors
+    records = client.scroll(IntelligentSearchEngine.COLLECTION_NAME, limit=200, with_vectors=True)[0]
+    vectors = {r.id: r.vector for r in records}
+
+    def fused(point_id):
+        return sum(
+            weight * float(np.dot(vectors[3][name], vectors[point_id][name]))
+            for name, weight in IntelligentSearchEngine.WEIGHTS.items()
+        )
+
+    expected = sorted((i for i in vectors if i != 3), key=fused, reverse=True)[:5]
+    assert [c["id"] for c in results] == expected
+    assert np.isclose(results[0]["final_score"], fused(expected[0]), atol=1e-4)
+
+    seed_title = client.retrieve(IntelligentSearchEngine.COLLECTION_NAME, ids=[3])[0].payload["job_title"]
+    topic = seed_title.split()[-1]
+    assert all(topic in c["payload"]["job_title"] for c in results[:3])
+
+
+def test_filters_and_negative_examples():
+    client = create_local_qdrant(build_synthetic_corpus(120, dim=16, seed=21))
+    engine = IntelligentSearchEngine(client=client, gemini_client=NoEmbeddings())
+
+    filtered = engine.similar([3], filters={"min_experience": 5.0}, limit=10)
+    assert filtered and all(c["payload"]["total_years_experience"] >= 5.0 for c in filtered)
+
+    plain = engine.similar([3, 8], limit=10)
+    pushed = engine.similar([3, 8], negative_ids=[plain[0]["id"]], limit=10)
+    assert not {3, 8, plain[0]["id"]} & {c["id"] for c in pushed}
+    assert [c["id"] for c in pushed] != [c["id"] for c in plain[1:]]
+
+    for call in (lambda: engine.similar([9999]), lambda: engine.similar([3], negative_ids=[9999])):
+        try:
+            call()
+        except ApplicantNotFound as e:
+            assert "9999" in str(e)
+        else:
+            raise AssertionError("expected ApplicantNotFound for an unknown applicant")
+
+
+def test_partitioned_matches_single_collection():
+    client = create_local_qdrant(build_synthetic_corpus(150, dim=16, seed=22))
+    single = IntelligentSearchEngine(client=client, gemini_client=NoEmbeddings(), overfetch=20)
+    expected = [c["id"] for c in single.similar([4], negative_ids=[9], limit=10)]
+
+    split(client, IntelligentSearchEngine.COLLECTION_NAME)
+    partitioned = IntelligentSearchEngine(
+        client=client, gemini_client=NoEmbeddings(), overfetch=20,
+        partition_router=PartitionRouter(IntelligentSearchEngine.COLLECTION_NAME, refresh_seconds=0)
+    )
+    assert [c["id"] for c in partitioned.similar([4], negative_ids=[9], limit=10)] == expected
+    try:
+        partitioned.similar([4, 9999])
+    except ApplicantNotFound:
+        pass
+    else:
+        raise AssertionError("expected ApplicantNotFound for an unknown applicant")
+
+
+def test_api_similar_endpoint():
+    from fastapi.testclient import TestClient
+    from benchmarks.load_test import install_stand_ins
+    from api import search_api
+
+    install_stand_ins(corpus_size=200, dim=16)
+    client = TestClient(search_api.app)
+
+    body = client.post("/search", json={"query": "Python developer with Django", "limit": 3, "mode": "fast"}).json()
+    point_id = body["results"][0]["candidate"]["point_id"]
+
+    body = client.post(f"/candidates/{point_id}/similar", json={"limit": 5, "scores_only": True}).json()
+    assert body["candidate_id"] == point_id and body["total_results"] == 5
+    assert point_id not in [r["candidate"]["point_id"] for r in body["results"]]
+    assert client.post(f"/candidates/{point_id}/similar").status_code == 200
+
+    assert client.post("/candidates/99999/similar").status_code == 404
+    bad_filter = client.post(f"/candidates/{point_id}/similar", json={"filters": {"min_experience": "five"}})
+    assert bad_filter.status_code == 400
@@ -0,0 +1,83 @@
+"""
+Snapshot Transfer Tests
+Streaming download/upload against a stand-in Qdrant snapshot endpoint
+"""
+import sys
+import os
+
+import httpx
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.snapshot_transfer import build_mode, download_snapshot, upload_snapshot
+
+SNAPSHOT_BYTES = os.urandom(3 * 1024 * 1024 + 17)
+
+
+def stand_in_qdrant(received: dict) -> httpx.Client:
+    """Serves one snapshot and accepts uploads, recording what arrived"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET" and request.url.path == "/collections/applicants_unified_v3/snapshots/s1.snapshot":
+            return httpx.Response(200, content=SNAPSHOT_BYTES)
+        if request.method == "POST" and request.url.path == "/collections/applicants_unified_v3/snapshots/upload":
+            received["params"] = dict(request.url.params)
+            received["api_key"] = request.headers.get("api-key")
+            received["body"] = request.read()
+            return httpx.Response(200, json={"result": True, "status": "ok"})
+        return httpx.Response(404, text="Not found")
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_snapshot_round_trip(tmp_path):
+    received = {}
+    http = stand_in_qdrant(received)
+    path = str(tmp_path / "snapshots" / "s1.snapshot")
+
+    written = download_snapshot("http://localhost:6333", "applicants_unified_v3", "s1.snapshot", path, http=http)
+    assert written == len(SNAPSHOT_BYTES)
+    with open(path, "rb") as f:
+        assert f.read() == SNAPSHOT_BYTES
+
+    upload_snapshot("https://cloud.example:6333/", "applicants_unified_v3", path, api_key="key", http=http)
+    assert received["params"] == {"priority": "snapshot", "wait": "true"}
+    assert received["api_key"] == "key"
+    assert SNAPSHOT_BYTES in received["body"]  # multipart body carries the file unchanged
+
+
+def test_rejected_upload_raises(tmp_path):
+    path = tmp_path / "s1.snapshot"
+    path.write_bytes(b"snapshot")
+    with pytest.raises(RuntimeError, match="404"):
+        upload_snapshot("http://cloud.example", "missing", str(path), http=stand_in_qdrant({}))
+
+
+def test_own_client_is_closed_and_callers_is_not(tmp_path, monkeypatch):
+    opened = []
+    transport = stand_in_qdrant({})._transport
+
+    class StandInClient(httpx.Client):
+        def __init__(self, timeout=None):
+            super().__init__(transport=transport, timeout=timeout)
+            opened.append(self)
+
+    monkeypatch.setattr(httpx, "Client", StandInClient)
+    path = str(tmp_path / "s1.snapshot")
+    download_snapshot("http://localhost:6333", "applicants_unified_v3", "s1.snapshot", path)
+    upload_snapshot("http://cloud.example", "applicants_unified_v3", path)
+    assert len(opened) == 2 and all(client.is_closed for client in opened)
+
+    http = StandInClient()
+    upload_snapshot("http://cloud.example", "applicants_unified_v3", path, http=http)
+    assert not http.is_closed
+
+
+def test_build_mode_from_env(monkeypatch):
+    monkeypatch.delenv("COLLECTION_BUILD", raising=False)
+    assert build_mode() == "direct"
+    monkeypatch.setenv("COLLECTION_BUILD", "Snapshot")
+    assert build_mode() == "snapshot"
+    monkeypatch.setenv("COLLECTION_BUILD", "rsync")
+    with pytest.raises(ValueError):
+        build_mode()
@@ -0,0 +1,112 @@
+"""
+Text Store Tests
+Compressed round trip, batched cached lookups, payload migration and explainer snippets
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.text_store import TextStore, TEXT_FIELDS
+from core.cache import TTLCache
+from core.match_explainer import MatchExplainer
+from core.intelligent_search import IntelligentSearchEngine
+from migrations.move_text_to_store import move_text
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+
+def test_round_trip_and_cache(tmp_path):
+    store = TextStore(str(tmp_path / "text.db"), cache=TTLCache(16, 60))
+    resume = "Senior Python engineer. " * 200 + "Zürich, 日本語 ok."
+    store.put_many([("a1", {"resume_full_text": resume}), ("a2", {"tasks_summary": "Built APIs"})])
+    assert len(store) == 2
+    blob = store._db.execute("SELECT blob FROM texts WHERE id = 'a1'").fetchone()[0]
+    assert len(blob) < 0.1 * len(resume)  # compressed
+
+    store.cache.clear()
+    found = store.get_many(["a1", "a2", "missing", None, "a1"])
+    assert found == {"a1": {"resume_full_text": resume}, "a2": {"tasks_summary": "Built APIs"}}
+    hits = store.cache.hits
+    store.get_many(["a1"])
+    assert store.cache.hits == hits + 1
+
+    # Writes go through the cache; blobs of either codec stay readable
+    store.put_many([("a2", {"tasks_summary": "Led the API team"})])
+    assert store.get_many(["a2"])["a2"]["tasks_summary"] == "Led the API team"
+    TextStore(store.path, codec="zlib", cache=None).put_many([("a3", {"tasks_summary": "Ran migrations"})])
+    assert TextStore(store.path, cache=None).get_many(["a1", "a3"])["a3"] == {"tasks_summary": "Ran migrations"}
+
+
+def test_moving_text_shrinks_payloads_and_keeps_snippets(tmp_path):
+    records = build_synthetic_corpus(40, dim=16, seed=9)
+    for record in records:
+        record["resume_full_text"] = record["resume_full_text"] + "\n" + "Delivered production services. " * 150
+    client = create_local_qdrant(records)
+    stats = move_text(client, "applicants_unified", TextStore(str(tmp_path / "text.db")), batch_size=16)
+    assert stats["moved"] == 40
+    assert stats["payload_bytes_after"] < 0.1 * stats["payload_bytes_before"]
+    payload = client.scroll("applicants_unified", limit=1)[0][0].payload
+    assert not any(field in payload for field in TEXT_FIELDS)
+
+    store = TextStore(str(tmp_path / "text.db"), cache=TTLCache(64, 60))
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=16))
+    parsed = rule_parse("Python developer with Django")
+    candidates = engine.search(parsed, limit=5)
+    explained = MatchExplainer(text_store=store).explain_batch(candidates, parsed)
+    by_id = {record["id"]: record for record in records}
+    for result in explained:
+        expected = by_id[result["candidate"]["id"]]["resume_full_text"][:200] + "..."
+        assert result["resume_snippet"] == expected
+    assert store.cache.misses == 5  # one batched lookup for the page
+
+    MatchExplainer(text_store=store).explain_batch(candidates, parsed, scores_only=True)
+    assert store.cache.misses == 5
+
+
+def test_no_store_lookup_when_the_passage_index_serves_the_snippet(tmp_path):
+    from core.passage_index import PassageIndex
+
+    records = build_synthetic_corpus(40, dim=16, seed=12)
+    client = create_local_qdrant(records)
+    move_text(client, "applicants_unified", TextStore(str(tmp_path / "text.db")))
+
+    class RecordingStore(TextStore):
+        lookups = []
+
+        def get_many(self, applicant_ids):
+            ids = list(applicant_ids)
+            self.lookups.append(ids)
+            return super().get_many(ids)
+
+    store = RecordingStore(str(tmp_path / "text.db"), cache=None)
+    engine = IntelligentSearchEngine(client=client, gemini_client=FakeGeminiClient(dim=16))
+    parsed = rule_parse("Python developer with Django")
+    candidates = engine.search(parsed, limit=5)
+    ids = [candidate["payload"]["id"] for candidate in candidates]
+    by_id = {record["id"]: record for record in records}
+
+    # Every candidate indexed: snippets come from passages, the store is not read
+    index = PassageIndex.build([(i, by_id[i]["resume_full_text"]) for i in ids])
+    explained = MatchExplainer(passage_index=index, text_store=store).explain_batch(candidates, parsed)
+    assert store.lookups == [] and all(result["resume_snippet"] for result in explained)
+
+    # Only the candidates the index lacks are looked up
+    index = PassageIndex.build([(i, by_id[i]["resume_full_text"]) for i in ids[:3]])
+    explained = MatchExplainer(passage_index=index, text_store=store).explain_batch(candidates, parsed)
+    assert store.lookups[-1] == ids[3:] and all(result["resume_snippet"] for result in explained)
+
+
+def test_moving_text_marks_points_updated_for_replicas(tmp_path):
+    from core.read_replica import ReadReplica
+    from qdrant_client import QdrantClient
+
+    primary = create_local_qdrant(build_synthetic_corpus(20, dim=16, seed=13))
+    replica = ReadReplica(primary, QdrantClient(":memory:"), overlap_seconds=0)
+    replica.initial_load()
+    replica._watermark = time.time() - 1  # everything older is already on the replica
+
+    move_text(primary, "applicants_unified", TextStore(str(tmp_path / "text.db")))
+    assert replica.sync() == 20
+    payload = replica.replica.scroll("applicants_unified", limit=1)[0][0].payload
+    assert not any(field in payload for field in TEXT_FIELDS)
@@ -0,0 +1,62 @@
+"""
+Truncated Vector Retrieval Tests
+Two-stage search: truncated vectors first, rescoring on the full vectors (local stand-in)
+"""
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.intelligent_search import IntelligentSearchEngine
+from core.truncated_vectors import truncate, truncated_document_vectors
+from benchmarks.recall_harness import measure_recall, sample_point_queries
+from benchmarks.stand_ins import FakeGeminiClient, build_synthetic_corpus, create_local_qdrant, rule_parse
+
+
+def test_truncate_is_normalized_prefix():
+    vector = [3.0, 4.0, 12.0]
+    assert np.allclose(truncate(vector, 2), [0.6, 0.8])
+    named = truncated_document_vectors({"resume": vector, "skills": vector}, [1, 2])
+    assert set(named) == {"resume_1", "resume_2", "skills_1", "skills_2"}
+
+
+def test_truncated_retrieval_rescores_on_full_vectors():
+    client = create_local_qdrant(build_synthetic_corpus(400, dim=64, seed=4), truncated_dims=[16])
+    engine = IntelligentSearchEngine(
+        client=client, gemini_client=FakeGeminiClient(dim=64), truncated_dim=16, rescore_limit=200
+    )
+    parsed = rule_parse("Civil engineer with AutoCAD, 5+ years")
+
+    trace = {}
+    full = engine.search(parsed, limit=10, trace=trace)
+    assert trace["retrieval"] == "full"
+    truncated = engine.search(parsed, limit=10, retrieval="truncated", trace=trace)
+    assert trace["retrieval"] == "truncated_16"
+
+    # Final scores come from the full vectors, so shared candidates score identically
+    full_scores = {c["id"]: c["final_score"] for c in full}
+    shared = [c for c in truncated if c["id"] in full_scores]
+    assert len(shared) >= 8
+    assert all(abs(c["final_score"] - full_scores[c["id"]]) < 1e-6 for c in shared)
+    assert all(c["payload"]["total_years_experience"] >= 5 for c in truncated)
+
+    hybrid = engine.search(parsed, limit=5, retrieval="truncated", hybrid=True, trace=trace)
+    assert trace["hybrid"] is True and len(hybrid) == 5
+
+    # Falls back to full search when the collection has no vectors of that dim
+    engine.truncated_dim = 8
+    engine.search(parsed, limit=5, retrieval="truncated", trace=trace)
+    assert trace["retrieval"] == "full"
+
+
+def test_recall_harness_reports_rescoring_gain():
+    client = create_local_qdrant(build_synthetic_corpus(300, dim=64, seed=8), truncated_dims=[16])
+    queries = sample_point_queries(client, "applicants_unified", "resume", 10)
+    report = measure_recall(client, queries, dims=[16], rescore_limits=[100], k=10)
+
+    configs = report["configs"]
+    assert configs["full"]["recall@10"] == 1.0
+    assert configs["16+rescore100"]["recall@10"] >= configs["16"]["recall@10"]
+    assert configs["16+rescore100"]["memory_ratio"] == 4.0
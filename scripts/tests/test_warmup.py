@@ -0,0 +1,116 @@
+"""
+Warm-Up, Readiness and Cache Tests
+Runs the API lifespan against local stand-ins (no credentials or network)
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from core.cache import TTLCache
+from core.warmup import load_warmup_queries
+from benchmarks.load_test import install_stand_ins
+
+
+def test_ttl_cache_evicts_and_expires():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts least recently used ("b")
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    expiring = TTLCache(max_size=2, ttl_seconds=0)
+    expiring.set("a", 1)
+    assert expiring.get("a") is None
+    assert expiring.stats()["misses"] == 1
+
+
+def test_load_warmup_queries_ranks_query_log(tmp_path):
+    from core.query_log import QueryLogger
+
+    path = str(tmp_path / "queries.jsonl")
+    query_logger = QueryLogger(path)
+    for query in ["python developer", "civil engineer", "python developer"]:
+        query_logger.record(query, {}, {"search_intent": query, "filters": {}}, None, {}, [])
+
+    assert load_warmup_queries(path, limit=1) == ["python developer"]
+
+    text_file = tmp_path / "queries.txt"
+    text_file.write_text("# top queries\nAutoCAD drafter\n\nReact developer\n")
+    assert load_warmup_queries(str(text_file)) == ["AutoCAD drafter", "React developer"]
+
+
+def test_ready_after_warmup_and_health_is_measured(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    queries_file = tmp_path / "queries.txt"
+    queries_file.write_text("Python developer with Django\nCivil engineer with AutoCAD, 5+ years\n")
+    monkeypatch.setenv("WARMUP_QUERIES_FILE", str(queries_file))
+
+    app = install_stand_ins(corpus_size=200, dim=64, qdrant_latency="const:20")
+    from api import search_api
+
+    with TestClient(app) as client:
+        deadline = time.time() + 30
+        while client.get("/ready").status_code != 200:
+            assert time.time() < deadline, client.get("/ready").json()
+            time.sleep(0.05)
+
+        warmup = client.get("/ready").json()["warmup"]
+        assert warmup["queries_prefilled"] == 2
+        assert set(warmup["steps"]["vector_search_ms"]) == {"resume", "skills", "tasks"}
+
+        health = client.get("/health")
+        assert health.status_code == 200
+        components = health.json()["components"]
+        assert components["qdrant"]["status"] == "ok"
+        assert components["qdrant"]["latency_ms"] >= 20
+        assert components["gemini"]["status"] == "ok"
+
+        # Prefilled queries are served from the parse cache
+        parser = search_api.get_parser()
+        hits_before = parser.cache.hits
+        assert client.post("/search", json={"query": "python developer with  django", "limit": 5}).status_code == 200
+        assert parser.cache.hits == hits_before + 1
+
+
+def test_probes_answer_while_a_search_is_running(monkeypatch):
+    import threading
+    from fastapi.testclient import TestClient
+    from api import search_api
+
+    app = install_stand_ins(corpus_size=200, dim=16)
+    engine = search_api.get_engine()
+    search = engine.search
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_search(*args, **kwargs):
+        if threading.current_thread().name != "search-warmup":
+            started.set()
+            release.wait(10)
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(engine, "search", blocking_search)
+    # One event loop for every request, as under uvicorn
+    with TestClient(app) as client:
+        deadline = time.time() + 30
+        while client.get("/ready").status_code != 200:
+            assert time.time() < deadline, client.get("/ready").json()
+            time.sleep(0.05)
+
+        searching = threading.Thread(target=lambda: client.post("/search", json={"query": "Python developer", "limit": 3}))
+        searching.start()
+        assert started.wait(10)
+
+        probes = []
+        probing = threading.Thread(target=lambda: probes.append(client.get("/ready").status_code))
+        probing.start()
+        probing.join(5)
+        answered = list(probes)
+        release.set()
+        searching.join(10)
+        probing.join(10)
+    assert answered == [200]  # /ready was not queued behind the blocked search